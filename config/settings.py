@@ -67,6 +67,8 @@ SETTINGS = {
         'fair': 40,       # 40-59 = Fair
         'poor': 0,        # < 40 = Poor
     },
+    # Highest/lowest scoring items kept by the run aggregator (scoring/aggregator.py)
+    'report_notable_examples': int(os.getenv('REPORT_NOTABLE_EXAMPLES', '5')),
 
     # Feature flags
     'enable_legacy_ar_mode': True,  # Synthesize AR from ratings for backward compatibility
@@ -76,12 +78,149 @@ SETTINGS = {
     'max_content_length': 10000,  # Characters
     'deduplication_window': 24,   # Hours for SimHash deduplication
     'batch_size': 100,
-    
+    # Items scored concurrently by ContentScorer.batch_score_content (1 = sequential)
+    'scoring_concurrency': int(os.getenv('SCORING_CONCURRENCY', '1')),
+    # Dimension scorers run concurrently within one item (1 = sequential)
+    'dimension_concurrency': int(os.getenv('DIMENSION_CONCURRENCY', '5')),
+    # 'per_dimension' sends one prompt per dimension; 'single_call' scores
+    # provenance, transparency, coherence and resonance in one JSON prompt
+    'scoring_mode': os.getenv('SCORING_MODE', 'per_dimension'),
+    # Dimensions whose score + feedback come back in one LLM round trip
+    # instead of a score call followed by a feedback call (e.g. "coherence")
+    'single_round_trip_feedback': [d.strip().lower() for d in os.getenv('SINGLE_ROUND_TRIP_FEEDBACK', '').split(',') if d.strip()],
+    # Model cascade: score calls go to the first (cheapest) model and
+    # escalate to the next when the output fails validation; an item whose
+    # weighted composite lies within scoring_cascade_margin of a rating band
+    # / rubric threshold is rescored on the last model
+    'scoring_cascade_enabled': os.getenv('SCORING_CASCADE_ENABLED', 'False').lower() == 'true',
+    'scoring_cascade_models': [m.strip() for m in os.getenv('SCORING_CASCADE_MODELS', 'gpt-4o-mini,gpt-4o').split(',') if m.strip()],
+    'scoring_cascade_margin': float(os.getenv('SCORING_CASCADE_MARGIN', '0.05')),
+    # Budget-aware scheduling: batches are scored in order of expected
+    # information value (brand-owned, channel coverage, triage uncertainty).
+    # Unset limits fall back to the rubric's defaults.max_llm_items and
+    # defaults.max_llm_cost_per_run. The last scoring_budget_cheap_reserve of
+    # the budget goes to scoring_budget_cheap_model; once it is spent the
+    # remaining items get scoring_budget_exhausted_treatment
+    # ('detector_only' or 'skipped')
+    'scoring_budget_enabled': os.getenv('SCORING_BUDGET_ENABLED', 'False').lower() == 'true',
+    'scoring_budget_max_tokens': int(os.getenv('SCORING_BUDGET_MAX_TOKENS')) if os.getenv('SCORING_BUDGET_MAX_TOKENS') else None,
+    'scoring_budget_max_cost': float(os.getenv('SCORING_BUDGET_MAX_COST')) if os.getenv('SCORING_BUDGET_MAX_COST') else None,
+    'scoring_budget_max_seconds': float(os.getenv('SCORING_BUDGET_MAX_SECONDS')) if os.getenv('SCORING_BUDGET_MAX_SECONDS') else None,
+    'scoring_budget_max_llm_items': int(os.getenv('SCORING_BUDGET_MAX_LLM_ITEMS')) if os.getenv('SCORING_BUDGET_MAX_LLM_ITEMS') else None,
+    'scoring_budget_cheap_model': os.getenv('SCORING_BUDGET_CHEAP_MODEL', 'gpt-4o-mini') or None,
+    'scoring_budget_cheap_reserve': float(os.getenv('SCORING_BUDGET_CHEAP_RESERVE', '0.2')),
+    'scoring_budget_exhausted_treatment': os.getenv('SCORING_BUDGET_EXHAUSTED_TREATMENT', 'detector_only'),
+    'scoring_priority_weights': {
+        'brand_owned': 2.0,
+        'channel_coverage': 1.0,
+        'uncertainty': 1.0,
+    },
+    # Approximate USD per 1K tokens (blended input/output) for budget accounting
+    'llm_cost_per_1k_tokens': {
+        'gpt-3.5-turbo': 0.001,
+        'gpt-4o-mini': 0.0004,
+        'gpt-4o': 0.005,
+        'default': 0.001,
+    },
+    # Streaming pipeline: items buffered between stages, pages fetched
+    # concurrently, and scores per S3 upload part
+    'stream_queue_size': int(os.getenv('STREAM_QUEUE_SIZE', '32')),
+    'fetch_concurrency': int(os.getenv('FETCH_CONCURRENCY', '4')),
+    'stream_upload_batch_size': int(os.getenv('STREAM_UPLOAD_BATCH_SIZE', '50')),
+    # Characters of an item's body kept in its score meta once it is uploaded
+    # (report excerpts); the full body is dropped so a run's memory stays flat
+    'stream_retained_description_chars': int(os.getenv('STREAM_RETAINED_DESCRIPTION_CHARS', '500')),
+
     # API rate limits
     'reddit_rate_limit': 60,      # requests per minute
     'amazon_rate_limit': 1,       # requests per second
     'openai_rate_limit': 60,      # requests per minute
     'youtube_rate_limit': 60,    # requests per minute (YouTube Data API key quota should be considered)
+
+    # Shared adaptive limiter for all LLM calls, one per provider/model
+    # (0 disables a budget). Concurrency adapts between 1 and the max (AIMD).
+    'llm_requests_per_minute': int(os.getenv('LLM_REQUESTS_PER_MINUTE', '500')),
+    'llm_tokens_per_minute': int(os.getenv('LLM_TOKENS_PER_MINUTE', '200000')),
+    'llm_max_concurrency': int(os.getenv('LLM_MAX_CONCURRENCY', '16')),
+    'llm_latency_target_seconds': float(os.getenv('LLM_LATENCY_TARGET_SECONDS', '30')),
+    'llm_rate_limit_retries': int(os.getenv('LLM_RATE_LIMIT_RETRIES', '3')),
+    # Per-request timeout for ChatClient.achat (0 disables)
+    'llm_request_timeout_seconds': float(os.getenv('LLM_REQUEST_TIMEOUT_SECONDS', '60')),
+
+    # ChatClient tail latency: hedge a request that has not answered by the
+    # provider's observed p90 latency, and fail over to an equivalent model
+    # on another provider when a provider returns 5xx
+    'llm_hedging_enabled': os.getenv('LLM_HEDGING_ENABLED', 'False').lower() == 'true',
+    'llm_hedge_quantile': float(os.getenv('LLM_HEDGE_QUANTILE', '0.9')),
+    'llm_hedge_min_samples': 20,             # latency samples before the quantile is trusted
+    'llm_hedge_min_delay_seconds': 1.0,
+    'llm_hedge_default_delay_seconds': 10.0,  # hedge delay until enough samples exist
+    'llm_latency_window': 500,               # latency samples kept per provider
+    # Threads shared by all hedged requests (each one uses up to two)
+    'llm_hedge_max_workers': int(os.getenv('LLM_HEDGE_MAX_WORKERS', '32')),
+    'llm_failover_enabled': os.getenv('LLM_FAILOVER_ENABLED', 'True').lower() == 'true',
+    # Interchangeable models on other providers, in preference order
+    'llm_equivalent_models': {
+        'gpt-3.5-turbo': ['claude-3-haiku-20240307', 'gemini-1.5-flash'],
+        'gpt-4o-mini': ['claude-3-haiku-20240307', 'gemini-1.5-flash'],
+        'gpt-4o': ['claude-3-5-sonnet-20241022', 'gemini-1.5-pro'],
+        'claude-3-haiku-20240307': ['gpt-4o-mini', 'gemini-1.5-flash'],
+        'claude-3-5-sonnet-20241022': ['gpt-4o', 'gemini-1.5-pro'],
+        'gemini-1.5-flash': ['gpt-4o-mini', 'claude-3-haiku-20240307'],
+        'gemini-1.5-pro': ['gpt-4o', 'claude-3-5-sonnet-20241022'],
+        'deepseek-chat': ['gpt-4o-mini', 'claude-3-haiku-20240307'],
+    },
+    # Per "provider" or "provider/model" overrides of the keys above, e.g.
+    # {'anthropic': {'requests_per_minute': 50, 'tokens_per_minute': 40000}}
+    'llm_rate_limit_overrides': {},
+
+    # LLM response cache (shared by LLMScoringClient and ChatClient)
+    'llm_cache_enabled': os.getenv('LLM_CACHE_ENABLED', 'True').lower() == 'true',
+    'llm_cache_bypass': os.getenv('LLM_CACHE_BYPASS', 'False').lower() == 'true',  # Skip reads and writes for this process
+    'llm_cache_path': os.getenv('LLM_CACHE_PATH', os.path.join('.cache', 'llm', 'responses.sqlite3')),
+    'llm_cache_ttl_seconds': int(os.getenv('LLM_CACHE_TTL_SECONDS', str(7 * 24 * 3600))),
+    'llm_cache_max_entries': int(os.getenv('LLM_CACHE_MAX_ENTRIES', '50000')),
+
+    # Incremental rescoring: finished per-item scores keyed by content
+    # fingerprint, rubric, model and prompt version. Bump
+    # scoring_prompt_version whenever scoring prompts change.
+    'score_store_enabled': os.getenv('SCORE_STORE_ENABLED', 'True').lower() == 'true',
+    'score_store_path': os.getenv('SCORE_STORE_PATH', os.path.join('.cache', 'scores', 'scores.sqlite3')),
+    'score_store_ttl_seconds': int(os.getenv('SCORE_STORE_TTL_SECONDS', str(30 * 24 * 3600))),
+    'score_store_max_entries': int(os.getenv('SCORE_STORE_MAX_ENTRIES', '200000')),
+    'scoring_prompt_version': '1',
+
+    # Claim verification cache: verdicts per normalized claim and Serper
+    # evidence per normalized query, shared across pages and runs
+    'claim_cache_enabled': os.getenv('CLAIM_CACHE_ENABLED', 'True').lower() == 'true',
+    'claim_cache_path': os.getenv('CLAIM_CACHE_PATH', os.path.join('.cache', 'claims', 'claims.sqlite3')),
+    'claim_cache_ttl_seconds': int(os.getenv('CLAIM_CACHE_TTL_SECONDS', str(14 * 24 * 3600))),
+    'claim_cache_max_entries': int(os.getenv('CLAIM_CACHE_MAX_ENTRIES', '100000')),
+    # Run-level verification: extract claims for several items per prompt,
+    # cluster near-duplicate claims across items (MinHash Jaccard) and
+    # verify each cluster once. Streaming runs do this per window of
+    # stream_verification_window items (<= 1 verifies each item on its own)
+    'run_level_verification': os.getenv('RUN_LEVEL_VERIFICATION', 'True').lower() == 'true',
+    'claim_extraction_batch_size': int(os.getenv('CLAIM_EXTRACTION_BATCH_SIZE', '5')),
+    'claim_extraction_concurrency': int(os.getenv('CLAIM_EXTRACTION_CONCURRENCY', '4')),
+    'claim_cluster_threshold': float(os.getenv('CLAIM_CLUSTER_THRESHOLD', '0.6')),
+    'claim_verification_concurrency': int(os.getenv('CLAIM_VERIFICATION_CONCURRENCY', '8')),
+    'stream_verification_window': int(os.getenv('STREAM_VERIFICATION_WINDOW', '20')),
+    # Claim pre-detector: skip RAG verification (neutral 0.5) when the
+    # deterministic claim likelihood of the body is below the threshold
+    'claim_predetect_enabled': os.getenv('CLAIM_PREDETECT_ENABLED', 'True').lower() == 'true',
+    'claim_predetect_threshold': float(os.getenv('CLAIM_PREDETECT_THRESHOLD', '0.3')),
+    # Brand guidelines are cached per process and split into chunks of
+    # guidelines_chunk_size chars; coherence prompts get up to
+    # guidelines_top_k chunks most relevant to the item (BM25), at most
+    # guidelines_max_chars in total (the untargeted preview was 1500).
+    # Brands without guidelines are rechecked after guidelines_cache_ttl seconds
+    'guidelines_retrieval_enabled': os.getenv('GUIDELINES_RETRIEVAL_ENABLED', 'True').lower() == 'true',
+    'guidelines_top_k': int(os.getenv('GUIDELINES_TOP_K', '3')),
+    'guidelines_chunk_size': int(os.getenv('GUIDELINES_CHUNK_SIZE', '400')),
+    'guidelines_chunk_overlap': int(os.getenv('GUIDELINES_CHUNK_OVERLAP', '50')),
+    'guidelines_max_chars': int(os.getenv('GUIDELINES_MAX_CHARS', '1000')),
+    'guidelines_cache_ttl': float(os.getenv('GUIDELINES_CACHE_TTL', '300')),
     
     # Data retention
     'data_retention_days': 90,
@@ -95,6 +234,14 @@ SETTINGS = {
     # Triage configuration: enable cheap triage before LLM scoring
     'triage_enabled': False,
     'triage_promote_threshold': 0.6,
+    # Learned triage model (scripts/train_triage_model.py): items whose
+    # widest 10-90% prediction interval is within triage_model_max_uncertainty
+    # take the model's scores instead of LLM scoring, for at most
+    # triage_model_skip_budget of the items in a batch
+    'triage_model_enabled': os.getenv('TRIAGE_MODEL_ENABLED', 'False').lower() == 'true',
+    'triage_model_path': os.getenv('TRIAGE_MODEL_PATH', os.path.join('models', 'triage')),
+    'triage_model_max_uncertainty': float(os.getenv('TRIAGE_MODEL_MAX_UNCERTAINTY', '0.15')),
+    'triage_model_skip_budget': float(os.getenv('TRIAGE_MODEL_SKIP_BUDGET', '0.3')),
     # When true, items demoted by triage are excluded from S3 uploads and reports
     'exclude_demoted_from_upload': False,
     # Global control: whether to include parsed comments in the analysis
@@ -7,11 +7,11 @@ import boto3
 import pandas as pd
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import json
 import logging
 import time
 
 from config.database import DATABASE_CONFIG, AWS_CONFIG, ATHENA_CONFIG
+from data import json_codec
 from data.models import NormalizedContent, ContentScores, AuthenticityRatio
 
 logger = logging.getLogger(__name__)
@@ -106,7 +106,7 @@ class AthenaClient:
                 'helpful_count': content.helpful_count,
                 'event_ts': content.event_ts,
                 'run_id': run_id,
-                'meta': json.dumps(content.meta)
+                'meta': json_codec.dumps(content.meta)
             })
         
         df = pd.DataFrame(data)
@@ -129,8 +129,13 @@ class AthenaClient:
         logger.info(f"Uploaded {len(content_list)} normalized content items to s3://ar-ingestion-normalized/{key}")
     
     def upload_content_scores(self, scores_list: List[ContentScores], 
-                            brand_id: str, source: str, run_id: str) -> None:
-        """Upload content scores to S3 as Parquet"""
+                            brand_id: str, source: str, run_id: str,
+                            part: Optional[int] = None) -> None:
+        """Upload content scores to S3 as Parquet
+
+        Streaming runs upload in batches and pass `part` so each batch lands
+        in its own file under the same run partition.
+        """
         import pyarrow as pa
         import pyarrow.parquet as pq
         from io import BytesIO
@@ -152,7 +157,7 @@ class AthenaClient:
                 'is_authentic': score.is_authentic,
                 'rubric_version': score.rubric_version,
                 'run_id': run_id,
-                'meta': score.meta
+                'meta': score.meta_json
             })
         
         df = pd.DataFrame(data)
@@ -164,7 +169,8 @@ class AthenaClient:
         buffer.seek(0)
         
         # Upload to S3
-        key = f"scores/brand_id={brand_id}/source={source}/run_id={run_id}/content_scores.parquet"
+        filename = "content_scores.parquet" if part is None else f"content_scores-part-{part:05d}.parquet"
+        key = f"scores/brand_id={brand_id}/source={source}/run_id={run_id}/{filename}"
         self.s3_client.put_object(
             Bucket='ar-ingestion-normalized',
             Key=key,
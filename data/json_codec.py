@@ -0,0 +1,55 @@
+"""
+JSON codec for persistence boundaries (score meta, Athena uploads)
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise; both produce plain JSON text.
+"""
+
+import json
+from typing import Any
+
+try:
+    # Optional: several times faster than json for large nested dicts
+    import orjson
+    ORJSON_AVAILABLE = True
+except Exception:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if ORJSON_AVAILABLE else 0
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize to a JSON string
+
+    Values the codec does not know (datetimes, enums, custom objects) are
+    written with str() rather than failing the upload.
+
+    Args:
+        obj: JSON-compatible value (dicts, lists, strings, numbers, ...)
+
+    Returns:
+        JSON text
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            # e.g. integers beyond 64 bits or recursion limits: use json
+            pass
+    return json.dumps(obj, default=str)
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON text (str or bytes)
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,12 +3,15 @@ Data models for Trust Stack Rating tool
 Matching the AWS Athena schema structure
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Sequence, Union
 from datetime import datetime
 from enum import Enum
 import warnings
 
+from data import json_codec
+
 class ContentSource(Enum):
     REDDIT = "reddit"
     AMAZON = "amazon"
@@ -28,9 +31,14 @@ class RatingBand(Enum):
     FAIR = "fair"           # 40-59
     POOR = "poor"           # 0-39
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedContent:
-    """Matches ar_content_normalized_v2 table schema with enhanced Trust Stack fields"""
+    """
+    Matches ar_content_normalized_v2 table schema with enhanced Trust Stack fields
+
+    Slotted: attributes outside the declared fields cannot be added, so the
+    scorer's per-item side channels are declared below.
+    """
     content_id: str
     src: str
     platform_id: str
@@ -58,11 +66,87 @@ class NormalizedContent:
     # Language detection
     language: str = "en"  # Detected language code (e.g., 'en', 'fr', 'es')
 
+    # Derived text views shared by the analyzers (scoring.text_profile.profile_of)
+    _text_profile: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    # Scorer side channels: LLM-reported issues and score debug info per dimension
+    _llm_issues: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _score_debug: Dict[str, Dict[str, Any]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if self.meta is None:
             self.meta = {}
 
-@dataclass
+class ScoreMeta(dict):
+    """
+    In-memory ContentScores.meta
+
+    A dict of scoring context the scorer and pipeline attach to an item:
+    title/description/source_url, modality/channel/platform_type, language,
+    brand_context, detected_attributes, attribute_count, score_reused,
+    scoring_treatment, orig_meta (the fetched content meta) and the
+    pipeline's _llm_* annotations. It stays a dict for the whole run and
+    is only serialized (to_json) at upload and persistence boundaries.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def coerce(cls, value: Any) -> 'ScoreMeta':
+        """
+        ScoreMeta for a meta value of any supported form
+
+        Args:
+            value: ScoreMeta (returned as is), dict (wrapped in a copy),
+                JSON string (parsed) or None
+
+        Returns:
+            ScoreMeta ({} when the value is empty or unparsable)
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls(value)
+        if isinstance(value, (str, bytes)) and value:
+            try:
+                parsed = json_codec.loads(value)
+            except ValueError:
+                return cls()
+            return cls(parsed) if isinstance(parsed, dict) else cls()
+        return cls()
+
+    @staticmethod
+    def serialize(value: Any) -> str:
+        """JSON text for a meta value (strings are passed through unchanged)"""
+        if isinstance(value, str):
+            return value
+        if not value:
+            return ""
+        return json_codec.dumps(value)
+
+    def to_json(self) -> str:
+        """JSON text for upload/persistence"""
+        return json_codec.dumps(self)
+
+    @property
+    def detected_attributes(self) -> List[Dict[str, Any]]:
+        return self.get('detected_attributes') or []
+
+    @property
+    def triage_status(self) -> Optional[str]:
+        """Triage status recorded on the item or on its fetched content meta"""
+        status = self.get('triage_status')
+        if status:
+            return status
+        orig_meta = self.get('orig_meta')
+        return orig_meta.get('triage_status') if isinstance(orig_meta, dict) else None
+
+    @property
+    def llm_adjusted_score_total(self) -> Optional[float]:
+        total = self.get('_llm_adjusted_score_total')
+        return float(total) if total else None
+
+
+@dataclass(slots=True)
 class ContentScores:
     """
     Matches ar_content_scores_v2 table schema.
@@ -82,7 +166,7 @@ class ContentScores:
     is_authentic: bool = False  # Legacy field - optional
     rubric_version: str = "v2.0-trust-stack"
     run_id: str = ""
-    meta: str = ""
+    meta: Union[ScoreMeta, str] = ""  # ScoreMeta in memory; JSON text only at upload (meta_json)
 
     # Enhanced Trust Stack fields for 5D analysis
     modality: str = "text"  # text, image, video, audio
@@ -93,6 +177,11 @@ class ContentScores:
     source_type: str = "unknown"  # brand_owned, third_party, unknown
     source_tier: str = "unknown"  # specific tier within brand_owned or third_party
 
+    @property
+    def meta_json(self) -> str:
+        """meta serialized for the ar_content_scores_v2 meta column"""
+        return ScoreMeta.serialize(self.meta)
+
     @property
     def overall_score(self) -> float:
         """Calculate weighted overall score (0.0-1.0 scale)"""
@@ -140,13 +229,15 @@ class ContentScores:
 
     @property
     def rating_band(self) -> RatingBand:
-        """Optional descriptive band based on comprehensive rating"""
+        """Optional descriptive band based on comprehensive rating (SETTINGS['rating_bands'])"""
+        from config.settings import SETTINGS
+        bands = SETTINGS['rating_bands']
         rating = self.rating_comprehensive
-        if rating >= 80:
+        if rating >= bands['excellent']:
             return RatingBand.EXCELLENT
-        elif rating >= 60:
+        elif rating >= bands['good']:
             return RatingBand.GOOD
-        elif rating >= 40:
+        elif rating >= bands['fair']:
             return RatingBand.FAIR
         else:
             return RatingBand.POOR
@@ -154,7 +245,85 @@ class ContentScores:
 # Alias for clearer naming in Trust Stack context
 ContentRatings = ContentScores
 
-@dataclass
+
+class ScoresBatch:
+    """
+    Array-backed container for many ContentScores (historical backfills,
+    multi-brand webapp sessions)
+
+    Dimension scores are stored in float64 arrays and is_authentic in a
+    byte array, so they take 8 (1) bytes per item instead of a float
+    (bool) reference and object per ContentScores. The other fields are
+    kept in one list per field. Items are materialized as ContentScores
+    on access; changes to a materialized item are not written back.
+    """
+
+    DIMENSIONS = ("provenance", "resonance", "coherence", "transparency", "verification")
+    FIELDS = tuple(f.name for f in fields(ContentScores)
+                   if f.name != 'is_authentic' and not f.name.startswith('score_'))
+
+    __slots__ = ('_scores', '_authentic', '_columns')
+
+    def __init__(self, scores_list: Iterable[ContentScores] = ()):
+        self._scores: Dict[str, array] = {dim: array('d') for dim in self.DIMENSIONS}
+        self._authentic = array('b')
+        self._columns: Dict[str, List[Any]] = {name: [] for name in self.FIELDS}
+        self.extend(scores_list)
+
+    def append(self, scores: ContentScores) -> None:
+        """Add one item"""
+        for dim, column in self._scores.items():
+            column.append(getattr(scores, f"score_{dim}"))
+        self._authentic.append(bool(scores.is_authentic))
+        for name, column in self._columns.items():
+            column.append(getattr(scores, name))
+
+    def extend(self, scores_list: Iterable[ContentScores]) -> None:
+        """Add items in order"""
+        for scores in scores_list:
+            self.append(scores)
+
+    def __len__(self) -> int:
+        return len(self._authentic)
+
+    def __getitem__(self, index: int) -> ContentScores:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ScoresBatch index out of range")
+        kwargs = {name: column[index] for name, column in self._columns.items()}
+        kwargs.update({f"score_{dim}": column[index] for dim, column in self._scores.items()})
+        return ContentScores(is_authentic=bool(self._authentic[index]), **kwargs)
+
+    def __iter__(self) -> Iterator[ContentScores]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def dimension(self, dimension: str) -> array:
+        """Scores of one dimension (0.0-1.0) as a float64 array (shared, not a copy)"""
+        return self._scores[dimension]
+
+    def column(self, name: str) -> List[Any]:
+        """Values of a non-score field (shared, not a copy)"""
+        return self._columns[name]
+
+    def matrix(self, dimensions: Sequence[str] = DIMENSIONS):
+        """
+        Items x dimensions NumPy matrix of dimension scores
+
+        Args:
+            dimensions: Column order
+
+        Returns:
+            float64 ndarray of shape (len(self), len(dimensions))
+        """
+        import numpy as np
+        matrix = np.empty((len(self), len(dimensions)), dtype=np.float64)
+        for j, dim in enumerate(dimensions):
+            matrix[:, j] = np.frombuffer(self._scores[dim], dtype=np.float64)
+        return matrix
+
+@dataclass(slots=True)
 class DetectedAttribute:
     """Represents a Trust Stack attribute detected in content"""
     attribute_id: str
@@ -288,11 +457,19 @@ class PipelineRun:
     end_time: Optional[datetime] = None
     status: str = "running"  # running, completed, failed
     items_processed: int = 0
+    # Items whose scores were reused from the score store instead of rescored
+    items_reused: int = 0
+    # Model cascade stats (LLMScoringClient.cascade_summary) when enabled
+    cascade_stats: Optional[Dict[str, Any]] = None
+    # Budget scheduler summary (ScoringScheduler.summary): treatment per item
+    scoring_treatments: Optional[Dict[str, Any]] = None
     errors: List[str] = None
     # Optional: hold classified scores produced by the scoring pipeline so
     # callers (reports/telemetry) can consume the exact objects that were
     # uploaded to S3/Athena.
     classified_scores: Optional[List[Any]] = None
+    # Report aggregates (scoring.aggregator.RunAggregator) built as items finished
+    aggregates: Optional[Any] = None
     
     def __post_init__(self):
         if self.errors is None:
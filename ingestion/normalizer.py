@@ -5,7 +5,7 @@ Handles deduplication and content standardization
 
 import hashlib
 import json
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Optional
 from datetime import datetime, timedelta
 import logging
 
@@ -49,7 +49,34 @@ class ContentNormalizer:
         logger.info(f"After validation: {len(validated_content)} items")
 
         return validated_content
-    
+
+    def normalize_item(self, content: NormalizedContent) -> Optional[NormalizedContent]:
+        """
+        Normalize a single item for the streaming pipeline
+
+        Applies the same cleaning, metadata enrichment and length validation
+        as normalize_content. Duplicates are checked against every item this
+        normalizer has already seen, and the first copy wins because a more
+        engaged copy may not have arrived yet. Not thread-safe: run it from a
+        single stage worker.
+
+        Returns:
+            The normalized item, or None if it was dropped
+        """
+        cleaned = self._clean_content([content])
+        if not cleaned:
+            return None
+        enriched = self._enrich_metadata(cleaned)[0]
+
+        content_hash = self._generate_simhash(enriched)
+        if content_hash in self.seen_hashes:
+            logger.debug(f"Skipping duplicate content {enriched.content_id}")
+            return None
+        self.seen_hashes.add(content_hash)
+
+        validated = self._validate_content_length([enriched])
+        return validated[0] if validated else None
+
     def _clean_content(self, content_list: List[NormalizedContent]) -> List[NormalizedContent]:
         """Clean and standardize content text"""
         cleaned_content = []
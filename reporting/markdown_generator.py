@@ -18,6 +18,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from webapp.utils.recommendations import get_remedy_for_issue
+from scoring.text_profile import split_sentences
 
 logger = logging.getLogger(__name__)
 
@@ -131,10 +132,8 @@ def html_unescape(text: str) -> str:
 
 
 def _split_sentences(text: str) -> List[str]:
-    # Simple but pragmatic sentence splitter
-    parts = re.split(r'(?<=[\.\!\?])\s+', text)
-    parts = [p.strip() for p in parts if len(p.strip()) > 10]
-    return parts
+    # Simple but pragmatic sentence splitter (shared with TextProfile.sentences)
+    return split_sentences(text)
 
 
 def clean_text_for_llm(meta: Dict[str, Any]) -> str:
@@ -1120,9 +1119,8 @@ Each dimension is independently scored and combined to form a comprehensive trus
 
         # Load rubric to get attribute definitions
         try:
-            import json
-            with open('config/rubric.json', 'r') as f:
-                rubric = json.load(f)
+            from scoring.rubric import get_rubric
+            rubric = get_rubric().source
             attributes = rubric.get('attributes', [])
         except Exception as e:
             logger.warning(f"Could not load rubric for attribute analysis: {e}")
@@ -1701,9 +1699,8 @@ Trust performance analysis across different platforms and channel types.
 
         # Load rubric for attribute metadata
         try:
-            import json
-            with open('config/rubric.json', 'r') as f:
-                rubric = json.load(f)
+            from scoring.rubric import get_rubric
+            rubric = get_rubric().source
             attributes = {attr['id']: attr for attr in rubric.get('attributes', [])}
             dimension_weights = rubric.get('dimension_weights', {})
         except Exception as e:
@@ -2642,6 +2639,16 @@ This report provides actionable insights for brand health and content strategy b
             except Exception:
                 pass
 
+            # Budget-degraded scoring (scoring/scheduler.py)
+            try:
+                treatment = meta.get('scoring_treatment') if isinstance(meta, dict) else None
+                if treatment == 'cheap_model':
+                    rationale_sentences.append('Scored with the lower-cost model after the run\'s primary scoring budget was used.')
+                elif treatment == 'detector_only':
+                    rationale_sentences.append('Scored from detected attributes only (no LLM review) because the run\'s scoring budget was exhausted.')
+            except Exception:
+                pass
+
             rationale = ' '.join(rationale_sentences) if rationale_sentences else ''
 
             # Build dimensional performance summary
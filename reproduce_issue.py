@@ -3,6 +3,7 @@ import sys
 import os
 import json
 import logging
+from dataclasses import asdict
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -57,7 +58,7 @@ def test_detectors_and_remedies():
         # Simulate pipeline item structure
         item = {
             "meta": {
-                "detected_attributes": [attr.__dict__ for attr in detected_coherence],
+                "detected_attributes": [asdict(attr) for attr in detected_coherence],
                 "title": content_coherence.title,
                 "url": content_coherence.url
             }
@@ -104,7 +105,7 @@ def test_detectors_and_remedies():
         # Simulate pipeline item structure
         item = {
             "meta": {
-                "detected_attributes": [attr.__dict__ for attr in detected_verification],
+                "detected_attributes": [asdict(attr) for attr in detected_verification],
                 "title": content_verification.title,
                 "url": content_verification.url
             }
@@ -0,0 +1,246 @@
+"""
+Incremental run aggregates for scoring reports
+Updated once per finished item, so dimension statistics, rating bands,
+channel/modality/source-type rollups and notable examples are ready when
+scoring ends without re-iterating the item list, in memory independent of
+the number of items
+"""
+
+import heapq
+import math
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from config.settings import SETTINGS
+from data.models import ScoreMeta
+
+DIMENSIONS = ("provenance", "verification", "transparency", "coherence", "resonance")
+BANDS = ("excellent", "good", "fair", "poor")
+
+
+class RunningStats:
+    """Welford running count, mean, variance, min and max"""
+
+    __slots__ = ('count', 'mean', '_m2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def merge(self, other: 'RunningStats') -> None:
+        """Combine with stats over a disjoint set of values (Chan et al.)"""
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation (0.0 below two values)"""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(max(0.0, self._m2 / (self.count - 1)))
+
+    def summary(self) -> Dict[str, float]:
+        """average/min/max/std_dev, zeros when empty (generate_scoring_report's shape)"""
+        if not self.count:
+            return {"average": 0, "min": 0, "max": 0, "std_dev": 0.0}
+        return {"average": self.mean, "min": self.min, "max": self.max, "std_dev": self.std_dev}
+
+
+def rating_band(rating: float) -> str:
+    """Band name for a 0-100 rating from SETTINGS['rating_bands']"""
+    bands = SETTINGS['rating_bands']
+    if rating >= bands['excellent']:
+        return 'excellent'
+    if rating >= bands['good']:
+        return 'good'
+    if rating >= bands['fair']:
+        return 'fair'
+    return 'poor'
+
+
+def report_final_score(scores: Any, meta: Optional[Dict[str, Any]] = None) -> float:
+    """
+    Report final score (0-100): SETTINGS-weighted dimensions, or the
+    LLM-adjusted total when the AR step recorded one in meta
+    """
+    if meta is None:
+        meta = ScoreMeta.coerce(getattr(scores, 'meta', None))
+    adjusted = meta.get('_llm_adjusted_score_total')
+    if adjusted:
+        try:
+            return float(adjusted)
+        except (TypeError, ValueError):
+            pass
+    w = SETTINGS['scoring_weights']
+    try:
+        return (
+            getattr(scores, 'score_provenance', 0.0) * w.provenance +
+            getattr(scores, 'score_resonance', 0.0) * w.resonance +
+            getattr(scores, 'score_coherence', 0.0) * w.coherence +
+            getattr(scores, 'score_transparency', 0.0) * w.transparency +
+            getattr(scores, 'score_verification', 0.0) * w.verification
+        ) * 100.0
+    except TypeError:
+        return 0.0
+
+
+class RunAggregator:
+    """
+    Streaming aggregates over the scored items of a run
+
+    Call add() as each item finishes scoring (thread-safe); the report
+    sections are then available without another pass over the items.
+
+    Args:
+        top_k: Notable examples kept at each end of the score range
+            (defaults to SETTINGS['report_notable_examples'])
+    """
+
+    ROLLUPS = ('channel', 'modality', 'source_type', 'src')
+
+    def __init__(self, top_k: Optional[int] = None):
+        self.top_k = top_k if top_k is not None else SETTINGS.get('report_notable_examples', 5)
+        self.count = 0
+        self.dimensions: Dict[str, RunningStats] = {dim: RunningStats() for dim in DIMENSIONS}
+        self.final = RunningStats()
+        self.bands: Dict[str, int] = {band: 0 for band in BANDS}
+        self.rollups: Dict[str, Dict[str, RunningStats]] = {key: {} for key in self.ROLLUPS}
+        self.content_types: Dict[str, int] = {}
+        # Min-heaps of (score, seq, example): _top keeps the highest scores,
+        # _bottom (scores negated) the lowest
+        self._top: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._bottom: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_scores(cls, scores_list: Iterable[Any], top_k: Optional[int] = None) -> 'RunAggregator':
+        """Aggregator over already-scored items (one pass)"""
+        aggregator = cls(top_k)
+        for scores in scores_list:
+            aggregator.add(scores)
+        return aggregator
+
+    def add(self, scores: Any) -> None:
+        """Fold one finished item (ContentScores) into the aggregates"""
+        meta = ScoreMeta.coerce(getattr(scores, 'meta', None))
+        score = report_final_score(scores, meta)
+        # Same 0.5 default generate_scoring_report used for missing dimensions
+        values = [getattr(scores, f"score_{dim}", 0.5) for dim in DIMENSIONS]
+        groups = {
+            'channel': getattr(scores, 'channel', None) or 'unknown',
+            'modality': getattr(scores, 'modality', None) or 'unknown',
+            'source_type': getattr(scores, 'source_type', None) or 'unknown',
+            'src': getattr(scores, 'src', None) or 'unknown',
+        }
+        content_type = meta.get('content_type') or getattr(scores, 'content_type', None) or 'unknown'
+        example = {
+            'content_id': getattr(scores, 'content_id', None),
+            'source': getattr(scores, 'src', ''),
+            'title': meta.get('title') or meta.get('name') or '',
+            'url': meta.get('source_url') or meta.get('url') or '',
+            'final_score': score,
+        }
+
+        with self._lock:
+            self.count += 1
+            for dim, value in zip(DIMENSIONS, values):
+                self.dimensions[dim].add(value)
+            self.final.add(score)
+            self.bands[rating_band(score)] += 1
+            for key, value in groups.items():
+                group = self.rollups[key].get(value)
+                if group is None:
+                    group = self.rollups[key][value] = RunningStats()
+                group.add(score)
+            self.content_types[content_type] = self.content_types.get(content_type, 0) + 1
+            if self.top_k > 0:
+                self._seq += 1
+                self._push(self._top, (score, -self._seq, example))
+                self._push(self._bottom, (-score, -self._seq, example))
+
+    def _push(self, heap: List[Tuple[float, int, Dict[str, Any]]], entry: Tuple[float, int, Dict[str, Any]]) -> None:
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    def merge(self, other: 'RunAggregator') -> None:
+        """Fold in the aggregates of another run (e.g. another brand or worker)"""
+        with self._lock:
+            self.count += other.count
+            for dim in DIMENSIONS:
+                self.dimensions[dim].merge(other.dimensions[dim])
+            self.final.merge(other.final)
+            for band, n in other.bands.items():
+                self.bands[band] += n
+            for key, groups in other.rollups.items():
+                for value, stats in groups.items():
+                    self.rollups[key].setdefault(value, RunningStats()).merge(stats)
+            for content_type, n in other.content_types.items():
+                self.content_types[content_type] = self.content_types.get(content_type, 0) + n
+            for score, _, example in other._top:
+                self._seq += 1
+                self._push(self._top, (score, -self._seq, example))
+            for score, _, example in other._bottom:
+                self._seq += 1
+                self._push(self._bottom, (score, -self._seq, example))
+
+    def dimension_breakdown(self) -> Dict[str, Dict[str, float]]:
+        """Per-dimension average/min/max/std_dev"""
+        return {dim: self.dimensions[dim].summary() for dim in DIMENSIONS}
+
+    def content_type_pct(self) -> Dict[str, float]:
+        """Share of items per content type (percent)"""
+        if not self.count:
+            return {}
+        return {ctype: n / self.count * 100.0 for ctype, n in self.content_types.items()}
+
+    def top_examples(self) -> List[Dict[str, Any]]:
+        """Highest-scoring items, best first (earliest first on ties)"""
+        return [example for _, _, example in sorted(self._top, reverse=True)]
+
+    def bottom_examples(self) -> List[Dict[str, Any]]:
+        """Lowest-scoring items, worst first (earliest first on ties)"""
+        return [example for _, _, example in sorted(self._bottom, reverse=True)]
+
+    def summary(self) -> Dict[str, Any]:
+        """Report-ready aggregates (plain JSON-serializable values)"""
+        with self._lock:
+            return {
+                'total_items': self.count,
+                'average_rating': self.final.mean if self.count else 0.0,
+                'rating_std_dev': self.final.std_dev,
+                'rating_bands': dict(self.bands),
+                'rollups': {
+                    key: {value: {'count': stats.count, 'average_rating': stats.mean}
+                          for value, stats in sorted(groups.items())}
+                    for key, groups in self.rollups.items()
+                },
+                'top_examples': self.top_examples(),
+                'bottom_examples': self.bottom_examples(),
+            }
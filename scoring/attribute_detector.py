@@ -2,122 +2,221 @@
 Trust Stack Attribute Detector
 Detects 36 Trust Stack attributes from normalized content metadata
 """
-import json
 import re
-from typing import List, Dict, Optional
+import time
+import inspect
+import threading
+from typing import List, Dict, Optional, Tuple, Callable, Sequence
 from urllib.parse import urlparse
 import logging
 
 from data.models import NormalizedContent, DetectedAttribute
+from scoring.rubric import get_rubric
+from scoring.text_profile import TextProfile, profile_of
 
 logger = logging.getLogger(__name__)
 
+# Data-driven claims that call for a citation. Kept as separate patterns:
+# each has a literal prefix re can scan for, which beats one alternation.
+DATA_CLAIM_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\d+%',  # Percentages: 50%
+    r'\$[\d,]+',  # Dollar amounts: $1,000
+    r'\d+\s*million',  # Large numbers: 5 million
+    r'\d+\s*billion',
+    r'\d+\s*thousand',
+    r'study\s+(?:found|shows|revealed)',
+    r'research\s+(?:found|shows|revealed)',
+    r'survey\s+(?:found|shows|revealed)',
+    r'statistics?\s+(?:show|indicate)',
+    r'data\s+(?:show|indicate)',
+    r'according\s+to\s+(?:a\s+)?(?:study|research|survey|report)',
+    r'findings?\s+(?:from|of)',
+    r'results?\s+(?:from|of)',
+))
+CITATION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\[\d+\]',  # [1], [2], etc.
+    r'\(\w+,? \d{4}\)',  # (Author, 2024)
+    r'according to\s+[\w\s]+(?:University|Institute|Organization|Agency|Department)',
+    r'source:\s*[\w\s]+',
+    r'cited by',
+    r'study by',
+    r'research by',
+    r'report by',
+))
+
 
 class TrustStackAttributeDetector:
     """Detects Trust Stack attributes from content metadata"""
 
-    def __init__(self, rubric_path: str = "config/rubric.json"):
+    # Attribute id -> detector method, in detection order
+    DETECTORS: Dict[str, str] = {
+        # Provenance
+        "ai_vs_human_labeling_clarity": "_detect_ai_human_labeling",
+        "author_brand_identity_verified": "_detect_author_verified",
+        "c2pa_cai_manifest_present": "_detect_c2pa_manifest",
+        "canonical_url_matches_declared_source": "_detect_canonical_url",
+        "digital_watermark_fingerprint_detected": "_detect_watermark",
+        "exif_metadata_integrity": "_detect_exif_integrity",
+        "source_domain_trust_baseline": "_detect_domain_trust",
+
+        # Resonance
+        "community_alignment_index": "_detect_community_alignment",
+        "creative_recency_vs_trend": "_detect_trend_alignment",
+        "cultural_context_alignment": "_detect_cultural_context",
+        "language_locale_match": "_detect_language_match",
+        "personalization_relevance_embedding_similarity": "_detect_personalization",
+        "readability_grade_level_fit": "_detect_readability",
+        "tone_sentiment_appropriateness": "_detect_tone_sentiment",
+
+        # Coherence
+        "brand_voice_consistency_score": "_detect_brand_voice",
+        "broken_link_rate": "_detect_broken_links",
+        "claim_consistency_across_pages": "_detect_claim_consistency",
+        "email_asset_consistency_check": "_detect_email_consistency",
+        "engagement_to_trust_correlation": "_detect_engagement_trust",
+        "multimodal_consistency_score": "_detect_multimodal_consistency",
+        "temporal_continuity_versions": "_detect_temporal_continuity",
+        "trust_fluctuation_index": "_detect_trust_fluctuation",
+
+        # Transparency
+        "ai_explainability_disclosure": "_detect_ai_explainability",
+        "ai_generated_assisted_disclosure_present": "_detect_ai_disclosure",
+        "bot_disclosure_response_audit": "_detect_bot_disclosure",
+        "caption_subtitle_availability_accuracy": "_detect_captions",
+        "data_source_citations_for_claims": "_detect_citations",
+        "privacy_policy_link_availability_clarity": "_detect_privacy_policy",
+
+        # Verification
+        "ad_sponsored_label_consistency": "_detect_ad_labels",
+        "agent_safety_guardrail_presence": "_detect_safety_guardrails",
+        "claim_to_source_traceability": "_detect_claim_traceability",
+        "engagement_authenticity_ratio": "_detect_engagement_authenticity",
+        "influencer_partner_identity_verified": "_detect_influencer_verified",
+        "review_authenticity_confidence": "_detect_review_authenticity",
+        "seller_product_verification_rate": "_detect_seller_verification",
+        "verified_purchaser_review_rate": "_detect_verified_purchaser",
+
+        # 
+        "schema_compliance": "_detect_schema_compliance",
+        "metadata_completeness": "_detect_metadata_completeness",
+        "llm_retrievability": "_detect_llm_retrievability",
+        "canonical_linking": "_detect_canonical_linking",
+        "indexing_visibility": "_detect_indexing_visibility",
+        "ethical_training_signals": "_detect_ethical_training_signals",
+    }
+
+    def __init__(self, rubric_path: Optional[str] = None):
         """
         Initialize detector with rubric configuration
 
         Args:
             rubric_path: Path to rubric.json containing attribute definitions
+                (default: config/rubric.json)
         """
-        with open(rubric_path, "r", encoding="utf-8") as f:
-            self.rubric = json.load(f)
-
-        # Load only enabled attributes
-        self.attributes = {
-            attr["id"]: attr
-            for attr in self.rubric["attributes"]
-            if attr.get("enabled", False)
-        }
-
+        self.rubric_path = rubric_path
+        self._plan_cache: Optional[Tuple[str, List[Tuple[str, Callable, bool]]]] = None
+        # Attribute id -> [calls, seconds] accumulated by detect_attributes_batch
+        self.timings: Dict[str, List[float]] = {}
+        self._timings_lock = threading.Lock()
         logger.info(f"Loaded {len(self.attributes)} enabled Trust Stack attributes")
 
-    def detect_attributes(self, content: NormalizedContent) -> List[DetectedAttribute]:
+    @property
+    def rubric(self) -> Dict:
+        """Raw rubric JSON (shared compiled rubric; follows edits to the file)"""
+        return get_rubric(self.rubric_path).source
+
+    @property
+    def attributes(self) -> Dict[str, Dict]:
+        """Enabled attribute definitions by id"""
+        return get_rubric(self.rubric_path).enabled_attributes
+
+    def _plan(self) -> List[Tuple[str, Callable, bool]]:
+        """
+        Detector plan for the enabled rubric attributes: (attribute id,
+        bound detector, whether it takes the TextProfile), in DETECTORS
+        order. Rebuilt only when the rubric changes.
+        """
+        rubric = get_rubric(self.rubric_path)
+        cached = self._plan_cache
+        if cached is not None and cached[0] == rubric.fingerprint:
+            return cached[1]
+        plan = []
+        for attr_id, method_name in self.DETECTORS.items():
+            if attr_id not in rubric.enabled_attributes:
+                continue
+            func = getattr(self, method_name)
+            plan.append((attr_id, func, 'profile' in inspect.signature(func).parameters))
+        self._plan_cache = (rubric.fingerprint, plan)
+        return plan
+
+    def detect_attributes(self, content: NormalizedContent,
+                          profile: Optional[TextProfile] = None,
+                          timings: Optional[Dict[str, List[float]]] = None) -> List[DetectedAttribute]:
         """
         Detect all applicable Trust Stack attributes from content
 
         Args:
             content: Normalized content to analyze
+            profile: TextProfile of the content (default: the one memoized on it)
+            timings: Optional dict to accumulate [calls, seconds] per detector
 
         Returns:
             List of detected attributes with values 1-10
         """
+        if profile is None:
+            profile = profile_of(content)
         detected = []
+        for attr_id, detection_func, takes_profile in self._plan():
+            started = time.perf_counter() if timings is not None else 0.0
+            try:
+                result = detection_func(content, profile) if takes_profile else detection_func(content)
+                if result:
+                    detected.append(result)
+            except Exception as e:
+                logger.warning(f"Error detecting {attr_id}: {e}")
+            if timings is not None:
+                entry = timings.setdefault(attr_id, [0, 0.0])
+                entry[0] += 1
+                entry[1] += time.perf_counter() - started
 
-        # Dispatch to specific detection methods
-        detection_methods = {
-            # Provenance
-            "ai_vs_human_labeling_clarity": self._detect_ai_human_labeling,
-            "author_brand_identity_verified": self._detect_author_verified,
-            "c2pa_cai_manifest_present": self._detect_c2pa_manifest,
-            "canonical_url_matches_declared_source": self._detect_canonical_url,
-            "digital_watermark_fingerprint_detected": self._detect_watermark,
-            "exif_metadata_integrity": self._detect_exif_integrity,
-            "source_domain_trust_baseline": self._detect_domain_trust,
-
-            # Resonance
-            "community_alignment_index": self._detect_community_alignment,
-            "creative_recency_vs_trend": self._detect_trend_alignment,
-            "cultural_context_alignment": self._detect_cultural_context,
-            "language_locale_match": self._detect_language_match,
-            "personalization_relevance_embedding_similarity": self._detect_personalization,
-            "readability_grade_level_fit": self._detect_readability,
-            "tone_sentiment_appropriateness": self._detect_tone_sentiment,
-
-            # Coherence
-            "brand_voice_consistency_score": self._detect_brand_voice,
-            "broken_link_rate": self._detect_broken_links,
-            "claim_consistency_across_pages": self._detect_claim_consistency,
-            "email_asset_consistency_check": self._detect_email_consistency,
-            "engagement_to_trust_correlation": self._detect_engagement_trust,
-            "multimodal_consistency_score": self._detect_multimodal_consistency,
-            "temporal_continuity_versions": self._detect_temporal_continuity,
-            "trust_fluctuation_index": self._detect_trust_fluctuation,
-
-            # Transparency
-            "ai_explainability_disclosure": self._detect_ai_explainability,
-            "ai_generated_assisted_disclosure_present": self._detect_ai_disclosure,
-            "bot_disclosure_response_audit": self._detect_bot_disclosure,
-            "caption_subtitle_availability_accuracy": self._detect_captions,
-            "data_source_citations_for_claims": self._detect_citations,
-            "privacy_policy_link_availability_clarity": self._detect_privacy_policy,
-
-            # Verification
-            "ad_sponsored_label_consistency": self._detect_ad_labels,
-            "agent_safety_guardrail_presence": self._detect_safety_guardrails,
-            "claim_to_source_traceability": self._detect_claim_traceability,
-            "engagement_authenticity_ratio": self._detect_engagement_authenticity,
-            "influencer_partner_identity_verified": self._detect_influencer_verified,
-            "review_authenticity_confidence": self._detect_review_authenticity,
-            "seller_product_verification_rate": self._detect_seller_verification,
-            "verified_purchaser_review_rate": self._detect_verified_purchaser,
-
-            # 
-            "schema_compliance": self._detect_schema_compliance,
-            "metadata_completeness": self._detect_metadata_completeness,
-            "llm_retrievability": self._detect_llm_retrievability,
-            "canonical_linking": self._detect_canonical_linking,
-            "indexing_visibility": self._detect_indexing_visibility,
-            "ethical_training_signals": self._detect_ethical_training_signals,
-        }
+        return detected
 
-        for attr_id, detection_func in detection_methods.items():
-            if attr_id in self.attributes:
-                try:
-                    result = detection_func(content)
-                    if result:
-                        detected.append(result)
-                except Exception as e:
-                    logger.warning(f"Error detecting {attr_id}: {e}")
+    def detect_attributes_batch(self, contents: Sequence[NormalizedContent]) -> List[List[DetectedAttribute]]:
+        """
+        Detect attributes for several items with one detector plan
 
-        return detected
+        Per-detector call counts and seconds are added to self.timings
+        (see timing_report()).
+
+        Args:
+            contents: Items to analyze
+
+        Returns:
+            Detected attributes per item, in input order
+        """
+        timings: Dict[str, List[float]] = {}
+        results = [self.detect_attributes(content, profile_of(content), timings) for content in contents]
+        with self._timings_lock:
+            for attr_id, (calls, seconds) in timings.items():
+                entry = self.timings.setdefault(attr_id, [0, 0.0])
+                entry[0] += calls
+                entry[1] += seconds
+        return results
+
+    def timing_report(self) -> List[Dict[str, float]]:
+        """Accumulated batch timings per detector, slowest first"""
+        with self._timings_lock:
+            rows = [
+                {'attribute_id': attr_id, 'calls': calls, 'seconds': round(seconds, 6),
+                 'us_per_call': round(seconds / calls * 1e6, 2) if calls else 0.0}
+                for attr_id, (calls, seconds) in self.timings.items()
+            ]
+        return sorted(rows, key=lambda r: -r['seconds'])
 
     # ===== PROVENANCE DETECTORS =====
 
-    def _detect_ai_human_labeling(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_ai_human_labeling(self, content: NormalizedContent,
+                                  profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """
         Detect AI vs human labeling clarity - context-aware version.
         
@@ -128,7 +227,8 @@ class TrustStackAttributeDetector:
         
         Does NOT flag standard corporate pages, landing pages, product pages, etc.
         """
-        text = (content.body + " " + content.title).lower()
+        profile = profile or profile_of(content)
+        text = profile.text_lower
         meta = content.meta or {}
 
         # Check for explicit AI/human labels
@@ -151,7 +251,7 @@ class TrustStackAttributeDetector:
             )
 
         # Determine if AI labeling is relevant for this content
-        content_type = self._determine_content_type(content)
+        content_type = self._determine_content_type(content, profile)
         
         # Check for AI generation indicators
         ai_generation_indicators = [
@@ -331,13 +431,22 @@ class TrustStackAttributeDetector:
                         confidence=0.8
                     )
 
-    def _determine_content_type(self, content: NormalizedContent) -> str:
+    def _determine_content_type(self, content: NormalizedContent,
+                                profile: Optional[TextProfile] = None) -> str:
         """
         Determine content type based on channel, URL patterns, and metadata.
 
+        Args:
+            content: Content to classify
+            profile: TextProfile to memoize the result on
+
         Returns:
             Content type: 'blog', 'article', 'news', 'landing_page', 'other'
         """
+        if profile is not None:
+            if 'content_type' not in profile.memo:
+                profile.memo['content_type'] = self._determine_content_type(content)
+            return profile.memo['content_type']
         url_lower = content.url.lower()
 
         # Check for blog/article/news patterns in URL
@@ -735,7 +844,8 @@ class TrustStackAttributeDetector:
         # TODO: Implement embedding similarity
         return None
 
-    def _detect_readability(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_readability(self, content: NormalizedContent,
+                            profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect readability grade level fit"""
         text = content.body
 
@@ -743,16 +853,15 @@ class TrustStackAttributeDetector:
         if not text or len(text) < 50:
             return None
 
-        # Split into sentences using positive lookbehind (split after punctuation + whitespace)
-        # This avoids the off-by-one error from re.split()
-        sentence_list = re.split(r'(?<=[\.\!\?])\s+', text)
-        # Filter out very short fragments (< 10 chars) that aren't real sentences
-        sentence_list = [s.strip() for s in sentence_list if len(s.strip()) > 10]
+        # Sentences split after punctuation + whitespace, without fragments
+        # of 10 chars or less that aren't real sentences
+        profile = profile or profile_of(content)
+        sentence_list = profile.sentences
 
         if len(sentence_list) == 0:
             return None
 
-        words = len(text.split())
+        words = profile.body_word_count
         words_per_sentence = words / len(sentence_list)
 
         # Target: 15-20 words per sentence (grade 8-10)
@@ -782,10 +891,12 @@ class TrustStackAttributeDetector:
 
     # ===== COHERENCE DETECTORS =====
 
-    def _detect_brand_voice(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_brand_voice(self, content: NormalizedContent,
+                            profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect brand voice consistency"""
         # Simple heuristic: Check for professional tone markers vs casual/slang
-        text = (content.body + " " + content.title).lower()
+        profile = profile or profile_of(content)
+        text = profile.text_lower
         
         # Slang/casual markers that might violate professional brand voice
         casual_markers = ["gonna", "wanna", "lol", "lmao", "omg", "thx", "u", "ur", "cuz"]
@@ -802,12 +913,11 @@ class TrustStackAttributeDetector:
             )
         return None  # No issue detected
 
-    def _detect_broken_links(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_broken_links(self, content: NormalizedContent,
+                             profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect broken link rate"""
-        text = content.body + " " + content.title
-
         # Find URLs in text
-        urls = re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', text)
+        urls = (profile or profile_of(content)).urls
 
         if not urls:
             return None  # No links to check
@@ -841,10 +951,11 @@ class TrustStackAttributeDetector:
             confidence=0.8
         )
 
-    def _detect_claim_consistency(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_claim_consistency(self, content: NormalizedContent,
+                                  profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect claim consistency across pages"""
         # Heuristic: Check for contradictory terms in close proximity
-        text = content.body.lower()
+        text = (profile or profile_of(content)).body_lower
         
         contradictions = [
             ("always", "never"),
@@ -1006,9 +1117,11 @@ class TrustStackAttributeDetector:
 
     # ===== TRANSPARENCY DETECTORS =====
 
-    def _detect_ai_explainability(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_ai_explainability(self, content: NormalizedContent,
+                                  profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect AI explainability disclosure"""
-        text = (content.body + " " + content.title).lower()
+        profile = profile or profile_of(content)
+        text = profile.text_lower
         meta = content.meta or {}
 
         # First, check if the page actually uses AI features
@@ -1063,9 +1176,11 @@ class TrustStackAttributeDetector:
                 confidence=0.8
             )
 
-    def _detect_ai_disclosure(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_ai_disclosure(self, content: NormalizedContent,
+                              profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect AI-generated/assisted disclosure"""
-        text = (content.body + " " + content.title).lower()
+        profile = profile or profile_of(content)
+        text = profile.text_lower
         meta = content.meta or {}
 
         ai_disclosure_phrases = [
@@ -1133,47 +1248,17 @@ class TrustStackAttributeDetector:
                 confidence=1.0
             )
 
-    def _detect_citations(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_citations(self, content: NormalizedContent,
+                          profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect data source citations"""
         text = content.body
 
-        # First, check if the page actually has data-driven claims that need citations
-        data_claim_indicators = [
-            r'\d+%',  # Percentages: 50%
-            r'\$[\d,]+',  # Dollar amounts: $1,000
-            r'\d+\s*million',  # Large numbers: 5 million
-            r'\d+\s*billion',
-            r'\d+\s*thousand',
-            r'study\s+(?:found|shows|revealed)',
-            r'research\s+(?:found|shows|revealed)',
-            r'survey\s+(?:found|shows|revealed)',
-            r'statistics?\s+(?:show|indicate)',
-            r'data\s+(?:show|indicate)',
-            r'according\s+to\s+(?:a\s+)?(?:study|research|survey|report)',
-            r'findings?\s+(?:from|of)',
-            r'results?\s+(?:from|of)',
-        ]
-
-        # Check if content has data-driven claims
-        has_data_claims = any(re.search(pattern, text, re.IGNORECASE) for pattern in data_claim_indicators)
-
-        # Skip pages without data claims
-        if not has_data_claims:
+        # Skip pages without data-driven claims that would need citations
+        if not any(pattern.search(text) for pattern in DATA_CLAIM_PATTERNS):
             return None
 
         # Content has data claims, now check for citations
-        citation_patterns = [
-            r'\[\d+\]',  # [1], [2], etc.
-            r'\(\w+,? \d{4}\)',  # (Author, 2024)
-            r'according to\s+[\w\s]+(?:University|Institute|Organization|Agency|Department)',
-            r'source:\s*[\w\s]+',
-            r'cited by',
-            r'study by',
-            r'research by',
-            r'report by'
-        ]
-
-        has_citations = any(re.search(pattern, text, re.IGNORECASE) for pattern in citation_patterns)
+        has_citations = any(pattern.search(text) for pattern in CITATION_PATTERNS)
 
         if has_citations:
             return DetectedAttribute(
@@ -1194,9 +1279,11 @@ class TrustStackAttributeDetector:
                 confidence=0.8
             )
 
-    def _detect_privacy_policy(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_privacy_policy(self, content: NormalizedContent,
+                               profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect privacy policy link"""
-        text = (content.body + " " + content.title).lower()
+        profile = profile or profile_of(content)
+        text = profile.text_lower
         meta = content.meta or {}
 
         # Check for privacy policy in multiple ways
@@ -1244,7 +1331,7 @@ class TrustStackAttributeDetector:
 
         # Only flag as missing for owned/corporate content where privacy policy is expected
         # Don't flag social media posts, marketplace listings, etc.
-        content_type = self._determine_content_type(content)
+        content_type = self._determine_content_type(content, profile)
         if content_type in ['landing_page', 'other'] and content.platform_type.lower() == 'owned':
             return DetectedAttribute(
                 attribute_id="privacy_policy_link_availability_clarity",
@@ -1259,9 +1346,11 @@ class TrustStackAttributeDetector:
 
     # ===== VERIFICATION DETECTORS =====
 
-    def _detect_ad_labels(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_ad_labels(self, content: NormalizedContent,
+                          profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect ad/sponsored label consistency"""
-        text = (content.body + " " + content.title).lower()
+        profile = profile or profile_of(content)
+        text = profile.text_lower
         meta = content.meta or {}
 
         ad_labels = ["sponsored", "advertisement", "ad", "promoted", "paid partnership"]
@@ -1603,9 +1692,11 @@ class TrustStackAttributeDetector:
             confidence=0.7
         )
 
-    def _detect_ad_labels(self, content: NormalizedContent) -> Optional[DetectedAttribute]:
+    def _detect_ad_labels(self, content: NormalizedContent,
+                          profile: Optional[TextProfile] = None) -> Optional[DetectedAttribute]:
         """Detect ad/sponsored label consistency"""
-        text = (content.body + " " + content.title).lower()
+        profile = profile or profile_of(content)
+        text = profile.text_lower
         
         # Check for ad intent markers without proper labeling
         ad_intent_markers = ["buy now", "limited time offer", "discount code", "affiliate link"]
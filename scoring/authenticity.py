@@ -0,0 +1,263 @@
+"""
+Columnar Authenticity Ratio computation
+Builds an items x dimensions score matrix and an items x rules trigger
+matrix once, then applies rubric weights, meta-rule bonuses/penalties and
+thresholds as NumPy array operations. Per-item breakdowns and label
+counts are produced from the resulting arrays.
+"""
+
+import logging
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from data.models import ScoreMeta
+from scoring.rubric import CompiledRubric, get_rubric
+
+logger = logging.getLogger(__name__)
+
+# Column order of the score matrix
+AR_DIMENSIONS = ('provenance', 'resonance', 'coherence', 'transparency', 'verification')
+LABELS = ('authentic', 'suspect', 'inauthentic')
+
+
+def enrich_meta(meta: Dict[str, Any], scores: Any) -> Dict[str, Any]:
+    """
+    Fill the keys reporting relies on (title, description, source_url,
+    modality, channel, platform_type), falling back to fields on the score
+
+    Updates and returns `meta`.
+    """
+    meta_title = meta.get('title') or getattr(scores, 'title', None) or meta.get('name')
+    meta_desc = meta.get('description') or meta.get('snippet') or getattr(scores, 'body', None)
+    meta_url = meta.get('source_url') or meta.get('url') or getattr(scores, 'platform_id', None)
+    meta_modality = meta.get('modality') or getattr(scores, 'modality', 'text')
+    meta_channel = meta.get('channel') or getattr(scores, 'channel', 'unknown')
+    meta_platform_type = meta.get('platform_type') or getattr(scores, 'platform_type', 'unknown')
+
+    if meta_title:
+        meta['title'] = meta_title
+    if meta_desc:
+        meta['description'] = meta_desc
+    if meta_url:
+        meta['source_url'] = meta_url
+    if meta_modality:
+        meta['modality'] = meta_modality
+    if meta_channel:
+        meta['channel'] = meta_channel
+    if meta_platform_type:
+        meta['platform_type'] = meta_platform_type
+    return meta
+
+
+def score_matrix(scores_list: Sequence[Any]) -> np.ndarray:
+    """
+    Items x AR_DIMENSIONS matrix of dimension scores (0.0-1.0)
+
+    Missing or None scores count as 0.0.
+    """
+    n = len(scores_list)
+    matrix = np.zeros((n, len(AR_DIMENSIONS)), dtype=np.float64)
+    for j, dimension in enumerate(AR_DIMENSIONS):
+        attr = f'score_{dimension}'
+        matrix[:, j] = np.fromiter(
+            ((getattr(s, attr, 0.0) or 0.0) for s in scores_list), dtype=np.float64, count=n)
+    return matrix
+
+
+def weighted_scores(matrix: np.ndarray, weights: Dict[str, float]) -> np.ndarray:
+    """
+    Weighted 0-100 score per item
+
+    Summed column by column in AR_DIMENSIONS order so results are
+    bit-identical to the scalar per-item formula.
+    """
+    total = np.zeros(matrix.shape[0], dtype=np.float64)
+    for j, dimension in enumerate(AR_DIMENSIONS):
+        total = total + matrix[:, j] * weights.get(dimension, 0.0)
+    return total * 100.0
+
+
+class MetaColumns:
+    """
+    Per-key views of item metas used by the meta rules
+
+    Attributes:
+        truthy: key -> bool array, meta.get(key) is truthy
+        numeric: key -> float array, float(meta[key]) (NaN when missing
+            or not numeric)
+    """
+
+    def __init__(self, metas: Sequence[Dict[str, Any]], keys: Sequence[str]):
+        n = len(metas)
+        self.truthy: Dict[str, np.ndarray] = {}
+        self.numeric: Dict[str, np.ndarray] = {}
+        for key in keys:
+            values = [meta.get(key) for meta in metas]
+            self.truthy[key] = np.fromiter((bool(v) for v in values), dtype=bool, count=n)
+            self.numeric[key] = np.fromiter((_as_float(v) for v in values), dtype=np.float64, count=n)
+
+
+def _as_float(value: Any) -> float:
+    if value is None:
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+_VECTOR_OPS = {'>=': np.greater_equal, '<=': np.less_equal, '>': np.greater, '<': np.less}
+
+
+def rule_matrix(metas: Sequence[Dict[str, Any]],
+                rubric: CompiledRubric) -> Tuple[np.ndarray, np.ndarray, MetaColumns]:
+    """
+    Evaluate every meta rule against every item
+
+    Mirrors MetaRule.evaluate: a rule triggers on the first of its
+    match_meta keys that is present (truthy) or, for condition rules,
+    whose numeric value satisfies the condition.
+
+    Returns:
+        (hits, key_index, columns): items x rules bool matrix, items x rules
+        index into each rule's match_meta of the triggering key, and the
+        meta columns used to build reasons
+    """
+    rules = rubric.meta_rules
+    keys = sorted({key for rule in rules for key in rule.match_meta})
+    columns = MetaColumns(metas, keys)
+    n = len(metas)
+    hits = np.zeros((n, len(rules)), dtype=bool)
+    key_index = np.zeros((n, len(rules)), dtype=np.intp)
+    for r, rule in enumerate(rules):
+        if rule.op is None:
+            per_key = [columns.truthy[key] for key in rule.match_meta]
+        else:
+            compare = _VECTOR_OPS[rule.op]
+            # NaN (missing or non-numeric) never satisfies a comparison
+            per_key = [compare(columns.numeric[key], rule.threshold) for key in rule.match_meta]
+        stacked = np.vstack(per_key)
+        hits[:, r] = stacked.any(axis=0)
+        key_index[:, r] = stacked.argmax(axis=0)
+    return hits, key_index, columns
+
+
+def rule_deltas(hits: np.ndarray, rubric: CompiledRubric, base: np.ndarray) -> np.ndarray:
+    """
+    `base` with triggered bonuses added and penalties subtracted
+
+    Rules are applied one column at a time in rubric order, the same
+    order as the scalar loop, so floating-point results match exactly.
+    """
+    total = base.copy()
+    for r, rule in enumerate(rubric.meta_rules):
+        if rule.effect == 'bonus':
+            total = total + np.where(hits[:, r], rule.value, 0.0)
+        elif rule.effect == 'penalty':
+            total = total - np.where(hits[:, r], abs(rule.value), 0.0)
+    return total
+
+
+def classify_scores(final: np.ndarray, rubric: CompiledRubric) -> np.ndarray:
+    """Label per item from the rubric's threshold table (first match wins)"""
+    names = np.array([label for _, label in rubric.threshold_table] + ['inauthentic'], dtype=object)
+    codes = np.full(final.shape[0], len(rubric.threshold_table), dtype=np.intp)
+    for k in range(len(rubric.threshold_table) - 1, -1, -1):
+        codes[final >= rubric.threshold_table[k][0]] = k
+    return names[codes]
+
+
+class AuthenticityArrays:
+    """
+    Columnar AR result for a batch of ContentScores
+
+    Attributes:
+        scores: Items x AR_DIMENSIONS score matrix
+        base: Weighted score plus meta-rule adjustments (unclamped)
+        final: base clamped to 0-100
+        labels: Label per item
+        hits: Items x rules trigger matrix
+        key_index: Triggering match_meta key per item and rule
+        metas: Parsed and enriched meta per item
+    """
+
+    def __init__(self, scores_list: Sequence[Any], rubric: Optional[CompiledRubric] = None):
+        self.rubric = rubric or get_rubric()
+        self.scores_list = scores_list
+        self.metas: List[Dict[str, Any]] = []
+        for s in scores_list:
+            try:
+                # Enrich a copy: in-memory metas belong to the item and are uploaded as is
+                self.metas.append(enrich_meta(dict(ScoreMeta.coerce(getattr(s, 'meta', None))), s))
+            except Exception:
+                self.metas.append({})
+        self.scores = score_matrix(scores_list)
+        self.hits, self.key_index, self._columns = rule_matrix(self.metas, self.rubric)
+        self.base = rule_deltas(self.hits, self.rubric, weighted_scores(self.scores, self.rubric.dimension_weights))
+        self.final = np.clip(self.base, 0.0, 100.0)
+        self.labels = classify_scores(self.final, self.rubric)
+
+    def counts(self) -> Dict[str, int]:
+        """Items per label"""
+        return {label: int(np.count_nonzero(self.labels == label)) for label in LABELS}
+
+    def applied_rules(self, i: int) -> List[Dict[str, Any]]:
+        """The rules that triggered for item i, as breakdown dicts"""
+        applied = []
+        for r in np.flatnonzero(self.hits[i]):
+            rule = self.rubric.meta_rules[r]
+            key = rule.match_meta[self.key_index[i, r]]
+            if rule.op is None:
+                reason = f"meta.{key} present"
+            else:
+                reason = f"{key} {float(self._columns.numeric[key][i])} {rule.op} {rule.threshold}"
+            applied.append({
+                "id": rule.id,
+                "effect": rule.effect,
+                "value": rule.value,
+                "reason": reason,
+                "dimension": rule.dimension,
+                "label": rule.label  # Include label for UI display
+            })
+        return applied
+
+    def breakdowns(self) -> List[Dict[str, Any]]:
+        """Per-item breakdown dicts (plain Python values, JSON-serializable)"""
+        # Column lists of Python floats (no per-row containers to allocate)
+        p, r, c, t, v = (self.scores[:, j].tolist() for j in range(len(AR_DIMENSIONS)))
+        base = self.base.tolist()
+        final = self.final.tolist()
+        labels = self.labels.tolist()
+        with_rules = set(np.flatnonzero(self.hits.any(axis=1)).tolist())
+        items = []
+        for i, s in enumerate(self.scores_list):
+            dim_scores = {
+                'provenance': p[i],
+                'resonance': r[i],
+                'coherence': c[i],
+                'transparency': t[i],
+                'verification': v[i],
+            }
+            items.append({
+                'content_id': s.content_id,
+                'source': getattr(s, 'src', ''),
+                'event_ts': getattr(s, 'event_ts', ''),
+                'dimension_scores': dim_scores,
+                'dimensions': dim_scores,  # Alias for compatibility with markdown_generator
+                'base_score': base[i],
+                'applied_rules': self.applied_rules(i) if i in with_rules else [],
+                'final_score': final[i],
+                'label': labels[i],
+                'meta': self.metas[i],
+            })
+        return items
+
+    def apply_labels(self) -> None:
+        """Persist labels to the ContentScores (class_label, is_authentic)"""
+        for s, label in zip(self.scores_list, self.labels.tolist()):
+            try:
+                s.class_label = label
+                s.is_authentic = label == 'authentic'
+            except Exception:
+                pass
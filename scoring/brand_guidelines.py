@@ -0,0 +1,196 @@
+"""
+Brand guidelines cache and retrieval
+Keeps each brand's guidelines loaded once per process, chunked and indexed
+with BM25, so coherence prompts carry only the chunks relevant to an item
+instead of the whole document
+"""
+
+import math
+import re
+import time
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9'\-]*")
+
+# Marks the gaps between non-adjacent excerpts in a prompt
+EXCERPT_SEPARATOR = "\n\n[...]\n\n"
+
+# Words that match nearly every chunk and carry no guideline signal
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in is it its of on or our that the this to was we were will with
+you your not all can do if into more no so than then there these they their them which who what when where how
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords"""
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+
+class GuidelineIndex:
+    """
+    BM25 index over guideline chunks
+
+    Args:
+        chunks: Guideline text chunks
+        k1: BM25 term-frequency saturation
+        b: BM25 length normalization
+    """
+
+    def __init__(self, chunks: List[str], k1: float = 1.5, b: float = 0.75):
+        self.chunks = chunks
+        self.k1 = k1
+        self.b = b
+        self._tfs = [Counter(tokenize(chunk)) for chunk in chunks]
+        self._lengths = [sum(tf.values()) for tf in self._tfs]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        df = Counter(term for tf in self._tfs for term in tf)
+        n = len(chunks)
+        self._idf = {term: math.log(1 + (n - freq + 0.5) / (freq + 0.5)) for term, freq in df.items()}
+
+    def search(self, query: str, k: int = 3) -> List[Tuple[float, int]]:
+        """
+        Top-k chunks for a query
+
+        Returns:
+            (score, chunk index) pairs, best first; chunks without any query
+            term are not returned
+        """
+        terms = [t for t in set(tokenize(query)) if t in self._idf]
+        if not terms or not self.chunks:
+            return []
+        scored = []
+        for i, tf in enumerate(self._tfs):
+            norm = self.k1 * (1 - self.b + self.b * self._lengths[i] / (self._avg_length or 1.0))
+            score = 0.0
+            for term in terms:
+                freq = tf.get(term)
+                if freq:
+                    score += self._idf[term] * freq * (self.k1 + 1) / (freq + norm)
+            if score > 0:
+                scored.append((score, i))
+        scored.sort(key=lambda si: (-si[0], si[1]))
+        return scored[:k]
+
+
+@dataclass
+class BrandGuidelines:
+    """A brand's guidelines text with its chunk index"""
+    brand_id: str
+    text: str
+    index: GuidelineIndex = field(repr=False)
+
+    def relevant_excerpts(self, query: str, k: Optional[int] = None,
+                          max_chars: Optional[int] = None) -> List[str]:
+        """
+        The k guideline chunks most relevant to `query`, in document order
+
+        Chunks are taken best first while their total length (with
+        EXCERPT_SEPARATOR between them) stays within max_chars
+        (SETTINGS['guidelines_max_chars']); the best chunk alone is cut to
+        max_chars. Falls back to the opening chunk when nothing in the
+        query matches, so the prompt still carries the brand's general
+        voice guidance.
+        """
+        if k is None:
+            k = SETTINGS.get('guidelines_top_k', 3)
+        if max_chars is None:
+            max_chars = SETTINGS.get('guidelines_max_chars', 1000)
+        hits = self.index.search(query, k)
+        if not hits:
+            return [chunk[:max_chars] for chunk in self.index.chunks[:1]]
+        picked, used = [], 0
+        for _, i in hits:
+            size = len(self.index.chunks[i]) + (len(EXCERPT_SEPARATOR) if picked else 0)
+            if picked and used + size > max_chars:
+                break
+            picked.append(i)
+            used += size
+        if len(picked) == 1:
+            return [self.index.chunks[picked[0]][:max_chars]]
+        return [self.index.chunks[i] for i in sorted(picked)]
+
+    def excerpt_text(self, query: str) -> str:
+        """relevant_excerpts joined for a prompt"""
+        return EXCERPT_SEPARATOR.join(self.relevant_excerpts(query))
+
+
+# brand_id -> (source signature, loaded at, BrandGuidelines or None)
+_cache: Dict[str, Tuple[Optional[Tuple[int, int]], float, Optional[BrandGuidelines]]] = {}
+_cache_lock = threading.Lock()
+_processor = None
+
+
+def _get_processor():
+    """Shared BrandGuidelinesProcessor (one S3 client per process)"""
+    global _processor
+    if _processor is None:
+        from utils.document_processor import BrandGuidelinesProcessor
+        _processor = BrandGuidelinesProcessor()
+    return _processor
+
+
+def _local_signature(brand_id: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of the brand's locally cached guidelines file"""
+    from utils.document_processor import LOCAL_CACHE_DIR
+    try:
+        st = (LOCAL_CACHE_DIR / brand_id / "guidelines.txt").stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def get_brand_guidelines(brand_id: str) -> Optional[BrandGuidelines]:
+    """
+    Cached, indexed guidelines for a brand (None when it has none)
+
+    Entries are reloaded when the local guidelines file changes (uploads
+    and deletes go through it) and, for brands without guidelines, after
+    SETTINGS['guidelines_cache_ttl'] seconds so uploads from other
+    processes are picked up.
+    """
+    if not brand_id:
+        return None
+    signature = _local_signature(brand_id)
+    cached = _cache.get(brand_id)
+    if cached is not None and cached[0] == signature and (
+            cached[2] is not None or time.monotonic() - cached[1] < SETTINGS.get('guidelines_cache_ttl', 300)):
+        return cached[2]
+
+    with _cache_lock:
+        cached = _cache.get(brand_id)
+        if cached is not None and cached[0] == signature and (
+                cached[2] is not None or time.monotonic() - cached[1] < SETTINGS.get('guidelines_cache_ttl', 300)):
+            return cached[2]
+        guidelines = None
+        try:
+            text = _get_processor().load_guidelines(brand_id)
+        except Exception as e:
+            logger.warning(f"Failed to load brand guidelines for {brand_id}: {e}")
+            text = None
+        if text:
+            from utils.document_processor import chunk_text
+            chunks = chunk_text(text, SETTINGS.get('guidelines_chunk_size', 400),
+                                SETTINGS.get('guidelines_chunk_overlap', 50))
+            guidelines = BrandGuidelines(brand_id, text, GuidelineIndex(chunks))
+            logger.info(f"Indexed brand guidelines for {brand_id}: {len(text)} characters, {len(chunks)} chunks")
+        # Loading from S3 writes the local file, so take the signature afterwards
+        _cache[brand_id] = (_local_signature(brand_id), time.monotonic(), guidelines)
+        return guidelines
+
+
+def invalidate_brand_guidelines(brand_id: Optional[str] = None) -> None:
+    """Drop cached guidelines for one brand (or all brands)"""
+    with _cache_lock:
+        if brand_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(brand_id, None)
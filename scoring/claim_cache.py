@@ -0,0 +1,107 @@
+"""
+Persistent claim verification cache
+Caches claim verdicts (keyed by normalized claim) and Serper evidence
+(keyed by normalized query) so claims repeated across pages and runs skip
+both the search and the verification LLM call
+"""
+
+import os
+import re
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, List, Optional
+
+from config.settings import SETTINGS
+from .llm_cache import LLMResponseCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CLAIM_CACHE_PATH = os.path.join('.cache', 'claims', 'claims.sqlite3')
+
+_NUMBER_WORDS = {
+    'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5',
+    'six': '6', 'seven': '7', 'eight': '8', 'nine': '9', 'ten': '10',
+}
+_THOUSANDS_RE = re.compile(r'(?<=\d),(?=\d{3}\b)')
+_TRAILING_ZERO_RE = re.compile(r'\b(\d+)\.0+\b')
+_PERCENT_RE = re.compile(r'\s*(?:per\s*cent|percent)\b')
+_RANK_RE = re.compile(r'\b(?:no\.?|number)\s*(\d+)\b')
+_PUNCT_RE = re.compile(r'[^\w\s%#$.]')
+
+
+def normalize_claim(claim: str) -> str:
+    """
+    Canonical form of a claim for cache lookups
+
+    Casefolds, collapses whitespace, drops quotes/punctuation and
+    normalizes numbers so "Founded in 1964." and "founded in  1964" (or
+    "No. 1 rated" and "#1 rated", "50 percent" and "50%") share an entry.
+    """
+    text = (claim or '').casefold()
+    text = _THOUSANDS_RE.sub('', text)
+    text = _TRAILING_ZERO_RE.sub(r'\1', text)
+    text = _PERCENT_RE.sub('%', text)
+    text = _RANK_RE.sub(r'#\1', text)
+    text = _PUNCT_RE.sub(' ', text)
+    words = [_NUMBER_WORDS.get(w, w) for w in text.split()]
+    return ' '.join(words).strip(' .')
+
+
+def _key(kind: str, *parts: Any) -> str:
+    payload = '\x1f'.join([kind] + [str(p) for p in parts])
+    return f"{kind}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class ClaimCache(LLMResponseCache):
+    """
+    SQLite cache of claim verdicts and search evidence
+
+    Uses the LLM response cache's storage (WAL, TTL, LRU bound) in its own
+    file; verdicts go stale after SETTINGS['claim_cache_ttl_seconds'].
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None, bypass: Optional[bool] = None):
+        """
+        Initialize cache
+
+        Args:
+            path: SQLite file path (default: SETTINGS['claim_cache_path'])
+            ttl_seconds: Entry lifetime (default: SETTINGS['claim_cache_ttl_seconds'])
+            max_entries: LRU bound (default: SETTINGS['claim_cache_max_entries'])
+            bypass: If True, never read or write the cache
+        """
+        super().__init__(
+            path=path or SETTINGS.get('claim_cache_path') or DEFAULT_CLAIM_CACHE_PATH,
+            ttl_seconds=ttl_seconds if ttl_seconds is not None else SETTINGS.get('claim_cache_ttl_seconds', 0),
+            max_entries=max_entries if max_entries is not None else SETTINGS.get('claim_cache_max_entries', 0),
+            bypass=bypass if bypass is not None else False,
+        )
+
+    def get_verdict(self, claim: str, model: str) -> Optional[Dict[str, Any]]:
+        """Cached verdict for a claim verified with `model`, or None"""
+        return self.get(_key('verdict', model, normalize_claim(claim)))
+
+    def set_verdict(self, claim: str, model: str, verdict: Dict[str, Any]) -> None:
+        self.set(_key('verdict', model, normalize_claim(claim)), verdict)
+
+    def get_search(self, query: str, size: int) -> Optional[List[Dict[str, str]]]:
+        """Cached search results for a query, or None"""
+        return self.get(_key('search', size, normalize_claim(query)))
+
+    def set_search(self, query: str, size: int, results: List[Dict[str, str]]) -> None:
+        self.set(_key('search', size, normalize_claim(query)), results)
+
+
+_shared_cache: Optional[ClaimCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_claim_cache() -> ClaimCache:
+    """Get the process-wide claim cache"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ClaimCache(bypass=not SETTINGS.get('claim_cache_enabled', True))
+        return _shared_cache
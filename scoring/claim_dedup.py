@@ -0,0 +1,156 @@
+"""
+Near-duplicate claim clustering
+Character shingles + MinHash with LSH banding, so near-identical claims
+extracted from different pages are verified once per run
+"""
+
+import re
+import hashlib
+import logging
+from typing import Dict, FrozenSet, List, NamedTuple, Set, Tuple
+
+import numpy as np
+
+from .claim_cache import normalize_claim
+
+logger = logging.getLogger(__name__)
+
+# (a * h + b) mod p permutations; with a, b < p = 2^31 - 1 and 32-bit shingle
+# hashes every intermediate value stays below 2^63, inside uint64
+_PRIME = (1 << 31) - 1
+_MAX_HASH = (1 << 32) - 1
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+# "No. 1" / "no 1" is a rank, not a negation
+_RANK_NO_RE = re.compile(r'\bno\b\.?\s*(?=#?\d)', re.IGNORECASE)
+_NEGATION_RE = re.compile(r"\b(?:not|never|no)\b|n't")
+# Capitalized words: names, places, brands, agencies
+_ENTITY_RE = re.compile(r"(?<![\w'])[A-Z][A-Za-z0-9&'-]*")
+_WORD_RE = re.compile(r"[a-z0-9&'-]+")
+
+
+class ClaimAnchors(NamedTuple):
+    """The parts of a claim that change its meaning without changing much text"""
+    numbers: Tuple[str, ...]
+    negations: Tuple[str, ...]
+    entities: FrozenSet[str]
+    words: FrozenSet[str]
+
+
+def claim_numbers(claim: str) -> Tuple[str, ...]:
+    """Numbers in the normalized claim; claims that differ in a number are different claims"""
+    return tuple(sorted(_NUMBER_RE.findall(normalize_claim(claim))))
+
+
+def claim_anchors(claim: str) -> ClaimAnchors:
+    """Numbers, negations and capitalized (entity) words of a claim, plus its casefolded words"""
+    text = _RANK_NO_RE.sub('#', (claim or '').replace('\u2019', "'"))
+    folded = text.casefold()
+    return ClaimAnchors(
+        numbers=claim_numbers(claim),
+        negations=tuple(sorted(_NEGATION_RE.findall(folded))),
+        entities=frozenset(m.casefold().rstrip("'") for m in _ENTITY_RE.findall(text)),
+        words=frozenset(w.strip("'") for w in _WORD_RE.findall(folded)),
+    )
+
+
+def anchors_match(a: ClaimAnchors, b: ClaimAnchors) -> bool:
+    """
+    True if a verdict on one claim can stand for the other
+
+    Numbers and negations must be identical, and every capitalized word of
+    either claim must appear in the other ("not FDA approved" never matches
+    "FDA approved", "in Europe" never matches "in Asia", "John Smith" never
+    matches "Jane Smith"). A capitalized first word only needs to appear in
+    any case, so "Founded in 1964." still matches "founded in 1964".
+    """
+    return (a.numbers == b.numbers and a.negations == b.negations
+            and a.entities <= b.words and b.entities <= a.words)
+
+
+def same_anchors(claim: str, other: str) -> bool:
+    """anchors_match for two claim texts"""
+    return anchors_match(claim_anchors(claim), claim_anchors(other))
+
+
+def claim_shingles(claim: str, k: int = 4) -> Set[str]:
+    """Character k-grams of the normalized claim (the whole claim if shorter than k)"""
+    text = normalize_claim(claim)
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+class MinHasher:
+    """
+    MinHash signatures over string shingles
+
+    Signatures of two sets agree in each position with probability equal to
+    their Jaccard similarity.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        self.num_perm = num_perm
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingles: Set[str]) -> np.ndarray:
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little') for s in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % np.uint64(_PRIME)
+        return permuted.min(axis=1)
+
+
+def cluster_claims(claims: List[str], threshold: float = 0.6, num_perm: int = 64,
+                   bands: int = 16) -> List[List[int]]:
+    """
+    Group near-duplicate claims
+
+    Each claim joins the first earlier cluster whose representative (its
+    first claim) has an estimated Jaccard similarity (over character
+    4-grams of the normalized text) of at least `threshold` and the same
+    anchors: numbers, negations and capitalized/entity words ("founded in
+    1964" never merges with "founded in 1965", nor "not FDA approved" with
+    "FDA approved"). Otherwise it starts a new cluster. Members are only
+    compared with the representative, never chained through each other.
+    LSH banding limits comparisons to candidate pairs that share at least
+    one band.
+
+    Args:
+        claims: Claim texts
+        threshold: Minimum estimated Jaccard similarity to merge
+        num_perm: MinHash signature length
+        bands: LSH bands (num_perm must be divisible by bands)
+
+    Returns:
+        Clusters as lists of indices into `claims`, in first-seen order
+    """
+    if not claims:
+        return []
+    rows = num_perm // bands
+    hasher = MinHasher(num_perm=num_perm)
+    signatures = [hasher.signature(claim_shingles(c)) for c in claims]
+    anchors = [claim_anchors(c) for c in claims]
+
+    # (band, rows) -> representatives hashed into that bucket
+    buckets: Dict[Tuple[int, bytes], List[int]] = {}
+    clusters: Dict[int, List[int]] = {}
+    for i, sig in enumerate(signatures):
+        keys = [(band, sig[band * rows:(band + 1) * rows].tobytes()) for band in range(bands)]
+        candidates = sorted({rep for key in keys for rep in buckets.get(key, ())})
+        for rep in candidates:
+            if anchors_match(anchors[rep], anchors[i]) and float(np.mean(signatures[rep] == sig)) >= threshold:
+                clusters[rep].append(i)
+                break
+        else:
+            clusters[i] = [i]
+            for key in keys:
+                buckets.setdefault(key, []).append(i)
+
+    result = list(clusters.values())
+    logger.debug(f"Clustered {len(claims)} claims into {len(result)} groups")
+    return result
@@ -0,0 +1,125 @@
+"""
+Deterministic claim pre-detector
+Estimates whether content contains checkable factual claims (numbers,
+dates, percentages, absolute statements, citations) so RAG verification
+can be skipped on claim-free pages without an LLM extraction call
+"""
+
+import re
+import logging
+from typing import Dict, Any, Tuple
+
+from scoring.text_profile import profile_of
+
+logger = logging.getLogger(__name__)
+
+# Currency amounts are prices, not checkable claims (product grids list
+# one per card); they are removed before the signal patterns run
+CURRENCY_RE = re.compile(
+    r'(?:[$€£¥]|\b(?:usd|eur|gbp)\s?)\d[\d,]*(?:\.\d+)?|\b\d[\d,]*(?:\.\d+)?\s?(?:usd|eur|gbp)\b',
+    re.IGNORECASE
+)
+
+# Copyright notices ("© 2024", "Copyright 2019-2024") sit in nearly every
+# footer and say nothing about the content; removed like prices
+COPYRIGHT_RE = re.compile(
+    r'(?:©|\(c\)|\bcopyright\b)\s*(?:©\s*)?(?:\d{4}\s*(?:[-–]\s*\d{2,4})?)?',
+    re.IGNORECASE
+)
+
+PERCENT_RE = re.compile(r'\b\d+(?:\.\d+)?\s?(?:%|percent\b|per cent\b)', re.IGNORECASE)
+STATISTIC_RE = re.compile(
+    r'\b\d[\d,]*(?:\.\d+)?\s?(?:million|billion|trillion|thousand)\b'
+    r'|\b\d{1,3}(?:,\d{3})+\b'
+    r'|\b\d+(?:\.\d+)?\s?(?:times|x)\s+(?:more|less|faster|higher|lower)\b',
+    re.IGNORECASE
+)
+YEAR_RE = re.compile(r'\b(?:1[89]\d{2}|20\d{2})\b')
+DATE_RE = re.compile(
+    r'\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|jun(?:e)?|jul(?:y)?|aug(?:ust)?'
+    r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?\s+\d{1,2}(?:st|nd|rd|th)?\b'
+    r'|\b\d{1,2}/\d{1,2}/\d{2,4}\b',
+    re.IGNORECASE
+)
+SUPERLATIVE_RE = re.compile(
+    r"\b(?:first|only|largest|biggest|leading|fastest|oldest|number one|no\. ?1|world'?s most"
+    r"|best[- ]selling|award[- ]winning|most (?:trusted|popular|widely))\b|#1\b",
+    re.IGNORECASE
+)
+CITATION_RE = re.compile(
+    r'\b(?:according to|study|studies|survey|research(?:ers)?|report(?:ed|s)?|found that'
+    r'|data (?:from|shows?)|published (?:in|by)|peer[- ]reviewed|certified by|cited)\b',
+    re.IGNORECASE
+)
+
+# Weight each signal contributes per match; the likelihood is their sum
+# capped at 1.0. At the default 0.3 threshold one strong signal (citation,
+# percentage, statistic) is enough to verify, while weak signals (a year,
+# a date, "first"/"only") need three matches: one on its own is routine in
+# navigation, calls to action and short reviews
+SIGNAL_WEIGHTS = {
+    'citations': 0.5,
+    'percentages': 0.4,
+    'statistics': 0.4,
+    'dates': 0.12,
+    'years': 0.12,
+    'superlatives': 0.12,
+}
+
+SIGNAL_PATTERNS = {
+    'citations': CITATION_RE,
+    'percentages': PERCENT_RE,
+    'statistics': STATISTIC_RE,
+    'dates': DATE_RE,
+    'years': YEAR_RE,
+    'superlatives': SUPERLATIVE_RE,
+}
+
+# Same window VerificationManager._extract_claims sends to the LLM
+MAX_CHARS = 3000
+
+
+def claim_likelihood(text: str) -> Tuple[float, Dict[str, int]]:
+    """
+    Estimate how likely text contains checkable factual claims
+
+    Args:
+        text: Content body
+
+    Returns:
+        Tuple of (likelihood in 0.0-1.0, match count per signal)
+    """
+    if not text:
+        return 0.0, {name: 0 for name in SIGNAL_PATTERNS}
+
+    sample = COPYRIGHT_RE.sub(' ', CURRENCY_RE.sub(' ', text[:MAX_CHARS]))
+    signals = {name: len(pattern.findall(sample)) for name, pattern in SIGNAL_PATTERNS.items()}
+    likelihood = min(1.0, sum(SIGNAL_WEIGHTS[name] * count for name, count in signals.items()))
+    return likelihood, signals
+
+
+def should_verify(content: Any, threshold: float = 0.3) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Decide whether content is worth RAG verification
+
+    Args:
+        content: Content item with a body
+        threshold: Minimum claim likelihood to verify
+
+    Returns:
+        Tuple of (verify, debug info with likelihood, threshold and signals)
+    """
+    # Run-level verification and the scorer both ask; score the body once
+    memo = profile_of(content).memo
+    if 'claim_likelihood' not in memo:
+        memo['claim_likelihood'] = claim_likelihood(getattr(content, 'body', '') or '')
+    likelihood, signals = memo['claim_likelihood']
+    verify = likelihood >= threshold
+    if not verify:
+        logger.debug(f"No checkable claims detected for {getattr(content, 'content_id', '?')} "
+                     f"(likelihood {likelihood:.2f} < {threshold:.2f})")
+    return verify, {
+        'claim_likelihood': round(likelihood, 3),
+        'threshold': threshold,
+        'signals': {name: count for name, count in signals.items() if count},
+    }
@@ -12,16 +12,25 @@ This classifier is kept for:
 New implementations should use TrustStackRating model with rating bands instead.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 import logging
 import json
 import warnings
 
+import numpy as np
+
 from config.settings import SETTINGS
-from data.models import ContentScores, ContentClass, RatingBand
+from data.models import ContentScores, ContentClass, RatingBand, ScoresBatch
 
 logger = logging.getLogger(__name__)
 
+# Column order of ScoreMatrix arrays (and of the classifier's weighted sum)
+DIMENSIONS = ("provenance", "verification", "transparency", "coherence", "resonance")
+# ContentScores.overall_score sums in this order; rating bands follow it exactly
+_OVERALL_ORDER = ("provenance", "resonance", "coherence", "transparency", "verification")
+# Rating bands from lowest to highest (np.digitize bin order)
+BAND_ORDER = (RatingBand.POOR, RatingBand.FAIR, RatingBand.GOOD, RatingBand.EXCELLENT)
+
 # Issue deprecation warning
 warnings.warn(
     "ContentClassifier is deprecated in Trust Stack v2.0. "
@@ -31,6 +40,134 @@ warnings.warn(
     stacklevel=2
 )
 
+class ScoreMatrix:
+    """
+    Dimension scores of many ContentScores as one items x DIMENSIONS array
+
+    Batch analytics (averages, correlation matrix, rating band histogram,
+    classification confidence) are array operations on the matrix, so
+    dashboards over large score histories can also build one straight
+    from query results with ScoreMatrix(matrix, labels).
+
+    Args:
+        matrix: Items x DIMENSIONS scores (0.0-1.0)
+        labels: Optional class_label per item
+    """
+
+    def __init__(self, matrix: np.ndarray, labels: Optional[Sequence[str]] = None):
+        self.matrix = np.asarray(matrix, dtype=np.float64).reshape(-1, len(DIMENSIONS))
+        self.labels = np.asarray(labels, dtype=object) if labels is not None else None
+
+    @classmethod
+    def from_scores(cls, scores_list: Sequence[ContentScores]) -> 'ScoreMatrix':
+        """Matrix from ContentScores (one attribute read per item and dimension)"""
+        if isinstance(scores_list, ScoresBatch):
+            # Already columnar: copy the score arrays without materializing items
+            return cls(scores_list.matrix(DIMENSIONS), list(scores_list.column('class_label')))
+        n = len(scores_list)
+        matrix = np.empty((n, len(DIMENSIONS)), dtype=np.float64)
+        for j, dimension in enumerate(DIMENSIONS):
+            attr = f"score_{dimension}"
+            matrix[:, j] = np.fromiter((getattr(s, attr) for s in scores_list), dtype=np.float64, count=n)
+        return cls(matrix, [s.class_label for s in scores_list])
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    def _weighted(self, weights: Any, order: Sequence[str]) -> np.ndarray:
+        # Column by column in `order`, matching the scalar formulas bit for bit
+        total = np.zeros(len(self), dtype=np.float64)
+        for dimension in order:
+            total = total + self.matrix[:, DIMENSIONS.index(dimension)] * getattr(weights, dimension)
+        return total
+
+    def overall_scores(self, weights: Any = None) -> np.ndarray:
+        """Weighted overall score per item (0.0-1.0), as ContentClassifier computes it"""
+        return self._weighted(weights or SETTINGS['scoring_weights'], DIMENSIONS)
+
+    def comprehensive_ratings(self, weights: Any = None) -> np.ndarray:
+        """ContentScores.rating_comprehensive per item (0-100)"""
+        return self._weighted(weights or SETTINGS['scoring_weights'], _OVERALL_ORDER) * 100
+
+    def mask(self, label: str) -> np.ndarray:
+        """Items whose class_label is `label`"""
+        if self.labels is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.labels == label
+
+    def averages(self, mask: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """Mean score per dimension ({} when no item is selected)"""
+        matrix = self.matrix if mask is None else self.matrix[mask]
+        if not len(matrix):
+            return {}
+        return dict(zip(DIMENSIONS, matrix.mean(axis=0).tolist()))
+
+    def correlation_matrix(self) -> np.ndarray:
+        """
+        DIMENSIONS x DIMENSIONS Pearson correlation matrix
+
+        Pairs involving a constant dimension are 0.0 (as in
+        ContentClassifier._calculate_correlation); fewer than two items
+        give all zeros.
+        """
+        k = len(DIMENSIONS)
+        if len(self) < 2:
+            return np.zeros((k, k))
+        centered = self.matrix - self.matrix.mean(axis=0)
+        cov = centered.T @ centered
+        std = np.sqrt(np.diag(cov))
+        denom = np.outer(std, std)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.where(denom > 0, cov / denom, 0.0)
+        return np.clip(corr, -1.0, 1.0)
+
+    def correlations(self) -> Dict[str, float]:
+        """Correlation per dimension pair, keyed '<dim1>_<dim2>' in DIMENSIONS order"""
+        if len(self) < 2:
+            return {}
+        corr = self.correlation_matrix()
+        return {
+            f"{DIMENSIONS[i]}_{DIMENSIONS[j]}": float(corr[i, j])
+            for i in range(len(DIMENSIONS)) for j in range(i + 1, len(DIMENSIONS))
+        }
+
+    def band_indices(self, weights: Any = None) -> np.ndarray:
+        """Index into BAND_ORDER per item, from SETTINGS['rating_bands']"""
+        bands = SETTINGS['rating_bands']
+        edges = [bands['fair'], bands['good'], bands['excellent']]
+        ratings = self.comprehensive_ratings(weights)
+        # NaN ratings fail every threshold, like ContentScores.rating_band
+        return np.digitize(np.nan_to_num(ratings, nan=-np.inf), edges)
+
+    def band_histogram(self, weights: Any = None) -> Dict[RatingBand, int]:
+        """Item count per rating band"""
+        counts = np.bincount(self.band_indices(weights), minlength=len(BAND_ORDER))
+        return {band: int(counts[i]) for i, band in enumerate(BAND_ORDER)}
+
+    def classification_confidence(self, min_authentic: float, suspect: float,
+                                  weights: Any = None) -> Dict[str, np.ndarray]:
+        """
+        ContentClassifier.get_classification_confidence for every item
+
+        Returns:
+            Dictionary with a confidence vector for each class
+        """
+        overall = self.overall_scores(weights)
+        authentic = np.maximum(0, overall - min_authentic) / (1.0 - min_authentic)
+        suspect_upper = np.minimum(1, (min_authentic - overall) / (min_authentic - suspect))
+        suspect_lower = np.maximum(0, (overall - suspect) / (min_authentic - suspect))
+        suspect_conf = np.minimum(suspect_upper, suspect_lower)
+        inauthentic = np.maximum(0, suspect - overall) / suspect
+
+        total = authentic + suspect_conf + inauthentic
+        scale = np.where(total > 0, total, 1.0)
+        return {
+            "authentic": authentic / scale,
+            "suspect": suspect_conf / scale,
+            "inauthentic": inauthentic / scale,
+        }
+
+
 class ContentClassifier:
     """
     DEPRECATED: Classifies content based on 5D scores
@@ -174,23 +311,22 @@ class ContentClassifier:
         if not scores_list:
             return {}
         
-        # Group by classification
-        authentic_scores = [s for s in scores_list if s.class_label == ContentClass.AUTHENTIC.value]
-        suspect_scores = [s for s in scores_list if s.class_label == ContentClass.SUSPECT.value]
-        inauthentic_scores = [s for s in scores_list if s.class_label == ContentClass.INAUTHENTIC.value]
+        # One matrix for every statistic; groups are boolean masks over it
+        matrix = ScoreMatrix.from_scores(scores_list)
+        masks = {label.value: matrix.mask(label.value) for label in ContentClass}
         
         analysis = {
             "dimension_averages": {
-                "all": self._get_dimension_averages(scores_list),
-                "authentic": self._get_dimension_averages(authentic_scores) if authentic_scores else {},
-                "suspect": self._get_dimension_averages(suspect_scores) if suspect_scores else {},
-                "inauthentic": self._get_dimension_averages(inauthentic_scores) if inauthentic_scores else {}
+                "all": matrix.averages(),
+                "authentic": matrix.averages(masks[ContentClass.AUTHENTIC.value]),
+                "suspect": matrix.averages(masks[ContentClass.SUSPECT.value]),
+                "inauthentic": matrix.averages(masks[ContentClass.INAUTHENTIC.value])
             },
-            "dimension_correlations": self._get_dimension_correlations(scores_list),
+            "dimension_correlations": matrix.correlations(),
             "classification_distribution": {
-                "authentic": len(authentic_scores),
-                "suspect": len(suspect_scores),
-                "inauthentic": len(inauthentic_scores)
+                "authentic": int(masks[ContentClass.AUTHENTIC.value].sum()),
+                "suspect": int(masks[ContentClass.SUSPECT.value].sum()),
+                "inauthentic": int(masks[ContentClass.INAUTHENTIC.value].sum())
             }
         }
         
@@ -201,32 +337,11 @@ class ContentClassifier:
         if not scores_list:
             return {}
         
-        return {
-            "provenance": sum(s.score_provenance for s in scores_list) / len(scores_list),
-            "verification": sum(s.score_verification for s in scores_list) / len(scores_list),
-            "transparency": sum(s.score_transparency for s in scores_list) / len(scores_list),
-            "coherence": sum(s.score_coherence for s in scores_list) / len(scores_list),
-            "resonance": sum(s.score_resonance for s in scores_list) / len(scores_list)
-        }
+        return ScoreMatrix.from_scores(scores_list).averages()
     
     def _get_dimension_correlations(self, scores_list: List[ContentScores]) -> Dict[str, float]:
         """Calculate correlations between dimensions"""
-        if len(scores_list) < 2:
-            return {}
-        
-        # Simple correlation calculation (in production, use numpy/scipy)
-        dimensions = ["provenance", "verification", "transparency", "coherence", "resonance"]
-        correlations = {}
-        
-        for i, dim1 in enumerate(dimensions):
-            for dim2 in dimensions[i+1:]:
-                corr = self._calculate_correlation(
-                    [getattr(s, f"score_{dim1}") for s in scores_list],
-                    [getattr(s, f"score_{dim2}") for s in scores_list]
-                )
-                correlations[f"{dim1}_{dim2}"] = corr
-        
-        return correlations
+        return ScoreMatrix.from_scores(scores_list).correlations()
     
     def _calculate_correlation(self, x: List[float], y: List[float]) -> float:
         """Calculate simple correlation coefficient"""
@@ -272,18 +387,21 @@ class ContentClassifier:
         Returns:
             Dictionary with count for each rating band
         """
-        distribution = {
-            RatingBand.EXCELLENT: 0,
-            RatingBand.GOOD: 0,
-            RatingBand.FAIR: 0,
-            RatingBand.POOR: 0
-        }
+        histogram = ScoreMatrix.from_scores(scores_list).band_histogram()
+        return {band: histogram[band] for band in reversed(BAND_ORDER)}
 
-        for scores in scores_list:
-            band = self.get_rating_band(scores)
-            distribution[band] += 1
+    def batch_classification_confidence(self, scores_list: List[ContentScores]) -> Dict[str, np.ndarray]:
+        """
+        Confidence vectors for each classification over a batch
+
+        Args:
+            scores_list: List of ContentScores
 
-        return distribution
+        Returns:
+            Dictionary with a confidence array (one value per item) for each class
+        """
+        return ScoreMatrix.from_scores(scores_list).classification_confidence(
+            self.min_authentic_threshold, self.suspect_threshold, self.scoring_weights)
 
     def log_rating_band_summary(self, scores_list: List[ContentScores]) -> None:
         """
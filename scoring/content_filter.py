@@ -4,7 +4,9 @@ Content quality filter to detect and skip error pages, login walls, and invalid
 
 import logging
 import re
-from typing import Optional
+from typing import Any, Optional
+
+from scoring.text_profile import TextProfile, profile_of
 
 logger = logging.getLogger(__name__)
 
@@ -39,19 +41,23 @@ LOGIN_INDICATORS = {
 MIN_CONTENT_LENGTH = 100
 
 
-def is_error_page(title: str, body: str) -> bool:
+def is_error_page(title: str, body: str, profile: Optional[TextProfile] = None) -> bool:
     """
     Check if content appears to be an error page
     
     Args:
         title: Page title
         body: Page body text
+        profile: TextProfile of the same title/body (reuses its lowercased text)
     
     Returns:
         True if content is an error page
     """
-    title_lower = title.lower().strip() if title else ""
-    body_lower = body.lower() if body else ""
+    if profile is not None:
+        title_lower, body_lower = profile.title_lower.strip(), profile.body_lower
+    else:
+        title_lower = title.lower().strip() if title else ""
+        body_lower = body[:500].lower() if body else ""
     
     # Check title against error indicators
     if title_lower in ERROR_TITLES:
@@ -73,19 +79,23 @@ def is_error_page(title: str, body: str) -> bool:
     return False
 
 
-def is_login_wall(title: str, body: str) -> bool:
+def is_login_wall(title: str, body: str, profile: Optional[TextProfile] = None) -> bool:
     """
     Check if content appears to be a login/authentication page
     
     Args:
         title: Page title
         body: Page body text
+        profile: TextProfile of the same title/body (reuses its lowercased text)
     
     Returns:
         True if content is a login wall
     """
-    title_lower = title.lower().strip() if title else ""
-    body_lower = body.lower() if body else ""
+    if profile is not None:
+        title_lower, body_lower = profile.title_lower.strip(), profile.body_lower
+    else:
+        title_lower = title.lower().strip() if title else ""
+        body_lower = body[:1000].lower() if body else ""
     
     # AGGRESSIVE: Check title alone first
     if title_lower in LOGIN_INDICATORS:
@@ -142,7 +152,8 @@ def is_insufficient_content(title: str, body: str) -> bool:
     return False
 
 
-def should_skip_content(title: str, body: str, url: str = None) -> Optional[str]:
+def should_skip_content(title: str, body: str, url: str = None,
+                        profile: Optional[TextProfile] = None) -> Optional[str]:
     """
     Determine if content should be skipped from scoring
     
@@ -150,17 +161,43 @@ def should_skip_content(title: str, body: str, url: str = None) -> Optional[str]
         title: Page title
         body: Page body text
         url: Optional URL for logging
+        profile: TextProfile of the same title/body (reuses its lowercased text)
     
     Returns:
         Reason string if content should be skipped, None otherwise
     """
-    if is_error_page(title, body):
+    if is_error_page(title, body, profile):
         return "error_page"
     
-    if is_login_wall(title, body):
+    if is_login_wall(title, body, profile):
         return "login_wall"
     
     if is_insufficient_content(title, body):
         return "insufficient_content"
     
     return None
+
+
+def content_skip_reason(content: Any) -> Optional[str]:
+    """
+    should_skip_content for a content item, computed once per item
+
+    The pipeline pre-filter, run-level verification and the scorer all ask;
+    the answer is memoized on the item's TextProfile, which is rebuilt (and
+    the answer recomputed) if the title or body changes.
+
+    Args:
+        content: NormalizedContent (or anything with title/body/url)
+
+    Returns:
+        Reason string if content should be skipped, None otherwise
+    """
+    profile = profile_of(content)
+    if 'skip_reason' not in profile.memo:
+        profile.memo['skip_reason'] = should_skip_content(
+            title=getattr(content, 'title', ''),
+            body=getattr(content, 'body', ''),
+            url=getattr(content, 'url', ''),
+            profile=profile
+        )
+    return profile.memo['skip_reason']
@@ -6,10 +6,15 @@ Handles deterministic analysis of content using textstat and regex.
 import logging
 import re
 import textstat
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from scoring.text_profile import TextProfile
 
 logger = logging.getLogger(__name__)
 
+# 'to be' verb followed by a past participle (ed/en)
+PASSIVE_RE = re.compile(r'\b(am|is|are|was|were|be|been|being)\s+(\w+ed|\w+en)\b', re.IGNORECASE)
+
 class LinguisticAnalyzer:
     """
     Analyzes text for objective linguistic features:
@@ -18,12 +23,19 @@ class LinguisticAnalyzer:
     - Absolutist/weak language
     """
     
-    def analyze(self, text: str) -> Dict[str, Any]:
-        """Run all analyses on text."""
+    def analyze(self, text: str, profile: Optional[TextProfile] = None) -> Dict[str, Any]:
+        """
+        Run all analyses on text.
+
+        Args:
+            text: Text to analyze
+            profile: TextProfile whose body is `text`; its cached sentences,
+                lowercased text and readability are reused
+        """
         return {
-            "readability": self._analyze_readability(text),
-            "passive_voice": self._check_passive_voice(text),
-            "weak_words": self._check_weak_words(text)
+            "readability": profile.readability if profile is not None else self._analyze_readability(text),
+            "passive_voice": self._check_passive_voice(text, profile),
+            "weak_words": self._check_weak_words(text, profile)
         }
 
     def _analyze_readability(self, text: str) -> Dict[str, float]:
@@ -38,31 +50,30 @@ class LinguisticAnalyzer:
             logger.warning(f"Readability analysis failed: {e}")
             return {}
 
-    def _check_passive_voice(self, text: str) -> List[str]:
+    def _check_passive_voice(self, text: str, profile: Optional[TextProfile] = None) -> List[str]:
         """
         Detect passive voice using regex heuristics.
         Matches 'to be' verbs + past participle (ed/en).
         Returns list of matching sentences/fragments.
         """
-        passive_pattern = r'\b(am|is|are|was|were|be|been|being)\s+(\w+ed|\w+en)\b'
         matches = []
         
         # Split into sentences (rough approximation)
-        sentences = re.split(r'[.!?]+', text)
+        sentences = profile.clauses if profile is not None else [
+            s.strip() for s in re.split(r'[.!?]+', text) if s.strip()
+        ]
         
         for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-                
-            if re.search(passive_pattern, sentence, re.IGNORECASE):
+            if PASSIVE_RE.search(sentence):
                 # Verify it's not just an adjective (simple check)
                 # This is imperfect without a full parser, but good for a heuristic
                 matches.append(sentence)
+                if len(matches) == 5:
+                    break
                 
-        return matches[:5]  # Return top 5 examples
+        return matches  # Return top 5 examples
 
-    def _check_weak_words(self, text: str) -> List[str]:
+    def _check_weak_words(self, text: str, profile: Optional[TextProfile] = None) -> List[str]:
         """Check for weak or absolutist words that undermine credibility."""
         weak_words = [
             "maybe", "perhaps", "sort of", "kind of", "basically",
@@ -70,7 +81,7 @@ class LinguisticAnalyzer:
         ]
         
         found = []
-        lower_text = text.lower()
+        lower_text = profile.body_lower if profile is not None else text.lower()
         for word in weak_words:
             if f" {word} " in lower_text:
                 found.append(word)
@@ -3,12 +3,13 @@ Link verifier for validating LLM-reported broken links
 Checks actual HTTP status codes to prevent hallucinations
 """
 
-import re
 import logging
-from typing import List, Set
+from typing import Iterable, List, Optional, Set
 import requests
 from urllib.parse import urljoin, urlparse
 
+from scoring.text_profile import URL_RE
+
 logger = logging.getLogger(__name__)
 
 # Timeout for HTTP requests (seconds)
@@ -25,11 +26,7 @@ def extract_urls(text: str) -> Set[str]:
     Returns:
         Set of unique URLs found in text
     """
-    # Regex pattern for URLs
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    
-    urls = set(re.findall(url_pattern, text))
-    return urls
+    return set(URL_RE.findall(text))
 
 
 def check_link_status(url: str) -> dict:
@@ -71,18 +68,20 @@ def check_link_status(url: str) -> dict:
         }
 
 
-def verify_broken_links(content_text: str, content_url: str = None) -> List[dict]:
+def verify_broken_links(content_text: str, content_url: str = None,
+                        urls: Optional[Iterable[str]] = None) -> List[dict]:
     """
     Verify which links in content are actually broken
     
     Args:
         content_text: Text content to check for links
         content_url: Base URL for resolving relative links (optional)
+        urls: URLs already extracted from content_text (e.g. TextProfile.urls)
     
     Returns:
         List of broken link dicts with url, status_code, error
     """
-    urls = extract_urls(content_text)
+    urls = set(urls) if urls is not None else extract_urls(content_text)
     
     if not urls:
         logger.debug("No URLs found in content")
@@ -51,12 +51,19 @@ class LLMClient:
         if self.api_key:
             openai.api_key = self.api_key
 
+        from scoring.rate_limiter import call_with_rate_limit, estimate_tokens
+
         # Use ChatCompletion for gpt-3.5-turbo
-        resp = openai.ChatCompletion.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.0,
-            max_tokens=400
+        messages = [{"role": "user", "content": prompt}]
+        resp = call_with_rate_limit(
+            'openai', self.model,
+            lambda: openai.ChatCompletion.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.0,
+                max_tokens=400
+            ),
+            estimated_tokens=estimate_tokens(messages, 400)
         )
         text = resp['choices'][0]['message']['content']
         # Try to parse JSON from response
@@ -0,0 +1,224 @@
+"""
+Persistent LLM response cache
+Content-addressed SQLite store shared by LLMScoringClient and ChatClient
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional, List
+
+from config.settings import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join('.cache', 'llm', 'responses.sqlite3')
+
+
+def make_cache_key(provider: str, model: str, messages: List[Dict[str, Any]],
+                   temperature: Optional[float] = None,
+                   response_format: Optional[Dict[str, Any]] = None,
+                   rubric_version: Optional[str] = None,
+                   **extra: Any) -> str:
+    """
+    Build a content-addressed key for an LLM request
+
+    Args:
+        provider: Provider name (openai, anthropic, ...)
+        model: Model name
+        messages: Chat messages sent to the model
+        temperature: Sampling temperature
+        response_format: Structured output format, if any
+        rubric_version: Rubric version the prompt was built for
+        **extra: Any other request parameters that change the response
+
+    Returns:
+        SHA-256 hex digest of the canonical request
+    """
+    payload = {
+        'provider': provider,
+        'model': model,
+        'messages': messages,
+        'temperature': temperature,
+        'response_format': response_format,
+        'rubric_version': rubric_version,
+        'extra': extra,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    On-disk LLM response cache backed by SQLite in WAL mode
+
+    Entries expire after a TTL and the store is kept under max_entries by
+    evicting the least recently used rows. Safe to share across threads;
+    each thread gets its own connection.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None, bypass: Optional[bool] = None):
+        """
+        Initialize cache
+
+        Args:
+            path: SQLite file path (default: SETTINGS['llm_cache_path'])
+            ttl_seconds: Entry lifetime; 0 or None disables expiry
+            max_entries: LRU bound on stored entries; 0 or None disables eviction
+            bypass: If True, never read or write the cache
+        """
+        self.path = path or SETTINGS.get('llm_cache_path') or DEFAULT_CACHE_PATH
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else SETTINGS.get('llm_cache_ttl_seconds', 0)
+        self.max_entries = max_entries if max_entries is not None else SETTINGS.get('llm_cache_max_entries', 0)
+        self.bypass = bypass if bypass is not None else bool(SETTINGS.get('llm_cache_bypass', False))
+
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0, 'errors': 0}
+
+        if not self.bypass:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                conn = self._connect()
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    " key TEXT PRIMARY KEY,"
+                    " value TEXT NOT NULL,"
+                    " created_at REAL NOT NULL,"
+                    " last_access REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses(last_access)")
+                conn.commit()
+            except Exception as e:
+                logger.warning(f"LLM cache unavailable at {self.path}, bypassing: {e}")
+                self.bypass = True
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, stat: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[stat] += n
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response
+
+        Returns:
+            The cached value, or None on miss, expiry or bypass
+        """
+        if self.bypass:
+            return None
+
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT value, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            now = time.time()
+            if row is None:
+                self._count('misses')
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                self._count('misses')
+                return None
+
+            conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self._count('hits')
+            return json.loads(value)
+        except Exception as e:
+            logger.debug(f"LLM cache read failed: {e}")
+            self._count('errors')
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable response"""
+        if self.bypass:
+            return
+
+        try:
+            serialized = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError):
+            # Non-serializable responses (e.g. mocks) are simply not cached
+            return
+
+        try:
+            conn = self._connect()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, serialized, now, now)
+            )
+            evicted = self._evict(conn)
+            conn.commit()
+            self._count('writes')
+            if evicted:
+                self._count('evictions', evicted)
+        except Exception as e:
+            logger.debug(f"LLM cache write failed: {e}")
+            self._count('errors')
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Drop expired rows and least recently used rows above max_entries"""
+        evicted = 0
+        if self.ttl_seconds:
+            cur = conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            evicted += max(0, cur.rowcount)
+        if self.max_entries:
+            (count,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                cur = conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,)
+                )
+                evicted += max(0, cur.rowcount)
+        return evicted
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        if self.bypass:
+            return
+        conn = self._connect()
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for this process"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the process-wide LLM response cache"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            bypass = True if not SETTINGS.get('llm_cache_enabled', True) else None
+            _shared_cache = LLMResponseCache(bypass=bypass)
+        return _shared_cache
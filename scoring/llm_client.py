@@ -33,27 +33,40 @@ Example usage:
     )
 
     summary = response.get('content')
+
+    # Async: one event loop, pooled provider connections
+    responses = await client.achat_many(
+        [{'messages': [{'role': 'user', 'content': text}], 'max_tokens': 150} for text in texts],
+        concurrency=20
+    )
 """
 
 import os
+import time
+import asyncio
 import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Dict, Any, List, Optional
 from enum import Enum
 
 # Import OpenAI
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
     from openai import OpenAIError
 except Exception:
     OpenAI = None
+    AsyncOpenAI = None
     OpenAIError = Exception
 
 # Import Anthropic
 try:
-    from anthropic import Anthropic
+    from anthropic import Anthropic, AsyncAnthropic
     from anthropic import AnthropicError
 except Exception:
     Anthropic = None
+    AsyncAnthropic = None
     AnthropicError = Exception
 
 # Import Google Gemini
@@ -66,6 +79,11 @@ except Exception:
     GenerationConfig = None
     GOOGLE_AVAILABLE = False
 
+from config.settings import SETTINGS
+from scoring.llm_cache import LLMResponseCache, get_llm_cache, make_cache_key
+from scoring.rate_limiter import call_with_rate_limit, acall_with_rate_limit, estimate_tokens
+from scoring import llm_resilience
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +95,43 @@ class LLMProvider(Enum):
     DEEPSEEK = "deepseek"
 
 
+# Long-lived async provider clients, one per provider/API key per event loop.
+# Each client owns an HTTP connection pool that every achat call on that loop
+# reuses. Keyed weakly by loop so clients from finished loops are dropped.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]" = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+# Bounded pool shared by every hedged request, created on first use
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    """Process-wide executor that runs hedged requests and their duplicates"""
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=max(2, int(SETTINGS.get('llm_hedge_max_workers', 32))),
+                thread_name_prefix='llm-hedge'
+            )
+        return _hedge_executor
+
+
+async def aclose_async_clients() -> None:
+    """Close the pooled async provider clients bound to the running event loop"""
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        clients = _async_clients.pop(loop, {})
+    for client in clients.values():
+        close = getattr(client, 'close', None)
+        if close is not None:
+            try:
+                await close()
+            except Exception as e:
+                logger.debug(f"Error closing async LLM client: {e}")
+
+
 class ChatClient:
     """
     Multi-provider chat client for LLM text generation.
@@ -96,6 +151,12 @@ class ChatClient:
         - GOOGLE_API_KEY: Google Gemini API key
         - DEEPSEEK_API_KEY: DeepSeek API key
 
+    Tail latency:
+        With SETTINGS['llm_hedging_enabled'], a request that has not answered
+        by the provider's observed p90 latency is duplicated and the first
+        valid response wins. A 5xx from a provider fails over to the
+        equivalent models in SETTINGS['llm_equivalent_models'].
+
     Raises:
         ImportError: If required package is not installed for the provider
         ValueError: If API key is not configured for the provider
@@ -115,7 +176,8 @@ class ChatClient:
         default_model: str = 'gpt-3.5-turbo',
         anthropic_api_key: Optional[str] = None,
         google_api_key: Optional[str] = None,
-        deepseek_api_key: Optional[str] = None
+        deepseek_api_key: Optional[str] = None,
+        cache: Optional[LLMResponseCache] = None
     ):
         """
         Initialize ChatClient with API credentials.
@@ -126,6 +188,7 @@ class ChatClient:
             anthropic_api_key: Anthropic API key (optional, will use ANTHROPIC_API_KEY env var)
             google_api_key: Google API key (optional, will use GOOGLE_API_KEY env var)
             deepseek_api_key: DeepSeek API key (optional, will use DEEPSEEK_API_KEY env var)
+            cache: Response cache (optional, defaults to the shared process-wide cache)
 
         Raises:
             ValueError: If API key is not configured for the default provider
@@ -137,6 +200,7 @@ class ChatClient:
         self.anthropic_client = None
         self.google_client_initialized = False
         self.deepseek_client = None
+        self.cache = cache if cache is not None else get_llm_cache()
 
         # Store API keys
         self.openai_api_key = api_key or os.environ.get('OPENAI_API_KEY')
@@ -221,22 +285,263 @@ class ChatClient:
             )
         return self.deepseek_client
 
+    def _get_async_client(self, provider: LLMProvider) -> Any:
+        """
+        Get the pooled async client for a provider on the running event loop
+
+        Clients are shared across ChatClient instances, so every achat call on
+        the loop reuses the same HTTP connection pool.
+        """
+        if provider == LLMProvider.OPENAI:
+            api_key, factory, package = self.openai_api_key, AsyncOpenAI, 'openai'
+            kwargs = {}
+        elif provider == LLMProvider.ANTHROPIC:
+            api_key, factory, package = self.anthropic_api_key, AsyncAnthropic, 'anthropic'
+            kwargs = {}
+        elif provider == LLMProvider.DEEPSEEK:
+            # DeepSeek uses OpenAI-compatible API
+            api_key, factory, package = self.deepseek_api_key, AsyncOpenAI, 'openai'
+            kwargs = {'base_url': "https://api.deepseek.com"}
+        else:
+            raise ValueError(f"No pooled async client for provider: {provider}")
+
+        if not api_key:
+            raise ValueError(f"{provider.value} API key not configured")
+        if factory is None:
+            raise ImportError(f"{package} package not installed. Install with: pip install {package}")
+
+        loop = asyncio.get_running_loop()
+        key = (provider, api_key)
+        with _async_clients_lock:
+            clients = _async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = factory(api_key=api_key, **kwargs)
+                clients[key] = client
+        return client
+
+    def _cache_key(self, provider: LLMProvider, model: str, messages: List[Dict[str, str]],
+                   max_tokens: int, temperature: float, kwargs: Dict[str, Any]) -> str:
+        """Response cache key for a chat request"""
+        extra = {k: v for k, v in kwargs.items() if k != 'response_format'}
+        return make_cache_key(provider.value, model, messages, temperature,
+                              kwargs.get('response_format'), SETTINGS.get('rubric_version'),
+                              max_tokens=max_tokens, **extra)
+
+    def _provider_available(self, provider: LLMProvider) -> bool:
+        """Check whether a provider has credentials and its SDK installed"""
+        if provider == LLMProvider.OPENAI:
+            return bool(self.openai_api_key) and OpenAI is not None
+        if provider == LLMProvider.ANTHROPIC:
+            return bool(self.anthropic_api_key) and Anthropic is not None
+        if provider == LLMProvider.GOOGLE:
+            return bool(self.google_api_key) and GOOGLE_AVAILABLE
+        if provider == LLMProvider.DEEPSEEK:
+            return bool(self.deepseek_api_key) and OpenAI is not None
+        return False
+
+    def _alternate_models(self, model: str, **kwargs) -> List[str]:
+        """
+        Equivalent models on other configured providers (SETTINGS['llm_equivalent_models'])
+
+        Provider-specific kwargs (e.g. response_format) do not translate across
+        providers, so requests that pass them get no alternates.
+        """
+        if kwargs:
+            return []
+        provider = self._detect_provider(model)
+        alternates = []
+        for alternate in SETTINGS.get('llm_equivalent_models', {}).get(model, []):
+            alternate_provider = self._detect_provider(alternate)
+            if alternate_provider != provider and self._provider_available(alternate_provider):
+                alternates.append(alternate)
+        return alternates
+
+    def _sender(self, provider: LLMProvider, is_async: bool = False) -> Any:
+        """Provider-specific send method"""
+        senders = {
+            LLMProvider.OPENAI: (self._chat_openai, self._achat_openai),
+            LLMProvider.ANTHROPIC: (self._chat_anthropic, self._achat_anthropic),
+            LLMProvider.GOOGLE: (self._chat_google, self._achat_google),
+            LLMProvider.DEEPSEEK: (self._chat_deepseek, self._achat_deepseek),
+        }
+        if provider not in senders:
+            raise ValueError(f"Unsupported provider: {provider}")
+        return senders[provider][1 if is_async else 0]
+
+    def _send(self, messages: List[Dict[str, str]], model: str, max_tokens: int,
+              temperature: float, **kwargs) -> Dict[str, Any]:
+        """One rate-limited provider call; records the provider's latency"""
+        provider = self._detect_provider(model)
+        send = self._sender(provider)
+
+        def timed_send():
+            # Time the provider call only: rate-limiter queueing is not
+            # provider latency and must not stretch the hedge delay
+            started = time.monotonic()
+            response = send(messages, model, max_tokens, temperature, **kwargs)
+            llm_resilience.get_latency_histogram(provider.value).record(time.monotonic() - started)
+            return response
+
+        # All providers share the process-wide adaptive limiter
+        return call_with_rate_limit(
+            provider.value, model, timed_send,
+            estimated_tokens=estimate_tokens(messages, max_tokens)
+        )
+
+    def _send_hedged(self, messages: List[Dict[str, str]], model: str, max_tokens: int,
+                     temperature: float, **kwargs) -> Dict[str, Any]:
+        """
+        Send a request and, if it has not answered by the provider's hedge
+        delay, race a duplicate against it (to an equivalent model on another
+        provider when one is configured, else the same model). The first
+        response with content wins; the slower call finishes in the background.
+        """
+        provider = self._detect_provider(model)
+        delay = llm_resilience.hedge_delay(provider.value)
+        alternates = self._alternate_models(model, **kwargs)
+        hedge_model = alternates[0] if alternates else model
+
+        executor = _get_hedge_executor()
+        primary = executor.submit(self._send, messages, model, max_tokens, temperature, **kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if primary in done or not primary.running():
+            # Still queued behind other hedged requests: the provider is not
+            # slow, the pool is full, and a duplicate would only queue too
+            return primary.result()
+
+        logger.info(f"No response from {provider.value}/{model} after {delay:.1f}s, hedging with {hedge_model}")
+        llm_resilience.count('hedges_fired')
+        hedge = executor.submit(self._send, messages, hedge_model, max_tokens, temperature, **kwargs)
+
+        pending = {primary, hedge}
+        errors = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                if response.get('content'):
+                    if future is hedge:
+                        llm_resilience.count('hedges_won')
+                    return response
+                errors.append(ValueError(f"Empty response from {response.get('provider')}/{response.get('model')}"))
+        raise errors[0]
+
+    def _send_with_failover(self, messages: List[Dict[str, str]], model: str, max_tokens: int,
+                            temperature: float, **kwargs) -> Dict[str, Any]:
+        """Send (hedged if enabled), failing over to equivalent models on 5xx"""
+        send = self._send_hedged if SETTINGS.get('llm_hedging_enabled', False) else self._send
+        try:
+            return send(messages, model, max_tokens, temperature, **kwargs)
+        except Exception as e:
+            if not (SETTINGS.get('llm_failover_enabled', True) and llm_resilience.is_server_error(e)):
+                raise
+            for alternate in self._alternate_models(model, **kwargs):
+                logger.warning(f"{model} failed with a server error ({e}); failing over to {alternate}")
+                llm_resilience.count('failovers')
+                try:
+                    return self._send(messages, alternate, max_tokens, temperature, **kwargs)
+                except Exception as alternate_error:
+                    logger.warning(f"Failover to {alternate} failed: {alternate_error}")
+            raise
+
+    async def _asend(self, messages: List[Dict[str, str]], model: str, max_tokens: int,
+                     temperature: float, timeout: Optional[float], **kwargs) -> Dict[str, Any]:
+        """Async version of _send with a per-call timeout"""
+        provider = self._detect_provider(model)
+        send = self._sender(provider, is_async=True)
+
+        async def timed_send():
+            started = time.monotonic()
+            response = await asyncio.wait_for(send(messages, model, max_tokens, temperature, **kwargs), timeout)
+            llm_resilience.get_latency_histogram(provider.value).record(time.monotonic() - started)
+            return response
+
+        return await acall_with_rate_limit(
+            provider.value, model, timed_send,
+            estimated_tokens=estimate_tokens(messages, max_tokens)
+        )
+
+    async def _asend_hedged(self, messages: List[Dict[str, str]], model: str, max_tokens: int,
+                            temperature: float, timeout: Optional[float], **kwargs) -> Dict[str, Any]:
+        """Async version of _send_hedged; the losing request is cancelled"""
+        provider = self._detect_provider(model)
+        delay = llm_resilience.hedge_delay(provider.value)
+        alternates = self._alternate_models(model, **kwargs)
+        hedge_model = alternates[0] if alternates else model
+
+        primary = asyncio.ensure_future(self._asend(messages, model, max_tokens, temperature, timeout, **kwargs))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if primary in done:
+            return primary.result()
+
+        logger.info(f"No response from {provider.value}/{model} after {delay:.1f}s, hedging with {hedge_model}")
+        llm_resilience.count('hedges_fired')
+        hedge = asyncio.ensure_future(self._asend(messages, hedge_model, max_tokens, temperature, timeout, **kwargs))
+
+        pending = {primary, hedge}
+        errors = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        errors.append(task.exception())
+                        continue
+                    response = task.result()
+                    if response.get('content'):
+                        if task is hedge:
+                            llm_resilience.count('hedges_won')
+                        return response
+                    errors.append(ValueError(f"Empty response from {response.get('provider')}/{response.get('model')}"))
+            raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _asend_with_failover(self, messages: List[Dict[str, str]], model: str, max_tokens: int,
+                                   temperature: float, timeout: Optional[float], **kwargs) -> Dict[str, Any]:
+        """Async version of _send_with_failover"""
+        send = self._asend_hedged if SETTINGS.get('llm_hedging_enabled', False) else self._asend
+        try:
+            return await send(messages, model, max_tokens, temperature, timeout, **kwargs)
+        except Exception as e:
+            if not (SETTINGS.get('llm_failover_enabled', True) and llm_resilience.is_server_error(e)):
+                raise
+            for alternate in self._alternate_models(model, **kwargs):
+                logger.warning(f"{model} failed with a server error ({e}); failing over to {alternate}")
+                llm_resilience.count('failovers')
+                try:
+                    return await self._asend(messages, alternate, max_tokens, temperature, timeout, **kwargs)
+                except Exception as alternate_error:
+                    logger.warning(f"Failover to {alternate} failed: {alternate_error}")
+            raise
+
     def chat(
         self,
         messages: List[Dict[str, str]],
         model: Optional[str] = None,
         max_tokens: int = 150,
         temperature: float = 0.3,
+        use_cache: bool = True,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Send a chat completion request to the appropriate LLM provider.
 
+        Identical requests are served from the shared response cache; cached
+        responses carry 'cached': True.
+
         Args:
             messages: List of message dicts with 'role' and 'content' keys
             model: Model to use (auto-detects provider, defaults to default_model)
             max_tokens: Maximum tokens to generate (default: 150)
             temperature: Sampling temperature 0-1 (default: 0.3)
+            use_cache: Set False to bypass the response cache for this call
             **kwargs: Additional arguments to pass to the provider API
 
         Returns:
@@ -251,22 +556,132 @@ class ChatClient:
         provider = self._detect_provider(model)
         logger.info(f"Using provider {provider.value} for model {model}")
 
+        cache_key = self._cache_key(provider, model, messages, max_tokens, temperature, kwargs)
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit for {provider.value}/{model}")
+                return {**cached, 'cached': True}
+
         try:
-            if provider == LLMProvider.OPENAI:
-                return self._chat_openai(messages, model, max_tokens, temperature, **kwargs)
-            elif provider == LLMProvider.ANTHROPIC:
-                return self._chat_anthropic(messages, model, max_tokens, temperature, **kwargs)
-            elif provider == LLMProvider.GOOGLE:
-                return self._chat_google(messages, model, max_tokens, temperature, **kwargs)
-            elif provider == LLMProvider.DEEPSEEK:
-                return self._chat_deepseek(messages, model, max_tokens, temperature, **kwargs)
-            else:
-                raise ValueError(f"Unsupported provider: {provider}")
+            response = self._send_with_failover(messages, model, max_tokens, temperature, **kwargs)
+
+        except Exception as e:
+            logger.error(f"Chat completion error with {provider.value}/{model}: {e}")
+            raise
+
+        if use_cache and response.get('content'):
+            self.cache.set(cache_key, response)
+        return response
+
+    async def achat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        max_tokens: int = 150,
+        temperature: float = 0.3,
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async version of chat().
+
+        Uses one long-lived async client per provider (see _get_async_client)
+        and the same response cache and rate limiter as chat(). Cancelling the
+        awaiting task cancels the provider request.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys
+            model: Model to use (auto-detects provider, defaults to default_model)
+            max_tokens: Maximum tokens to generate (default: 150)
+            temperature: Sampling temperature 0-1 (default: 0.3)
+            use_cache: Set False to bypass the response cache for this call
+            timeout: Seconds before the request is cancelled
+                (default: SETTINGS['llm_request_timeout_seconds']; 0/None disables)
+            **kwargs: Additional arguments to pass to the provider API
+
+        Returns:
+            Dict with 'content' or 'text' key containing the response text
 
+        Raises:
+            asyncio.TimeoutError if the request exceeds timeout, or
+            provider-specific errors if the API request fails
+        """
+        if model is None:
+            model = self.default_model
+        if timeout is None:
+            timeout = SETTINGS.get('llm_request_timeout_seconds') or None
+
+        provider = self._detect_provider(model)
+        logger.debug(f"Using provider {provider.value} for model {model} (async)")
+
+        cache_key = self._cache_key(provider, model, messages, max_tokens, temperature, kwargs)
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit for {provider.value}/{model}")
+                return {**cached, 'cached': True}
+
+        try:
+            response = await self._asend_with_failover(messages, model, max_tokens, temperature, timeout, **kwargs)
+
+        except asyncio.TimeoutError:
+            logger.error(f"Chat completion timed out after {timeout}s with {provider.value}/{model}")
+            raise
         except Exception as e:
             logger.error(f"Chat completion error with {provider.value}/{model}: {e}")
             raise
 
+        if use_cache and response.get('content'):
+            self.cache.set(cache_key, response)
+        return response
+
+    async def achat_many(
+        self,
+        requests: List[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        return_exceptions: bool = True
+    ) -> List[Any]:
+        """
+        Run many achat() requests on the current event loop.
+
+        Args:
+            requests: List of achat() keyword-argument dicts
+            concurrency: Maximum requests in flight (default: SETTINGS['llm_max_concurrency'])
+            return_exceptions: If True, a failed request yields its exception in
+                the result list instead of cancelling the batch
+
+        Returns:
+            Responses in the same order as requests
+        """
+        if concurrency is None:
+            concurrency = SETTINGS.get('llm_max_concurrency', 16)
+        semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+
+        async def run(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.achat(**request)
+
+        return await asyncio.gather(*(run(r) for r in requests), return_exceptions=return_exceptions)
+
+    @staticmethod
+    def _openai_result(response: Any, model: str, provider: str) -> Dict[str, Any]:
+        """Normalize an OpenAI-compatible completion into the ChatClient response dict"""
+        content = response.choices[0].message.content
+
+        return {
+            'content': content,
+            'text': content,
+            'model': model,
+            'provider': provider,
+            'usage': {
+                'prompt_tokens': response.usage.prompt_tokens if hasattr(response, 'usage') else 0,
+                'completion_tokens': response.usage.completion_tokens if hasattr(response, 'usage') else 0,
+                'total_tokens': response.usage.total_tokens if hasattr(response, 'usage') else 0
+            }
+        }
+
     def _chat_openai(
         self,
         messages: List[Dict[str, str]],
@@ -286,21 +701,9 @@ class ChatClient:
             **kwargs
         )
 
-        content = response.choices[0].message.content
+        return self._openai_result(response, model, 'openai')
 
-        return {
-            'content': content,
-            'text': content,
-            'model': model,
-            'provider': 'openai',
-            'usage': {
-                'prompt_tokens': response.usage.prompt_tokens if hasattr(response, 'usage') else 0,
-                'completion_tokens': response.usage.completion_tokens if hasattr(response, 'usage') else 0,
-                'total_tokens': response.usage.total_tokens if hasattr(response, 'usage') else 0
-            }
-        }
-
-    def _chat_anthropic(
+    async def _achat_openai(
         self,
         messages: List[Dict[str, str]],
         model: str,
@@ -308,9 +711,28 @@ class ChatClient:
         temperature: float,
         **kwargs
     ) -> Dict[str, Any]:
-        """Anthropic Claude chat completion"""
-        client = self._get_anthropic_client()
+        """OpenAI chat completion (async)"""
+        client = self._get_async_client(LLMProvider.OPENAI)
+
+        response = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+
+        return self._openai_result(response, model, 'openai')
 
+    @staticmethod
+    def _anthropic_request(
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build Anthropic messages.create kwargs from ChatClient messages"""
         # Convert messages format (Anthropic uses system parameter separately)
         system_message = None
         anthropic_messages = []
@@ -343,8 +765,11 @@ class ChatClient:
         if system_message:
             api_kwargs['system'] = [{"type": "text", "text": system_message}]
 
-        response = client.messages.create(**api_kwargs)
+        return api_kwargs
 
+    @staticmethod
+    def _anthropic_result(response: Any, model: str) -> Dict[str, Any]:
+        """Normalize an Anthropic message into the ChatClient response dict"""
         content = response.content[0].text
 
         return {
@@ -359,7 +784,7 @@ class ChatClient:
             }
         }
 
-    def _chat_google(
+    def _chat_anthropic(
         self,
         messages: List[Dict[str, str]],
         model: str,
@@ -367,10 +792,31 @@ class ChatClient:
         temperature: float,
         **kwargs
     ) -> Dict[str, Any]:
-        """Google Gemini chat completion"""
-        self._init_google_client()
+        """Anthropic Claude chat completion"""
+        client = self._get_anthropic_client()
+
+        response = client.messages.create(**self._anthropic_request(messages, model, max_tokens, temperature, **kwargs))
+
+        return self._anthropic_result(response, model)
+
+    async def _achat_anthropic(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Anthropic Claude chat completion (async)"""
+        client = self._get_async_client(LLMProvider.ANTHROPIC)
+
+        response = await client.messages.create(**self._anthropic_request(messages, model, max_tokens, temperature, **kwargs))
 
-        # Convert messages to Gemini format
+        return self._anthropic_result(response, model)
+
+    @staticmethod
+    def _gemini_messages(messages: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Convert messages to Gemini format"""
         gemini_messages = []
         for msg in messages:
             role = 'user' if msg['role'] in ['user', 'system'] else 'model'
@@ -378,6 +824,37 @@ class ChatClient:
                 'role': role,
                 'parts': [msg['content']]
             })
+        return gemini_messages
+
+    @staticmethod
+    def _google_result(response: Any, model: str) -> Dict[str, Any]:
+        """Normalize a Gemini response into the ChatClient response dict"""
+        content = response.text
+
+        return {
+            'content': content,
+            'text': content,
+            'model': model,
+            'provider': 'google',
+            'usage': {
+                'prompt_tokens': getattr(response.usage_metadata, 'prompt_token_count', 0) if hasattr(response, 'usage_metadata') else 0,
+                'completion_tokens': getattr(response.usage_metadata, 'candidates_token_count', 0) if hasattr(response, 'usage_metadata') else 0,
+                'total_tokens': getattr(response.usage_metadata, 'total_token_count', 0) if hasattr(response, 'usage_metadata') else 0
+            }
+        }
+
+    def _chat_google(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Google Gemini chat completion"""
+        self._init_google_client()
+
+        gemini_messages = self._gemini_messages(messages)
 
         # Create generative model
         gemini_model = genai.GenerativeModel(model)
@@ -403,19 +880,39 @@ class ChatClient:
                 generation_config=generation_config
             )
 
-        content = response.text
+        return self._google_result(response, model)
 
-        return {
-            'content': content,
-            'text': content,
-            'model': model,
-            'provider': 'google',
-            'usage': {
-                'prompt_tokens': getattr(response.usage_metadata, 'prompt_token_count', 0) if hasattr(response, 'usage_metadata') else 0,
-                'completion_tokens': getattr(response.usage_metadata, 'candidates_token_count', 0) if hasattr(response, 'usage_metadata') else 0,
-                'total_tokens': getattr(response.usage_metadata, 'total_token_count', 0) if hasattr(response, 'usage_metadata') else 0
-            }
-        }
+    async def _achat_google(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Google Gemini chat completion (async; the SDK pools its own gRPC channel)"""
+        self._init_google_client()
+
+        gemini_messages = self._gemini_messages(messages)
+        gemini_model = genai.GenerativeModel(model)
+        generation_config = GenerationConfig(
+            max_output_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+        if len(gemini_messages) == 1:
+            response = await gemini_model.generate_content_async(
+                gemini_messages[0]['parts'][0],
+                generation_config=generation_config
+            )
+        else:
+            chat = gemini_model.start_chat(history=gemini_messages[:-1])
+            response = await chat.send_message_async(
+                gemini_messages[-1]['parts'][0],
+                generation_config=generation_config
+            )
+
+        return self._google_result(response, model)
 
     def _chat_deepseek(
         self,
@@ -436,19 +933,28 @@ class ChatClient:
             **kwargs
         )
 
-        content = response.choices[0].message.content
+        return self._openai_result(response, model, 'deepseek')
 
-        return {
-            'content': content,
-            'text': content,
-            'model': model,
-            'provider': 'deepseek',
-            'usage': {
-                'prompt_tokens': response.usage.prompt_tokens if hasattr(response, 'usage') else 0,
-                'completion_tokens': response.usage.completion_tokens if hasattr(response, 'usage') else 0,
-                'total_tokens': response.usage.total_tokens if hasattr(response, 'usage') else 0
-            }
-        }
+    async def _achat_deepseek(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """DeepSeek chat completion (async, OpenAI-compatible API)"""
+        client = self._get_async_client(LLMProvider.DEEPSEEK)
+
+        response = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+
+        return self._openai_result(response, model, 'deepseek')
 
     def summarize(
         self,
@@ -0,0 +1,128 @@
+"""
+Tail-latency helpers for ChatClient
+Per-provider latency histograms that drive hedge delays, plus the error
+classification used for provider failover
+"""
+
+import bisect
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, List
+
+from config.settings import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+
+def is_server_error(error: Exception) -> bool:
+    """Check whether a provider exception is a 5xx / connection failure worth failing over"""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if isinstance(status, int):
+        return status >= 500
+    name = type(error).__name__
+    return name in ('APIConnectionError', 'APITimeoutError', 'InternalServerError',
+                    'ServiceUnavailable', 'ServiceUnavailableError', 'DeadlineExceeded')
+
+
+class LatencyHistogram:
+    """
+    Sliding-window latency histogram for one provider
+
+    Keeps the last `window` successful call latencies in sorted order so
+    quantiles are a lookup. Used to time hedged requests.
+    """
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._samples = deque()
+        self._sorted: List[float] = []
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        with self._lock:
+            if len(self._samples) >= self.window:
+                oldest = self._samples.popleft()
+                del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+            self._samples.append(latency)
+            bisect.insort(self._sorted, latency)
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._sorted)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency at quantile q (0-1), or None with no samples"""
+        with self._lock:
+            if not self._sorted:
+                return None
+            index = min(len(self._sorted) - 1, max(0, int(q * len(self._sorted))))
+            return self._sorted[index]
+
+
+_histograms: Dict[str, LatencyHistogram] = {}
+_histograms_lock = threading.Lock()
+_stats = {'hedges_fired': 0, 'hedges_won': 0, 'failovers': 0}
+_stats_lock = threading.Lock()
+
+
+def get_latency_histogram(provider: str) -> LatencyHistogram:
+    """Get the process-wide latency histogram for a provider"""
+    with _histograms_lock:
+        histogram = _histograms.get(provider)
+        if histogram is None:
+            histogram = LatencyHistogram(SETTINGS.get('llm_latency_window', 500))
+            _histograms[provider] = histogram
+        return histogram
+
+
+def hedge_delay(provider: str) -> float:
+    """
+    Seconds to wait for a provider before firing a hedged request
+
+    The observed SETTINGS['llm_hedge_quantile'] (p90 by default) latency once
+    enough samples exist, otherwise SETTINGS['llm_hedge_default_delay_seconds'];
+    never below SETTINGS['llm_hedge_min_delay_seconds'].
+    """
+    histogram = get_latency_histogram(provider)
+    delay = None
+    if histogram.count() >= SETTINGS.get('llm_hedge_min_samples', 20):
+        delay = histogram.quantile(SETTINGS.get('llm_hedge_quantile', 0.9))
+    if delay is None:
+        delay = SETTINGS.get('llm_hedge_default_delay_seconds', 10.0)
+    return max(SETTINGS.get('llm_hedge_min_delay_seconds', 1.0), delay)
+
+
+def count(stat: str) -> None:
+    """Increment a hedging/failover counter"""
+    with _stats_lock:
+        _stats[stat] += 1
+
+
+def resilience_stats() -> Dict[str, Any]:
+    """Hedging/failover counters and per-provider p50/p90/p99 latencies"""
+    with _stats_lock:
+        stats = dict(_stats)
+    with _histograms_lock:
+        histograms = dict(_histograms)
+    stats['latency'] = {
+        provider: {
+            'samples': h.count(),
+            'p50': h.quantile(0.5),
+            'p90': h.quantile(0.9),
+            'p99': h.quantile(0.99),
+        }
+        for provider, h in histograms.items()
+    }
+    return stats
+
+
+def reset_resilience_state() -> None:
+    """Drop latency histograms and counters"""
+    with _histograms_lock:
+        _histograms.clear()
+    with _stats_lock:
+        for key in _stats:
+            _stats[key] = 0
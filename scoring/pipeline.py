@@ -4,15 +4,19 @@ Orchestrates the scoring and classification process
 """
 
 import uuid
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Callable
 from datetime import datetime
 import logging
 
-from data.models import NormalizedContent, ContentScores, PipelineRun, AuthenticityRatio
-from .scorer import ContentScorer
+from data.models import NormalizedContent, ContentScores, PipelineRun, AuthenticityRatio, ScoreMeta
 from .scorer import ContentScorer
 from config.settings import SETTINGS
 from .classifier import ContentClassifier
+from .llm_cache import get_llm_cache
+from .streaming import Stage, run_stages
+from .aggregator import RunAggregator, report_final_score
+from .scheduler import ScoringBudget, ScoringScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +29,20 @@ class ScoringPipeline:
         # Athena client is optional at runtime (may require boto3). Initialize
         # lazily when upload is requested to allow local runs without AWS deps.
         self.athena_client = None
+        # content_ids whose scores the last AR calculation's LLM review adjusted
+        self.last_llm_adjusted_ids = set()
     
     def run_scoring_pipeline(self, content_list: List[NormalizedContent], 
-                           brand_config: Dict[str, Any]) -> PipelineRun:
+                           brand_config: Dict[str, Any],
+                           max_workers: Optional[int] = None) -> PipelineRun:
         """
         Run the complete scoring pipeline
         
         Args:
             content_list: List of normalized content to score
             brand_config: Brand configuration and context
+            max_workers: Items to score concurrently (defaults to
+                SETTINGS['scoring_concurrency'])
             
         Returns:
             PipelineRun object with execution details
@@ -54,16 +63,12 @@ class ScoringPipeline:
         
         try:
             # Step 0: Filter out error pages, login walls, and insufficient content
-            from scoring.content_filter import should_skip_content
+            from scoring.content_filter import content_skip_reason
             
             filtered_content = []
             skipped_count = 0
             for content in content_list:
-                skip_reason = should_skip_content(
-                    title=getattr(content, 'title', ''),
-                    body=getattr(content, 'body', ''),
-                    url=getattr(content, 'url', '')
-                )
+                skip_reason = content_skip_reason(content)
                 
                 if skip_reason:
                     logger.info(f"Pre-filtering: Skipped '{content.title}' ({skip_reason})")
@@ -84,32 +89,33 @@ class ScoringPipeline:
             
             # Step 1: Score content (Triage is handled internally by ContentScorer)
             logger.info("Step 1: Scoring content on 5D dimensions")
-            scores_list = self.scorer.batch_score_content(content_list, brand_config)
+            reused_before = self.scorer.reuse_stats['reused']
+            self.scorer.llm_client.reset_cascade_stats()
+            exclude_demoted = SETTINGS.get('exclude_demoted_from_upload', False)
+
+            def is_excluded(scores: ContentScores) -> bool:
+                return exclude_demoted and ScoreMeta.coerce(scores.meta).get('triage_status') == 'skipped'
+
+            # Report aggregates are updated as each item finishes scoring
+            aggregator = RunAggregator()
+
+            def aggregate(scores: ContentScores) -> None:
+                if not is_excluded(scores):
+                    aggregator.add(scores)
+
+            scores_list = self.scorer.batch_score_content(content_list, brand_config, max_workers=max_workers,
+                                                          on_item=aggregate)
             pipeline_run.items_processed += len(scores_list)
+            pipeline_run.items_reused = self.scorer.reuse_stats['reused'] - reused_before
+            logger.info(f"Reused stored scores for {pipeline_run.items_reused}/{len(scores_list)} unchanged items")
+            self._record_cascade_stats(pipeline_run)
+            if SETTINGS.get('scoring_budget_enabled', False):
+                pipeline_run.scoring_treatments = self.scorer.last_schedule
             
             # Filter out demoted items if configured
-            exclude_demoted = SETTINGS.get('exclude_demoted_from_upload', False)
             if exclude_demoted:
                 original_count = len(scores_list)
-                scores_list = [s for s in scores_list if not (isinstance(s.meta, dict) and s.meta.get('triage_status') == 'skipped')]
-                # Handle case where meta is a string (JSON)
-                if len(scores_list) == original_count:
-                    # Try checking serialized meta if dict check didn't filter anything
-                    import json
-                    filtered = []
-                    for s in scores_list:
-                        try:
-                            if isinstance(s.meta, str):
-                                m = json.loads(s.meta)
-                                if m.get('triage_status') == 'skipped':
-                                    continue
-                            elif isinstance(s.meta, dict):
-                                if s.meta.get('triage_status') == 'skipped':
-                                    continue
-                        except:
-                            pass
-                        filtered.append(s)
-                    scores_list = filtered
+                scores_list = [s for s in scores_list if not is_excluded(s)]
                 
                 if len(scores_list) < original_count:
                     logger.info(f"Excluded {original_count - len(scores_list)} demoted items from results")
@@ -135,12 +141,17 @@ class ScoringPipeline:
             # Attach classified scores to the pipeline run so callers can use
             # the exact objects that were uploaded to S3/Athena.
             pipeline_run.classified_scores = classified_scores
+            if self.last_llm_adjusted_ids:
+                # LLM review changed some scores after they were aggregated
+                aggregator = RunAggregator.from_scores(classified_scores)
+            pipeline_run.aggregates = aggregator
 
             # Complete pipeline run
             pipeline_run.end_time = datetime.now()
             pipeline_run.status = "completed"
             
             logger.info(f"Scoring pipeline {run_id} completed successfully")
+            logger.info(f"LLM cache stats: {get_llm_cache().stats()}")
             try:
                 logger.info(f"Authenticity Ratio: {ar_result.authenticity_ratio_pct:.2f}%")
             except Exception:
@@ -162,9 +173,296 @@ class ScoringPipeline:
             raise
         
         return pipeline_run
-    
-    def _upload_scores_to_athena(self, scores_list: List[ContentScores], brand_id: str) -> None:
-        """Upload content scores to S3/Athena"""
+
+    def stream_scoring_pipeline(self, source: Iterable[Any], brand_config: Dict[str, Any],
+                                fetch: Optional[Callable[[Any], Any]] = None,
+                                normalizer=None,
+                                max_workers: Optional[int] = None,
+                                fetch_workers: Optional[int] = None,
+                                queue_size: Optional[int] = None,
+                                upload_batch_size: Optional[int] = None,
+                                stats: Optional[Dict[str, Dict[str, int]]] = None) -> Iterator[ContentScores]:
+        """
+        Stream content through fetch, normalize, filter, language-detect,
+        triage, verify, score and upload stages
+
+        Stages are connected by bounded queues (see scoring.streaming), so
+        the first items are scored while later pages are still being fetched
+        and only a bounded number of bodies is held in memory. Scores are
+        uploaded in parts of `upload_batch_size` as they arrive; once a part
+        is uploaded, each item's meta['description'] is cut to a preview of
+        SETTINGS['stream_retained_description_chars'] characters. With
+        scoring_budget_enabled, each item takes its treatment from one
+        ScoringScheduler for the run (in arrival order, not by priority);
+        its summary() ends up in ContentScorer.last_schedule. With
+        run_level_verification, the verify stage holds items back in windows
+        of SETTINGS['stream_verification_window'] and verifies each window's
+        claims together (ContentScorer._prepare_run_verification) before
+        forwarding its items to the score stage.
+
+        Args:
+            source: Items to process; NormalizedContent, or fetch tasks when
+                `fetch` is given
+            brand_config: Brand configuration and context
+            fetch: Optional function turning a source item into
+                NormalizedContent (or a list of them, or None to drop it)
+            normalizer: ContentNormalizer to use (a fresh one by default)
+            max_workers: Items scored concurrently (defaults to
+                SETTINGS['scoring_concurrency'])
+            fetch_workers: Concurrent fetches (defaults to
+                SETTINGS['fetch_concurrency'])
+            queue_size: Items buffered between stages (defaults to
+                SETTINGS['stream_queue_size'])
+            upload_batch_size: Scores per upload part (defaults to
+                SETTINGS['stream_upload_batch_size'])
+            stats: Optional dict filled with per-stage counts
+
+        Yields:
+            Classified ContentScores in completion order
+        """
+        from scoring.content_filter import content_skip_reason
+        from utils.language_utils import detect_language
+
+        if normalizer is None:
+            from ingestion.normalizer import ContentNormalizer
+            normalizer = ContentNormalizer()
+        if max_workers is None:
+            max_workers = SETTINGS.get('scoring_concurrency', 1)
+        if fetch_workers is None:
+            fetch_workers = SETTINGS.get('fetch_concurrency', 4)
+        if upload_batch_size is None:
+            upload_batch_size = SETTINGS.get('stream_upload_batch_size', 50)
+        brand_id = brand_config.get('brand_id', 'unknown')
+        exclude_demoted = SETTINGS.get('exclude_demoted_from_upload', False)
+        retained_chars = SETTINGS.get('stream_retained_description_chars', 500)
+        verification_window = 0
+        if SETTINGS.get('run_level_verification', True):
+            verification_window = SETTINGS.get('stream_verification_window', 20)
+        # Learned triage skip budget counts this run's items only
+        gate = self.scorer.triage_gate
+        triage_run = gate.new_run() if gate is not None else None
+        # Items arrive one by one, so there is no priority order, but each
+        # item still acquires its treatment from the run's budget. Window
+        # claim verification runs after the scheduler starts and is spent
+        # from the same budget.
+        scheduler = None
+        if SETTINGS.get('scoring_budget_enabled', False):
+            scheduler = ScoringScheduler(ScoringBudget.from_settings())
+
+        def prefilter(content: NormalizedContent) -> Optional[NormalizedContent]:
+            skip_reason = content_skip_reason(content)
+            if skip_reason:
+                logger.info(f"Pre-filtering: Skipped '{content.title}' ({skip_reason})")
+                return None
+            return content
+
+        def language(content: NormalizedContent) -> NormalizedContent:
+            content.language = detect_language(content.body)
+            if content.language != 'en':
+                logger.info(f"Detected non-English content: {content.title} ({content.language})")
+            return content
+
+        def triage(content: NormalizedContent) -> Any:
+            if SETTINGS.get('triage_enabled', False):
+                should_score, reason, _ = self.scorer.triage_scorer.should_score(content)
+                if not should_score:
+                    # Triaged items never reach the LLM; score them here so the
+                    # score workers stay free for items that do
+                    return self.scorer._score_item(content, brand_config, scheduler, triage_run)
+            return content
+
+        # Run-level claim verification over windows of items: claims are
+        # extracted in batches and near-duplicates verified once per window
+        window: List[NormalizedContent] = []
+
+        def flush_verification() -> List[NormalizedContent]:
+            items = list(window)
+            window.clear()
+            if len(items) > 1:
+                try:
+                    uncertainties = self.scorer._triage_uncertainties(items) if gate is not None else None
+                    self.scorer._prepare_run_verification(items, brand_config, uncertainties=uncertainties)
+                except Exception as e:
+                    # The window's items fall back to per-item verification
+                    logger.warning(f"Window claim verification failed: {e}")
+            return items
+
+        def verify(item: Any) -> Any:
+            if isinstance(item, ContentScores):
+                return item
+            window.append(item)
+            if len(window) >= verification_window:
+                return flush_verification()
+            return None
+
+        def score(item: Any) -> Optional[ContentScores]:
+            if isinstance(item, ContentScores):
+                scores = item
+            else:
+                scores = self.scorer._score_item(item, brand_config, scheduler, triage_run)
+            if scores is None:
+                return None
+            if exclude_demoted and self._is_demoted(scores):
+                logger.info(f"Excluded demoted item {scores.content_id} from results")
+                return None
+            return self.classifier.classify_content(scores)
+
+        pending: List[ContentScores] = []
+        parts = [0]
+
+        def flush_upload() -> None:
+            if pending:
+                self._upload_scores_to_athena(list(pending), brand_id, part=parts[0])
+                parts[0] += 1
+                for scores in pending:
+                    self._trim_description(scores, retained_chars)
+                pending.clear()
+
+        def upload(scores: ContentScores) -> ContentScores:
+            pending.append(scores)
+            if len(pending) >= upload_batch_size:
+                flush_upload()
+            return scores
+
+        stages = []
+        if fetch is not None:
+            stages.append(Stage('fetch', fetch, workers=fetch_workers))
+        stages.extend([
+            # Deduplication state lives on the normalizer, so one worker
+            Stage('normalize', normalizer.normalize_item),
+            Stage('filter', prefilter),
+            Stage('language', language),
+            Stage('triage', triage),
+        ])
+        if verification_window > 1:
+            stages.append(Stage('verify', verify, on_close=flush_verification))
+        else:
+            logger.info("Streaming run verifies claims per item (stream_verification_window <= 1)")
+        stages.extend([
+            Stage('score', score, workers=max_workers),
+            Stage('upload', upload, on_close=flush_upload),
+        ])
+
+        logger.info(f"Streaming scoring pipeline for brand {brand_id} (score workers: {max_workers})")
+        try:
+            yield from run_stages(source, stages, queue_size=queue_size, stats=stats)
+        finally:
+            self.scorer.verification_manager.clear_run_results()
+            if scheduler is not None:
+                self.scorer.last_schedule = scheduler.summary()
+                logger.info(f"Scoring budget: {self.scorer.last_schedule['counts']} "
+                            f"({self.scorer.last_schedule['tokens']} tokens, "
+                            f"${self.scorer.last_schedule['cost']:.4f}, "
+                            f"{self.scorer.last_schedule['seconds']:.1f}s)")
+
+    def run_streaming_pipeline(self, source: Iterable[Any], brand_config: Dict[str, Any],
+                               fetch: Optional[Callable[[Any], Any]] = None,
+                               max_workers: Optional[int] = None,
+                               on_score: Optional[Callable[[ContentScores], None]] = None,
+                               **stream_kwargs) -> PipelineRun:
+        """
+        Run the streaming pipeline to completion
+
+        Produces the same PipelineRun as run_scoring_pipeline (classified
+        scores, Authenticity Ratio, appendix) but scores and uploads items as
+        they are fetched.
+
+        Args:
+            source: Items to process (see stream_scoring_pipeline)
+            brand_config: Brand configuration and context
+            fetch: Optional fetch function (see stream_scoring_pipeline)
+            max_workers: Items scored concurrently
+            on_score: Optional callback invoked with each classified score
+                as soon as it is available (e.g. to update progress)
+            **stream_kwargs: Passed through to stream_scoring_pipeline
+
+        Returns:
+            PipelineRun object with execution details
+        """
+        run_id = str(uuid.uuid4())
+        brand_id = brand_config.get('brand_id', 'unknown')
+        pipeline_run = PipelineRun(
+            run_id=run_id,
+            brand_id=brand_id,
+            start_time=datetime.now(),
+            status="running"
+        )
+        logger.info(f"Starting streaming scoring pipeline {run_id} for brand {brand_id}")
+
+        classified_scores = []
+        aggregator = RunAggregator()
+        stats: Dict[str, Dict[str, int]] = {}
+        reused_before = self.scorer.reuse_stats['reused']
+        self.scorer.llm_client.reset_cascade_stats()
+        try:
+            for scores in self.stream_scoring_pipeline(source, brand_config, fetch=fetch,
+                                                       max_workers=max_workers, stats=stats,
+                                                       **stream_kwargs):
+                classified_scores.append(scores)
+                aggregator.add(scores)
+                pipeline_run.items_processed += 1
+                if on_score:
+                    on_score(scores)
+            logger.info(f"Streaming stage stats: {stats}")
+            pipeline_run.items_reused = self.scorer.reuse_stats['reused'] - reused_before
+            logger.info(f"Reused stored scores for {pipeline_run.items_reused}/{len(classified_scores)} unchanged items")
+            self._record_cascade_stats(pipeline_run)
+            if SETTINGS.get('scoring_budget_enabled', False):
+                pipeline_run.scoring_treatments = self.scorer.last_schedule
+
+            ar_result, per_item_breakdowns = self._calculate_authenticity_ratio(
+                classified_scores, brand_id, run_id, include_appendix=True)
+            if self.last_llm_adjusted_ids:
+                # LLM review changed some scores after they were aggregated
+                aggregator = RunAggregator.from_scores(classified_scores)
+            pipeline_run.classified_scores = classified_scores
+            pipeline_run.aggregates = aggregator
+            pipeline_run.appendix = per_item_breakdowns
+            pipeline_run.stage_stats = stats
+            pipeline_run.end_time = datetime.now()
+            pipeline_run.status = "completed"
+
+            logger.info(f"Streaming scoring pipeline {run_id} completed: {len(classified_scores)} items")
+            logger.info(f"LLM cache stats: {get_llm_cache().stats()}")
+            logger.info(f"Authenticity Ratio: {ar_result.authenticity_ratio_pct:.2f}%")
+        except Exception as e:
+            pipeline_run.end_time = datetime.now()
+            pipeline_run.status = "failed"
+            pipeline_run.errors.append(str(e))
+            logger.error(f"Streaming scoring pipeline {run_id} failed: {e}")
+            raise
+
+        return pipeline_run
+
+    @staticmethod
+    def _trim_description(scores: ContentScores, max_chars: int) -> None:
+        """Cut an uploaded item's body copy to a report-sized preview"""
+        meta = scores.meta
+        if isinstance(meta, dict):
+            description = meta.get('description')
+            if isinstance(description, str) and len(description) > max_chars:
+                meta['description'] = description[:max_chars]
+
+    @staticmethod
+    def _is_demoted(scores: ContentScores) -> bool:
+        """Check whether triage skipped an item (meta may be a dict or JSON)"""
+        meta = ScoreMeta.coerce(scores.meta)
+        orig_meta = meta.get('orig_meta') if isinstance(meta.get('orig_meta'), dict) else {}
+        return 'skipped' in (meta.get('triage_status'), orig_meta.get('triage_status'))
+
+    def _record_cascade_stats(self, pipeline_run: PipelineRun) -> None:
+        """Attach this run's model cascade stats to the run and log the escalation rate"""
+        if not SETTINGS.get('scoring_cascade_enabled', False):
+            return
+        pipeline_run.cascade_stats = self.scorer.llm_client.cascade_summary()
+        logger.info(f"Model cascade: {pipeline_run.cascade_stats['escalated_calls']}/"
+                    f"{pipeline_run.cascade_stats['calls']} score calls escalated "
+                    f"({pipeline_run.cascade_stats['escalation_rate']:.1%}), "
+                    f"answered by {pipeline_run.cascade_stats['answered_by']}")
+
+    def _upload_scores_to_athena(self, scores_list: List[ContentScores], brand_id: str,
+                                 part: Optional[int] = None) -> None:
+        """Upload content scores to S3/Athena (optionally as one part of a streamed run)"""
         if not scores_list:
             logger.warning("No scores to upload")
             return
@@ -190,7 +488,7 @@ class ScoringPipeline:
         for source, source_scores in scores_by_source.items():
             run_id = source_scores[0].run_id
             try:
-                self.athena_client.upload_content_scores(source_scores, brand_id, source, run_id)
+                self.athena_client.upload_content_scores(source_scores, brand_id, source, run_id, part=part)
             except Exception as e:
                 logger.warning(f"Failed to upload scores for source {source}: {e}")
     
@@ -217,189 +515,27 @@ class ScoringPipeline:
                 ), []
             )
 
-        # Load rubric (weights, thresholds, attributes, defaults)
-        from scoring.rubric import load_rubric
-        rubric = load_rubric()
-        weights = rubric.get('dimension_weights', {})
-        thresholds = rubric.get('thresholds', {'authentic': 75, 'suspect': 40})
-        attributes_cfg = rubric.get('attributes', [])
-        defaults = rubric.get('defaults', {})
+        # Compiled rubric (weights, thresholds, meta rules, defaults)
+        from scoring.rubric import get_rubric
+        rubric = get_rubric()
+        weights = rubric.dimension_weights
+        thresholds = rubric.thresholds
+        defaults = rubric.defaults
 
         # triage settings
         max_llm_items = defaults.get('max_llm_items', 5)
         triage_method = defaults.get('triage_method', 'top_uncertain')
 
-        def _parse_meta(s: ContentScores):
-            meta = {}
-            try:
-                if isinstance(s.meta, str):
-                    import json as _json
-                    meta = _json.loads(s.meta) if s.meta else {}
-                elif isinstance(s.meta, dict):
-                    meta = s.meta
-            except Exception:
-                meta = {}
-            return meta
-
-        authentic_count = 0
-        suspect_count = 0
-        inauthentic_count = 0
         total_count = len(scores_list)
 
-        per_item_breakdowns = []
-        for s in scores_list:
-            # Defensive defaults for missing scores (5D)
-            p = getattr(s, 'score_provenance', 0.0) or 0.0
-            r = getattr(s, 'score_resonance', 0.0) or 0.0
-            c = getattr(s, 'score_coherence', 0.0) or 0.0
-            t = getattr(s, 'score_transparency', 0.0) or 0.0
-            v = getattr(s, 'score_verification', 0.0) or 0.0
-            # Base weighted score (0-100). Use weights.get to be resilient.
-            base = (
-                p * weights.get('provenance', 0.0) +
-                r * weights.get('resonance', 0.0) +
-                c * weights.get('coherence', 0.0) +
-                t * weights.get('transparency', 0.0) +
-                v * weights.get('verification', 0.0)
-            ) * 100.0
-
-            # Metadata bonuses/penalties applied from attributes_cfg
-            meta = _parse_meta(s)
-            # Normalize/enrich meta so reporting can rely on common keys
-            try:
-                # prefer existing keys but fall back to content fields on the score
-                if isinstance(meta, dict):
-                    meta_title = meta.get('title') or getattr(s, 'title', None) or meta.get('name')
-                    meta_desc = meta.get('description') or meta.get('snippet') or getattr(s, 'body', None)
-                    meta_url = meta.get('source_url') or meta.get('url') or getattr(s, 'platform_id', None)
-                    meta_modality = meta.get('modality') or getattr(s, 'modality', 'text')
-                    meta_channel = meta.get('channel') or getattr(s, 'channel', 'unknown')
-                    meta_platform_type = meta.get('platform_type') or getattr(s, 'platform_type', 'unknown')
-
-                    if meta_title:
-                        meta['title'] = meta_title
-                    if meta_desc:
-                        meta['description'] = meta_desc
-                    if meta_url:
-                        meta['source_url'] = meta_url
-                    if meta_modality:
-                        meta['modality'] = meta_modality
-                    if meta_channel:
-                        meta['channel'] = meta_channel
-                    if meta_platform_type:
-                        meta['platform_type'] = meta_platform_type
-                else:
-                    meta = {}
-            except Exception:
-                meta = {}
-            applied_rules = []
-
-            for attr in attributes_cfg:
-                if not attr.get('enabled', True):
-                    continue
-                aid = attr.get('id')
-                effect = attr.get('effect', 'bonus')
-                val = attr.get('value', 0) or 0
-                # condition support: e.g., {op: '>=', threshold: 0.8}
-                condition = attr.get('condition')
-                match_meta_keys = attr.get('match_meta', [])
-
-                triggered = False
-                reason = None
-
-                # If a numeric condition is present, attempt to evaluate against meta
-                if condition and match_meta_keys:
-                    # try to find a numeric field in meta matching any key
-                    for mk in match_meta_keys:
-                        if mk in meta:
-                            try:
-                                mval = float(meta.get(mk))
-                                op = condition.get('op')
-                                th = float(condition.get('threshold'))
-                                if op == '>=' and mval >= th:
-                                    triggered = True
-                                    reason = f"{mk} {mval} {op} {th}"
-                                    break
-                                if op == '<=' and mval <= th:
-                                    triggered = True
-                                    reason = f"{mk} {mval} {op} {th}"
-                                    break
-                                if op == '>' and mval > th:
-                                    triggered = True
-                                    reason = f"{mk} {mval} {op} {th}"
-                                    break
-                                if op == '<' and mval < th:
-                                    triggered = True
-                                    reason = f"{mk} {mval} {op} {th}"
-                                    break
-                            except Exception:
-                                continue
-                else:
-                    # Otherwise, trigger if any of match_meta_keys present and truthy in meta
-                    for mk in match_meta_keys:
-                        if mk in meta and meta.get(mk):
-                            triggered = True
-                            reason = f"meta.{mk} present"
-                            break
-
-                if triggered and val != 0:
-                    applied_rules.append({
-                        "id": aid,
-                        "effect": effect,
-                        "value": val,
-                        "reason": reason,
-                        "dimension": attr.get('dimension'),
-                        "label": attr.get('label')  # Include label for UI display
-                    })
-                    if effect == 'bonus':
-                        base += float(val)
-                    elif effect == 'penalty':
-                        base -= float(abs(val))
-
-            # Clamp
-            item_score = max(0.0, min(100.0, base))
-
-            # Classification thresholds from config
-            auth_th = thresholds.get('authentic', 75.0)
-            susp_th = thresholds.get('suspect', 40.0)
-
-            label = 'inauthentic'
-            if item_score >= auth_th:
-                label = 'authentic'
-            elif item_score >= susp_th:
-                label = 'suspect'
-            else:
-                label = 'inauthentic'
-
-            # Persist classification back to the ContentScores object so
-            # subsequent logic and AR counting use the same final labels.
-            try:
-                s.class_label = label
-                s.is_authentic = True if label == 'authentic' else False
-            except Exception:
-                pass
-
-            # Build dimension scores dict (5D)
-            dim_scores = {
-                'provenance': p,
-                'resonance': r,
-                'coherence': c,
-                'transparency': t,
-                'verification': v,
-            }
-
-            per_item_breakdowns.append({
-                'content_id': s.content_id,
-                'source': getattr(s, 'src', ''),
-                'event_ts': getattr(s, 'event_ts', ''),
-                'dimension_scores': dim_scores,
-                'dimensions': dim_scores,  # Alias for compatibility with markdown_generator
-                'base_score': base,
-                'applied_rules': applied_rules,
-                'final_score': item_score,
-                'label': label,
-                'meta': meta,
-            })
+        # Columnar pass: score matrix x weights, meta-rule trigger matrix,
+        # clamp and thresholds as array operations (scoring/authenticity.py)
+        from scoring.authenticity import AuthenticityArrays
+        arrays = AuthenticityArrays(scores_list, rubric)
+        # Persist classification back to the ContentScores objects so
+        # subsequent logic and AR counting use the same final labels.
+        arrays.apply_labels()
+        per_item_breakdowns = arrays.breakdowns()
 
         # Triage: select items for LLM review based on triage_method
         try:
@@ -411,6 +547,8 @@ class ScoringPipeline:
 
         triage_candidates = [d for d in per_item_breakdowns if d['label'] == 'suspect']
         selected_for_llm = []
+        llm_adjusted_ids = set()
+        self.last_llm_adjusted_ids = llm_adjusted_ids
         if triage_method == 'top_uncertain' and triage_candidates:
             mid = (auth_th + susp_th) / 2.0
             triage_candidates.sort(key=lambda x: abs(x['final_score'] - mid))
@@ -448,16 +586,8 @@ class ScoringPipeline:
                         s.class_label = label
                         s.is_authentic = True if label == 'authentic' else False
                         # attach llm confidence to meta for traceability
-                        try:
-                            import json as _json
-                            meta = _json.loads(s.meta) if isinstance(s.meta, str) and s.meta else (s.meta or {})
-                        except Exception:
-                            meta = {}
+                        s.meta = meta = ScoreMeta.coerce(s.meta)
                         meta['_llm_classification'] = {'label': label, 'confidence': conf}
-                        try:
-                            s.meta = _json.dumps(meta)
-                        except Exception:
-                            s.meta = str(meta)
                 # Apply small per-dimension score adjustments based on LLM confidence
                 try:
                     adj_scale = float(defaults.get('llm_score_adjustment_scale', 20.0))
@@ -524,51 +654,34 @@ class ScoringPipeline:
                             attribute_total = bd.get('base_score', 0.0) - orig_weighted
                             new_final = max(0.0, min(100.0, new_weighted + attribute_total))
                             bd['final_score'] = new_final
+                            llm_adjusted_ids.add(cid)
 
                             # annotate meta with details
-                            try:
-                                import json as _json
-                                meta = _json.loads(s.meta) if isinstance(s.meta, str) and s.meta else (s.meta or {})
-                            except Exception:
-                                meta = {}
+                            s.meta = meta = ScoreMeta.coerce(s.meta)
                             meta['_llm_adjusted_scores'] = new_scores
                             meta['_llm_adjusted_score_total'] = new_final
                             meta['_llm_classification_confidence'] = conf
-                            try:
-                                s.meta = _json.dumps(meta)
-                            except Exception:
-                                s.meta = str(meta)
             except Exception as e:
                 logger.warning(f"LLM classification failed or not available: {e}")
 
         # After potential LLM adjustments, recompute authentic/suspect/inauthentic
         # counts from the (possibly) updated ContentScores so the AR reflects
         # the final labels returned to callers and uploaded to Athena.
-        try:
-            authentic_count = sum(1 for sc in scores_list if getattr(sc, 'class_label', None) == 'authentic')
-            suspect_count = sum(1 for sc in scores_list if getattr(sc, 'class_label', None) == 'suspect')
-            inauthentic_count = sum(1 for sc in scores_list if getattr(sc, 'class_label', None) == 'inauthentic')
-        except Exception:
-            # Fallback to zeros if something unexpected happens
-            authentic_count = 0
-            suspect_count = 0
-            inauthentic_count = 0
+        label_counts = Counter(getattr(sc, 'class_label', None) for sc in scores_list)
+        authentic_count = label_counts['authentic']
+        suspect_count = label_counts['suspect']
+        inauthentic_count = label_counts['inauthentic']
 
         # Sync per_item_breakdowns labels with any final class_label present on
-        # the ContentScores to keep per-item diagnostics consistent.
+        # the ContentScores to keep per-item diagnostics consistent. Items the
+        # LLM adjusted above already carry their new final score; others may
+        # carry one from an earlier run in the meta parsed by the columnar pass.
         try:
-            id_to_score = {s.content_id: s for s in scores_list}
-            for bd in per_item_breakdowns:
-                s_obj = id_to_score.get(bd.get('content_id'))
-                if s_obj and getattr(s_obj, 'class_label', None):
+            for bd, s_obj, meta in zip(per_item_breakdowns, scores_list, arrays.metas):
+                if getattr(s_obj, 'class_label', None):
                     bd['label'] = getattr(s_obj, 'class_label')
                     # If LLM adjusted a final score, prefer that
-                    try:
-                        import json as _json
-                        meta = _json.loads(s_obj.meta) if isinstance(s_obj.meta, str) and s_obj.meta else (s_obj.meta or {})
-                    except Exception:
-                        meta = {}
-                    if isinstance(meta, dict) and meta.get('_llm_adjusted_score_total'):
+                    if bd['content_id'] not in llm_adjusted_ids and meta.get('_llm_adjusted_score_total'):
                         bd['final_score'] = float(meta.get('_llm_adjusted_score_total'))
         except Exception:
             # Non-fatal; per-item diagnostics are best-effort
@@ -632,8 +745,18 @@ class ScoringPipeline:
         }
     
     def generate_scoring_report(self, scores_list: List[ContentScores], 
-                              brand_config: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate detailed scoring report"""
+                              brand_config: Dict[str, Any],
+                              aggregator: Optional[RunAggregator] = None) -> Dict[str, Any]:
+        """
+        Generate detailed scoring report
+
+        Args:
+            scores_list: Classified scores of the run
+            brand_config: Brand configuration and context
+            aggregator: Aggregates built while the run scored
+                (PipelineRun.aggregates); rebuilt in one pass over
+                scores_list when missing or covering a different item count
+        """
         # If no scores are provided, return a structured report with zeros so
         # callers don't need to handle a special error case.
         if not scores_list:
@@ -715,16 +838,10 @@ class ScoringPipeline:
         else:
             ar_dict = ar_result
         
-        # Generate dimension breakdown
-        dimension_breakdown = {}
-        for dimension in ["provenance", "verification", "transparency", "coherence", "resonance"]:
-            scores = [getattr(s, f"score_{dimension}", 0.5) for s in scores_list]  # Default to 0.5 if not present
-            dimension_breakdown[dimension] = {
-                "average": sum(scores) / len(scores) if scores else 0,
-                "min": min(scores) if scores else 0,
-                "max": max(scores) if scores else 0,
-                "std_dev": self._calculate_std_dev(scores)
-            }
+        # Dimension breakdown, bands and rollups from the run aggregates
+        if aggregator is None or aggregator.count != len(scores_list):
+            aggregator = RunAggregator.from_scores(scores_list)
+        dimension_breakdown = aggregator.dimension_breakdown()
         
         report = {
             "brand_id": brand_config.get('brand_id', 'unknown'),
@@ -736,7 +853,8 @@ class ScoringPipeline:
             "total_items_analyzed": len(scores_list),
             # Include data sources used for this report (prefer explicit brand_config, fallback to sources present on scores)
             "sources": brand_config.get('sources') if brand_config.get('sources') else sorted({s.src for s in scores_list}),
-            "rubric_version": scores_list[0].rubric_version if scores_list else "unknown"
+            "rubric_version": scores_list[0].rubric_version if scores_list else "unknown",
+            "aggregates": aggregator.summary()
         }
 
         # Include per-item appendix if available
@@ -746,22 +864,14 @@ class ScoringPipeline:
         # Build an enriched appendix from scores_list and merge any existing breakdowns
         enriched = []
         try:
-            import json as _json
             id_to_bd = {d.get('content_id'): d for d in (per_item_breakdowns if 'per_item_breakdowns' in locals() else [])}
             for s in scores_list:
-                try:
-                    meta = s.meta
-                    if isinstance(meta, str):
-                        meta_obj = _json.loads(meta) if meta else {}
-                    elif isinstance(meta, dict):
-                        meta_obj = meta
-                    else:
-                        meta_obj = {}
-                except Exception:
-                    meta_obj = {}
+                meta_obj = ScoreMeta.coerce(s.meta)
 
                 # Smart fallback: ensure channel/platform_type are set
                 if not meta_obj.get('channel') or meta_obj.get('channel') == 'unknown':
+                    # Fill a copy so the item's own meta is left as scored
+                    meta_obj = ScoreMeta(meta_obj)
                     # Try to get from ContentScores attributes first
                     channel = getattr(s, 'channel', 'unknown')
                     platform_type = getattr(s, 'platform_type', 'unknown')
@@ -829,71 +939,19 @@ class ScoringPipeline:
 
         report['appendix'] = enriched
 
-        # Compute a content-type breakdown (percentage) using meta JSON where available
-        content_type_counts = {}
-        total = 0
-        for s in scores_list:
-            total += 1
-            try:
-                # meta might be a JSON string or dict depending on upstream. Try to parse
-                meta = s.meta
-                if isinstance(meta, str):
-                    import json as _json
-                    meta_obj = _json.loads(meta) if meta else {}
-                elif isinstance(meta, dict):
-                    meta_obj = meta
-                else:
-                    meta_obj = {}
-
-                ctype = meta_obj.get('content_type') or getattr(s, 'content_type', None) or 'unknown'
-            except Exception:
-                ctype = 'unknown'
-
-            content_type_counts[ctype] = content_type_counts.get(ctype, 0) + 1
-
-        # Convert to percentage breakdown
-        content_type_pct = {k: (v / total * 100.0) for k, v in content_type_counts.items()} if total > 0 else {}
+        # Content-type breakdown (percentage) using meta JSON where available
+        content_type_pct = aggregator.content_type_pct()
         report['content_type_breakdown_pct'] = content_type_pct
         # Build a per-item summary for reporting (title/url, per-dimension scores, final score, label)
         per_items = []
         for s in scores_list:
-            try:
-                meta = s.meta
-                if isinstance(meta, str):
-                    import json as _json
-                    meta_obj = _json.loads(meta) if meta else {}
-                elif isinstance(meta, dict):
-                    meta_obj = meta
-                else:
-                    meta_obj = {}
-            except Exception:
-                meta_obj = {}
-
-            # compute a simple final score from per-dimension scores and SETTINGS weights
-            from config.settings import SETTINGS
-            w = SETTINGS.get('scoring_weights')
-            try:
-                final_score = (
-                    getattr(s, 'score_provenance', 0.0) * w.provenance +
-                    getattr(s, 'score_resonance', 0.0) * w.resonance +
-                    getattr(s, 'score_coherence', 0.0) * w.coherence +
-                    getattr(s, 'score_transparency', 0.0) * w.transparency +
-                    getattr(s, 'score_verification', 0.0) * w.verification
-                ) * 100.0
-            except Exception:
-                final_score = 0.0
-
-            # Prefer LLM-adjusted final score if present in meta
-            try:
-                if isinstance(meta_obj, dict) and meta_obj.get('_llm_adjusted_score_total'):
-                    final_score = float(meta_obj.get('_llm_adjusted_score_total'))
-            except Exception:
-                pass
+            meta_obj = ScoreMeta.coerce(s.meta)
 
+            # SETTINGS-weighted final score, or the LLM-adjusted total if present in meta
             per_items.append({
                 'content_id': s.content_id,
                 'source': getattr(s, 'src', ''),
-                'final_score': final_score,
+                'final_score': report_final_score(s, meta_obj),
                 'label': getattr(s, 'class_label', '') or '',
                 'meta': meta_obj
             })
@@ -901,22 +959,6 @@ class ScoringPipeline:
         report['items'] = per_items
 
         # Score-based AR: mean of per-item final scores (0-100) converted to percentage
-        try:
-            if per_items:
-                score_mean = sum([it.get('final_score', 0.0) for it in per_items]) / len(per_items)
-            else:
-                score_mean = 0.0
-        except Exception:
-            score_mean = 0.0
-        report['score_based_ar_pct'] = float(score_mean)
+        report['score_based_ar_pct'] = float(aggregator.final.mean if aggregator.count else 0.0)
         
         return report
-    
-    def _calculate_std_dev(self, scores: List[float]) -> float:
-        """Calculate standard deviation"""
-        if len(scores) < 2:
-            return 0.0
-        
-        mean = sum(scores) / len(scores)
-        variance = sum((x - mean) ** 2 for x in scores) / (len(scores) - 1)
-        return variance ** 0.5
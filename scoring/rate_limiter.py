@@ -0,0 +1,376 @@
+"""
+Shared adaptive rate limiter for LLM traffic
+One limiter per provider/model enforces requests/min and tokens/min budgets
+and adapts concurrency with additive-increase/multiplicative-decrease (AIMD)
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Any, Optional, Callable, Awaitable, List, Tuple
+
+from config.settings import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether a provider exception is an HTTP 429 / rate limit error"""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status == 429:
+        return True
+    name = type(error).__name__.lower()
+    return 'ratelimit' in name or 'resourceexhausted' in name
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the Retry-After delay from a provider exception
+
+    Returns:
+        Delay in seconds, or None if the response carries no hint
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers.get('retry-after-ms')) / 1000.0
+        if headers.get('retry-after'):
+            return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], max_tokens: int = 0) -> int:
+    """Rough token estimate for a request (~4 characters per token plus the completion budget)"""
+    chars = sum(len(str(m.get('content', ''))) for m in messages)
+    return chars // 4 + (max_tokens or 0)
+
+
+def _response_tokens(response: Any) -> Optional[int]:
+    """Read total tokens from an OpenAI/Anthropic response or a ChatClient dict"""
+    usage = response.get('usage') if isinstance(response, dict) else getattr(response, 'usage', None)
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        total = usage.get('total_tokens')
+    else:
+        total = getattr(usage, 'total_tokens', None)
+        if total is None:
+            total = (getattr(usage, 'input_tokens', 0) or 0) + (getattr(usage, 'output_tokens', 0) or 0)
+    try:
+        return int(total) if total else None
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Requests/min + tokens/min token buckets with an AIMD concurrency window
+
+    acquire() blocks until a concurrency slot, one request and the estimated
+    tokens are available. release() reports the outcome: a 429 halves the
+    window and pauses new requests for Retry-After (or a default backoff),
+    latency above the target shrinks it more gently, and every success grows
+    it by 1/window (about +1 per window of successful calls).
+    """
+
+    def __init__(self, name: str, requests_per_minute: int = 0, tokens_per_minute: int = 0,
+                 max_concurrency: int = 16, min_concurrency: int = 1,
+                 initial_concurrency: Optional[int] = None,
+                 latency_target: Optional[float] = None,
+                 decrease_factor: float = 0.5, backoff_seconds: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize limiter
+
+        Args:
+            name: Label for logging (e.g. "openai/gpt-3.5-turbo")
+            requests_per_minute: Request budget; 0 disables it
+            tokens_per_minute: Token budget; 0 disables it
+            max_concurrency: Upper bound on in-flight requests
+            min_concurrency: Lower bound the window never shrinks below
+            initial_concurrency: Starting window (default: half of max)
+            latency_target: Latency in seconds above which the window shrinks
+            decrease_factor: Multiplicative decrease applied on 429
+            backoff_seconds: Pause after a 429 without Retry-After
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.backoff_seconds = backoff_seconds
+        self._clock = clock
+
+        if initial_concurrency is None:
+            initial_concurrency = max(self.min_concurrency, self.max_concurrency // 2)
+        self.concurrency_limit = float(min(self.max_concurrency, max(self.min_concurrency, initial_concurrency)))
+
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._request_tokens = float(requests_per_minute)
+        self._token_tokens = float(tokens_per_minute)
+        self._last_refill = clock()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._stats = {'requests': 0, 'rate_limited': 0, 'slow': 0, 'wait_seconds': 0.0, 'tokens': 0}
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._last_refill)
+        self._last_refill = now
+        if self.requests_per_minute:
+            self._request_tokens = min(float(self.requests_per_minute),
+                                       self._request_tokens + elapsed * self.requests_per_minute / 60.0)
+        if self.tokens_per_minute:
+            self._token_tokens = min(float(self.tokens_per_minute),
+                                     self._token_tokens + elapsed * self.tokens_per_minute / 60.0)
+
+    def _wait_time(self, now: float, tokens: int) -> Optional[float]:
+        """Seconds until a request can start, 0 if it can start now, None to wait for a release"""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._in_flight >= int(self.concurrency_limit):
+            return None
+        wait = 0.0
+        if self.requests_per_minute and self._request_tokens < 1:
+            wait = max(wait, (1 - self._request_tokens) * 60.0 / self.requests_per_minute)
+        if self.tokens_per_minute:
+            # A single request larger than the whole budget waits for a full bucket
+            needed = min(tokens, self.tokens_per_minute)
+            if self._token_tokens < needed:
+                wait = max(wait, (needed - self._token_tokens) * 60.0 / self.tokens_per_minute)
+        return wait
+
+    def _take(self, estimated_tokens: int) -> None:
+        self._in_flight += 1
+        if self.requests_per_minute:
+            self._request_tokens -= 1
+        if self.tokens_per_minute:
+            self._token_tokens -= estimated_tokens
+        self._stats['requests'] += 1
+
+    def acquire(self, estimated_tokens: int = 0) -> None:
+        """Block until the request may be sent"""
+        started = self._clock()
+        with self._cond:
+            while True:
+                now = self._clock()
+                self._refill(now)
+                wait = self._wait_time(now, estimated_tokens)
+                if wait == 0:
+                    break
+                self._cond.wait(timeout=wait)
+
+            self._take(estimated_tokens)
+            self._stats['wait_seconds'] += self._clock() - started
+
+    def try_acquire(self, estimated_tokens: int = 0) -> Optional[float]:
+        """
+        Non-blocking acquire for event-loop callers
+
+        Returns:
+            0 if the request was admitted, otherwise seconds to wait before
+            trying again (None if it is waiting on an in-flight request)
+        """
+        with self._cond:
+            now = self._clock()
+            self._refill(now)
+            wait = self._wait_time(now, estimated_tokens)
+            if wait == 0:
+                self._take(estimated_tokens)
+            return wait
+
+    def release(self, latency: float, estimated_tokens: int = 0, actual_tokens: Optional[int] = None,
+                rate_limited: bool = False, retry_after: Optional[float] = None) -> None:
+        """
+        Report the outcome of a request acquired with acquire()
+
+        Args:
+            latency: Seconds the provider call took
+            estimated_tokens: Tokens debited at acquire()
+            actual_tokens: Tokens the provider reported (corrects the estimate)
+            rate_limited: True if the provider answered 429
+            retry_after: Retry-After delay from the provider, if any
+        """
+        with self._cond:
+            now = self._clock()
+            self._in_flight = max(0, self._in_flight - 1)
+            if self.tokens_per_minute and actual_tokens is not None:
+                self._token_tokens += estimated_tokens - actual_tokens
+            if not rate_limited:
+                self._stats['tokens'] += actual_tokens if actual_tokens is not None else estimated_tokens
+
+            if rate_limited:
+                self._stats['rate_limited'] += 1
+                self._paused_until = max(self._paused_until, now + (retry_after if retry_after is not None else self.backoff_seconds))
+                self._decrease(now, self.decrease_factor, force=True)
+                logger.warning(f"LLM rate limited on {self.name}; concurrency -> {int(self.concurrency_limit)}, "
+                               f"pausing {self._paused_until - now:.1f}s")
+            elif self.latency_target and latency > self.latency_target:
+                self._stats['slow'] += 1
+                self._decrease(now, 0.8)
+            else:
+                self.concurrency_limit = min(float(self.max_concurrency),
+                                             self.concurrency_limit + 1.0 / self.concurrency_limit)
+            self._cond.notify_all()
+
+    def _decrease(self, now: float, factor: float, force: bool = False) -> None:
+        # Responses that were already in flight report the same congestion;
+        # only shrink once per latency-target window unless forced by a 429
+        cooldown = self.latency_target or 1.0
+        if not force and now - self._last_decrease < cooldown:
+            return
+        self.concurrency_limit = max(float(self.min_concurrency), self.concurrency_limit * factor)
+        self._last_decrease = now
+
+    def stats(self) -> Dict[str, Any]:
+        """Get counters and the current concurrency window"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats['concurrency_limit'] = int(self.concurrency_limit)
+            stats['in_flight'] = self._in_flight
+        return stats
+
+
+_limiters: Dict[Tuple[str, str], AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str) -> AdaptiveRateLimiter:
+    """
+    Get the process-wide limiter for a provider/model
+
+    Budgets come from SETTINGS['llm_requests_per_minute'] etc., overridden
+    by SETTINGS['llm_rate_limit_overrides'] keyed by "provider/model" or
+    "provider".
+    """
+    key = (provider, model)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            overrides = SETTINGS.get('llm_rate_limit_overrides', {}) or {}
+            config = {
+                'requests_per_minute': SETTINGS.get('llm_requests_per_minute', 0),
+                'tokens_per_minute': SETTINGS.get('llm_tokens_per_minute', 0),
+                'max_concurrency': SETTINGS.get('llm_max_concurrency', 16),
+                'latency_target': SETTINGS.get('llm_latency_target_seconds') or None,
+            }
+            config.update(overrides.get(provider, {}))
+            config.update(overrides.get(f"{provider}/{model}", {}))
+            limiter = AdaptiveRateLimiter(f"{provider}/{model}", **config)
+            _limiters[key] = limiter
+        return limiter
+
+
+def token_usage() -> Dict[Tuple[str, str], int]:
+    """
+    Tokens spent per (provider, model) since each limiter was created
+
+    Counts provider-reported usage, or the request estimate when the
+    response carries none.
+    """
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {key: limiter.stats()['tokens'] for key, limiter in limiters.items()}
+
+
+def reset_rate_limiters() -> None:
+    """Drop all limiters (they are rebuilt from SETTINGS on next use)"""
+    with _limiters_lock:
+        _limiters.clear()
+
+
+def call_with_rate_limit(provider: str, model: str, call: Callable[[], Any],
+                         estimated_tokens: int = 0, max_retries: Optional[int] = None) -> Any:
+    """
+    Run an LLM call through the shared limiter for provider/model
+
+    429 responses shrink the concurrency window and are retried (after the
+    Retry-After pause) up to max_retries times before the error is raised,
+    so call sites only fall back to neutral scores when the budget is truly
+    exhausted.
+
+    Args:
+        provider: Provider name (openai, anthropic, google, deepseek)
+        model: Model name
+        call: Zero-argument function that performs the request
+        estimated_tokens: Token estimate debited from the tokens/min budget
+        max_retries: Retries on 429 (default: SETTINGS['llm_rate_limit_retries'])
+
+    Returns:
+        Whatever `call` returns
+    """
+    if max_retries is None:
+        max_retries = SETTINGS.get('llm_rate_limit_retries', 3)
+    limiter = get_rate_limiter(provider, model)
+
+    attempt = 0
+    while True:
+        limiter.acquire(estimated_tokens)
+        started = time.monotonic()
+        try:
+            result = call()
+        except Exception as e:
+            latency = time.monotonic() - started
+            if is_rate_limit_error(e):
+                limiter.release(latency, estimated_tokens, rate_limited=True, retry_after=get_retry_after(e))
+                if attempt < max_retries:
+                    attempt += 1
+                    continue
+            else:
+                limiter.release(latency, estimated_tokens)
+            raise
+
+        limiter.release(time.monotonic() - started, estimated_tokens, actual_tokens=_response_tokens(result))
+        return result
+
+
+async def acall_with_rate_limit(provider: str, model: str, call: Callable[[], Awaitable[Any]],
+                                estimated_tokens: int = 0, max_retries: Optional[int] = None) -> Any:
+    """
+    Async counterpart of call_with_rate_limit
+
+    Waits for the shared limiter with asyncio.sleep instead of blocking a
+    thread. A cancelled call releases its slot before the cancellation
+    propagates.
+    """
+    if max_retries is None:
+        max_retries = SETTINGS.get('llm_rate_limit_retries', 3)
+    limiter = get_rate_limiter(provider, model)
+
+    attempt = 0
+    while True:
+        while True:
+            wait = limiter.try_acquire(estimated_tokens)
+            if wait == 0:
+                break
+            await asyncio.sleep(wait if wait is not None else 0.05)
+
+        started = time.monotonic()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            limiter.release(time.monotonic() - started, estimated_tokens)
+            raise
+        except Exception as e:
+            latency = time.monotonic() - started
+            if is_rate_limit_error(e):
+                limiter.release(latency, estimated_tokens, rate_limited=True, retry_after=get_retry_after(e))
+                if attempt < max_retries:
+                    attempt += 1
+                    continue
+            else:
+                limiter.release(latency, estimated_tokens)
+            raise
+
+        limiter.release(time.monotonic() - started, estimated_tokens, actual_tokens=_response_tokens(result))
+        return result
@@ -1,6 +1,10 @@
+import copy
+import hashlib
 import json
+import operator
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, List, Optional, Tuple, NamedTuple, FrozenSet
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 RUBRIC_PATH = os.path.join(PROJECT_ROOT, "config", "rubric.json")
@@ -36,21 +40,8 @@ def _normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
     return {k: float(v) / float(total) for k, v in weights.items()}
 
 
-def load_rubric(path: str = None) -> Dict[str, Any]:
-    """Load rubric JSON from `config/rubric.json` with validation and fallbacks.
-
-    Returns a dict with keys: dimension_weights, thresholds, attributes, defaults
-    """
-    p = path or RUBRIC_PATH
-    if not os.path.exists(p):
-        return DEFAULT_RUBRIC.copy()
-
-    try:
-        with open(p, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception:
-        return DEFAULT_RUBRIC.copy()
-
+def _normalize_rubric(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate parsed rubric JSON and fill defaults"""
     # Basic validation and fill defaults
     dim = data.get("dimension_weights", DEFAULT_RUBRIC["dimension_weights"])
     defaults = data.get("defaults", DEFAULT_RUBRIC["defaults"])
@@ -72,6 +63,205 @@ def load_rubric(path: str = None) -> Dict[str, Any]:
     }
 
 
+def load_rubric(path: str = None) -> Dict[str, Any]:
+    """Load rubric JSON from `config/rubric.json` with validation and fallbacks.
+
+    Returns a dict with keys: dimension_weights, thresholds, attributes, defaults
+
+    The result is a private copy of the cached rubric (see get_rubric), so
+    callers may modify it.
+    """
+    return copy.deepcopy(get_rubric(path).rubric)
+
+
+# Numeric comparisons supported by attribute `condition` rules
+_CONDITION_OPS = {'>=': operator.ge, '<=': operator.le, '>': operator.gt, '<': operator.lt}
+
+
+class MetaRule(NamedTuple):
+    """An enabled attribute bonus/penalty that can trigger on item meta"""
+    id: str
+    effect: str
+    value: float
+    dimension: Optional[str]
+    label: Optional[str]
+    match_meta: Tuple[str, ...]
+    op: Optional[str] = None
+    threshold: Optional[float] = None
+
+    def evaluate(self, meta: Dict[str, Any]) -> Optional[str]:
+        """Reason string when the rule triggers on `meta`, else None"""
+        if self.op is None:
+            # Trigger if any of match_meta keys is present and truthy
+            for mk in self.match_meta:
+                if meta.get(mk):
+                    return f"meta.{mk} present"
+            return None
+        compare = _CONDITION_OPS[self.op]
+        for mk in self.match_meta:
+            if mk in meta:
+                try:
+                    mval = float(meta.get(mk))
+                except (TypeError, ValueError):
+                    continue
+                if compare(mval, self.threshold):
+                    return f"{mk} {mval} {self.op} {self.threshold}"
+        return None
+
+
+class CompiledRubric:
+    """
+    Rubric prepared for the scoring hot path
+
+    Attributes:
+        rubric: load_rubric-style dict (normalized weights and defaults);
+            shared, treat as read-only
+        source: Raw parsed rubric JSON; shared, treat as read-only
+        version: Rubric `version` field
+        fingerprint: Short hash of the rubric file contents, for cache keys
+        dimension_weights: Normalized dimension weights
+        thresholds: Label thresholds (0-100)
+        threshold_table: (min_score, label) pairs, highest first
+        multipliers: (dimension, content_type) -> score multiplier, with
+            content_type '_default' as each dimension's fallback
+        enabled_attributes: Attribute id -> definition for attributes with
+            `enabled: true` (the attribute detector's set)
+        enabled_by_dimension: Dimension -> ids of enabled attributes
+        meta_rules: Attribute bonuses/penalties that can trigger on item meta
+    """
+
+    def __init__(self, source: Dict[str, Any], fingerprint: str):
+        self.source = source
+        self.fingerprint = fingerprint
+        self.rubric = _normalize_rubric(source)
+        self.version = self.rubric.get('version')
+        self.dimension_weights: Dict[str, float] = dict(self.rubric['dimension_weights'])
+        self.thresholds: Dict[str, float] = dict(self.rubric['thresholds'])
+        self.defaults: Dict[str, Any] = self.rubric['defaults']
+        self.threshold_table: List[Tuple[float, str]] = [
+            (float(self.thresholds.get('authentic', 75.0)), 'authentic'),
+            (float(self.thresholds.get('suspect', 40.0)), 'suspect'),
+        ]
+
+        self.multipliers: Dict[Tuple[str, str], float] = {}
+        for dimension, by_type in (self.rubric.get('score_multipliers') or {}).items():
+            if not isinstance(by_type, dict):
+                continue
+            for content_type, value in by_type.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    self.multipliers[(dimension, content_type)] = float(value)
+
+        attributes = self.rubric.get('attributes') or []
+        self.enabled_attributes: Dict[str, Dict[str, Any]] = {
+            attr['id']: attr for attr in attributes if attr.get('enabled', False) and 'id' in attr
+        }
+        by_dimension: Dict[str, set] = {}
+        for attr_id, attr in self.enabled_attributes.items():
+            by_dimension.setdefault(attr.get('dimension'), set()).add(attr_id)
+        self.enabled_by_dimension: Dict[str, FrozenSet[str]] = {
+            dimension: frozenset(ids) for dimension, ids in by_dimension.items()
+        }
+        self.meta_rules: List[MetaRule] = [
+            rule for rule in (self._compile_meta_rule(attr) for attr in attributes) if rule is not None
+        ]
+
+    @staticmethod
+    def _compile_meta_rule(attr: Dict[str, Any]) -> Optional[MetaRule]:
+        """MetaRule for an attribute, or None when it can never change a score"""
+        # Meta rules count as enabled unless disabled explicitly
+        if not attr.get('enabled', True):
+            return None
+        value = attr.get('value', 0) or 0
+        match_meta = tuple(attr.get('match_meta') or ())
+        if value == 0 or not match_meta:
+            return None
+        op = threshold = None
+        condition = attr.get('condition')
+        if condition:
+            op = condition.get('op')
+            try:
+                threshold = float(condition.get('threshold'))
+            except (TypeError, ValueError):
+                return None
+            if op not in _CONDITION_OPS:
+                return None
+        return MetaRule(attr.get('id'), attr.get('effect', 'bonus'), float(value),
+                        attr.get('dimension'), attr.get('label'), match_meta, op, threshold)
+
+    def multiplier(self, dimension: str, content_type: str) -> float:
+        """Score multiplier for a dimension and content type (1.0 if not configured)"""
+        value = self.multipliers.get((dimension, content_type))
+        if value is None:
+            value = self.multipliers.get((dimension, '_default'), 1.0)
+        return value
+
+    def classify(self, score: float) -> str:
+        """Label for a 0-100 score from the threshold table"""
+        for minimum, label in self.threshold_table:
+            if score >= minimum:
+                return label
+        return 'inauthentic'
+
+
+_DEFAULT_FINGERPRINT = 'default-' + hashlib.sha256(
+    json.dumps(DEFAULT_RUBRIC, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+
+# Path -> (stat signature, CompiledRubric)
+_cache: Dict[str, Tuple[Optional[Tuple[int, int]], CompiledRubric]] = {}
+_cache_lock = threading.Lock()
+
+
+def _stat_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def get_rubric(path: str = None) -> CompiledRubric:
+    """
+    Process-wide compiled rubric for `path` (default config/rubric.json)
+
+    The file is stat()ed on every call and re-read only when its mtime or
+    size changed; it is recompiled only when the contents hash differs, so
+    rubric edits take effect in long-running processes without a restart.
+    A missing or unparsable file yields the built-in DEFAULT_RUBRIC.
+    """
+    p = os.path.abspath(path or RUBRIC_PATH)
+    signature = _stat_signature(p)
+    cached = _cache.get(p)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with _cache_lock:
+        cached = _cache.get(p)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        compiled = None
+        if signature is not None:
+            try:
+                with open(p, 'rb') as f:
+                    raw = f.read()
+                fingerprint = hashlib.sha256(raw).hexdigest()[:12]
+                if cached is not None and cached[1].fingerprint == fingerprint:
+                    compiled = cached[1]
+                else:
+                    compiled = CompiledRubric(json.loads(raw.decode('utf-8')), fingerprint)
+            except Exception:
+                compiled = None
+        if compiled is None:
+            compiled = CompiledRubric(copy.deepcopy(DEFAULT_RUBRIC), _DEFAULT_FINGERPRINT)
+        _cache[p] = (signature, compiled)
+        return compiled
+
+
+def clear_rubric_cache() -> None:
+    """Drop all compiled rubrics (they are rebuilt on next use)"""
+    with _cache_lock:
+        _cache.clear()
+
+
 if __name__ == "__main__":
     import pprint
 
@@ -0,0 +1,248 @@
+"""
+Budget-aware scoring scheduler
+Orders a batch by expected information value and assigns each item a
+scoring treatment (full LLM, cheaper model, detector-only or skip) from
+the run's token/cost/time budget
+"""
+
+import time
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence, Callable, Tuple
+
+from config.settings import SETTINGS
+from scoring.rate_limiter import token_usage
+
+logger = logging.getLogger(__name__)
+
+# Treatments recorded per item (ContentScores meta 'scoring_treatment')
+TREATMENT_LLM = 'llm'
+TREATMENT_CHEAP_MODEL = 'cheap_model'
+TREATMENT_DETECTOR_ONLY = 'detector_only'
+TREATMENT_SKIPPED = 'skipped'
+TREATMENT_REUSED = 'reused'
+
+EXHAUSTED_TREATMENTS = (TREATMENT_DETECTOR_ONLY, TREATMENT_SKIPPED)
+
+
+@dataclass
+class ScoringBudget:
+    """
+    Per-run scoring budget; None leaves a limit unset
+
+    The last `cheap_reserve` share of the token/cost/time budget is spent
+    on `cheap_model`; once the budget is gone the remaining items get
+    `exhausted_treatment`.
+    """
+    max_tokens: Optional[int] = None
+    max_cost: Optional[float] = None
+    max_seconds: Optional[float] = None
+    max_llm_items: Optional[int] = None
+    cheap_model: Optional[str] = None
+    cheap_reserve: float = 0.2
+    exhausted_treatment: str = TREATMENT_DETECTOR_ONLY
+
+    def __post_init__(self):
+        if self.exhausted_treatment not in EXHAUSTED_TREATMENTS:
+            raise ValueError(f"exhausted_treatment must be one of {EXHAUSTED_TREATMENTS}, "
+                             f"got {self.exhausted_treatment!r}")
+
+    @classmethod
+    def from_settings(cls) -> 'ScoringBudget':
+        """
+        Budget from SETTINGS['scoring_budget_*'], falling back to the rubric's
+        defaults.max_llm_items and defaults.max_llm_cost_per_run
+        """
+        from scoring.rubric import get_rubric
+
+        defaults = get_rubric().defaults
+        max_cost = SETTINGS.get('scoring_budget_max_cost')
+        if max_cost is None:
+            max_cost = defaults.get('max_llm_cost_per_run')
+        max_llm_items = SETTINGS.get('scoring_budget_max_llm_items')
+        if max_llm_items is None:
+            max_llm_items = defaults.get('max_llm_items')
+        return cls(
+            max_tokens=SETTINGS.get('scoring_budget_max_tokens'),
+            max_cost=max_cost,
+            max_seconds=SETTINGS.get('scoring_budget_max_seconds'),
+            max_llm_items=max_llm_items,
+            cheap_model=SETTINGS.get('scoring_budget_cheap_model'),
+            cheap_reserve=SETTINGS.get('scoring_budget_cheap_reserve', 0.2),
+            exhausted_treatment=SETTINGS.get('scoring_budget_exhausted_treatment', TREATMENT_DETECTOR_ONLY),
+        )
+
+
+def tokens_cost(usage: Dict[Tuple[str, str], int]) -> float:
+    """USD cost of token usage per (provider, model) from SETTINGS['llm_cost_per_1k_tokens']"""
+    prices = SETTINGS.get('llm_cost_per_1k_tokens', {})
+    default = prices.get('default', 0.0)
+    return sum(tokens / 1000.0 * prices.get(model, default) for (_, model), tokens in usage.items())
+
+
+def item_value(content: Any, uncertainty: float = 0.5) -> float:
+    """
+    Static expected information value of scoring an item with the LLM
+
+    Brand-owned pages matter most to the report; uncertain items (per the
+    triage model) are where an LLM score changes the outcome most.
+    """
+    weights = SETTINGS.get('scoring_priority_weights', {})
+    value = weights.get('uncertainty', 1.0) * uncertainty
+    if getattr(content, 'source_type', 'unknown') == 'brand_owned':
+        value += weights.get('brand_owned', 2.0)
+    return value
+
+
+def prioritize(contents: Sequence[Any], uncertainties: Optional[Sequence[float]] = None) -> List[int]:
+    """
+    Order items by expected information value
+
+    Static value (item_value) plus a channel-coverage bonus that shrinks
+    with every item already picked from the same channel, so the first
+    pages of each channel come before the tenth page of any one channel.
+
+    Args:
+        contents: Items to order
+        uncertainties: Triage uncertainty per item (0.5 when unknown)
+
+    Returns:
+        Indices into `contents`, highest value first
+    """
+    coverage_weight = SETTINGS.get('scoring_priority_weights', {}).get('channel_coverage', 1.0)
+    if uncertainties is None:
+        uncertainties = [0.5] * len(contents)
+
+    by_channel: Dict[str, List[Tuple[float, int]]] = {}
+    for i, (content, uncertainty) in enumerate(zip(contents, uncertainties)):
+        channel = getattr(content, 'channel', None) or getattr(content, 'src', 'unknown')
+        by_channel.setdefault(channel, []).append((item_value(content, uncertainty), i))
+    for queue in by_channel.values():
+        # Highest value first; ties keep input order
+        queue.sort(key=lambda vi: (-vi[0], vi[1]))
+
+    picked = {channel: 0 for channel in by_channel}
+    heads = {channel: 0 for channel in by_channel}
+    order = []
+    while len(order) < len(contents):
+        best_channel, best_key = None, None
+        for channel, queue in by_channel.items():
+            if heads[channel] >= len(queue):
+                continue
+            value, index = queue[heads[channel]]
+            key = (value + coverage_weight / (1 + picked[channel]), -index)
+            if best_key is None or key > best_key:
+                best_channel, best_key = channel, key
+        order.append(by_channel[best_channel][heads[best_channel]][1])
+        heads[best_channel] += 1
+        picked[best_channel] += 1
+    return order
+
+
+class ScoringScheduler:
+    """
+    Assigns scoring treatments against a budget as items start
+
+    Spend is the token usage of all rate-limited LLM calls since start()
+    (so cached responses are free), plus the average spend of a finished
+    LLM item for each item still in flight. Usage is read from the
+    process-wide rate limiters (token_usage), so runs scoring at the same
+    time in one process (e.g. several webapp sessions) count each other's
+    calls against their budgets. Treatments, in order:
+
+    - llm: while spend is below (1 - cheap_reserve) of every limit and
+      fewer than max_llm_items items got the full LLM treatment
+    - cheap_model: until the budget is spent (needs budget.cheap_model)
+    - budget.exhausted_treatment (detector_only or skipped) afterwards
+    """
+
+    def __init__(self, budget: ScoringBudget,
+                 usage: Callable[[], Dict[Tuple[str, str], int]] = token_usage,
+                 clock: Callable[[], float] = time.monotonic):
+        self.budget = budget
+        self._usage = usage
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.treatments: Dict[str, str] = {}
+        self.start()
+
+    def start(self) -> None:
+        """Reset spend and treatments for a new run"""
+        with self._lock:
+            self._baseline = self._usage()
+            self._started = self._clock()
+            self._in_flight = 0
+            self._llm_started = 0
+            self._finished = 0
+            self.treatments = {}
+
+    def _spend(self) -> Tuple[int, float]:
+        """Tokens and cost since start()"""
+        usage = self._usage()
+        delta = {key: tokens - self._baseline.get(key, 0) for key, tokens in usage.items()}
+        return sum(delta.values()), tokens_cost(delta)
+
+    def spent_fraction(self) -> float:
+        """Largest share of any configured limit already spent (with in-flight projection)"""
+        budget = self.budget
+        tokens, cost = self._spend()
+        projection = self._in_flight / self._finished if self._finished else 0.0
+        fractions = [0.0]
+        if budget.max_tokens:
+            fractions.append(tokens * (1 + projection) / budget.max_tokens)
+        if budget.max_cost:
+            fractions.append(cost * (1 + projection) / budget.max_cost)
+        if budget.max_seconds:
+            fractions.append((self._clock() - self._started) / budget.max_seconds)
+        return max(fractions)
+
+    def acquire(self, content_id: str) -> str:
+        """
+        Pick the treatment for an item that is about to be scored
+
+        Returns:
+            One of the TREATMENT_* constants
+        """
+        budget = self.budget
+        with self._lock:
+            spent = self.spent_fraction()
+            llm_items_left = budget.max_llm_items is None or self._llm_started < budget.max_llm_items
+            cheap_limit = 1.0 if budget.cheap_model else 0.0
+            if llm_items_left and spent < 1.0 - (budget.cheap_reserve if budget.cheap_model else 0.0):
+                treatment = TREATMENT_LLM
+                self._llm_started += 1
+            elif spent < cheap_limit:
+                treatment = TREATMENT_CHEAP_MODEL
+            else:
+                treatment = budget.exhausted_treatment
+            if treatment in (TREATMENT_LLM, TREATMENT_CHEAP_MODEL):
+                self._in_flight += 1
+            self.treatments[content_id] = treatment
+        return treatment
+
+    def release(self, treatment: str) -> None:
+        """Mark an item acquired with acquire() as finished"""
+        if treatment not in (TREATMENT_LLM, TREATMENT_CHEAP_MODEL):
+            return
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._finished += 1
+
+    def record(self, content_id: str, treatment: str) -> None:
+        """Record a treatment decided outside the budget (e.g. reused scores)"""
+        with self._lock:
+            self.treatments[content_id] = treatment
+
+    def summary(self) -> Dict[str, Any]:
+        """Treatment per item and counts, plus tokens/cost/seconds spent since start()"""
+        with self._lock:
+            tokens, cost = self._spend()
+            return {
+                'treatments': dict(self.treatments),
+                'counts': dict(Counter(self.treatments.values())),
+                'tokens': tokens,
+                'cost': round(cost, 6),
+                'seconds': round(self._clock() - self._started, 3),
+            }
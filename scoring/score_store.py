@@ -0,0 +1,149 @@
+"""
+Persistent score store for incremental rescoring
+Reuses prior dimension scores, LLM issues and detected attributes for content
+whose normalized text and scoring configuration have not changed
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+from config.settings import SETTINGS
+from .llm_cache import LLMResponseCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = os.path.join('.cache', 'scores', 'scores.sqlite3')
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Casefold and collapse whitespace so cosmetic re-fetch differences don't change the fingerprint"""
+    return ' '.join((text or '').split()).casefold()
+
+
+def content_fingerprint(content: Any) -> str:
+    """
+    Fingerprint the parts of a content item the scorers read
+
+    Covers the normalized title and body plus the URL, source and footer
+    links that provenance/transparency scoring look at.
+    """
+    meta = getattr(content, 'meta', None) or {}
+    payload = {
+        'title': normalize_text(getattr(content, 'title', '')),
+        'body': normalize_text(getattr(content, 'body', '')),
+        'url': getattr(content, 'url', '') or getattr(content, 'platform_id', ''),
+        'src': getattr(content, 'src', ''),
+        'source_type': getattr(content, 'source_type', 'unknown'),
+        'terms': meta.get('terms') if isinstance(meta, dict) else None,
+        'privacy': meta.get('privacy') if isinstance(meta, dict) else None,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+_rubric_fingerprints: Dict[str, Tuple[float, str]] = {}
+_rubric_lock = threading.Lock()
+
+
+def rubric_fingerprint(path: Optional[str] = None) -> str:
+    """SHA-256 of the rubric file (re-read only when its mtime changes)"""
+    from scoring.rubric import RUBRIC_PATH
+
+    path = path or RUBRIC_PATH
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return 'missing'
+    with _rubric_lock:
+        cached = _rubric_fingerprints.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    with _rubric_lock:
+        _rubric_fingerprints[path] = (mtime, digest)
+    return digest
+
+
+def make_score_key(content: Any, brand_context: Dict[str, Any], rubric_version: str,
+                   model: str, **extra: Any) -> str:
+    """
+    Build the store key for one item
+
+    Args:
+        content: Content being scored
+        brand_context: Brand context the scorers prompt with
+        rubric_version: SETTINGS['rubric_version']
+        model: Scoring model name
+        **extra: Any other scoring configuration that changes the result
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = {
+        'content': content_fingerprint(content),
+        'brand_context': brand_context,
+        'rubric_version': rubric_version,
+        'rubric': rubric_fingerprint(),
+        'model': model,
+        'prompt_version': SETTINGS.get('scoring_prompt_version'),
+        'extra': extra,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ScoreStore(LLMResponseCache):
+    """
+    SQLite store of finished per-item scoring results
+
+    Shares the LLM response cache's storage (WAL, TTL, LRU bound) but keeps
+    its own file and limits; a hit means the item is not rescored at all.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None, bypass: Optional[bool] = None):
+        """
+        Initialize store
+
+        Args:
+            path: SQLite file path (default: SETTINGS['score_store_path'])
+            ttl_seconds: Entry lifetime (default: SETTINGS['score_store_ttl_seconds'])
+            max_entries: LRU bound (default: SETTINGS['score_store_max_entries'])
+            bypass: If True, never read or write the store
+        """
+        super().__init__(
+            path=path or SETTINGS.get('score_store_path') or DEFAULT_STORE_PATH,
+            ttl_seconds=ttl_seconds if ttl_seconds is not None else SETTINGS.get('score_store_ttl_seconds', 0),
+            max_entries=max_entries if max_entries is not None else SETTINGS.get('score_store_max_entries', 0),
+            bypass=bypass if bypass is not None else False,
+        )
+
+    def contains(self, key: str) -> bool:
+        """Check for a live entry without counting a hit or touching its LRU position"""
+        if self.bypass:
+            return False
+        try:
+            row = self._connect().execute("SELECT created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        except Exception as e:
+            logger.debug(f"Score store read failed: {e}")
+            return False
+        return row is not None and not (self.ttl_seconds and time.time() - row[0] > self.ttl_seconds)
+
+
+_shared_store: Optional[ScoreStore] = None
+_shared_store_lock = threading.Lock()
+
+
+def get_score_store() -> ScoreStore:
+    """Get the process-wide score store"""
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = ScoreStore(bypass=not SETTINGS.get('score_store_enabled', True))
+        return _shared_store
@@ -4,18 +4,31 @@ Scores content on Provenance, Verification, Transparency, Coherence, Resonance
 Integrates with TrustStackAttributeDetector for comprehensive ratings
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Callable
 import logging
 import json
+import threading
+import contextvars
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from config.settings import SETTINGS
-from data.models import NormalizedContent, ContentScores, DetectedAttribute
+from data.models import NormalizedContent, ContentScores, DetectedAttribute, ScoreMeta
 from scoring.attribute_detector import TrustStackAttributeDetector
-from scoring.scoring_llm_client import LLMScoringClient
+from scoring.scoring_llm_client import LLMScoringClient, band_boundaries
 from scoring.verification_manager import VerificationManager
+from scoring.claim_detector import should_verify, SIGNAL_WEIGHTS
 from scoring.linguistic_analyzer import LinguisticAnalyzer
 from scoring.triage import TriageScorer
+from scoring.triage_model import TriageRun, get_triage_gate
+from scoring.rubric import get_rubric
+from scoring.text_profile import profile_of
+from scoring.brand_guidelines import get_brand_guidelines
+from scoring.scheduler import (
+    ScoringBudget, ScoringScheduler, prioritize,
+    TREATMENT_LLM, TREATMENT_CHEAP_MODEL, TREATMENT_DETECTOR_ONLY, TREATMENT_SKIPPED, TREATMENT_REUSED
+)
+from scoring.score_store import get_score_store, make_score_key
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +75,19 @@ class ContentScorer:
         self.verification_manager = VerificationManager()
         self.linguistic_analyzer = LinguisticAnalyzer()
         self.triage_scorer = TriageScorer()
+        # Learned triage: confident model predictions replace LLM scoring
+        self.triage_gate = get_triage_gate()
+
+        # Guards the per-content side channels (_llm_issues/_score_debug) that
+        # dimension scorers write to when they run on worker threads
+        self._side_channel_lock = threading.Lock()
+
+        # Incremental rescoring: unchanged items reuse their stored result
+        self.score_store = get_score_store()
+        self.reuse_stats = {'reused': 0, 'scored': 0}
+        # ScoringScheduler.summary() of the last budget-scheduled batch
+        self.last_schedule: Optional[Dict[str, Any]] = None
+        self._score_failures = 0
     
     def score_content(self, content: NormalizedContent, brand_context: Dict[str, Any]) -> DimensionScores:
         """
@@ -96,17 +122,10 @@ class ContentScorer:
                     )
 
             # Get LLM scores for each dimension
-            provenance_score = self._score_provenance(content, brand_context)
-            verification_score = self._score_verification(content, brand_context)
-            transparency_score = self._score_transparency(content, brand_context)
-            coherence_score = self._score_coherence(content, brand_context)
-            resonance_score = self._score_resonance(content, brand_context)
+            dimension_results = self._run_dimension_scorers(content, brand_context)
 
             # Serialize score debug info to meta
-            score_debug = getattr(content, '_score_debug', {})
-            score_debug = getattr(content, '_score_debug', {})
-            # import json - removed, using global import
-            meta_json = json.dumps(score_debug) if score_debug else ""
+            score_debug = content._score_debug
             
             if score_debug:
                 # Update content.meta with score debug info so it persists
@@ -115,11 +134,11 @@ class ContentScorer:
                 content.meta['score_debug'] = json.dumps(score_debug)
 
             return DimensionScores(
-                provenance=provenance_score,
-                verification=verification_score,
-                transparency=transparency_score,
-                coherence=coherence_score,
-                resonance=resonance_score
+                provenance=dimension_results['provenance'],
+                verification=dimension_results['verification'],
+                transparency=dimension_results['transparency'],
+                coherence=dimension_results['coherence'],
+                resonance=dimension_results['resonance']
             ) # Note: ContentScores creation happens in the caller (Pipeline), 
               # but we need to ensure the metadata is passed along. 
               # The caller typically uses content.meta. 
@@ -128,8 +147,112 @@ class ContentScorer:
 
         except Exception as e:
             logger.error(f"Error scoring content {content.content_id}: {e}")
+            with self._side_channel_lock:
+                self._score_failures += 1
             # Return neutral scores on error
             return DimensionScores(0.5, 0.5, 0.5, 0.5, 0.5)
+
+    def _run_dimension_scorers(self, content: NormalizedContent,
+                               brand_context: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Run the five dimension scorers for one item
+
+        The scorers are independent LLM round trips, so they run on a small
+        thread pool (SETTINGS['dimension_concurrency']) and per-item latency
+        approaches the slowest dimension instead of the sum of all five.
+        With SETTINGS['scoring_mode'] == 'single_call', provenance,
+        transparency, coherence and resonance share one prompt that runs
+        alongside verification. An exception from any scorer propagates
+        to the caller.
+
+        With the model cascade enabled, the LLM dimensions are redone on the
+        last cascade model when cheaper models answered and the item's
+        projected composite lies within SETTINGS['scoring_cascade_margin']
+        of a band boundary (band_boundaries()).
+
+        Returns:
+            Dictionary mapping dimension name to score
+        """
+        single_call = SETTINGS.get('scoring_mode', 'per_dimension') == 'single_call'
+        if single_call:
+            # Verification is RAG-based and stays separate; the other four
+            # dimensions come back from one structured prompt
+            scorers = {
+                'verification': self._score_verification,
+                'single_call': self._score_single_call,
+            }
+        else:
+            scorers = {
+                'provenance': self._score_provenance,
+                'verification': self._score_verification,
+                'transparency': self._score_transparency,
+                'coherence': self._score_coherence,
+                'resonance': self._score_resonance,
+            }
+
+        cascade = self.llm_client.cascade_models() if SETTINGS.get('scoring_cascade_enabled', False) else []
+        if not cascade:
+            results = self._run_scorers(scorers, content, brand_context)
+        else:
+            with self.llm_client.tracking_cascade() as answers:
+                results = self._run_scorers(scorers, content, brand_context)
+            cheaper = [model for model in answers if model != cascade[-1]]
+            if cheaper and self._near_band_boundary(self._merge_single_call(dict(results))):
+                # The cheap answers could put the item in the wrong band
+                logger.debug(f"Cascade: composite of {content.content_id} near a band boundary, "
+                             f"rescoring with {cascade[-1]}")
+                llm_scorers = {dim: scorer for dim, scorer in scorers.items() if dim != 'verification'}
+                with self.llm_client.using_model(cascade[-1]):
+                    results.update(self._run_scorers(llm_scorers, content, brand_context))
+                self.llm_client.escalate_answers(cheaper)
+
+        return self._merge_single_call(results)
+
+    def _run_scorers(self, scorers: Dict[str, Any], content: NormalizedContent,
+                     brand_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run dimension scorers, on a thread pool when dimension_concurrency > 1"""
+        try:
+            workers = max(1, int(SETTINGS.get('dimension_concurrency', 1)))
+        except (TypeError, ValueError):
+            workers = 1
+
+        if workers == 1:
+            return {dim: scorer(content, brand_context) for dim, scorer in scorers.items()}
+        # Each scorer runs in a copy of this context so a per-item model
+        # override (LLMScoringClient.using_model) reaches the workers
+        with ThreadPoolExecutor(max_workers=min(workers, len(scorers))) as executor:
+            futures = {dim: executor.submit(contextvars.copy_context().run, scorer, content, brand_context)
+                       for dim, scorer in scorers.items()}
+            return {dim: future.result() for dim, future in futures.items()}
+
+    @staticmethod
+    def _merge_single_call(results: Dict[str, Any]) -> Dict[str, float]:
+        """Flatten the single_call scorer's per-dimension dict into the results"""
+        if 'single_call' in results:
+            results.update(results.pop('single_call'))
+        return results
+
+    def _near_band_boundary(self, scores: Dict[str, float]) -> bool:
+        """Whether the rubric-weighted composite of dimension scores is near a band boundary"""
+        weights = get_rubric().dimension_weights
+        total = sum(weights.get(dim, 0.0) for dim in scores)
+        if not total:
+            return False
+        composite = sum(weights.get(dim, 0.0) * score for dim, score in scores.items()) / total
+        margin = SETTINGS.get('scoring_cascade_margin', 0.05)
+        return any(abs(composite - boundary) < margin for boundary in band_boundaries())
+
+    def _record_llm_issues(self, content: NormalizedContent, dimension: str,
+                           issues: List[Dict[str, Any]]) -> None:
+        """Store LLM-identified issues for a dimension for later merging"""
+        with self._side_channel_lock:
+            content._llm_issues[dimension] = issues
+
+    def _record_score_debug(self, content: NormalizedContent, dimension: str,
+                            debug_info: Dict[str, Any]) -> None:
+        """Store per-dimension score debug info"""
+        with self._side_channel_lock:
+            content._score_debug[dimension] = debug_info
     
     def _score_provenance(self, content: NormalizedContent, brand_context: Dict[str, Any]) -> float:
         """Score Provenance dimension: origin, traceability, metadata"""
@@ -168,21 +291,27 @@ class ContentScorer:
         brand_keywords = [kw.lower() for kw in brand_context.get('keywords', [])]
         is_brand_owned = any(keyword in content_url for keyword in brand_keywords if keyword)
         
-        # Use VerificationManager for RAG-based verification
-        logger.info(f"Starting RAG verification for {content.content_id}")
-        verification_result = self.verification_manager.verify_content(content)
+        # Skip RAG verification (and its claim-extraction call) when the
+        # deterministic pre-detector finds nothing checkable
+        skip_debug = None
+        if SETTINGS.get('claim_predetect_enabled', True):
+            verify, predetect = should_verify(content, SETTINGS.get('claim_predetect_threshold', 0.3))
+            if not verify:
+                skip_debug = dict(predetect, skipped='no_checkable_claims')
+
+        if skip_debug is not None:
+            logger.info(f"Skipping RAG verification for {content.content_id}: no checkable claims detected")
+            verification_result = {'score': 0.5, 'issues': []}
+        else:
+            # Use VerificationManager for RAG-based verification
+            logger.info(f"Starting RAG verification for {content.content_id}")
+            verification_result = self.verification_manager.verify_content(content)
         
         rag_score = verification_result.get('score', 0.5)
         rag_issues = verification_result.get('issues', [])
         
         # Store issues
-        if not hasattr(content, '_llm_issues'):
-            content._llm_issues = {}
-        content._llm_issues['verification'] = rag_issues
-        
-        # Initialize score debug storage
-        if not hasattr(content, '_score_debug'):
-            content._score_debug = {}
+        self._record_llm_issues(content, 'verification', rag_issues)
             
         base_score = rag_score
         
@@ -212,12 +341,15 @@ class ContentScorer:
             logger.info(f"  Adjusted score: {adjusted_score:.3f}")
         
         # Store debug info
-        content._score_debug['verification'] = {
+        debug_info = {
             'base_score': base_score,
             'multiplier': multiplier,
             'adjusted_score': adjusted_score,
             'content_type': content_type
         }
+        if skip_debug is not None:
+            debug_info['verification_skipped'] = skip_debug
+        self._record_score_debug(content, 'verification', debug_info)
                 
         return adjusted_score
     
@@ -266,36 +398,84 @@ class ContentScorer:
         result = self._get_llm_score_with_reasoning(prompt)
         
         # Store LLM-identified issues in content metadata for later merging
-        if not hasattr(content, '_llm_issues'):
-            content._llm_issues = {}
-        content._llm_issues['transparency'] = result.get('issues', [])
+        self._record_llm_issues(content, 'transparency', result.get('issues', []))
         
         return result.get('score', 0.5)
     
     def _score_coherence(self, content: NormalizedContent, brand_context: Dict[str, Any]) -> float:
         """Score Coherence dimension: consistency across channels with brand guidelines"""
         
+        context_guidance, content_type = self._build_coherence_guidance(content, brand_context)
+        
+        # Step 1: Simple scoring prompt
+        score_prompt = f"""
+        Score the COHERENCE of this content on a scale of 0.0 to 1.0.
+        
+        Coherence evaluates: consistency with brand messaging, logical flow, professional quality
+        
+        Content:
+        Title: {content.title}
+        Body: {content.body[:2000]}
+        Source: {content.src}
+        
+        Brand Context: {brand_context.get('keywords', [])}
+        
+        Scoring criteria:
+        - 0.8-1.0: Highly coherent, consistent with brand, professional quality
+        - 0.6-0.8: Mostly coherent, good consistency
+        - 0.4-0.6: Some coherence, minor inconsistencies
+        - 0.2-0.4: Limited coherence, noticeable inconsistencies
+        - 0.0-0.2: Incoherent, inconsistent, unprofessional
+        
+        Return only a number between 0.0 and 1.0:
+        """
+        
+        # Use two-step scoring with feedback
+        result = self._get_llm_score_with_feedback(
+            score_prompt=score_prompt,
+            content=content,
+            dimension="Coherence",
+            context_guidance=context_guidance
+        )
+        
+        # Store LLM-identified issues in content metadata for later merging
+        self._record_llm_issues(content, 'coherence', self._filter_coherence_issues(result.get('issues', [])))
+        
+        return self._finalize_coherence_score(content, result.get('score', 0.5), content_type)
+    
+    def _build_coherence_guidance(self, content: NormalizedContent,
+                                  brand_context: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Build the coherence context guidance (brand guidelines, content type, linguistic findings)
+        
+        Returns:
+            Tuple of (context_guidance, content_type)
+        """
+        brand_id = brand_context.get('brand_name', '').lower().strip().replace(' ', '_')
+        
         # Check if user wants to use guidelines (from session state/brand context)
         use_guidelines = brand_context.get('use_guidelines', True)  # Default True for backward compatibility
         
         brand_guidelines = None
+        guideline_excerpts = None
         if use_guidelines:
             # Load brand guidelines if available
-            brand_id = brand_context.get('brand_name', '').lower().strip().replace(' ', '_')
             brand_guidelines = self._load_brand_guidelines(brand_id)
             
             if brand_guidelines:
-                logger.info(f"Using brand guidelines for {brand_id} in coherence scoring ({len(brand_guidelines)} chars)")
+                guideline_excerpts = self._select_guideline_excerpts(brand_id, brand_guidelines, content)
+                logger.debug(f"Using brand guidelines for {brand_id} in coherence scoring "
+                             f"({len(guideline_excerpts)} of {len(brand_guidelines)} chars)")
             else:
-                logger.info(f"No guidelines found for {brand_id}, using generic coherence standards")
+                logger.debug(f"No guidelines found for {brand_id}, using generic coherence standards")
         else:
-            logger.info("Brand guidelines disabled by user preference")
+            logger.debug("Brand guidelines disabled by user preference")
         
         # Detect content type to adjust scoring criteria
         content_type = self._determine_content_type(content)
         
         # Run deterministic linguistic analysis
-        linguistic_data = self.linguistic_analyzer.analyze(content.body)
+        linguistic_data = self.linguistic_analyzer.analyze(content.body, profile_of(content))
         passive_voice_issues = linguistic_data.get('passive_voice', [])
         readability = linguistic_data.get('readability', {})
         
@@ -309,13 +489,12 @@ class ContentScorer:
 
         if brand_guidelines:
             # Use brand-specific guidelines
-            guidelines_preview = brand_guidelines[:1500]  # First 1500 chars
             context_guidance = f"""
             BRAND GUIDELINES FOR {brand_id.upper()}:
             
-            {guidelines_preview}
+            {guideline_excerpts}
             
-            {'... [guidelines truncated]' if len(brand_guidelines) > 1500 else ''}
+            {'... [only the guideline sections relevant to this content are shown]' if len(brand_guidelines) > len(guideline_excerpts) else ''}
             
             CRITICAL: Compare the content against these SPECIFIC brand guidelines.
             Flag inconsistencies with the documented voice, tone, vocabulary, and style rules.
@@ -356,39 +535,11 @@ class ContentScorer:
             Apply standard coherence criteria when providing feedback.
             """ + deterministic_context
         
-        # Step 1: Simple scoring prompt
-        score_prompt = f"""
-        Score the COHERENCE of this content on a scale of 0.0 to 1.0.
-        
-        Coherence evaluates: consistency with brand messaging, logical flow, professional quality
-        
-        Content:
-        Title: {content.title}
-        Body: {content.body[:2000]}
-        Source: {content.src}
-        
-        Brand Context: {brand_context.get('keywords', [])}
-        
-        Scoring criteria:
-        - 0.8-1.0: Highly coherent, consistent with brand, professional quality
-        - 0.6-0.8: Mostly coherent, good consistency
-        - 0.4-0.6: Some coherence, minor inconsistencies
-        - 0.2-0.4: Limited coherence, noticeable inconsistencies
-        - 0.0-0.2: Incoherent, inconsistent, unprofessional
-        
-        Return only a number between 0.0 and 1.0:
-        """
-        
-        # Use two-step scoring with feedback
-        result = self._get_llm_score_with_feedback(
-            score_prompt=score_prompt,
-            content=content,
-            dimension="Coherence",
-            context_guidance=context_guidance
-        )
-        
+        return context_guidance, content_type
+    
+    def _filter_coherence_issues(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop low-confidence and boilerplate coherence issues"""
         # Filter issues based on our strict criteria
-        issues = result.get('issues', [])
         filtered_issues = []
         for issue in issues:
             confidence = issue.get('confidence', 0.0)
@@ -416,17 +567,11 @@ class ContentScorer:
             else:
                 logger.debug(f"Filtered low-confidence Coherence issue: {issue.get('type')} (confidence={confidence})")
         
-        # Store LLM-identified issues in content metadata for later merging
-        if not hasattr(content, '_llm_issues'):
-            content._llm_issues = {}
-        content._llm_issues['coherence'] = filtered_issues
-        
-        base_score = result.get('score', 0.5)
-        
-        # Initialize score debug storage
-        if not hasattr(content, '_score_debug'):
-            content._score_debug = {}
-        
+        return filtered_issues
+    
+    def _finalize_coherence_score(self, content: NormalizedContent, base_score: float,
+                                  content_type: str) -> float:
+        """Apply the coherence content-type multiplier and record debug info"""
         # Apply content-type multiplier from rubric configuration
         multiplier = self._get_score_multiplier('coherence', content_type)
         
@@ -442,12 +587,12 @@ class ContentScorer:
             logger.debug(f"Coherence score for {content_type}: {base_score:.3f} (no multiplier)")
             
         # Store debug info
-        content._score_debug['coherence'] = {
+        self._record_score_debug(content, 'coherence', {
             'base_score': base_score,
             'multiplier': multiplier,
             'adjusted_score': adjusted_score,
             'content_type': content_type
-        }
+        })
             
         return adjusted_score
     
@@ -501,29 +646,16 @@ class ContentScorer:
             Multiplier value (default 1.0 if not configured)
         """
         try:
-            from scoring.rubric import load_rubric
-            rubric = load_rubric()
-            
-            multipliers = rubric.get('score_multipliers', {})
-            dimension_multipliers = multipliers.get(dimension, {})
-            
-            # Try to get content-type-specific multiplier
-            multiplier = dimension_multipliers.get(content_type)
-            
-            # Fall back to _default if not found
-            if multiplier is None:
-                multiplier = dimension_multipliers.get('_default', 1.0)
-            
-            # Ensure it's a valid number
-            return float(multiplier) if multiplier is not None else 1.0
-            
+            # Content-type-specific multiplier, falling back to _default
+            return get_rubric().multiplier(dimension, content_type)
         except Exception as e:
             logger.warning(f"Failed to load score multiplier for {dimension}/{content_type}: {e}")
             return 1.0
     
     def _load_brand_guidelines(self, brand_id: str) -> Optional[str]:
         """
-        Load brand guidelines from storage if available.
+        Load brand guidelines from storage if available (cached per process,
+        see scoring.brand_guidelines).
         
         Args:
             brand_id: Brand identifier
@@ -531,19 +663,19 @@ class ContentScorer:
         Returns:
             Guidelines text or None if not found
         """
-        if not brand_id:
-            return None
-        
-        try:
-            from utils.document_processor import BrandGuidelinesProcessor
-            processor = BrandGuidelinesProcessor()
-            guidelines = processor.load_guidelines(brand_id)
-            if guidelines:
-                logger.info(f"Loaded brand guidelines for {brand_id}: {len(guidelines)} characters")
-            return guidelines
-        except Exception as e:
-            logger.warning(f"Failed to load brand guidelines for {brand_id}: {e}")
-            return None
+        guidelines = get_brand_guidelines(brand_id)
+        return guidelines.text if guidelines else None
+    
+    def _select_guideline_excerpts(self, brand_id: str, brand_guidelines: str,
+                                   content: NormalizedContent) -> str:
+        """
+        Guideline text for the coherence prompt: the chunks most relevant to
+        this item (guidelines_retrieval_enabled), else the opening 1500 chars
+        """
+        guidelines = get_brand_guidelines(brand_id) if SETTINGS.get('guidelines_retrieval_enabled', True) else None
+        if guidelines is None or guidelines.text != brand_guidelines:
+            return brand_guidelines[:1500]
+        return guidelines.excerpt_text(f"{content.title}\n{content.body[:2000]}")
     
     def _score_resonance(self, content: NormalizedContent, brand_context: Dict[str, Any]) -> float:
         """Score Resonance dimension: cultural fit, organic engagement"""
@@ -579,10 +711,122 @@ class ContentScorer:
         
         llm_score = self._get_llm_score(prompt)
         
-        # Combine LLM score with engagement metrics (70% LLM, 30% engagement)
+        return self._combine_resonance(llm_score, engagement_score)
+    
+    def _combine_resonance(self, llm_score: float, engagement_score: float) -> float:
+        """Combine LLM score with engagement metrics (70% LLM, 30% engagement)"""
         combined_score = (0.7 * llm_score) + (0.3 * engagement_score)
-        
+
         return min(1.0, max(0.0, combined_score))
+
+    def _score_single_call(self, content: NormalizedContent, brand_context: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Score Provenance, Transparency, Coherence and Resonance with one JSON prompt
+
+        The body is sent once instead of once per dimension. The validated
+        response is post-processed exactly like the per-dimension scorers
+        (coherence issue filtering and multiplier, resonance engagement blend),
+        so _merge_llm_and_detector_issues sees the same _llm_issues shape.
+        If the response fails validation, falls back to per-dimension scoring.
+
+        Returns:
+            Dictionary mapping dimension name to score
+        """
+        dimensions = ['provenance', 'transparency', 'coherence', 'resonance']
+        context_guidance, content_type = self._build_coherence_guidance(content, brand_context)
+
+        prompt = f"""
+        Score this content on four trust dimensions, each on a scale of 0.0 to 1.0,
+        and identify specific issues for each dimension.
+
+        Content:
+        Title: {content.title}
+        Body: {content.body}
+        Author: {content.author}
+        Source: {content.src}
+        Platform ID: {content.platform_id}
+
+        Engagement Metrics:
+        Rating: {content.rating}
+        Upvotes: {content.upvotes}
+        Helpful Count: {content.helpful_count}
+
+        Brand Context: {brand_context.get('keywords', [])}
+
+        DIMENSIONS:
+        - provenance: origin clarity, traceability, metadata completeness
+        - transparency: clear disclosures, honest communication, no hidden agendas
+        - coherence: consistency with brand messaging, logical flow, professional quality
+        - resonance: cultural fit, authentic engagement, organic appeal
+
+        Scoring criteria (all dimensions):
+        - 0.8-1.0: Excellent
+        - 0.6-0.8: Good, minor omissions
+        - 0.4-0.6: Moderate, some unclear or inconsistent aspects
+        - 0.2-0.4: Weak, noticeable problems
+        - 0.0-0.2: Poor, deceptive, incoherent or unverifiable
+
+        COHERENCE GUIDANCE:
+        {context_guidance}
+
+        VALID ISSUE TYPES:
+        provenance:
+{self.llm_client._get_valid_issue_types('provenance')}
+        transparency:
+{self.llm_client._get_valid_issue_types('transparency')}
+        coherence:
+{self.llm_client._get_valid_issue_types('coherence')}
+        resonance:
+{self.llm_client._get_valid_issue_types('resonance')}
+
+        Respond with JSON in this exact format:
+        {{
+            "provenance": {{"score": 0.7, "issues": []}},
+            "transparency": {{"score": 0.6, "issues": [
+                {{
+                    "type": "missing_privacy_policy",
+                    "confidence": 0.85,
+                    "severity": "medium",
+                    "evidence": "EXACT QUOTE: 'the actual text from the content'",
+                    "suggestion": "Change 'the actual text from the content' → 'the corrected text'. This improves transparency because [reason]."
+                }}
+            ]}},
+            "coherence": {{"score": 0.8, "issues": []}},
+            "resonance": {{"score": 0.7, "issues": []}}
+        }}
+
+        CRITICAL REQUIREMENTS:
+        1. Include all four dimensions, each with a numeric score and an issues array
+        2. Use ONLY the issue types listed above for each dimension
+        3. Quoted evidence MUST appear in the content above - do NOT make up quotes
+        4. Show CONCRETE REWRITES using format: "Change 'X' → 'Y'"
+        5. Return an empty issues array when you cannot support an issue with specific text
+        """
+
+        results = self.llm_client.get_multi_dimension_scores(prompt, dimensions)
+        if results is None:
+            logger.warning(f"Single-call scoring failed validation for {content.content_id}, falling back to per-dimension scoring")
+            return {
+                'provenance': self._score_provenance(content, brand_context),
+                'transparency': self._score_transparency(content, brand_context),
+                'coherence': self._score_coherence(content, brand_context),
+                'resonance': self._score_resonance(content, brand_context),
+            }
+
+        # Store LLM-identified issues in content metadata for later merging
+        self._record_llm_issues(content, 'provenance', results['provenance']['issues'])
+        self._record_llm_issues(content, 'transparency', results['transparency']['issues'])
+        self._record_llm_issues(content, 'coherence', self._filter_coherence_issues(results['coherence']['issues']))
+        self._record_llm_issues(content, 'resonance', results['resonance']['issues'])
+        self._record_score_debug(content, 'single_call', {'dimensions': dimensions})
+
+        return {
+            'provenance': results['provenance']['score'],
+            'transparency': results['transparency']['score'],
+            'coherence': self._finalize_coherence_score(content, results['coherence']['score'], content_type),
+            'resonance': self._combine_resonance(results['resonance']['score'],
+                                                 self._calculate_engagement_resonance(content)),
+        }
     
     def _calculate_engagement_resonance(self, content: NormalizedContent) -> float:
         """Calculate engagement-based resonance score"""
@@ -728,7 +972,7 @@ class ContentScorer:
         Merge LLM-identified issues with detector-found attributes
         
         Args:
-            content: Content object (may have _llm_issues attribute)
+            content: Content object (LLM issues recorded in content._llm_issues)
             detected_attrs: List of attributes detected by attribute detector
         
         Returns:
@@ -747,7 +991,7 @@ class ContentScorer:
             merged_attrs.append(attr)
         
         # Process LLM issues if they exist
-        if hasattr(content, '_llm_issues'):
+        if content._llm_issues:
             # DIAGNOSTIC: Log LLM issues by dimension
             for dim, issues in content._llm_issues.items():
                 if issues:
@@ -761,7 +1005,8 @@ class ContentScorer:
                     if issue_type in ['broken_links', 'outdated_links']:
                         content_text = f"{content.title} {content.body}"
                         content_url = getattr(content, 'url', None)
-                        actual_broken_links = verify_broken_links(content_text, content_url)
+                        actual_broken_links = verify_broken_links(content_text, content_url,
+                                                                  urls=profile_of(content).urls)
                         
                         if not actual_broken_links:
                             # LLM hallucinated broken links - reject this issue
@@ -888,7 +1133,9 @@ class ContentScorer:
 
     
     def batch_score_content(self, content_list: List[NormalizedContent],
-                          brand_context: Dict[str, Any]) -> List[ContentScores]:
+                          brand_context: Dict[str, Any],
+                          max_workers: Optional[int] = None,
+                          on_item: Optional[Callable[[ContentScores], None]] = None) -> List[ContentScores]:
         """
         Score multiple content items in batch
         Combines LLM scoring with Trust Stack attribute detection
@@ -896,110 +1143,456 @@ class ContentScorer:
         Args:
             content_list: List of content to score
             brand_context: Brand-specific context
+            max_workers: Number of items to score concurrently. Defaults to
+                SETTINGS['scoring_concurrency']; 1 scores items sequentially.
+            on_item: Optional callback invoked with each item's scores as
+                soon as it finishes (in completion order, on the calling
+                thread)
 
         Returns:
-            List of ContentScores with dimension ratings
+            List of ContentScores with dimension ratings, in input order
         """
-        from scoring.content_filter import should_skip_content
-        
-        scores_list = []
+        if max_workers is None:
+            max_workers = SETTINGS.get('scoring_concurrency', 1)
+        try:
+            max_workers = max(1, int(max_workers))
+        except (TypeError, ValueError):
+            max_workers = 1
 
-        logger.info(f"Batch scoring {len(content_list)} content items (attribute detection: {self.use_attribute_detection})")
+        total = len(content_list)
+        logger.info(f"Batch scoring {total} content items (attribute detection: {self.use_attribute_detection}, workers: {max_workers})")
 
-        for i, content in enumerate(content_list):
-            if i % 10 == 0:
-                logger.info(f"Scoring progress: {i}/{len(content_list)}")
+        # Learned triage skip budget counts this batch's items only
+        triage_run = self.triage_gate.new_run() if self.triage_gate is not None else None
 
-            # Pre-filter: Skip error pages, login walls, and insufficient content
-            skip_reason = should_skip_content(
-                title=getattr(content, 'title', ''),
-                body=getattr(content, 'body', ''),
-                url=getattr(content, 'url', '')
-            )
-            
-            if skip_reason:
-                logger.warning(f"Skipping content '{content.title}' ({content.content_id}): {skip_reason}")
-                # Don't add to scores_list - effectively filters it out
-                continue
+        # Budget-aware scheduling: score the most valuable items first and
+        # degrade the rest once the run's budget is spent
+        budget = None
+        order = None
+        uncertainties = None
+        if self.triage_gate is not None and (SETTINGS.get('scoring_budget_enabled', False)
+                                             or SETTINGS.get('run_level_verification', True)):
+            uncertainties = self._triage_uncertainties(content_list)
+        if SETTINGS.get('scoring_budget_enabled', False):
+            budget = ScoringBudget.from_settings()
+            order = prioritize(content_list, uncertainties)
 
-            # Step 1: Get base LLM scores
-            dimension_scores = self.score_content(content, brand_context)
+        if SETTINGS.get('run_level_verification', True) and total > 1:
+            self._prepare_run_verification(content_list, brand_context, order, uncertainties, budget)
 
-            # Step 2: Detect Trust Stack attributes (if enabled)
-            detected_attrs = []
-            if self.use_attribute_detection and self.attribute_detector:
-                try:
-                    detected_attrs = self.attribute_detector.detect_attributes(content)
-                    logger.debug(f"Detected {len(detected_attrs)} attributes for {content.content_id}")
+        # The scheduler starts after run-level verification so its token
+        # baseline excludes that spend: verifying candidates up front must not
+        # use up the budget before any item acquires a treatment. The
+        # verification is already limited to items that can reach the LLM.
+        scheduler = ScoringScheduler(budget) if budget is not None else None
+        try:
+            results = self._score_batch(content_list, brand_context, max_workers, order, scheduler, triage_run,
+                                        on_item)
+        finally:
+            self.verification_manager.clear_run_results()
 
-                    # Step 2.5: Merge LLM issues with detector attributes
-                    detected_attrs = self._merge_llm_and_detector_issues(content, detected_attrs)
-                    logger.debug(f"After merging: {len(detected_attrs)} total attributes")
+        if scheduler is not None:
+            self.last_schedule = scheduler.summary()
+            logger.info(f"Scoring budget: {self.last_schedule['counts']} "
+                        f"({self.last_schedule['tokens']} tokens, ${self.last_schedule['cost']:.4f}, "
+                        f"{self.last_schedule['seconds']:.1f}s)")
 
-                    # Adjust LLM scores with attribute signals
-                    dimension_scores = self._adjust_scores_with_attributes(dimension_scores, detected_attrs)
+        scores_list = [r for r in results if r is not None]
+        logger.info(f"Completed batch scoring: {len(scores_list)} items scored")
+        return scores_list
+
+    def _triage_uncertainties(self, content_list: List[NormalizedContent]) -> Optional[List[float]]:
+        """Learned triage uncertainty per item for prioritization (None without a model)"""
+        if self.triage_gate is None:
+            return None
+        model = self.triage_gate.model
+        try:
+            attrs_list = None
+            if model.uses_attributes and self.use_attribute_detection and self.attribute_detector:
+                attrs_list = self.attribute_detector.detect_attributes_batch(content_list)
+            return [p.uncertainty for p in model.predict_many(content_list, attrs_list)]
+        except Exception as e:
+            logger.warning(f"Triage uncertainty unavailable for prioritization: {e}")
+            return None
+
+    def _score_batch(self, content_list: List[NormalizedContent], brand_context: Dict[str, Any],
+                     max_workers: int, order: Optional[List[int]] = None,
+                     scheduler: Optional[ScoringScheduler] = None,
+                     triage_run: Optional[TriageRun] = None,
+                     on_item: Optional[Callable[[ContentScores], None]] = None) -> List[Optional[ContentScores]]:
+        """
+        Score items sequentially or on a thread pool
+
+        Items start in `order` (default: input order); results are always
+        returned in input order. `on_item` sees each non-None result as it
+        completes.
+        """
+        total = len(content_list)
+        if order is None:
+            order = list(range(total))
+        if max_workers == 1 or total <= 1:
+            results = [None] * total
+            for n, i in enumerate(order):
+                if n % 10 == 0:
+                    logger.info(f"Scoring progress: {n}/{total}")
+                try:
+                    results[i] = self._score_item(content_list[i], brand_context, scheduler, triage_run)
                 except Exception as e:
-                    logger.warning(f"Attribute detection failed for {content.content_id}: {e}")
-
-            # Step 3: Create ContentScores object
-            content_scores = ContentScores(
-                content_id=content.content_id,
-                brand=brand_context.get('brand_name', 'unknown'),
-                src=content.src,
-                event_ts=content.event_ts,
-                score_provenance=dimension_scores.provenance,
-                score_resonance=dimension_scores.resonance,
-                score_coherence=dimension_scores.coherence,
-                score_transparency=dimension_scores.transparency,
-                score_verification=dimension_scores.verification,
-                class_label="",  # Optional - for backward compatibility
-                is_authentic=False,  # Optional - for backward compatibility
-                rubric_version=self.rubric_version,
-                run_id=content.run_id,
-                # Enhanced Trust Stack fields
-                modality=getattr(content, 'modality', 'text'),
-                channel=getattr(content, 'channel', 'unknown'),
-                platform_type=getattr(content, 'platform_type', 'unknown'),
-                meta=json.dumps(
-                    # Build a meta dict that includes scoring info and detected attributes
-                    (lambda cm: {
-                        "scoring_timestamp": content.event_ts,
-                        "brand_context": brand_context,
-                        "title": getattr(content, 'title', '') or None,
-                        "description": getattr(content, 'body', '') or None,
-                        "source_url": (cm.get('source_url') if isinstance(cm, dict) else None) or getattr(content, 'platform_id', None),
-                        # Enhanced Trust Stack metadata
-                        "modality": getattr(content, 'modality', 'text'),
-                        "channel": getattr(content, 'channel', 'unknown'),
-                        "platform_type": getattr(content, 'platform_type', 'unknown'),
-                        "url": getattr(content, 'url', ''),
-                        "language": getattr(content, 'language', 'en'),
-                        # Include detected attributes for downstream analysis
-                        "detected_attributes": [
-                            {
-                                "id": attr.attribute_id,
-                                "dimension": attr.dimension,
-                                "label": attr.label,
-                                "value": attr.value,
-                                "evidence": attr.evidence,
-                                "confidence": attr.confidence,
-                                "suggestion": attr.suggestion  # Include LLM suggestion
-                            }
-                            for attr in detected_attrs
-                        ] if detected_attrs else [],
-                        "attribute_count": len(detected_attrs),
-                        # preserve any existing content.meta under orig_meta
-                        "orig_meta": cm if isinstance(cm, dict) else None,
-                        # propagate explicit footer links if present so downstream reporting can use them
-                        **({
-                            'terms': cm.get('terms'),
-                            'privacy': cm.get('privacy')
-                        } if isinstance(cm, dict) and (cm.get('terms') or cm.get('privacy')) else {})
-                    })(content.meta if hasattr(content, 'meta') else {})
-                )
+                    logger.error(f"Error scoring content {content_list[i].content_id}: {e}")
+                    continue
+                if on_item is not None and results[i] is not None:
+                    on_item(results[i])
+        else:
+            # Items are independent and almost all of their wall time is spent
+            # waiting on the LLM, so score them on a bounded thread pool. Results
+            # are slotted back by index so the output keeps the input order.
+            results = [None] * total
+            completed = 0
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_index = {
+                    executor.submit(self._score_item, content_list[i], brand_context, scheduler, triage_run): i
+                    for i in order
+                }
+                for future in as_completed(future_to_index):
+                    i = future_to_index[future]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error scoring content {content_list[i].content_id}: {e}")
+                    else:
+                        if on_item is not None and results[i] is not None:
+                            on_item(results[i])
+                    completed += 1
+                    if completed % 10 == 0:
+                        logger.info(f"Scoring progress: {completed}/{total}")
+        return results
+
+    def _prepare_run_verification(self, content_list: List[NormalizedContent],
+                                  brand_context: Dict[str, Any],
+                                  order: Optional[List[int]] = None,
+                                  uncertainties: Optional[List[float]] = None,
+                                  budget: Optional[ScoringBudget] = None) -> None:
+        """
+        Verify claims for the whole batch at once (VerificationManager.verify_run)
+
+        Only items that will actually reach _score_verification take part:
+        filtered pages, triage skips, items reused from the score store,
+        items the learned triage model is confident about, items past the
+        budget's LLM item cap (when no cheap model can score them) and
+        items without checkable claims (claim_detector) are left out. Any
+        left-out item that does get verified falls back to per-item
+        verification.
+
+        Args:
+            content_list: Items of the batch
+            brand_context: Brand-specific context
+            order: Order the items will start in (default: input order)
+            uncertainties: Learned triage uncertainty per item, if known
+            budget: Budget of the run's ScoringScheduler, if any
+        """
+        from scoring.content_filter import content_skip_reason
+
+        if order is None:
+            order = list(range(len(content_list)))
+        llm_item_cap = None
+        if budget is not None and budget.max_llm_items is not None and not budget.cheap_model:
+            llm_item_cap = budget.max_llm_items
+
+        candidates = []
+        acquiring = 0
+        for i in order:
+            content = content_list[i]
+            if content_skip_reason(content):
+                continue
+            if self.score_store.contains(self._score_store_key(content, brand_context)):
+                continue
+            # The scheduler hands out LLM treatments in start order to items
+            # that are neither filtered nor reused
+            acquiring += 1
+            if llm_item_cap is not None and acquiring > llm_item_cap:
+                continue
+            if SETTINGS.get('triage_enabled', False) and not self.triage_scorer.should_score(content)[0]:
+                continue
+            if uncertainties is not None and self.triage_gate is not None and \
+                    uncertainties[i] <= self.triage_gate.max_uncertainty:
+                continue
+            if SETTINGS.get('claim_predetect_enabled', True) and \
+                    not should_verify(content, SETTINGS.get('claim_predetect_threshold', 0.3))[0]:
+                continue
+            candidates.append(content)
+
+        if len(candidates) < 2:
+            return
+        try:
+            self.verification_manager.verify_run(candidates)
+        except Exception as e:
+            # Items fall back to per-item verification
+            logger.warning(f"Run-level claim verification failed: {e}")
+
+    def _score_item(self, content: NormalizedContent, brand_context: Dict[str, Any],
+                    scheduler: Optional[ScoringScheduler] = None,
+                    triage_run: Optional[TriageRun] = None) -> Optional[ContentScores]:
+        """
+        Score a single content item end to end (filter, LLM, attributes)
+
+        Args:
+            content: Content to score
+            brand_context: Brand-specific context
+            scheduler: Budget scheduler choosing the item's treatment; the
+                treatment is recorded in meta['scoring_treatment']
+            triage_run: Learned triage skip counters of the current run
+
+        Returns:
+            ContentScores for the item, or None if the item was filtered out
+            or skipped by the scheduler
+        """
+        from scoring.content_filter import content_skip_reason
+
+        # Pre-filter: Skip error pages, login walls, and insufficient content
+        skip_reason = content_skip_reason(content)
+
+        if skip_reason:
+            logger.warning(f"Skipping content '{content.title}' ({content.content_id}): {skip_reason}")
+            # Don't return scores - effectively filters it out
+            return None
+
+        # Reuse the stored result when neither the content nor the scoring
+        # configuration changed since it was scored
+        store_key = self._score_store_key(content, brand_context)
+        stored = self.score_store.get(store_key)
+        reused = stored is not None
+        treatment = None
+        if reused:
+            dimension_scores, detected_attrs = self._restore_stored_scores(content, stored)
+            self._count_reuse('reused')
+            if scheduler is not None:
+                treatment = TREATMENT_REUSED
+                scheduler.record(content.content_id, treatment)
+        else:
+            treatment = scheduler.acquire(content.content_id) if scheduler is not None else None
+            if treatment == TREATMENT_SKIPPED:
+                logger.info(f"Scoring budget exhausted, skipping {content.content_id}")
+                return None
+            try:
+                failures_before = self._failure_count()
+                dimension_scores, detected_attrs = self._score_with_treatment(content, brand_context, treatment,
+                                                                              triage_run)
+                self._count_reuse('scored')
+            finally:
+                if scheduler is not None:
+                    scheduler.release(treatment)
+            # Results that fell back to neutral scores are not persisted, so
+            # the next run retries them. The counters are shared, so a failure
+            # on a concurrent item also skips the write (never the reverse).
+            # Budget-degraded results are not persisted either.
+            if treatment in (None, TREATMENT_LLM) and self._failure_count() == failures_before:
+                self.score_store.set(store_key, self._stored_scores(content, dimension_scores, detected_attrs))
+
+        # Step 3: Create ContentScores object
+        return ContentScores(
+            content_id=content.content_id,
+            brand=brand_context.get('brand_name', 'unknown'),
+            src=content.src,
+            event_ts=content.event_ts,
+            score_provenance=dimension_scores.provenance,
+            score_resonance=dimension_scores.resonance,
+            score_coherence=dimension_scores.coherence,
+            score_transparency=dimension_scores.transparency,
+            score_verification=dimension_scores.verification,
+            class_label="",  # Optional - for backward compatibility
+            is_authentic=False,  # Optional - for backward compatibility
+            rubric_version=self.rubric_version,
+            run_id=content.run_id,
+            # Enhanced Trust Stack fields
+            modality=getattr(content, 'modality', 'text'),
+            channel=getattr(content, 'channel', 'unknown'),
+            platform_type=getattr(content, 'platform_type', 'unknown'),
+            source_type=getattr(content, 'source_type', 'unknown'),
+            source_tier=getattr(content, 'source_tier', 'unknown'),
+            # Kept as an in-memory dict; serialized only at upload (ContentScores.meta_json)
+            meta=ScoreMeta(
+                # Build a meta dict that includes scoring info and detected attributes
+                (lambda cm: {
+                    "scoring_timestamp": content.event_ts,
+                    "brand_context": brand_context,
+                    "title": getattr(content, 'title', '') or None,
+                    "description": getattr(content, 'body', '') or None,
+                    "source_url": (cm.get('source_url') if isinstance(cm, dict) else None) or getattr(content, 'platform_id', None),
+                    # Enhanced Trust Stack metadata
+                    "modality": getattr(content, 'modality', 'text'),
+                    "channel": getattr(content, 'channel', 'unknown'),
+                    "platform_type": getattr(content, 'platform_type', 'unknown'),
+                    "url": getattr(content, 'url', ''),
+                    "language": getattr(content, 'language', 'en'),
+                    # Include detected attributes for downstream analysis
+                    "detected_attributes": [
+                        {
+                            "id": attr.attribute_id,
+                            "dimension": attr.dimension,
+                            "label": attr.label,
+                            "value": attr.value,
+                            "evidence": attr.evidence,
+                            "confidence": attr.confidence,
+                            "suggestion": attr.suggestion  # Include LLM suggestion
+                        }
+                        for attr in detected_attrs
+                    ] if detected_attrs else [],
+                    "attribute_count": len(detected_attrs),
+                    "score_reused": reused,
+                    # Budget scheduler treatment (llm, cheap_model, detector_only, reused)
+                    **({"scoring_treatment": treatment} if treatment else {}),
+                    # preserve any existing content.meta under orig_meta
+                    "orig_meta": cm if isinstance(cm, dict) else None,
+                    # propagate explicit footer links if present so downstream reporting can use them
+                    **({
+                        'terms': cm.get('terms'),
+                        'privacy': cm.get('privacy')
+                    } if isinstance(cm, dict) and (cm.get('terms') or cm.get('privacy')) else {})
+                })(content.meta if hasattr(content, 'meta') else {})
             )
+        )
 
-            scores_list.append(content_scores)
+    def _score_with_treatment(self, content: NormalizedContent, brand_context: Dict[str, Any],
+                              treatment: Optional[str],
+                              triage_run: Optional[TriageRun] = None) -> Tuple[DimensionScores, List[DetectedAttribute]]:
+        """Score an item the way the budget scheduler decided (None: full scoring)"""
+        if treatment == TREATMENT_CHEAP_MODEL:
+            with self.llm_client.using_model(SETTINGS.get('scoring_budget_cheap_model')):
+                return self._score_fresh(content, brand_context, triage_run)
+        if treatment == TREATMENT_DETECTOR_ONLY:
+            return self._score_detector_only(content)
+        return self._score_fresh(content, brand_context, triage_run)
 
-        logger.info(f"Completed batch scoring: {len(scores_list)} items scored")
-        return scores_list
+    def _score_detector_only(self, content: NormalizedContent) -> Tuple[DimensionScores, List[DetectedAttribute]]:
+        """Neutral base scores adjusted by attribute detection alone (no LLM calls)"""
+        dimension_scores = DimensionScores(0.5, 0.5, 0.5, 0.5, 0.5)
+        detected_attrs = self._detect_raw_attributes(content) or []
+        if detected_attrs:
+            dimension_scores = self._adjust_scores_with_attributes(dimension_scores, detected_attrs)
+        return dimension_scores, detected_attrs
+
+    def _score_fresh(self, content: NormalizedContent, brand_context: Dict[str, Any],
+                     triage_run: Optional[TriageRun] = None) -> Tuple[DimensionScores, List[DetectedAttribute]]:
+        """Run LLM scoring and attribute detection for one item"""
+        raw_attrs = None
+        if self.triage_gate is not None:
+            raw_attrs = self._detect_raw_attributes(content)
+            prediction = self.triage_gate.decide(content, raw_attrs, triage_run)
+            if prediction is not None:
+                return self._triage_model_scores(content, prediction), raw_attrs or []
+
+        # Step 1: Get base LLM scores
+        dimension_scores = self.score_content(content, brand_context)
+
+        # Step 2: Detect Trust Stack attributes (if enabled)
+        detected_attrs = []
+        if self.use_attribute_detection and self.attribute_detector:
+            try:
+                detected_attrs = raw_attrs if raw_attrs is not None else self.attribute_detector.detect_attributes(content)
+                logger.debug(f"Detected {len(detected_attrs)} attributes for {content.content_id}")
+
+                # Step 2.5: Merge LLM issues with detector attributes
+                detected_attrs = self._merge_llm_and_detector_issues(content, detected_attrs)
+                logger.debug(f"After merging: {len(detected_attrs)} total attributes")
+
+                # Adjust LLM scores with attribute signals
+                dimension_scores = self._adjust_scores_with_attributes(dimension_scores, detected_attrs)
+            except Exception as e:
+                logger.warning(f"Attribute detection failed for {content.content_id}: {e}")
+
+        return dimension_scores, detected_attrs
+
+    def _detect_raw_attributes(self, content: NormalizedContent) -> Optional[List[DetectedAttribute]]:
+        """Detector output before LLM merging (triage model features); None if unavailable"""
+        if not (self.use_attribute_detection and self.attribute_detector):
+            return None
+        try:
+            return self.attribute_detector.detect_attributes(content)
+        except Exception as e:
+            logger.warning(f"Attribute detection failed for {content.content_id}: {e}")
+            return None
+
+    def _triage_model_scores(self, content: NormalizedContent, prediction) -> DimensionScores:
+        """Use the learned triage model's prediction in place of LLM scoring"""
+        logger.info(f"Triage model scored {content.content_id} (uncertainty {prediction.uncertainty:.3f})")
+        if content.meta is None:
+            content.meta = {}
+        content.meta['triage_status'] = 'model_scored'
+        content.meta['triage_reason'] = 'Confident triage model prediction'
+        content.meta['score_debug'] = json.dumps({'triage_model': prediction.to_debug()})
+        return DimensionScores(**prediction.scores)
+
+    def _score_store_key(self, content: NormalizedContent, brand_context: Dict[str, Any]) -> str:
+        """Score store key: content fingerprint plus everything that changes the result"""
+        return make_score_key(
+            content, brand_context, self.rubric_version, self.llm_client.model,
+            attribute_detection=bool(self.use_attribute_detection and self.attribute_detector),
+            scoring_mode=SETTINGS.get('scoring_mode', 'per_dimension'),
+            single_round_trip_feedback=SETTINGS.get('single_round_trip_feedback', []),
+            triage_enabled=SETTINGS.get('triage_enabled', False),
+            scoring_cascade=((SETTINGS.get('scoring_cascade_models'), SETTINGS.get('scoring_cascade_margin'))
+                             if SETTINGS.get('scoring_cascade_enabled', False) else None),
+            triage_model=(self.triage_gate.model.manifest.get('trained_at')
+                          if self.triage_gate is not None else None),
+            claim_predetect=((SETTINGS.get('claim_predetect_threshold', 0.3), SIGNAL_WEIGHTS)
+                             if SETTINGS.get('claim_predetect_enabled', True) else None),
+            rubric=get_rubric().fingerprint,
+        )
+
+    def _stored_scores(self, content: NormalizedContent, dimension_scores: DimensionScores,
+                       detected_attrs: List[DetectedAttribute]) -> Dict[str, Any]:
+        """Serialize an item's scoring result for the score store"""
+        meta = content.meta if isinstance(content.meta, dict) else {}
+        return {
+            'scores': {
+                'provenance': dimension_scores.provenance,
+                'verification': dimension_scores.verification,
+                'transparency': dimension_scores.transparency,
+                'coherence': dimension_scores.coherence,
+                'resonance': dimension_scores.resonance,
+            },
+            'attributes': [
+                {
+                    'attribute_id': attr.attribute_id,
+                    'dimension': attr.dimension,
+                    'label': attr.label,
+                    'value': attr.value,
+                    'evidence': attr.evidence,
+                    'confidence': attr.confidence,
+                    'suggestion': attr.suggestion,
+                }
+                for attr in detected_attrs
+            ],
+            'llm_issues': content._llm_issues,
+            # Meta keys score_content writes (triage outcome, score debug)
+            'meta': {k: meta[k] for k in ('triage_status', 'triage_reason', 'score_debug') if k in meta},
+        }
+
+    def _restore_stored_scores(self, content: NormalizedContent,
+                               stored: Dict[str, Any]) -> Tuple[DimensionScores, List[DetectedAttribute]]:
+        """Rebuild scores, attributes and side channels from a score store entry"""
+        logger.info(f"Reusing stored scores for unchanged content {content.content_id}")
+        if content.meta is None:
+            content.meta = {}
+        content.meta.update(stored.get('meta', {}))
+        with self._side_channel_lock:
+            content._llm_issues = dict(stored.get('llm_issues', {}))
+        scores = stored['scores']
+        dimension_scores = DimensionScores(
+            provenance=scores['provenance'],
+            verification=scores['verification'],
+            transparency=scores['transparency'],
+            coherence=scores['coherence'],
+            resonance=scores['resonance']
+        )
+        detected_attrs = [DetectedAttribute(**attr) for attr in stored.get('attributes', [])]
+        return dimension_scores, detected_attrs
+
+    def _failure_count(self) -> int:
+        """Scoring calls so far that fell back to neutral scores"""
+        errors = getattr(self.llm_client, 'error_count', 0)
+        return (errors if isinstance(errors, int) else 0) + self._score_failures
+
+    def _count_reuse(self, stat: str) -> None:
+        with self._side_channel_lock:
+            self.reuse_stats[stat] += 1
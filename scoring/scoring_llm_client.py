@@ -4,15 +4,58 @@ Centralizes all OpenAI API interactions for content scoring
 """
 
 from openai import OpenAI
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Callable
 import logging
 import json
+import threading
+import contextvars
+from contextlib import contextmanager
 
-from config.settings import APIConfig
+from config.settings import APIConfig, SETTINGS
 from data.models import NormalizedContent
+from scoring.llm_cache import LLMResponseCache, get_llm_cache, make_cache_key
+from scoring.rate_limiter import call_with_rate_limit, estimate_tokens
+from scoring.llm_client import ChatClient, LLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Model override for the current scoring context (LLMScoringClient.using_model)
+_model_override: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('scoring_model_override', default=None)
+# Models that answered cascaded score calls for the item being scored
+# (LLMScoringClient.tracking_cascade)
+_cascade_answers: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar('scoring_cascade_answers', default=None)
+
+
+def detect_provider(model: str) -> str:
+    """Provider name for a model, using ChatClient's model-name patterns"""
+    for provider, patterns in ChatClient.PROVIDER_PATTERNS.items():
+        if any(model.startswith(pattern) for pattern in patterns):
+            return provider.value
+    return LLMProvider.OPENAI.value
+
+
+def _strip_code_fence(text: str) -> str:
+    """Drop a ```json ... ``` wrapper that providers without JSON mode add"""
+    if text.startswith('```'):
+        text = text.split('\n', 1)[1] if '\n' in text else ''
+        if text.rstrip().endswith('```'):
+            text = text.rstrip()[:-3]
+    return text.strip()
+
+
+def band_boundaries() -> List[float]:
+    """
+    Composite score boundaries (0.0-1.0) where a small change moves an item
+    across a band: SETTINGS['rating_bands'] and the rubric's
+    authentic/suspect thresholds
+    """
+    from scoring.rubric import get_rubric
+
+    scale = float(SETTINGS.get('rating_scale', 100))
+    values = [v for v in SETTINGS.get('rating_bands', {}).values() if v > 0]
+    values.extend(get_rubric().thresholds.values())
+    return sorted({float(v) / scale for v in values if isinstance(v, (int, float))})
+
 
 class LLMScoringClient:
     """
@@ -20,15 +63,234 @@ class LLMScoringClient:
     Handles all OpenAI API interactions with different scoring patterns
     """
     
-    def __init__(self, model: str = "gpt-3.5-turbo"):
+    def __init__(self, model: str = "gpt-3.5-turbo", cache: Optional[LLMResponseCache] = None):
         """
         Initialize LLM scoring client
         
         Args:
             model: OpenAI model to use (default: gpt-3.5-turbo)
+            cache: Response cache (default: the shared process-wide cache)
         """
         self.client = OpenAI(api_key=APIConfig.openai_api_key)
         self.model = model
+        self.cache = cache if cache is not None else get_llm_cache()
+        # Calls that fell back to a neutral result; ContentScorer checks this
+        # before persisting an item's scores for reuse
+        self.error_count = 0
+        self._error_lock = threading.Lock()
+        # Model cascade (SETTINGS['scoring_cascade_enabled']): per-tier
+        # answer counts and escalation reasons since the last reset
+        self._chat_client: Optional[ChatClient] = None
+        self._cascade_lock = threading.Lock()
+        self.reset_cascade_stats()
+    
+    def _record_error(self) -> None:
+        with self._error_lock:
+            self.error_count += 1
+    
+    @contextmanager
+    def using_model(self, model: str):
+        """
+        Score with `model` instead of self.model (and without the cascade)
+        inside this block
+        
+        The override is a context variable: it applies to this thread and to
+        work submitted with a copy of its context (ContentScorer's dimension
+        fan-out), not to other items scored concurrently.
+        """
+        token = _model_override.set(model)
+        try:
+            yield
+        finally:
+            _model_override.reset(token)
+    
+    def _get_chat_client(self) -> ChatClient:
+        """ChatClient for cascade tiers on providers other than OpenAI"""
+        if self._chat_client is None:
+            self._chat_client = ChatClient(api_key=APIConfig.openai_api_key, cache=self.cache)
+        return self._chat_client
+    
+    def _complete(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float,
+                  response_format: Optional[Dict[str, Any]] = None,
+                  parse: Optional[Callable[[str], Any]] = None,
+                  model: Optional[str] = None) -> Any:
+        """
+        Run a chat completion through the response cache
+        
+        The raw response text is cached only after `parse` succeeds, so
+        malformed responses are retried on the next run instead of replayed.
+        
+        Args:
+            messages: Chat messages
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            response_format: Optional structured output format
+            parse: Optional parser applied to the response text
+            model: Model to call (default: self.model); models of other
+                providers go through ChatClient
+        
+        Returns:
+            Parsed response (or raw text if no parser given)
+        """
+        model = model or _model_override.get() or self.model
+        provider = detect_provider(model)
+        key = make_cache_key(provider, model, messages, temperature, response_format,
+                             SETTINGS.get('rubric_version'), max_tokens=max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return parse(cached) if parse else cached
+        
+        if provider == LLMProvider.OPENAI.value:
+            request = {
+                'model': model,
+                'messages': messages,
+                'max_tokens': max_tokens,
+                'temperature': temperature,
+            }
+            if response_format:
+                request['response_format'] = response_format
+            response = call_with_rate_limit(
+                'openai', model,
+                lambda: self.client.chat.completions.create(**request),
+                estimated_tokens=estimate_tokens(messages, max_tokens)
+            )
+            
+            # Parse response
+            try:
+                text = response.choices[0].message.content.strip()
+            except Exception:
+                text = str(response.choices[0].message.get('content', '')).strip()
+        else:
+            # JSON mode only exists on OpenAI-compatible APIs; the prompts
+            # ask for JSON anyway and parse() validates it
+            extra = {'response_format': response_format} if response_format and provider == LLMProvider.DEEPSEEK.value else {}
+            response = self._get_chat_client().chat(messages, model=model, max_tokens=max_tokens,
+                                                    temperature=temperature, use_cache=False, **extra)
+            text = _strip_code_fence((response.get('content') or '').strip())
+        
+        result = parse(text) if parse else text
+        self.cache.set(key, text)
+        return result
+    
+    def _complete_scored(self, **request: Any) -> Any:
+        """
+        _complete for calls that return scores, with the model cascade
+        
+        With SETTINGS['scoring_cascade_enabled'], the call first goes to the
+        cheapest model in SETTINGS['scoring_cascade_models'] and escalates to
+        the next one when the output fails parsing/validation. The last
+        model's answer is always final.
+        
+        Whether a valid answer is close enough to a band to need the last
+        model depends on the item's composite score, not on one dimension,
+        so that check is made per item by ContentScorer (see
+        tracking_cascade and escalate_answers).
+        
+        Args:
+            **request: _complete arguments
+        
+        Returns:
+            Parsed response
+        
+        Raises:
+            Exception: Whatever the last model's call raised
+        """
+        models = self.cascade_models()
+        if not models:
+            return self._complete(**request)
+        
+        for tier, model in enumerate(models):
+            final = tier == len(models) - 1
+            try:
+                result = self._complete(model=model, **request)
+            except Exception as e:
+                if final:
+                    raise
+                logger.debug(f"Cascade: {model} output invalid, escalating: {e}")
+                self._count_cascade(model, 'invalid_output')
+                continue
+            self._count_cascade(model, None)
+            return result
+    
+    def cascade_models(self) -> List[str]:
+        """Cascade tiers for score calls in this context ([] when the cascade is off)"""
+        models = SETTINGS.get('scoring_cascade_models') or []
+        if not SETTINGS.get('scoring_cascade_enabled', False) or _model_override.get():
+            return []
+        return list(models)
+    
+    @contextmanager
+    def tracking_cascade(self):
+        """
+        Collect the model that answered each cascaded score call made inside
+        this block (including work submitted with a copy of its context)
+        
+        Yields:
+            List of answering model names, filled as calls complete
+        """
+        answers: List[str] = []
+        token = _cascade_answers.set(answers)
+        try:
+            yield answers
+        finally:
+            _cascade_answers.reset(token)
+    
+    def escalate_answers(self, answers: List[str]) -> None:
+        """
+        Record that an item's calls answered by cheaper tiers were redone on
+        the last model because its composite score was near a band boundary
+        
+        Args:
+            answers: Answering models from tracking_cascade
+        """
+        models = SETTINGS.get('scoring_cascade_models') or []
+        if not models:
+            return
+        final = models[-1]
+        with self._cascade_lock:
+            stats = self.cascade_stats
+            for model in answers:
+                if model == final:
+                    continue
+                stats['answered_by'][model] = stats['answered_by'].get(model, 0) - 1
+                if not stats['answered_by'][model]:
+                    del stats['answered_by'][model]
+                stats['answered_by'][final] = stats['answered_by'].get(final, 0) + 1
+                stats['escalations']['near_boundary'] = stats['escalations'].get('near_boundary', 0) + 1
+                if model == models[0]:
+                    stats['escalated_calls'] += 1
+    
+    def _count_cascade(self, model: str, escalation: Optional[str]) -> None:
+        with self._cascade_lock:
+            stats = self.cascade_stats
+            if escalation is None:
+                stats['answered_by'][model] = stats['answered_by'].get(model, 0) + 1
+                stats['calls'] += 1
+                answers = _cascade_answers.get()
+                if answers is not None:
+                    answers.append(model)
+            else:
+                stats['escalations'][escalation] = stats['escalations'].get(escalation, 0) + 1
+                if model == SETTINGS['scoring_cascade_models'][0]:
+                    stats['escalated_calls'] += 1
+    
+    def reset_cascade_stats(self) -> None:
+        with self._cascade_lock:
+            self.cascade_stats = {'calls': 0, 'escalated_calls': 0, 'answered_by': {}, 'escalations': {}}
+    
+    def cascade_summary(self) -> Dict[str, Any]:
+        """
+        Cascade stats since the last reset
+        
+        Returns:
+            Dictionary with scored calls, escalation rate (share of calls the
+            cheapest model did not answer), answers per model and
+            escalations per reason
+        """
+        with self._cascade_lock:
+            stats = json.loads(json.dumps(self.cascade_stats))
+        stats['escalation_rate'] = stats['escalated_calls'] / stats['calls'] if stats['calls'] else 0.0
+        return stats
     
     def get_score(self, prompt: str) -> float:
         """
@@ -41,29 +303,22 @@ class LLMScoringClient:
             Score between 0.0 and 1.0
         """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            score = self._complete_scored(
                 messages=[
                     {"role": "system", "content": "You are an expert content authenticity evaluator. Always respond in English, regardless of the language of the content being analyzed. Respond with only a number between 0.0 and 1.0."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=10,
-                temperature=0.1
+                temperature=0.1,
+                parse=float
             )
             
-            # Parse response
-            try:
-                score_text = response.choices[0].message.content.strip()
-            except Exception:
-                score_text = str(response.choices[0].message.get('content', '')).strip()
-            
-            score = float(score_text)
-            
             # Ensure score is in valid range
             return min(1.0, max(0.0, score))
             
         except Exception as e:
             logger.error(f"LLM scoring error: {e}")
+            self._record_error()
             return 0.5  # Return neutral score on error
     
     def get_score_with_reasoning(self, prompt: str) -> Dict[str, Any]:
@@ -77,47 +332,56 @@ class LLMScoringClient:
             Dictionary with 'score' (float) and 'issues' (list of dicts)
         """
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
+            return self._complete_scored(
                 messages=[
                     {"role": "system", "content": "You are an expert content authenticity evaluator. Always respond in English with valid JSON, regardless of the language of the content being analyzed."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=500,
                 temperature=0.1,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                parse=lambda text: _parse_score_and_issues(text, default_score=0.5)
             )
             
-            # Parse JSON response
-            try:
-                response_text = response.choices[0].message.content.strip()
-                result = json.loads(response_text)
-            except Exception:
-                response_text = str(response.choices[0].message.get('content', '{}')).strip()
-                result = json.loads(response_text)
-            
-            # Validate and normalize
-            score = float(result.get('score', 0.5))
-            score = min(1.0, max(0.0, score))
-            
-            issues = result.get('issues', [])
-            if not isinstance(issues, list):
-                issues = []
-            
-            return {
-                'score': score,
-                'issues': issues
-            }
-            
         except Exception as e:
             logger.error(f"LLM structured scoring error: {e}")
+            self._record_error()
             return {
                 'score': 0.5,
                 'issues': []
             }
     
+    def get_multi_dimension_scores(self, prompt: str, dimensions: List[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Score several dimensions in one structured JSON call
+        
+        Args:
+            prompt: Prompt requesting a JSON object keyed by dimension
+            dimensions: Dimension names the response must contain
+        
+        Returns:
+            Dictionary mapping dimension to {'score': float, 'issues': list},
+            or None if the call failed or the response did not validate
+        """
+        try:
+            return self._complete_scored(
+                messages=[
+                    {"role": "system", "content": "You are an expert content authenticity evaluator. Always respond in English with valid JSON, regardless of the language of the content being analyzed."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=300 * len(dimensions),
+                temperature=0.1,
+                response_format={"type": "json_object"},
+                parse=lambda text: parse_multi_dimension_response(text, dimensions)
+            )
+        except Exception as e:
+            logger.error(f"LLM multi-dimension scoring error: {e}")
+            self._record_error()
+            return None
+    
     def get_score_with_feedback(self, score_prompt: str, content: NormalizedContent,
-                                dimension: str, context_guidance: str = "") -> Dict[str, Any]:
+                                dimension: str, context_guidance: str = "",
+                                single_round_trip: Optional[bool] = None) -> Dict[str, Any]:
         """
         Two-step LLM scoring: Get score first, then get feedback based on score
         
@@ -126,15 +390,136 @@ class LLMScoringClient:
             content: Content being scored
             dimension: Dimension name (for logging)
             context_guidance: Optional context about content type
+            single_round_trip: Get score and feedback from one call (see
+                get_score_and_feedback). Defaults to whether the dimension is
+                listed in SETTINGS['single_round_trip_feedback'].
         
         Returns:
             Dictionary with 'score' (float) and 'issues' (list of dicts)
         """
+        if single_round_trip is None:
+            single_round_trip = dimension.lower() in SETTINGS.get('single_round_trip_feedback', [])
+        if single_round_trip:
+            result = self.get_score_and_feedback(score_prompt, dimension, context_guidance)
+            if result is not None:
+                return result
+            logger.warning(f"Single-round-trip feedback failed for {dimension}, falling back to two-step scoring")
+        
         # Step 1: Get the score
         score = self.get_score(score_prompt)
         logger.debug(f"{dimension} base score: {score:.2f}")
         
         # Step 2: Get feedback based on score
+        feedback_prompt = self._build_feedback_prompt(score, content, dimension, context_guidance)
+        
+        # Get feedback from LLM
+        try:
+            feedback_data = self._complete(
+                messages=[
+                    {"role": "system", "content": "You are an expert content evaluator. Always respond in English with valid JSON, regardless of the language of the content being analyzed."},
+                    {"role": "user", "content": feedback_prompt}
+                ],
+                max_tokens=500,
+                temperature=0.3,
+                response_format={"type": "json_object"},
+                parse=json.loads
+            )
+            
+            return {
+                'score': score,
+                'issues': feedback_data.get('issues', [])
+            }
+            
+        except Exception as e:
+            logger.error(f"LLM feedback error for {dimension}: {e}")
+            self._record_error()
+            return {'score': score, 'issues': []}
+    
+    def get_score_and_feedback(self, score_prompt: str, dimension: str,
+                               context_guidance: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Single-round-trip variant of get_score_with_feedback
+        
+        Asks for the score and the score-conditioned feedback in one JSON
+        response. The body is only sent once, inside score_prompt, so issue
+        evidence is quoted from that (possibly truncated) body.
+        
+        Args:
+            score_prompt: Prompt to get the score (0.0-1.0)
+            dimension: Dimension name
+            context_guidance: Optional context about content type
+        
+        Returns:
+            Dictionary with 'score' (float) and 'issues' (list of dicts),
+            or None if the call failed or the response had no valid score
+        """
+        valid_types = self._get_valid_issue_types(dimension)
+        
+        prompt = f"""
+        {score_prompt.strip()}
+        
+        Instead of a bare number, respond with JSON containing BOTH the score and
+        feedback that explains it.
+        
+        {context_guidance}
+        
+        FEEDBACK RULES (based on the score you assign):
+        - Below 0.9: list the specific issues that caused the lower score
+        - 0.9 to 0.95: provide at least ONE improvement that would move the score closer to 1.0, using type "improvement_opportunity"
+        - 0.95 or above: provide exactly ONE minor optimization tip, using type "improvement_opportunity" and severity "low"
+        
+        Respond with JSON in this exact format:
+        {{
+            "score": 0.7,
+            "issues": [
+                {{
+                    "type": "issue_type",
+                    "confidence": 0.85,
+                    "severity": "high",
+                    "evidence": "EXACT QUOTE: 'the actual text from the content'",
+                    "suggestion": "Change 'the actual text from the content' → 'the corrected text'. This improves {dimension} because [reason]."
+                }}
+            ]
+        }}
+        
+        VALID ISSUE TYPES FOR {dimension.upper()}:
+        {valid_types}
+          - improvement_opportunity - optimization for high-scoring content
+        
+        CRITICAL REQUIREMENTS:
+        1. Score first, then give feedback consistent with that score
+        2. Provide EXACT QUOTES in evidence field - the quoted text MUST appear in the content above
+        3. In suggestion field, show CONCRETE REWRITE using format: "Change 'X' → 'Y'"
+        4. Include brief explanation of WHY the change improves {dimension}
+        5. If you cannot find a specific quote in the content, return an empty issues array
+        """
+        
+        try:
+            result = self._complete_scored(
+                messages=[
+                    {"role": "system", "content": "You are an expert content authenticity evaluator. Always respond in English with valid JSON, regardless of the language of the content being analyzed."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=500,
+                temperature=0.1,
+                response_format={"type": "json_object"},
+                parse=_parse_score_and_issues
+            )
+            logger.debug(f"{dimension} single-round-trip score: {result['score']:.2f}")
+            return result
+        except Exception as e:
+            logger.error(f"LLM single-round-trip feedback error for {dimension}: {e}")
+            self._record_error()
+            return None
+    
+    def _build_feedback_prompt(self, score: float, content: NormalizedContent,
+                               dimension: str, context_guidance: str = "") -> str:
+        """
+        Build the step-two feedback prompt for a given score
+        
+        Returns:
+            Prompt asking for issues (low/medium score) or improvement tips (high score)
+        """
         if score < 0.9:
             # Low/medium score: Ask for specific issues with concrete rewrites
             # Provide valid issue types based on dimension
@@ -265,30 +650,7 @@ class LLMScoringClient:
                 - Suggesting changes to text that doesn't appear in the content provided
                 """
         
-        # Get feedback from LLM
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert content evaluator. Always respond in English with valid JSON, regardless of the language of the content being analyzed."},
-                    {"role": "user", "content": feedback_prompt}
-                ],
-                max_tokens=500,
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-            
-            feedback_text = response.choices[0].message.content.strip()
-            feedback_data = json.loads(feedback_text)
-            
-            return {
-                'score': score,
-                'issues': feedback_data.get('issues', [])
-            }
-            
-        except Exception as e:
-            logger.error(f"LLM feedback error for {dimension}: {e}")
-            return {'score': score, 'issues': []}
+        return feedback_prompt
     
     def _get_valid_issue_types(self, dimension: str) -> str:
         """
@@ -334,3 +696,84 @@ class LLMScoringClient:
         
         types = issue_types.get(dimension_lower, ['improvement_opportunity'])
         return '\n'.join(f'  - {t}' for t in types)
+
+
+def _parse_score_and_issues(text: str, default_score: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Parse a {"score": ..., "issues": [...]} response
+    
+    Args:
+        text: Raw JSON response text
+        default_score: Score to use when the object has no "score" key
+    
+    Raises:
+        ValueError: If the response is not a JSON object with a numeric score
+    """
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        raise ValueError("Response is not a JSON object")
+    try:
+        score = float(data.get('score', default_score))
+    except (TypeError, ValueError):
+        raise ValueError("Response has no numeric score")
+    
+    issues = data.get('issues', [])
+    if not isinstance(issues, list):
+        issues = []
+    
+    return {
+        'score': min(1.0, max(0.0, score)),
+        'issues': issues
+    }
+
+
+def parse_multi_dimension_response(text: str, dimensions: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse and validate a single-call multi-dimension scoring response
+    
+    Expected shape::
+    
+        {"provenance": {"score": 0.7, "issues": [...]}, "coherence": {...}, ...}
+    
+    Args:
+        text: Raw JSON response text
+        dimensions: Dimension names that must be present
+    
+    Returns:
+        Dictionary mapping dimension to {'score': float, 'issues': list}
+    
+    Raises:
+        ValueError: If the response is not valid JSON or a dimension is
+            missing or has no numeric score
+    """
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Response is not valid JSON: {e}")
+    
+    if not isinstance(data, dict):
+        raise ValueError("Response is not a JSON object")
+    
+    # Accept keys in any case ("Provenance" / "provenance")
+    by_name = {str(k).lower(): v for k, v in data.items()}
+    
+    results = {}
+    for dimension in dimensions:
+        entry = by_name.get(dimension.lower())
+        if not isinstance(entry, dict):
+            raise ValueError(f"Missing dimension '{dimension}' in response")
+        try:
+            score = float(entry.get('score'))
+        except (TypeError, ValueError):
+            raise ValueError(f"Dimension '{dimension}' has no numeric score")
+        
+        issues = entry.get('issues', [])
+        if not isinstance(issues, list):
+            issues = []
+        
+        results[dimension] = {
+            'score': min(1.0, max(0.0, score)),
+            'issues': [issue for issue in issues if isinstance(issue, dict) and issue.get('type')]
+        }
+    
+    return results
@@ -0,0 +1,177 @@
+"""
+Streaming stage runner for the AR pipeline
+Connects pipeline stages with bounded queues so fetching, normalization,
+scoring and upload overlap instead of running as strict phases
+"""
+
+import queue
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from config.settings import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+# How often blocked queue operations check whether the consumer went away
+_POLL_SECONDS = 0.1
+
+
+class Stage:
+    """
+    One pipeline stage
+
+    `fn` maps an input item to its output. Returning None drops the item and
+    returning a list forwards each element. `on_close` runs once after the
+    last item has gone through the stage (e.g. to flush a buffered upload);
+    a list it returns is forwarded downstream like `fn` output.
+    """
+
+    def __init__(self, name: str, fn: Callable[[Any], Any], workers: int = 1,
+                 on_close: Optional[Callable[[], Optional[List[Any]]]] = None):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, int(workers or 1))
+        self.on_close = on_close
+
+
+def run_stages(source: Iterable[Any], stages: List[Stage], queue_size: Optional[int] = None,
+               stats: Optional[Dict[str, Dict[str, int]]] = None) -> Iterator[Any]:
+    """
+    Run `source` through `stages` and yield the last stage's outputs
+
+    Each stage runs on its own worker thread(s) and reads from a queue
+    bounded by `queue_size`, so a slow stage applies backpressure upstream
+    and only a bounded number of items is in memory at once. Outputs are
+    yielded as soon as they leave the last stage, in completion order.
+
+    An exception raised by a stage function is logged and drops that item;
+    an exception raised by the source is re-raised once the items already
+    read have drained. Closing the generator early stops the source and
+    lets the workers exit after their current item.
+
+    Args:
+        source: Items to process (typically a lazy generator)
+        stages: Stages in order
+        queue_size: Items buffered between stages (default:
+            SETTINGS['stream_queue_size'])
+        stats: Optional dict filled with per-stage processed/dropped/failed
+            counts
+
+    Yields:
+        Items produced by the last stage
+    """
+    if queue_size is None:
+        queue_size = SETTINGS.get('stream_queue_size', 32)
+    queues = [queue.Queue(maxsize=max(1, queue_size)) for _ in range(len(stages) + 1)]
+    stop = threading.Event()
+    source_errors: List[BaseException] = []
+    if stats is None:
+        stats = {}
+    for stage in stages:
+        stats[stage.name] = {'processed': 0, 'dropped': 0, 'failed': 0}
+    stats_lock = threading.Lock()
+
+    def put(q: queue.Queue, item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(q: queue.Queue) -> Any:
+        while not stop.is_set():
+            try:
+                return q.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def feed():
+        try:
+            for item in source:
+                if not put(queues[0], item):
+                    return
+        except Exception as e:
+            logger.error(f"Streaming source failed: {e}")
+            source_errors.append(e)
+        finally:
+            put(queues[0], _DONE)
+
+    def make_worker(index: int, stage: Stage, remaining: List[int]):
+        inbox, outbox = queues[index], queues[index + 1]
+        counts = stats[stage.name]
+
+        def work():
+            while True:
+                item = get(inbox)
+                if item is _DONE:
+                    break
+                try:
+                    result = stage.fn(item)
+                except Exception as e:
+                    logger.error(f"Stage {stage.name} failed on an item: {e}")
+                    with stats_lock:
+                        counts['failed'] += 1
+                    continue
+                with stats_lock:
+                    counts['processed'] += 1
+                    if result is None:
+                        counts['dropped'] += 1
+                outputs = result if isinstance(result, list) else ([] if result is None else [result])
+                for output in outputs:
+                    if not put(outbox, output):
+                        return
+
+            if stop.is_set():
+                return
+            # Hand the end marker to the next sibling; the last worker out
+            # closes the stage and passes it downstream
+            with stats_lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if not last:
+                put(inbox, _DONE)
+                return
+            if stage.on_close:
+                try:
+                    closing = stage.on_close()
+                except Exception as e:
+                    logger.error(f"Stage {stage.name} failed to close: {e}")
+                    closing = None
+                for output in closing or []:
+                    if not put(outbox, output):
+                        return
+            put(outbox, _DONE)
+
+        return work
+
+    threads = [threading.Thread(target=feed, name='stream-source', daemon=True)]
+    for index, stage in enumerate(stages):
+        remaining = [stage.workers]
+        for n in range(stage.workers):
+            threads.append(threading.Thread(target=make_worker(index, stage, remaining),
+                                            name=f"stream-{stage.name}-{n}", daemon=True))
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = get(queues[-1])
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        # Early close (or an error in the consumer) stops every stage; the
+        # daemon workers exit after the item they are working on
+        stop.set()
+
+    for thread in threads:
+        thread.join()
+    if source_errors:
+        raise source_errors[0]
@@ -0,0 +1,125 @@
+"""
+Per-item text profile
+Lowercased text, sentences, URLs, tokens and readability computed once per
+item and shared by every analyzer that needs them (content filter, triage,
+claim pre-detector, linguistic analyzer, attribute detector, link checks)
+"""
+
+import re
+import logging
+from functools import cached_property
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Sentence split after terminal punctuation (keeps the punctuation)
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[\.\!\?])\s+')
+URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+WORD_RE = re.compile(r"[a-z0-9]+(?:['\-][a-z0-9]+)*")
+# Rough clause split used by the passive-voice heuristic
+CLAUSE_SPLIT_RE = re.compile(r'[.!?]+')
+
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences longer than 10 characters, split after terminal punctuation"""
+    stripped = (s.strip() for s in SENTENCE_SPLIT_RE.split(text))
+    return [s for s in stripped if len(s) > 10]
+
+
+def profile_of(content: Any) -> 'TextProfile':
+    """
+    The TextProfile memoized on a content item
+
+    Rebuilt when the item's body or title object changes, so edits made
+    between analyzers (e.g. body enrichment) are never served stale.
+    """
+    profile = getattr(content, '_text_profile', None)
+    if profile is None or profile.body is not (getattr(content, 'body', '') or '') \
+            or profile.title is not (getattr(content, 'title', '') or ''):
+        profile = TextProfile(content)
+        try:
+            content._text_profile = profile
+        except AttributeError:
+            pass
+    return profile
+
+
+class TextProfile:
+    """
+    Derived text views of one content item, each computed on first use
+
+    Args:
+        content: NormalizedContent (or anything with body/title)
+    """
+
+    def __init__(self, content: Any):
+        self.body: str = getattr(content, 'body', '') or ''
+        self.title: str = getattr(content, 'title', '') or ''
+        # Derived values owned by individual consumers (e.g. content type)
+        self.memo: Dict[str, Any] = {}
+
+    @cached_property
+    def text(self) -> str:
+        """Body and title joined the way the detectors have always combined them"""
+        return self.body + " " + self.title
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def body_lower(self) -> str:
+        return self.body.lower()
+
+    @cached_property
+    def title_lower(self) -> str:
+        return self.title.lower()
+
+    @cached_property
+    def body_stripped_length(self) -> int:
+        return len(self.body.strip())
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        """Body sentences longer than 10 characters"""
+        return split_sentences(self.body)
+
+    @cached_property
+    def clauses(self) -> List[str]:
+        """Non-empty body fragments between runs of . ! ?"""
+        stripped = (s.strip() for s in CLAUSE_SPLIT_RE.split(self.body))
+        return [s for s in stripped if s]
+
+    @cached_property
+    def body_word_count(self) -> int:
+        """Whitespace-separated words in the body"""
+        return len(self.body.split())
+
+    @cached_property
+    def urls(self) -> List[str]:
+        """http(s) URLs in body and title"""
+        return URL_RE.findall(self.text)
+
+    @cached_property
+    def body_urls(self) -> List[str]:
+        """http(s) URLs in the body"""
+        return URL_RE.findall(self.body)
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Lowercased word tokens of body and title"""
+        return WORD_RE.findall(self.text_lower)
+
+    @cached_property
+    def readability(self) -> Dict[str, float]:
+        """textstat grade level, reading ease and reading time of the body ({} on failure)"""
+        try:
+            import textstat
+            return {
+                "flesch_kincaid_grade": textstat.flesch_kincaid_grade(self.body),
+                "flesch_reading_ease": textstat.flesch_reading_ease(self.body),
+                "reading_time": textstat.reading_time(self.body)
+            }
+        except Exception as e:
+            logger.warning(f"Readability analysis failed: {e}")
+            return {}
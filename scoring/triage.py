@@ -2,6 +2,7 @@
 import logging
 from typing import Dict, Any, Optional, Tuple
 from data.models import NormalizedContent
+from scoring.text_profile import profile_of
 
 logger = logging.getLogger(__name__)
 
@@ -29,17 +30,18 @@ class TriageScorer:
         """
         # Rule 1: Length Check
         # Skip very short content (likely navigation, buttons, or empty pages)
-        if not content.body or len(content.body.strip()) < 100:
+        profile = profile_of(content)
+        if profile.body_stripped_length < 100:
             return False, "Content too short (< 100 chars)", 0.5
             
         # Rule 2: Keyword Check for Functional Pages
         # Skip Login / Sign Up / Cart pages if they don't have substantial content
-        title_lower = content.title.lower() if content.title else ""
+        title_lower = profile.title_lower
         functional_keywords = ['login', 'sign in', 'sign up', 'register', 'cart', 'checkout', 'forgot password']
         
         if any(kw in title_lower for kw in functional_keywords):
             # If it's a functional page AND has relatively short content, skip it
-            if len(content.body.strip()) < 300:
+            if profile.body_stripped_length < 300:
                 return False, f"Functional page detected: {content.title}", 0.5
                 
         # Rule 3: Error Pages
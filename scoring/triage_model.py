@@ -0,0 +1,393 @@
+"""
+Learned triage model
+Predicts the five dimension scores from cheap local features (hashed TF-IDF
+of the text plus attribute-detector outputs) with a per-dimension
+uncertainty interval, so confident items can skip LLM scoring
+"""
+
+import os
+import re
+import json
+import math
+import pickle
+import logging
+import threading
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    # Optional: scikit-learn/scipy are only needed to train or load a model
+    from scipy import sparse
+    from sklearn.ensemble import GradientBoostingRegressor
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    _HAVE_SKLEARN = True
+except Exception:
+    sparse = None
+    GradientBoostingRegressor = None
+    HashingVectorizer = None
+    TfidfTransformer = None
+    _HAVE_SKLEARN = False
+
+from data.models import DetectedAttribute
+
+logger = logging.getLogger(__name__)
+
+DIMENSIONS = ('provenance', 'verification', 'transparency', 'coherence', 'resonance')
+
+# Bump when the pickled payload or manifest layout changes
+MODEL_FORMAT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+MODEL_FILE = 'model.pkl'
+
+# Quantiles of the prediction interval; the middle model is the point estimate
+QUANTILES = (0.1, 0.5, 0.9)
+
+_URL_RE = re.compile(r'https?://\S+')
+
+
+def _require_sklearn() -> None:
+    if not _HAVE_SKLEARN:
+        raise ImportError("scikit-learn and scipy are required for the triage model (pip install scikit-learn)")
+
+
+class TriageFeaturizer:
+    """
+    Hashed TF-IDF of title and body plus a small dense block: per-dimension
+    mean value and count of detected attributes, body length, link count
+    and digit ratio
+    """
+
+    def __init__(self, n_features: int = 2 ** 12, use_attributes: bool = True, max_chars: int = 5000):
+        _require_sklearn()
+        self.n_features = n_features
+        self.use_attributes = use_attributes
+        self.max_chars = max_chars
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features, alternate_sign=False, ngram_range=(1, 2),
+            stop_words='english', norm=None
+        )
+        self.tfidf = TfidfTransformer(sublinear_tf=True)
+
+    def _texts(self, contents: Sequence[Any]) -> List[str]:
+        return [f"{getattr(c, 'title', '') or ''}\n{(getattr(c, 'body', '') or '')[:self.max_chars]}"
+                for c in contents]
+
+    def _dense(self, content: Any, attrs: Optional[List[DetectedAttribute]]) -> List[float]:
+        body = getattr(content, 'body', '') or ''
+        row = [
+            math.log1p(len(body)),
+            float(len(_URL_RE.findall(body))),
+            sum(ch.isdigit() for ch in body) / max(1, len(body)),
+        ]
+        if self.use_attributes:
+            for dimension in DIMENSIONS:
+                values = [a.value / 10.0 for a in (attrs or []) if a.dimension == dimension]
+                row.extend([sum(values) / len(values) if values else 0.0, float(len(values))])
+        return row
+
+    def fit(self, contents: Sequence[Any]) -> 'TriageFeaturizer':
+        self.tfidf.fit(self.vectorizer.transform(self._texts(contents)))
+        return self
+
+    def transform(self, contents: Sequence[Any],
+                  attrs_list: Optional[Sequence[Optional[List[DetectedAttribute]]]] = None):
+        """Feature matrix (scipy CSR) for contents; attrs_list aligns with contents"""
+        attrs_list = attrs_list if attrs_list is not None else [None] * len(contents)
+        text = self.tfidf.transform(self.vectorizer.transform(self._texts(contents)))
+        dense = sparse.csr_matrix(np.array([self._dense(c, a) for c, a in zip(contents, attrs_list)]))
+        return sparse.hstack([text, dense], format='csr')
+
+
+@dataclass
+class TriagePrediction:
+    """Predicted dimension scores with their prediction intervals"""
+    scores: Dict[str, float]
+    lower: Dict[str, float]
+    upper: Dict[str, float]
+
+    @property
+    def uncertainty(self) -> float:
+        """Widest prediction interval across the five dimensions"""
+        return max(self.upper[d] - self.lower[d] for d in DIMENSIONS)
+
+    def to_debug(self) -> Dict[str, Any]:
+        return {
+            'scores': {d: round(v, 3) for d, v in self.scores.items()},
+            'interval': {d: [round(self.lower[d], 3), round(self.upper[d], 3)] for d in DIMENSIONS},
+            'uncertainty': round(self.uncertainty, 3),
+        }
+
+
+@dataclass
+class TriageModel:
+    """
+    Per-dimension quantile gradient-boosted regressors over TriageFeaturizer
+    features
+
+    Artifact format: a directory holding manifest.json (format version,
+    training metadata and calibration report) and model.pkl (featurizer and
+    regressors).
+    """
+    featurizer: Any
+    models: Dict[str, Dict[float, Any]]
+    manifest: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def train(cls, contents: Sequence[Any], targets: Sequence[Dict[str, float]],
+              attrs_list: Optional[Sequence[Optional[List[DetectedAttribute]]]] = None,
+              n_features: int = 2 ** 12, n_estimators: int = 100,
+              random_state: int = 0) -> 'TriageModel':
+        """
+        Fit the featurizer and three quantile regressors per dimension
+
+        Args:
+            contents: Training items (title/body)
+            targets: Historical dimension scores (0.0-1.0) per item
+            attrs_list: Detected attributes per item; None trains a text-only model
+            n_features: Hashed TF-IDF width
+            n_estimators: Boosting rounds per regressor
+            random_state: Seed for reproducible training
+
+        Returns:
+            Trained TriageModel
+        """
+        _require_sklearn()
+        if len(contents) != len(targets):
+            raise ValueError(f"{len(contents)} contents but {len(targets)} targets")
+        if len(contents) < 10:
+            raise ValueError(f"Need at least 10 training items, got {len(contents)}")
+
+        featurizer = TriageFeaturizer(n_features=n_features, use_attributes=attrs_list is not None)
+        featurizer.fit(contents)
+        X = featurizer.transform(contents, attrs_list)
+
+        models: Dict[str, Dict[float, Any]] = {}
+        for dimension in DIMENSIONS:
+            y = np.array([float(t[dimension]) for t in targets])
+            models[dimension] = {}
+            for alpha in QUANTILES:
+                regressor = GradientBoostingRegressor(
+                    loss='quantile', alpha=alpha, n_estimators=n_estimators,
+                    max_depth=3, learning_rate=0.1, subsample=0.8, random_state=random_state
+                )
+                models[dimension][alpha] = regressor.fit(X, y)
+            logger.debug(f"Trained triage regressors for {dimension}")
+
+        manifest = {
+            'format_version': MODEL_FORMAT_VERSION,
+            'trained_at': datetime.now(timezone.utc).isoformat(),
+            'n_train': len(contents),
+            'dimensions': list(DIMENSIONS),
+            'quantiles': list(QUANTILES),
+            'features': {'n_features': n_features, 'use_attributes': featurizer.use_attributes},
+        }
+        return cls(featurizer=featurizer, models=models, manifest=manifest)
+
+    @property
+    def uses_attributes(self) -> bool:
+        return bool(self.featurizer.use_attributes)
+
+    def predict_many(self, contents: Sequence[Any],
+                     attrs_list: Optional[Sequence[Optional[List[DetectedAttribute]]]] = None) -> List[TriagePrediction]:
+        """Predict scores and intervals for several items"""
+        if not contents:
+            return []
+        X = self.featurizer.transform(contents, attrs_list)
+        low_q, mid_q, high_q = QUANTILES
+        columns = {
+            dimension: {alpha: np.clip(self.models[dimension][alpha].predict(X), 0.0, 1.0)
+                        for alpha in QUANTILES}
+            for dimension in DIMENSIONS
+        }
+        predictions = []
+        for i in range(len(contents)):
+            lower, scores, upper = {}, {}, {}
+            for dimension in DIMENSIONS:
+                # Independently fitted quantiles can cross; order them
+                low, mid, high = sorted(float(columns[dimension][q][i]) for q in (low_q, mid_q, high_q))
+                lower[dimension], scores[dimension], upper[dimension] = low, mid, high
+            predictions.append(TriagePrediction(scores=scores, lower=lower, upper=upper))
+        return predictions
+
+    def predict(self, content: Any, attrs: Optional[List[DetectedAttribute]] = None) -> TriagePrediction:
+        return self.predict_many([content], [attrs])[0]
+
+    def save(self, path: str) -> None:
+        """Write the model artifact directory"""
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, MODEL_FILE), 'wb') as f:
+            pickle.dump({'featurizer': self.featurizer, 'models': self.models}, f)
+        with open(os.path.join(path, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        logger.info(f"Saved triage model to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> 'TriageModel':
+        """
+        Load a model artifact directory
+
+        Raises:
+            FileNotFoundError: If the artifact is missing
+            ValueError: If it was written with a different format version
+        """
+        _require_sklearn()
+        with open(os.path.join(path, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format_version') != MODEL_FORMAT_VERSION:
+            raise ValueError(f"Triage model format {manifest.get('format_version')} != {MODEL_FORMAT_VERSION}")
+        with open(os.path.join(path, MODEL_FILE), 'rb') as f:
+            payload = pickle.load(f)
+        return cls(featurizer=payload['featurizer'], models=payload['models'], manifest=manifest)
+
+
+def calibration_report(model: TriageModel, contents: Sequence[Any], targets: Sequence[Dict[str, float]],
+                       attrs_list: Optional[Sequence[Optional[List[DetectedAttribute]]]] = None,
+                       thresholds: Sequence[float] = (0.1, 0.15, 0.2, 0.3)) -> Dict[str, Any]:
+    """
+    Evaluate a model on held-out items
+
+    Reports per-dimension MAE and interval coverage (nominal coverage is
+    the 10-90% quantile band, 0.8), and for each uncertainty threshold the
+    share of items that would skip the LLM and their error.
+
+    Args:
+        model: Trained model
+        contents: Held-out items
+        targets: Their historical dimension scores
+        attrs_list: Detected attributes per item (when the model uses them)
+        thresholds: Uncertainty thresholds to evaluate
+
+    Returns:
+        Report dictionary
+    """
+    n = len(contents)
+    if n == 0:
+        return {'n': 0}
+    predictions = model.predict_many(contents, attrs_list if model.uses_attributes else None)
+
+    dimensions = {}
+    for dimension in DIMENSIONS:
+        errors = [abs(p.scores[dimension] - float(t[dimension])) for p, t in zip(predictions, targets)]
+        covered = [p.lower[dimension] <= float(t[dimension]) <= p.upper[dimension]
+                   for p, t in zip(predictions, targets)]
+        dimensions[dimension] = {
+            'mae': sum(errors) / n,
+            'coverage': sum(covered) / n,
+            'mean_interval': sum(p.upper[dimension] - p.lower[dimension] for p in predictions) / n,
+        }
+
+    by_threshold = []
+    for threshold in thresholds:
+        confident = [(p, t) for p, t in zip(predictions, targets) if p.uncertainty <= threshold]
+        errors = [abs(p.scores[d] - float(t[d])) for p, t in confident for d in DIMENSIONS]
+        by_threshold.append({
+            'max_uncertainty': threshold,
+            'skip_rate': len(confident) / n,
+            'mae': sum(errors) / len(errors) if errors else None,
+            'max_abs_error': max(errors) if errors else None,
+        })
+
+    return {
+        'n': n,
+        'nominal_coverage': QUANTILES[-1] - QUANTILES[0],
+        'dimensions': dimensions,
+        'thresholds': by_threshold,
+    }
+
+
+class TriageRun:
+    """
+    Skip counters of one scoring run
+
+    The shared TriageGate holds the model and thresholds only; each run
+    (ContentScorer.batch_score_content, ScoringPipeline.stream_scoring_pipeline)
+    gets its own counters, so the skip budget is a share of that run's
+    items and concurrent runs do not reset each other.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seen = 0
+        self.skipped = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'seen': self.seen, 'skipped': self.skipped}
+
+
+class TriageGate:
+    """
+    Decides per item whether the model's prediction replaces LLM scoring
+
+    An item skips the LLM when its widest prediction interval is at most
+    max_uncertainty and the skip budget (maximum share of the run's items
+    answered by the model, counted in a TriageRun) is not exhausted.
+    """
+
+    def __init__(self, model: TriageModel, max_uncertainty: float = 0.15, skip_budget: float = 0.3):
+        self.model = model
+        self.max_uncertainty = max_uncertainty
+        self.skip_budget = skip_budget
+
+    def new_run(self) -> TriageRun:
+        """Fresh skip counters for a scoring run"""
+        return TriageRun()
+
+    def decide(self, content: Any, attrs: Optional[List[DetectedAttribute]] = None,
+               run: Optional[TriageRun] = None) -> Optional[TriagePrediction]:
+        """
+        Args:
+            content: Item about to be scored
+            attrs: Detector output (used when the model was trained on it)
+            run: Counters of the current run; without one the item is its
+                own run, so it is only skipped with a skip budget of 1.0
+
+        Returns:
+            The prediction to use instead of LLM scoring, or None to score normally
+        """
+        if run is None:
+            run = self.new_run()
+        prediction = self.model.predict(content, attrs if self.model.uses_attributes else None)
+        with run._lock:
+            run.seen += 1
+            if prediction.uncertainty > self.max_uncertainty:
+                return None
+            if run.skipped + 1 > self.skip_budget * run.seen:
+                return None
+            run.skipped += 1
+        return prediction
+
+
+_shared_gate: Optional[TriageGate] = None
+_shared_gate_lock = threading.Lock()
+
+
+def get_triage_gate() -> Optional[TriageGate]:
+    """
+    Shared gate from SETTINGS, or None when the learned triage stage is
+    disabled or no model artifact can be loaded
+    """
+    global _shared_gate
+    from config.settings import SETTINGS
+
+    if not SETTINGS.get('triage_model_enabled', False):
+        return None
+    with _shared_gate_lock:
+        if _shared_gate is None:
+            path = SETTINGS.get('triage_model_path')
+            try:
+                model = TriageModel.load(path)
+            except Exception as e:
+                logger.warning(f"Learned triage disabled, could not load model from {path}: {e}")
+                return None
+            _shared_gate = TriageGate(
+                model,
+                max_uncertainty=SETTINGS.get('triage_model_max_uncertainty', 0.15),
+                skip_budget=SETTINGS.get('triage_model_skip_budget', 0.3),
+            )
+            logger.info(f"Loaded triage model from {path} (trained {model.manifest.get('trained_at')})")
+        return _shared_gate
@@ -5,11 +5,16 @@ Handles RAG-based verification of content claims using Brave Search.
 
 import logging
 import json
+import threading
 from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ingestion.serper_search import search_serper
 from scoring.scoring_llm_client import LLMScoringClient
+from scoring.rate_limiter import call_with_rate_limit, estimate_tokens
+from scoring.claim_cache import ClaimCache, get_claim_cache
+from scoring.claim_dedup import cluster_claims, same_anchors
+from config.settings import SETTINGS
 from data.models import NormalizedContent
 
 logger = logging.getLogger(__name__)
@@ -20,10 +25,20 @@ class VerificationManager:
     1. Extract claims from content
     2. Search for evidence (Brave Search)
     3. Verify claims against evidence
+
+    Verdicts and search results are cached per normalized claim, so a
+    claim repeated across pages or runs is searched and verified once
+    per cache TTL. For a batch, verify_run() verifies near-duplicate
+    claims across all items once and verify_content() then serves the
+    precomputed results.
     """
     
-    def __init__(self):
+    def __init__(self, claim_cache: Optional[ClaimCache] = None):
         self.llm_client = LLMScoringClient()
+        self.claim_cache = claim_cache if claim_cache is not None else get_claim_cache()
+        # Results from verify_run, consumed by verify_content
+        self._run_results: Dict[str, Dict[str, Any]] = {}
+        self._run_lock = threading.Lock()
         
     def verify_content(self, content: NormalizedContent) -> Dict[str, Any]:
         """
@@ -32,6 +47,11 @@ class VerificationManager:
         Returns:
             Dict with 'score' (float) and 'issues' (list)
         """
+        with self._run_lock:
+            precomputed = self._run_results.pop(content.content_id, None)
+        if precomputed is not None:
+            return precomputed
+
         # 1. Extract checkable claims
         claims = self._extract_claims(content)
         if not claims:
@@ -44,6 +64,155 @@ class VerificationManager:
         # 3. Aggregate results into score and issues
         return self._aggregate_results(verified_claims)
     
+    def verify_run(self, contents: List[NormalizedContent]) -> Dict[str, Dict[str, Any]]:
+        """
+        Verify all items of a run together
+        
+        1. Extract claims for several items per prompt
+        2. Cluster near-duplicate claims across items (MinHash)
+        3. Verify one claim per cluster with bounded concurrency
+        4. Fan each verdict back out to every item that made the claim, as
+           long as its numbers, negations and entities match the verified one
+        
+        Results are kept for verify_content(), which returns them instead of
+        verifying the item again.
+        
+        Returns:
+            Dict of content_id -> verify_content-style result
+        """
+        claims_by_item = self._extract_claims_batch(contents)
+        
+        flat = [(content_id, claim) for content_id, claims in claims_by_item.items() for claim in claims]
+        clusters = cluster_claims([claim for _, claim in flat],
+                                  threshold=SETTINGS.get('claim_cluster_threshold', 0.6))
+        logger.info(f"Run verification: {len(flat)} claims from {len(contents)} items in {len(clusters)} clusters")
+        
+        # A verdict is only shared with members whose numbers, negations and
+        # entities match the representative; any other member is verified
+        # on its own
+        groups = []
+        for members in clusters:
+            representative = flat[members[0]][1]
+            shared = [i for i in members if same_anchors(representative, flat[i][1])]
+            groups.append(shared)
+            groups.extend([i] for i in members if i not in shared)
+        representatives = [flat[members[0]][1] for members in groups]
+        verdicts = self._verify_claims_parallel(
+            representatives, max_workers=SETTINGS.get('claim_verification_concurrency', 8))
+        verdict_by_claim = {v.get('claim'): v for v in verdicts}
+        
+        verified_by_item: Dict[str, List[Dict[str, Any]]] = {content_id: [] for content_id in claims_by_item}
+        for members, representative in zip(groups, representatives):
+            verdict = verdict_by_claim.get(representative)
+            if verdict is None:
+                continue
+            for index in members:
+                content_id, claim = flat[index]
+                verified_by_item[content_id].append(dict(verdict, claim=claim))
+        
+        results = {}
+        for content in contents:
+            if content.content_id not in claims_by_item:
+                continue
+            verified = verified_by_item.get(content.content_id, [])
+            if not verified:
+                logger.info(f"No verifiable claims found for {content.content_id}")
+                results[content.content_id] = {'score': 0.5, 'issues': []}
+            else:
+                results[content.content_id] = self._aggregate_results(verified)
+        
+        with self._run_lock:
+            self._run_results.update(results)
+        return results
+    
+    def clear_run_results(self) -> None:
+        """Drop verify_run results that were never consumed (e.g. filtered items)."""
+        with self._run_lock:
+            self._run_results.clear()
+    
+    def _extract_claims_batch(self, contents: List[NormalizedContent]) -> Dict[str, List[str]]:
+        """
+        Extract claims for several items per LLM call
+        
+        Batches run concurrently (SETTINGS['claim_extraction_concurrency']).
+        If a batched response is unusable, its items fall back to one
+        extraction call each.
+        
+        Returns:
+            Dict of content_id -> claims
+        """
+        batch_size = max(1, SETTINGS.get('claim_extraction_batch_size', 5))
+        batches = [contents[start:start + batch_size] for start in range(0, len(contents), batch_size)]
+        claims_by_item: Dict[str, List[str]] = {}
+        if not batches:
+            return claims_by_item
+        max_workers = max(1, min(SETTINGS.get('claim_extraction_concurrency', 4), len(batches)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for extracted in executor.map(self._extract_claims_for_items, batches):
+                claims_by_item.update(extracted)
+        return claims_by_item
+    
+    def _extract_claims_for_items(self, batch: List[NormalizedContent]) -> Dict[str, List[str]]:
+        """Claims for one extraction batch, one call per item if the batched response is unusable."""
+        extracted = self._extract_claims_for_batch(batch) if len(batch) > 1 else None
+        if extracted is None:
+            extracted = {content.content_id: self._extract_claims(content) for content in batch}
+        return extracted
+    
+    def _extract_claims_for_batch(self, batch: List[NormalizedContent]) -> Optional[Dict[str, List[str]]]:
+        """One extraction prompt for a batch of items; None if the response is unusable."""
+        documents = "\n\n".join(
+            f"--- Document {i} ---\n{content.body[:3000]}" for i, content in enumerate(batch, start=1)
+        )
+        prompt = f"""
+        For EACH document below, extract 3-5 key FACTUAL claims that should be verified.
+        Focus on:
+        - Statistics and data points
+        - Specific events or dates
+        - Absolute statements ("We are the first...", "The only...")
+        - Citations of external studies
+        
+        Do NOT extract:
+        - Opinions or subjective statements
+        - Generic marketing fluff ("We offer great service")
+        - Common knowledge
+        
+        {documents}
+        
+        Return ONLY JSON mapping each document number to its list of claims
+        (an empty list if it has none):
+        {{"documents": {{"1": ["claim 1", "claim 2"], "2": []}}}}
+        """
+        
+        try:
+            messages = [
+                {"role": "system", "content": "You are a fact-checker. Extract specific claims per document as JSON."},
+                {"role": "user", "content": prompt}
+            ]
+            response = call_with_rate_limit(
+                'openai', self.llm_client.model,
+                lambda: self.llm_client.client.chat.completions.create(
+                    model=self.llm_client.model,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=0.1
+                ),
+                estimated_tokens=estimate_tokens(messages, 300 * len(batch))
+            )
+            documents_claims = json.loads(response.choices[0].message.content).get('documents')
+            if not isinstance(documents_claims, dict):
+                raise ValueError("missing 'documents' object")
+            result = {}
+            for i, content in enumerate(batch, start=1):
+                claims = documents_claims.get(str(i), [])
+                if not isinstance(claims, list):
+                    raise ValueError(f"claims for document {i} are not a list")
+                result[content.content_id] = [c for c in claims if isinstance(c, str)][:5]
+            return result
+        except Exception as e:
+            logger.warning(f"Batched claim extraction failed for {len(batch)} items, extracting one by one: {e}")
+            return None
+
     def _extract_claims(self, content: NormalizedContent) -> List[str]:
         """Extract 3-5 key factual claims from content."""
         prompt = f"""
@@ -67,14 +236,19 @@ class VerificationManager:
         """
         
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.model,
-                messages=[
-                    {"role": "system", "content": "You are a fact-checker. Extract specific claims as a JSON list."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1
+            messages = [
+                {"role": "system", "content": "You are a fact-checker. Extract specific claims as a JSON list."},
+                {"role": "user", "content": prompt}
+            ]
+            response = call_with_rate_limit(
+                'openai', self.llm_client.model,
+                lambda: self.llm_client.client.chat.completions.create(
+                    model=self.llm_client.model,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=0.1
+                ),
+                estimated_tokens=estimate_tokens(messages, 500)
             )
             result = json.loads(response.choices[0].message.content)
             return result.get('claims', [])[:5]  # Limit to 5 claims max
@@ -82,10 +256,12 @@ class VerificationManager:
             logger.error(f"Claim extraction failed: {e}")
             return []
 
-    def _verify_claims_parallel(self, claims: List[str]) -> List[Dict[str, Any]]:
+    def _verify_claims_parallel(self, claims: List[str], max_workers: int = 3) -> List[Dict[str, Any]]:
         """Verify multiple claims in parallel."""
         results = []
-        with ThreadPoolExecutor(max_workers=3) as executor:
+        if not claims:
+            return results
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_claim = {executor.submit(self._verify_single_claim, claim): claim for claim in claims}
             for future in as_completed(future_to_claim):
                 try:
@@ -94,14 +270,29 @@ class VerificationManager:
                     logger.error(f"Claim verification failed: {e}")
         return results
 
-    def _verify_single_claim(self, claim: str) -> Dict[str, Any]:
-        """Search for evidence and verify a single claim."""
-        # Search Serper (Google)
+    def _search_evidence(self, claim: str, size: int = 3) -> List[Dict[str, str]]:
+        """Search Serper (Google) for evidence, reusing cached results for the same normalized query."""
+        cached = self.claim_cache.get_search(claim, size)
+        if cached is not None:
+            return cached
         try:
-            search_results = search_serper(claim, size=3)
+            search_results = search_serper(claim, size=size)
         except Exception as e:
             logger.warning(f"Serper search failed for '{claim}': {e}")
-            search_results = []
+            return []
+        # Empty results may be transient; only cache real evidence
+        if search_results:
+            self.claim_cache.set_search(claim, size, search_results)
+        return search_results
+
+    def _verify_single_claim(self, claim: str) -> Dict[str, Any]:
+        """Search for evidence and verify a single claim."""
+        cached = self.claim_cache.get_verdict(claim, self.llm_client.model)
+        if cached is not None:
+            logger.debug(f"Using cached verdict for claim '{claim}'")
+            return dict(cached, claim=claim)
+
+        search_results = self._search_evidence(claim)
         
         if not search_results:
             return {
@@ -140,18 +331,24 @@ class VerificationManager:
         """
         
         try:
-            response = self.llm_client.client.chat.completions.create(
-                model=self.llm_client.model,
-                messages=[
-                    {"role": "system", "content": "You are a strict fact-checker. Respond in JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1
+            messages = [
+                {"role": "system", "content": "You are a strict fact-checker. Respond in JSON."},
+                {"role": "user", "content": prompt}
+            ]
+            response = call_with_rate_limit(
+                'openai', self.llm_client.model,
+                lambda: self.llm_client.client.chat.completions.create(
+                    model=self.llm_client.model,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=0.1
+                ),
+                estimated_tokens=estimate_tokens(messages, 500)
             )
             result = json.loads(response.choices[0].message.content)
             result['claim'] = claim
             result['evidence'] = context  # Store evidence for debugging
+            self.claim_cache.set_verdict(claim, self.llm_client.model, result)
             return result
         except Exception as e:
             logger.error(f"Verification step failed for claim '{claim}': {e}")
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+A/B harness for LLMScoringClient.get_score_with_feedback
+
+Compares the two-step path (score call, then feedback call) against the
+single-round-trip path (score and feedback in one JSON call) on recorded
+fixtures and reports how well the scores agree.
+
+Usage:
+    # Record fixtures from content (JSONL of NormalizedContent fields)
+    python scripts/ab_feedback_modes.py record --content items.jsonl --brand-name Mastercard --out fixtures.jsonl
+
+    # Compare both paths on the recorded fixtures
+    python scripts/ab_feedback_modes.py compare --fixtures fixtures.jsonl
+
+Both paths go through the LLM response cache, so re-running a comparison
+replays the recorded responses instead of paying for them again.
+"""
+
+import sys
+import json
+import argparse
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Any, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import SETTINGS
+
+logger = logging.getLogger(__name__)
+
+
+def rating_band(score: float) -> str:
+    """Map a 0.0-1.0 score to its SETTINGS['rating_bands'] label"""
+    value = score * SETTINGS.get('rating_scale', 100)
+    for band, threshold in sorted(SETTINGS['rating_bands'].items(), key=lambda kv: kv[1], reverse=True):
+        if value >= threshold:
+            return band
+    return 'poor'
+
+
+def load_fixtures(path: str) -> List[Dict[str, Any]]:
+    """Load JSONL fixtures of get_score_with_feedback arguments"""
+    fixtures = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                fixtures.append(json.loads(line))
+    return fixtures
+
+
+def record_fixtures(content_path: str, brand_context: Dict[str, Any], out_path: str) -> int:
+    """
+    Capture the exact get_score_with_feedback arguments the scorer builds
+
+    Runs ContentScorer._score_coherence on each content item with the LLM
+    client stubbed out, so recording makes no LLM calls.
+
+    Returns:
+        Number of fixtures written
+    """
+    from data.models import NormalizedContent
+    from scoring.scorer import ContentScorer
+
+    scorer = ContentScorer(use_attribute_detection=False)
+    captured = []
+
+    def capture(score_prompt, content, dimension, context_guidance="", single_round_trip=None):
+        captured.append({
+            'content_id': content.content_id,
+            'title': content.title,
+            'body': content.body,
+            'dimension': dimension,
+            'score_prompt': score_prompt,
+            'context_guidance': context_guidance,
+        })
+        return {'score': 0.5, 'issues': []}
+
+    scorer.llm_client.get_score_with_feedback = capture
+
+    with open(content_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                scorer._score_coherence(NormalizedContent(**json.loads(line)), brand_context)
+
+    with open(out_path, 'w', encoding='utf-8') as f:
+        for fixture in captured:
+            f.write(json.dumps(fixture, ensure_ascii=False) + '\n')
+    return len(captured)
+
+
+def run_ab(client, fixtures: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Score every fixture with both feedback paths
+
+    Returns:
+        One row per fixture with two-step and single-round-trip results
+    """
+    rows = []
+    for fixture in fixtures:
+        content = SimpleNamespace(title=fixture.get('title', ''), body=fixture.get('body', ''))
+        kwargs = {
+            'score_prompt': fixture['score_prompt'],
+            'content': content,
+            'dimension': fixture.get('dimension', 'Coherence'),
+            'context_guidance': fixture.get('context_guidance', ''),
+        }
+        two_step = client.get_score_with_feedback(single_round_trip=False, **kwargs)
+        single = client.get_score_with_feedback(single_round_trip=True, **kwargs)
+        rows.append({
+            'content_id': fixture.get('content_id'),
+            'dimension': kwargs['dimension'],
+            'two_step_score': two_step['score'],
+            'single_score': single['score'],
+            'two_step_issues': len(two_step.get('issues', [])),
+            'single_issues': len(single.get('issues', [])),
+        })
+    return rows
+
+
+def summarize_agreement(rows: List[Dict[str, Any]], tolerance: float = 0.1) -> Dict[str, Any]:
+    """
+    Summarize score agreement between the two paths
+
+    Args:
+        rows: Output of run_ab
+        tolerance: Absolute score difference counted as agreement
+
+    Returns:
+        Dictionary with mean/max absolute difference, agreement rates and
+        mean issue counts per path
+    """
+    n = len(rows)
+    if n == 0:
+        return {'n': 0}
+
+    diffs = [abs(r['two_step_score'] - r['single_score']) for r in rows]
+    same_band = sum(1 for r in rows if rating_band(r['two_step_score']) == rating_band(r['single_score']))
+
+    return {
+        'n': n,
+        'mean_abs_diff': sum(diffs) / n,
+        'max_abs_diff': max(diffs),
+        'within_tolerance_rate': sum(1 for d in diffs if d <= tolerance) / n,
+        'band_agreement_rate': same_band / n,
+        'two_step_mean_issues': sum(r['two_step_issues'] for r in rows) / n,
+        'single_mean_issues': sum(r['single_issues'] for r in rows) / n,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='A/B two-step vs single-round-trip feedback scoring')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record = subparsers.add_parser('record', help='Record fixtures from content items')
+    record.add_argument('--content', required=True, help='JSONL of NormalizedContent fields')
+    record.add_argument('--brand-name', required=True, help='Brand name')
+    record.add_argument('--keywords', nargs='*', default=[], help='Brand keywords')
+    record.add_argument('--out', required=True, help='Output fixtures JSONL')
+
+    compare = subparsers.add_parser('compare', help='Compare both paths on fixtures')
+    compare.add_argument('--fixtures', required=True, help='Fixtures JSONL')
+    compare.add_argument('--tolerance', type=float, default=0.1, help='Score difference counted as agreement')
+    compare.add_argument('--rows-out', help='Optional JSONL of per-fixture results')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == 'record':
+        brand_context = {'brand_name': args.brand_name, 'keywords': args.keywords or [args.brand_name]}
+        count = record_fixtures(args.content, brand_context, args.out)
+        print(f"Recorded {count} fixtures to {args.out}")
+        return
+
+    from scoring.scoring_llm_client import LLMScoringClient
+
+    rows = run_ab(LLMScoringClient(), load_fixtures(args.fixtures))
+    if args.rows_out:
+        with open(args.rows_out, 'w', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps(row) + '\n')
+
+    summary = summarize_agreement(rows, args.tolerance)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark for Trust Stack attribute detection (scoring/attribute_detector.py)
+
+Runs the detector over a synthetic corpus (or recorded content) one item at
+a time and with detect_attributes_batch, checks both produce the same
+attributes and reports items/second plus the slowest detectors.
+
+Usage:
+    python scripts/bench_attribute_detection.py --items 10000
+    python scripts/bench_attribute_detection.py --content items.jsonl --top 15
+
+The content file is JSONL of NormalizedContent fields, one item per line.
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import logging
+from pathlib import Path
+from typing import List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.models import NormalizedContent
+from scoring.attribute_detector import TrustStackAttributeDetector
+
+logger = logging.getLogger(__name__)
+
+SENTENCES = [
+    "Our editorial team reviews every product before it is listed.",
+    "A 2023 study found that 64% of shoppers read reviews first [1].",
+    "Buy now and save with our limited time offer on all jackets!",
+    "Read our privacy policy at https://example.com/privacy for details.",
+    "This summary was AI-generated and checked by a human editor.",
+    "Prices start at $1,299 and include free shipping to 40 countries.",
+    "gonna be honest, this one is the best lol.",
+    "According to research by the National Institute of Standards, results of the test were consistent.",
+    "Our personalized recommendations explain why you're seeing this item.",
+    "Always free for members, never any paid upgrades.",
+    "Learn more at https://example.com/blog/how-we-test and https://example.com/about.",
+    "Sponsored content in partnership with our retail partners.",
+]
+URL_PATHS = ['/', '/blog/post-{i}', '/news/story-{i}', '/product/item-{i}', '/p/{i}', '/about']
+CHANNELS = ['web', 'web', 'web', 'reddit', 'youtube', 'instagram']
+
+
+def synthetic_corpus(n: int, seed: int = 0) -> List[NormalizedContent]:
+    """n items mixing sentences that trigger the text detectors"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        body = ' '.join(rng.choice(SENTENCES) for _ in range(rng.randint(5, 40)))
+        url = 'https://example.com' + rng.choice(URL_PATHS).format(i=i)
+        items.append(NormalizedContent(
+            content_id=f'bench-{i}', src=rng.choice(['brave', 'reddit', 'youtube']), platform_id=url,
+            author=rng.choice(['', 'Jane Doe', 'unknown']), title=f'Item {i}', body=body,
+            run_id='bench', url=url, channel=rng.choice(CHANNELS),
+            platform_type=rng.choice(['owned', 'social', 'marketplace']),
+            meta={'description': 'Synthetic item'} if i % 3 else {},
+        ))
+    return items
+
+
+def load_content(path: str) -> List[NormalizedContent]:
+    """Load JSONL of NormalizedContent fields"""
+    items = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                items.append(NormalizedContent(**json.loads(line)))
+    return items
+
+
+def signature(attrs) -> List[tuple]:
+    return [(a.attribute_id, a.value, a.evidence) for a in attrs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark per-item vs batch attribute detection')
+    parser.add_argument('--items', type=int, default=10000, help='Synthetic corpus size')
+    parser.add_argument('--content', help='JSONL of NormalizedContent fields instead of a synthetic corpus')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic corpus seed')
+    parser.add_argument('--top', type=int, default=10, help='Slowest detectors to list')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    items = load_content(args.content) if args.content else synthetic_corpus(args.items, args.seed)
+    detector = TrustStackAttributeDetector()
+
+    start = time.perf_counter()
+    per_item = [detector.detect_attributes(content) for content in items]
+    per_item_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = detector.detect_attributes_batch(items)
+    batch_seconds = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(per_item, batch) if signature(a) != signature(b))
+    report = {
+        'items': len(items),
+        'per_item_seconds': round(per_item_seconds, 3),
+        'per_item_items_per_second': round(len(items) / per_item_seconds, 1) if per_item_seconds else None,
+        'batch_seconds': round(batch_seconds, 3),
+        'batch_items_per_second': round(len(items) / batch_seconds, 1) if batch_seconds else None,
+        'mismatched_items': mismatches,
+        'slowest_detectors': detector.timing_report()[:args.top],
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"Items:        {report['items']}")
+    print(f"Per item:     {report['per_item_seconds']}s ({report['per_item_items_per_second']} items/s)")
+    print(f"Batch:        {report['batch_seconds']}s ({report['batch_items_per_second']} items/s)")
+    print(f"Mismatches:   {mismatches}")
+    print("Slowest detectors (batch run):")
+    for row in report['slowest_detectors']:
+        print(f"  {row['attribute_id']:<48} {row['seconds']:>9.4f}s  {row['us_per_call']:>8.1f} us/call")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the claim pre-detector (scoring/claim_detector.py)
+
+Runs the deterministic detector over recorded content and reports how
+many items skip RAG verification, how many LLM calls that saves and how
+many seconds.
+
+Usage:
+    # Detector only: count skips, estimate seconds from a per-call latency
+    python scripts/bench_claim_predetector.py --content items.jsonl --extraction-seconds 2.5
+
+    # Also run the LLM claim extraction on every item to measure real
+    # latency saved and count skipped items the LLM found claims in
+    python scripts/bench_claim_predetector.py --content items.jsonl --measure
+
+The content file is JSONL of NormalizedContent fields, one item per line.
+Measured extraction calls go straight to the provider (the LLM response
+cache is not used), so every --measure run pays for one extraction call
+per item.
+"""
+
+import sys
+import json
+import time
+import argparse
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import SETTINGS
+from data.models import NormalizedContent
+from scoring.claim_detector import should_verify
+
+logger = logging.getLogger(__name__)
+
+
+def load_content(path: str) -> List[NormalizedContent]:
+    """Load JSONL of NormalizedContent fields"""
+    items = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                items.append(NormalizedContent(**json.loads(line)))
+    return items
+
+
+def run_benchmark(items: List[NormalizedContent], threshold: float,
+                  extract_claims=None) -> List[Dict[str, Any]]:
+    """
+    Run the detector (and optionally the LLM extraction) on every item
+
+    Args:
+        items: Content items
+        threshold: Claim likelihood threshold
+        extract_claims: Optional callable(content) -> claims, timed per item
+
+    Returns:
+        One row per item
+    """
+    rows = []
+    for content in items:
+        start = time.perf_counter()
+        verify, debug = should_verify(content, threshold)
+        row = {
+            'content_id': content.content_id,
+            'skipped': not verify,
+            'claim_likelihood': debug['claim_likelihood'],
+            'detector_seconds': time.perf_counter() - start,
+        }
+        if extract_claims is not None:
+            start = time.perf_counter()
+            claims = extract_claims(content)
+            row['extraction_seconds'] = time.perf_counter() - start
+            row['llm_claims'] = len(claims)
+        rows.append(row)
+    return rows
+
+
+def summarize(rows: List[Dict[str, Any]], extraction_seconds: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Summarize skips and savings
+
+    Each skipped item saves its claim-extraction call. When the LLM
+    extraction was measured, skipped items it found claims in are reported
+    as missed_claim_items, and the per-claim verification calls they would
+    have made are counted as well.
+
+    Args:
+        rows: Output of run_benchmark
+        extraction_seconds: Per-call latency estimate when nothing was measured
+
+    Returns:
+        Summary dictionary
+    """
+    n = len(rows)
+    if n == 0:
+        return {'n': 0}
+
+    skipped = [r for r in rows if r['skipped']]
+    measured = all('extraction_seconds' in r for r in rows)
+    summary = {
+        'n': n,
+        'skipped': len(skipped),
+        'skip_rate': len(skipped) / n,
+        'extraction_calls_saved': len(skipped),
+        'detector_seconds_total': sum(r['detector_seconds'] for r in rows),
+    }
+    if measured:
+        missed = [r for r in skipped if r['llm_claims'] > 0]
+        summary.update({
+            'verification_calls_saved': sum(r['llm_claims'] for r in skipped),
+            'llm_calls_saved': len(skipped) + sum(r['llm_claims'] for r in skipped),
+            'seconds_saved': sum(r['extraction_seconds'] for r in skipped),
+            'missed_claim_items': len(missed),
+            'missed_claims': sum(r['llm_claims'] for r in missed),
+        })
+    elif extraction_seconds is not None:
+        summary.update({
+            'llm_calls_saved': len(skipped),
+            'seconds_saved_estimate': len(skipped) * extraction_seconds,
+        })
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the claim pre-detector on recorded content')
+    parser.add_argument('--content', required=True, help='JSONL of NormalizedContent fields')
+    parser.add_argument('--threshold', type=float,
+                        default=SETTINGS.get('claim_predetect_threshold', 0.3),
+                        help='Claim likelihood threshold')
+    parser.add_argument('--measure', action='store_true',
+                        help='Run the LLM claim extraction on every item and time it')
+    parser.add_argument('--extraction-seconds', type=float,
+                        help='Per-call latency estimate when not measuring')
+    parser.add_argument('--rows-out', help='Optional JSONL of per-item results')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    extract_claims = None
+    if args.measure:
+        from scoring.verification_manager import VerificationManager
+        extract_claims = VerificationManager()._extract_claims
+
+    rows = run_benchmark(load_content(args.content), args.threshold, extract_claims)
+    if args.rows_out:
+        with open(args.rows_out, 'w', encoding='utf-8') as f:
+            for row in rows:
+                f.write(json.dumps(row) + '\n')
+
+    print(json.dumps(summarize(rows, args.extraction_seconds), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Memory per item of the data models (data/models.py)
+
+Measures, with tracemalloc, the bytes held per instance by the slotted
+NormalizedContent, ContentScores and DetectedAttribute against the same
+dataclasses with a per-instance __dict__ (the layout before slots), and
+ContentScores stored in a ScoresBatch. Field values are built up front,
+so the figures are the overhead of each layout; ContentScores instances
+also keep five float objects (24 B each) alive that ScoresBatch stores
+unboxed in its arrays.
+
+Usage:
+    python scripts/bench_model_memory.py
+    python scripts/bench_model_memory.py --items 50000
+"""
+
+import sys
+import json
+import random
+import argparse
+import tracemalloc
+from pathlib import Path
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.models import NormalizedContent, ContentScores, DetectedAttribute, ScoresBatch
+
+
+def unslotted(cls: type) -> type:
+    """The same dataclass with a per-instance __dict__"""
+    namespace: Dict[str, Any] = {'__annotations__': dict(cls.__annotations__)}
+    for f in fields(cls):
+        namespace[f.name] = field(default=f.default, default_factory=f.default_factory,
+                                  init=f.init, repr=f.repr, compare=f.compare)
+    if hasattr(cls, '__post_init__'):
+        namespace['__post_init__'] = cls.__post_init__
+    return dataclass(type(cls.__name__, (), namespace))
+
+
+def held_bytes(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by what build() returns"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del built
+    return held
+
+
+def content_kwargs(n: int) -> List[Dict[str, Any]]:
+    body = 'Shared body text. ' * 50
+    return [{'content_id': f'c-{i}', 'src': 'brave', 'platform_id': f'https://example.com/{i}',
+             'author': 'author', 'title': 'Title', 'body': body, 'run_id': 'run', 'channel': 'web'}
+            for i in range(n)]
+
+
+def score_kwargs(n: int, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    meta = {'title': 'Title'}
+    return [{'content_id': f'c-{i}', 'brand': 'brand', 'src': 'brave', 'event_ts': '', 'run_id': 'run',
+             'meta': meta, **{f'score_{dim}': rng.random() for dim in ScoresBatch.DIMENSIONS}}
+            for i in range(n)]
+
+
+def attribute_kwargs(n: int) -> List[Dict[str, Any]]:
+    return [{'attribute_id': f'attr_{i % 40}', 'dimension': 'provenance', 'label': 'Label',
+             'value': float(i % 10), 'evidence': 'evidence'} for i in range(n)]
+
+
+def measure(n: int, seed: int) -> List[Dict[str, Any]]:
+    rows = []
+    cases = (
+        ('NormalizedContent', NormalizedContent, content_kwargs(n)),
+        ('ContentScores', ContentScores, score_kwargs(n, seed)),
+        ('DetectedAttribute', DetectedAttribute, attribute_kwargs(n)),
+    )
+    for name, cls, kwargs in cases:
+        plain = unslotted(cls)
+        dict_bytes = held_bytes(lambda: [plain(**kw) for kw in kwargs])
+        slots_bytes = held_bytes(lambda: [cls(**kw) for kw in kwargs])
+        rows.append({'model': name, 'dict_bytes_per_item': round(dict_bytes / n, 1),
+                     'slots_bytes_per_item': round(slots_bytes / n, 1)})
+        if cls is ContentScores:
+            items = [cls(**kw) for kw in kwargs]
+            rows.append({'model': 'ContentScores in ScoresBatch', 'dict_bytes_per_item': None,
+                         'slots_bytes_per_item': round(held_bytes(lambda: ScoresBatch(items)) / n, 1)})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure memory per item of the data models')
+    parser.add_argument('--items', type=int, default=10000, help='Instances per model')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic data seed')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    args = parser.parse_args()
+    rows = measure(args.items, args.seed)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+    print(f"{'model':<30} {'__dict__ B/item':>16} {'slots B/item':>13}")
+    for row in rows:
+        before = f"{row['dict_bytes_per_item']:.1f}" if row['dict_bytes_per_item'] is not None else '-'
+        print(f"{row['model']:<30} {before:>16} {row['slots_bytes_per_item']:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
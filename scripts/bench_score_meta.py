@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark for keeping ContentScores.meta in memory (data.models.ScoreMeta)
+
+Compares the JSON round-trip the scoring path used to do (json.dumps per
+item in the scorer, json.loads again in the AR step, the exclude_demoted
+filter, the report appendix/items and the run aggregates) with the
+in-memory ScoreMeta serialized once at upload. Reports CPU time and the
+memory held by the scored items, per 1k items.
+
+Usage:
+    python scripts/bench_score_meta.py
+    python scripts/bench_score_meta.py --items 5000 --body-chars 8000 --repeat 5
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data import json_codec
+from data.models import ContentScores, ScoreMeta
+
+# Downstream json.loads calls per item before the change (AR step,
+# exclude_demoted filter, report appendix, report items, run aggregates)
+LEGACY_PARSES = 5
+
+
+def synthetic_items(n: int, body_chars: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Per-item inputs to the scorer's meta dict (body, fetched meta, detected attributes)"""
+    rng = random.Random(seed)
+    words = ['trust', 'brand', 'review', 'product', 'verified', 'author', 'policy', 'quality', 'price', 'update']
+    brand_context = {'brand_name': 'bench', 'keywords': words[:5], 'guidelines': 'Be clear. ' * 200}
+    items = []
+    for i in range(n):
+        body = ' '.join(rng.choice(words) for _ in range(body_chars // 7))
+        attrs = [{
+            'id': f'attr_{j}', 'dimension': rng.choice(['provenance', 'coherence', 'verification']),
+            'label': f'Attribute {j}', 'value': rng.uniform(1, 10), 'evidence': body[j * 40:j * 40 + 120],
+            'confidence': rng.random(), 'suggestion': None,
+        } for j in range(rng.randint(4, 12))]
+        items.append({
+            'content_id': f'bench-{i}',
+            'body': body,
+            'orig_meta': {'source_url': f'https://example.com/{i}', 'description': body[:300],
+                          'schema_org': '{"@type": "Article"}', 'triage_status': 'skipped' if i % 20 == 0 else ''},
+            'attrs': attrs,
+            'brand_context': brand_context,
+        })
+    return items
+
+
+def build_meta(item: Dict[str, Any]) -> Dict[str, Any]:
+    """The dict the scorer attaches to each ContentScores"""
+    return {
+        'scoring_timestamp': '', 'brand_context': item['brand_context'], 'title': item['content_id'],
+        'description': item['body'], 'source_url': item['orig_meta']['source_url'], 'modality': 'text',
+        'channel': 'web', 'platform_type': 'owned', 'url': item['orig_meta']['source_url'], 'language': 'en',
+        'detected_attributes': item['attrs'], 'attribute_count': len(item['attrs']), 'score_reused': False,
+        'orig_meta': item['orig_meta'],
+    }
+
+
+def make_scores(item: Dict[str, Any], meta: Any) -> ContentScores:
+    return ContentScores(content_id=item['content_id'], brand='bench', src='brave', event_ts='',
+                         score_provenance=0.5, score_resonance=0.5, score_coherence=0.5,
+                         score_transparency=0.5, score_verification=0.5, run_id='bench', meta=meta)
+
+
+def legacy_score(items: List[Dict[str, Any]]) -> List[ContentScores]:
+    return [make_scores(item, json.dumps(build_meta(item))) for item in items]
+
+
+def in_memory_score(items: List[Dict[str, Any]]) -> List[ContentScores]:
+    return [make_scores(item, ScoreMeta(build_meta(item))) for item in items]
+
+
+def legacy_downstream(scores_list: List[ContentScores]) -> List[str]:
+    kept = []
+    for s in scores_list:
+        for _ in range(LEGACY_PARSES):
+            meta = json.loads(s.meta)
+        if meta['orig_meta'].get('triage_status') != 'skipped':
+            kept.append(s.meta)
+    return kept
+
+
+def in_memory_downstream(scores_list: List[ContentScores]) -> List[str]:
+    kept = []
+    for s in scores_list:
+        for _ in range(LEGACY_PARSES):
+            meta = ScoreMeta.coerce(s.meta)
+        if meta.triage_status != 'skipped':
+            kept.append(s.meta_json)
+    return kept
+
+
+def best_of(fn: Callable, arg: Any, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.process_time()
+        fn(arg)
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def held_bytes(score_fn: Callable, items: List[Dict[str, Any]]) -> int:
+    """Bytes still allocated by the scored items (inputs already exist and are shared)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    scores_list = score_fn(items)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del scores_list
+    return held
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the in-memory score meta vs the JSON round-trip')
+    parser.add_argument('--items', type=int, default=1000, help='Number of scored items')
+    parser.add_argument('--body-chars', type=int, default=4000, help='Approximate body length per item')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement (best CPU time is reported)')
+    parser.add_argument('--seed', type=int, default=0, help='Synthetic data seed')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    args = parser.parse_args()
+    items = synthetic_items(args.items, args.body_chars, args.seed)
+    per_1k = 1000.0 / args.items
+
+    legacy_scores = legacy_score(items)
+    in_memory_scores = in_memory_score(items)
+    uploaded = legacy_downstream(legacy_scores)
+    assert [json.loads(m) for m in uploaded] == [json.loads(m) for m in in_memory_downstream(in_memory_scores)]
+
+    rows = {}
+    for name, score_fn, downstream_fn in (('legacy', legacy_score, legacy_downstream),
+                                          ('in_memory', in_memory_score, in_memory_downstream)):
+        scores_list = score_fn(items)
+        rows[name] = {
+            'score_cpu_ms_per_1k': round(best_of(score_fn, items, args.repeat) * per_1k * 1000, 2),
+            'downstream_cpu_ms_per_1k': round(best_of(downstream_fn, scores_list, args.repeat) * per_1k * 1000, 2),
+            'held_kib_per_1k': round(held_bytes(score_fn, items) * per_1k / 1024, 1),
+        }
+    report = {'items': args.items, 'orjson': json_codec.ORJSON_AVAILABLE, **rows}
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{args.items} items, orjson={'yes' if json_codec.ORJSON_AVAILABLE else 'no'} (figures per 1k items)")
+    print(f"{'':>10} {'score ms':>10} {'downstream ms':>14} {'held KiB':>10}")
+    for name, row in rows.items():
+        print(f"{name:>10} {row['score_cpu_ms_per_1k']:>10.2f} {row['downstream_cpu_ms_per_1k']:>14.2f} "
+              f"{row['held_kib_per_1k']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
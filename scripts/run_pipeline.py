@@ -9,6 +9,7 @@ from __future__ import annotations
 import sys
 import os
 import argparse
+import threading
 from datetime import datetime
 import logging
 
@@ -63,6 +64,8 @@ def main():
     parser.add_argument('--max-items', '-n', type=int, default=100, help='Maximum total items to analyze across all sources (default: 100)')
     parser.add_argument('--max-content', type=int, help='[DEPRECATED] Use --max-items instead')
     parser.add_argument('--brave-pages', type=int, default=10, help='Number of Brave search results/pages to fetch (default: 10)')
+    parser.add_argument('--scoring-concurrency', type=int, default=None,
+                        help='Number of items to score in parallel (default: SETTINGS scoring_concurrency / SCORING_CONCURRENCY env, 1 = sequential)')
     parser.add_argument('--include-comments', action='store_true', help='Include comments in analysis (overrides settings include_comments_in_analysis)')
     parser.add_argument('--use-llm-examples', action='store_true', help='Use LLM to produce abstractive summaries for executive examples')
     parser.add_argument('--llm-model', default='gpt-3.5-turbo',
@@ -457,7 +460,7 @@ def main():
         # Step 4: Content Scoring and Classification
         logger.info("Step 3: Content Scoring and Classification")
         pipeline_run = scoring_pipeline.run_scoring_pipeline(
-            normalized_content, brand_config
+            normalized_content, brand_config, max_workers=args.scoring_concurrency
         )
         
         # Step 5: Generate Reports
@@ -469,7 +472,8 @@ def main():
         scores_list = pipeline_run.classified_scores or []
 
         # Generate scoring report
-        scoring_report = scoring_pipeline.generate_scoring_report(scores_list, brand_config)
+        scoring_report = scoring_pipeline.generate_scoring_report(scores_list, brand_config,
+                                                                  aggregator=pipeline_run.aggregates)
 
         # Generate PDF report
         pdf_path = os.path.join(args.output_dir, f'ar_report_{args.brand_id}_{run_id}.pdf')
@@ -503,12 +507,15 @@ if __name__ == "__main__":
     main()
 
 
-def run_pipeline_for_contents(urls: list, output_dir: str = './output', brand_id: str = 'brand', sources: list | None = None, keywords: list | None = None, include_comments: bool | None = None, include_items_table: bool = False, brand_domains: list | None = None, brand_subdomains: list | None = None, brand_owned_ratio: float = 0.6) -> dict:
+def run_pipeline_for_contents(urls: list, output_dir: str = './output', brand_id: str = 'brand', sources: list | None = None, keywords: list | None = None, include_comments: bool | None = None, include_items_table: bool = False, brand_domains: list | None = None, brand_subdomains: list | None = None, brand_owned_ratio: float = 0.6, scoring_concurrency: int | None = None) -> dict:
     """Run the pipeline for a set of URLs (used by the Streamlit webapp).
 
-    This helper is intentionally lightweight: it will fetch each URL using
-    the brave_search.fetch_page helper, convert to NormalizedContent objects,
-    call the normalizer and scoring pipeline, and write reports to output_dir.
+    This helper is intentionally lightweight: it fetches each URL using
+    the brave_search.fetch_page helper and streams the resulting
+    NormalizedContent objects through the normalizer and scoring pipeline
+    (ScoringPipeline.run_streaming_pipeline), then writes reports to
+    output_dir. brand_domains, brand_subdomains and brand_owned_ratio are
+    accepted for backward compatibility.
     """
     # Local imports to avoid circular imports when script is used as module
     from ingestion import brave_search
@@ -525,13 +532,33 @@ def run_pipeline_for_contents(urls: list, output_dir: str = './output', brand_id
     if keywords is None:
         keywords = [brand_id]
 
-    # Fetch pages (Brave) if requested
-    fetched = []
+    brand_config = {
+        'brand_id': brand_id,
+        'brand_name': brand_id,
+        'keywords': [brand_id],
+        'sources': ['brave']
+    }
+
+    # One fetch task per URL plus one per API source. The pipeline's fetch
+    # stage runs them concurrently, and each page is normalized and scored
+    # while later pages are still downloading.
+    tasks = []
     if 'brave' in sources and urls:
-        for i, u in enumerate(urls):
+        tasks.extend(('brave', i, u) for i, u in enumerate(urls))
+    if 'reddit' in sources:
+        tasks.append(('reddit', None, None))
+    if 'youtube' in sources:
+        tasks.append(('youtube', None, None))
+
+    fetched_any = threading.Event()
+
+    def fetch(task):
+        kind, i, u = task
+        if kind == 'brave':
             page = brave_search.fetch_page(u)
             content_id = f"web_{i}_{abs(hash(u))}"
-            nc = NormalizedContent(
+            fetched_any.set()
+            return NormalizedContent(
                 content_id=content_id,
                 src='brave',
                 platform_id=u,
@@ -547,126 +574,39 @@ def run_pipeline_for_contents(urls: list, output_dir: str = './output', brand_id
                 channel='web',
                 platform_type='web'
             )
-            fetched.append(nc)
 
-    # If brand_domains not supplied but brand_id is present, infer conservative defaults
-    if brand_domains is None and brand_id:
-        # keep inference minimal to avoid overreach
-        brand_domains = [f"{brand_id}.com", f"www.{brand_id}.com"]
-    if brand_subdomains is None and brand_id:
-        brand_subdomains = [f"blog.{brand_id}.com", f"shop.{brand_id}.com", f"store.{brand_id}.com"]
-
-    # If ratio enforcement requested, and brand-owned pages are insufficient,
-    # attempt to extract brand subpages from fetched brand-owned pages to hit target
-    try:
-        from ingestion.domain_classifier import URLCollectionConfig, classify_url, URLSourceType
-        from ingestion.brave_search import _extract_internal_links, fetch_page as _fetch_page
-        # Only attempt if we have any fetched items and a desired ratio
-        if fetched and brand_domains:
-            total_target = len(fetched)
-            config = URLCollectionConfig(
-                brand_owned_ratio=brand_owned_ratio,
-                third_party_ratio=1.0 - brand_owned_ratio,
-                brand_domains=brand_domains,
-                brand_subdomains=brand_subdomains or [],
-                brand_social_handles=[]
-            )
-
-            # Count current brand-owned items
-            brand_owned_now = 0
-            for item in fetched:
-                url = item.get('url') or item.get('platform_id') or item.get('source_url')
-                try:
-                    cl = classify_url(url, config)
-                    if cl.source_type == URLSourceType.BRAND_OWNED:
-                        brand_owned_now += 1
-                except Exception:
-                    continue
-
-            target_brand = int(total_target * config.brand_owned_ratio)
-            # If we need more brand-owned pages, try extracting subpages
-            if brand_owned_now < target_brand:
-                need = target_brand - brand_owned_now
-                # Iterate over fetched brand-owned primary pages and extract internal links
-                for item in list(fetched):
-                    if need <= 0:
-                        break
-                    url = item.get('url') or item.get('platform_id') or item.get('source_url')
-                    try:
-                        cl = classify_url(url, config)
-                        if cl.source_type != URLSourceType.BRAND_OWNED:
-                            continue
-                        # Try to extract internal links (limit per page)
-                        internal = _extract_internal_links(url, item.get('body', ''), max_links=10)
-                        for sub in internal:
-                            if need <= 0:
-                                break
-                            try:
-                                sub_page = _fetch_page(sub)
-                                body = sub_page.get('body') or ''
-                                if body and len(body) >= 200:
-                                    # attach minimal metadata similar to collectors
-                                    sub_page['source_type'] = 'brand_owned'
-                                    sub_page['source_tier'] = 'brand_subpage'
-                                    fetched.append({
-                                        'title': sub_page.get('title', ''),
-                                        'body': sub_page.get('body', ''),
-                                        'url': sub,
-                                        'terms': sub_page.get('terms', ''),
-                                        'privacy': sub_page.get('privacy', ''),
-                                        'source_type': 'brand_owned',
-                                        'source_tier': 'brand_subpage'
-                                    })
-                                    need -= 1
-                            except Exception:
-                                continue
-                    except Exception:
-                        continue
-    except Exception:
-        # If anything goes wrong in the optional enrichment step, continue gracefully
-        pass
-
-    # Ingest Reddit if requested
-    if 'reddit' in sources:
-        try:
-            reddit = RedditCrawler()
-            posts = reddit.search_posts(keywords=keywords, limit=10)
-            reddit_norm = reddit.convert_to_normalized_content(posts, brand_id, run_id)
-            fetched.extend(reddit_norm)
-        except Exception as e:
-            logger.warning(f"Skipping Reddit ingestion in programmatic run: {e}")
-
-    # Ingest YouTube if requested
-    if 'youtube' in sources:
-        try:
+        if kind == 'reddit':
+            try:
+                reddit = RedditCrawler()
+                posts = reddit.search_posts(keywords=keywords, limit=10)
+                items = reddit.convert_to_normalized_content(posts, brand_id, run_id)
+            except Exception as e:
+                logger.warning(f"Skipping Reddit ingestion in programmatic run: {e}")
+                return None
+        else:
             try:
                 yt = YouTubeScraper()
+                # Simple query from keywords
+                q = ' '.join(keywords)
+                videos = yt.search_videos(query=q, max_results=5)
+                items = yt.convert_videos_to_normalized(videos, brand_id, run_id, include_comments=include_comments)
             except Exception as e:
-                # Missing API key or config
-                raise
-            # Simple query from keywords
-            q = ' '.join(keywords)
-            videos = yt.search_videos(query=q, max_results=5)
-            youtube_norm = yt.convert_videos_to_normalized(videos, brand_id, run_id, include_comments=include_comments)
-            fetched.extend(youtube_norm)
-        except Exception as e:
-            logger.warning(f"Skipping YouTube ingestion in programmatic run: {e}")
-
-    if not fetched:
-        raise RuntimeError('No content fetched')
+                logger.warning(f"Skipping YouTube ingestion in programmatic run: {e}")
+                return None
+        if items:
+            fetched_any.set()
+        return list(items)
 
-    # Normalize
-    normalizer = ContentNormalizer()
-    normalized = normalizer.normalize_content(fetched)
-
-    # Score
+    # Fetch, normalize and score as a stream
     scoring_pipeline = ScoringPipeline()
-    pipeline_run = scoring_pipeline.run_scoring_pipeline(normalized, {
-        'brand_id': brand_id,
-        'brand_name': brand_id,
-        'keywords': [brand_id],
-        'sources': ['brave']
-    })
+    pipeline_run = scoring_pipeline.run_streaming_pipeline(
+        tasks, brand_config, fetch=fetch, max_workers=scoring_concurrency
+    )
+
+    if not fetched_any.is_set():
+        raise RuntimeError('No content fetched')
+    normalize_stats = pipeline_run.stage_stats.get('normalize', {})
+    normalized_count = normalize_stats.get('processed', 0) - normalize_stats.get('dropped', 0)
 
     # Generate reports
     pdf_generator = PDFReportGenerator()
@@ -676,12 +616,8 @@ def run_pipeline_for_contents(urls: list, output_dir: str = './output', brand_id
     md_path = os.path.join(output_dir, f'ar_report_{brand_id}_{run_id}.md')
 
     scores_list = pipeline_run.classified_scores or []
-    scoring_report = scoring_pipeline.generate_scoring_report(scores_list, {
-        'brand_id': brand_id,
-        'brand_name': brand_id,
-        'keywords': [brand_id],
-        'sources': ['brave']
-    })
+    scoring_report = scoring_pipeline.generate_scoring_report(scores_list, brand_config,
+                                                              aggregator=pipeline_run.aggregates)
 
     pdf_generator.generate_report(scoring_report, pdf_path, include_items_table=include_items_table)
     markdown_generator.generate_report(scoring_report, md_path)
@@ -690,5 +626,5 @@ def run_pipeline_for_contents(urls: list, output_dir: str = './output', brand_id
         'run_id': run_id,
         'pdf': pdf_path,
         'md': md_path,
-        'items': len(normalized)
+        'items': normalized_count
     }
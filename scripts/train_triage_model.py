@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Train the learned triage model (scoring/triage_model.py)
+
+Fits per-dimension quantile regressors on historical ContentScores joined
+with their normalized content, evaluates them on a held-out split and
+writes the model artifact with its calibration report.
+
+Usage:
+    python scripts/train_triage_model.py --data history.jsonl --out models/triage
+
+The data file is JSONL or Parquet with one row per scored item: the
+NormalizedContent fields (at least content_id, title, body) plus the
+score_provenance, score_verification, score_transparency, score_coherence
+and score_resonance columns of ContentScores, e.g. the normalized_content
+and content_scores tables joined on content_id.
+"""
+
+import sys
+import json
+import random
+import argparse
+import logging
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.models import NormalizedContent
+from scoring.triage_model import DIMENSIONS, TriageModel, calibration_report
+
+logger = logging.getLogger(__name__)
+
+CONTENT_FIELDS = {f.name for f in fields(NormalizedContent) if f.init}
+
+
+def load_rows(path: str) -> List[Dict[str, Any]]:
+    """Load training rows from JSONL or Parquet"""
+    if path.endswith('.parquet'):
+        import pandas as pd
+        return pd.read_parquet(path).to_dict(orient='records')
+    rows = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                rows.append(json.loads(line))
+    return rows
+
+
+def to_example(row: Dict[str, Any]) -> Tuple[NormalizedContent, Dict[str, float]]:
+    """Split a joined row into a NormalizedContent and its dimension scores"""
+    kwargs = {k: v for k, v in row.items() if k in CONTENT_FIELDS}
+    kwargs.setdefault('src', 'web')
+    kwargs.setdefault('platform_id', kwargs.get('url', ''))
+    kwargs.setdefault('author', '')
+    kwargs.setdefault('title', '')
+    kwargs.setdefault('run_id', '')
+    if isinstance(kwargs.get('meta'), str):
+        try:
+            kwargs['meta'] = json.loads(kwargs['meta'])
+        except ValueError:
+            kwargs['meta'] = {}
+    content = NormalizedContent(**kwargs)
+    targets = {d: float(row[f'score_{d}']) for d in DIMENSIONS}
+    return content, targets
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the learned triage model on historical scores')
+    parser.add_argument('--data', required=True, help='JSONL or Parquet of content joined with scores')
+    parser.add_argument('--out', required=True, help='Model artifact directory')
+    parser.add_argument('--holdout', type=float, default=0.2, help='Share of rows held out for calibration')
+    parser.add_argument('--no-attributes', action='store_true', help='Train on text features only')
+    parser.add_argument('--n-estimators', type=int, default=100, help='Boosting rounds per regressor')
+    parser.add_argument('--seed', type=int, default=0, help='Split and training seed')
+    parser.add_argument('--report-out', help='Optional path for the calibration report JSON')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    examples = []
+    for row in load_rows(args.data):
+        try:
+            examples.append(to_example(row))
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping row {row.get('content_id')}: {e}")
+    random.Random(args.seed).shuffle(examples)
+
+    attrs_list = None
+    if not args.no_attributes:
+        from scoring.attribute_detector import TrustStackAttributeDetector
+        detector = TrustStackAttributeDetector()
+        attrs_list = detector.detect_attributes_batch([content for content, _ in examples])
+
+    split = int(len(examples) * (1 - args.holdout))
+    contents = [content for content, _ in examples]
+    targets = [target for _, target in examples]
+
+    model = TriageModel.train(
+        contents[:split], targets[:split],
+        attrs_list[:split] if attrs_list is not None else None,
+        n_estimators=args.n_estimators, random_state=args.seed
+    )
+    report = calibration_report(
+        model, contents[split:], targets[split:],
+        attrs_list[split:] if attrs_list is not None else None
+    )
+    model.manifest['calibration'] = report
+    model.manifest['training_data'] = args.data
+    model.save(args.out)
+
+    if args.report_out:
+        with open(args.report_out, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+import pytest
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _disable_llm_response_cache():
+    """Keep test runs independent of LLM responses cached by earlier runs"""
+    from config.settings import SETTINGS
+    import scoring.llm_cache as llm_cache
+
+    SETTINGS['llm_cache_enabled'] = False
+    llm_cache._shared_cache = None
+    yield
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _disable_score_store():
+    """Keep test runs from reusing item scores stored by earlier runs"""
+    from config.settings import SETTINGS
+    import scoring.score_store as score_store
+
+    SETTINGS['score_store_enabled'] = False
+    score_store._shared_store = None
+    yield
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _disable_claim_cache():
+    """Keep test runs from reusing claim verdicts cached by earlier runs"""
+    from config.settings import SETTINGS
+    import scoring.claim_cache as claim_cache
+
+    SETTINGS['claim_cache_enabled'] = False
+    claim_cache._shared_cache = None
+    yield
@@ -0,0 +1,113 @@
+import json
+import random
+import statistics
+
+import pytest
+
+from data.models import ContentScores
+from scoring.aggregator import RunAggregator, RunningStats, report_final_score
+from scoring.pipeline import ScoringPipeline
+
+
+def make_scores(n, seed=0):
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        meta = {'title': f'Item {i}', 'content_type': rng.choice(['blog', 'product'])}
+        if i % 10 == 0:
+            meta['_llm_adjusted_score_total'] = 55.0
+        items.append(ContentScores(
+            content_id=f'id-{i}', brand='b', src=rng.choice(['brave', 'reddit']), event_ts='',
+            score_provenance=rng.random(), score_resonance=rng.random(), score_coherence=rng.random(),
+            score_transparency=rng.random(), score_verification=rng.random(),
+            class_label='authentic', run_id='run', meta=json.dumps(meta),
+            channel=rng.choice(['web', 'reddit', 'youtube']), modality='text',
+        ))
+    return items
+
+
+def test_running_stats_match_statistics_module_and_merge():
+    values = [random.Random(1).uniform(-5, 5) for _ in range(500)]
+    left, right, whole = RunningStats(), RunningStats(), RunningStats()
+    for i, x in enumerate(values):
+        whole.add(x)
+        (left if i % 3 else right).add(x)
+    left.merge(right)
+
+    for stats in (whole, left):
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.std_dev == pytest.approx(statistics.stdev(values))
+        assert (stats.min, stats.max) == (min(values), max(values))
+
+
+def test_aggregates_match_a_full_pass():
+    items = make_scores(200)
+
+    aggregator = RunAggregator.from_scores(items, top_k=3)
+    summary = aggregator.summary()
+
+    finals = [report_final_score(s) for s in items]
+    assert summary['average_rating'] == pytest.approx(statistics.mean(finals))
+    assert sum(summary['rating_bands'].values()) == 200
+    assert summary['rating_bands']['excellent'] == sum(1 for f in finals if f >= 80)
+    coherence = [s.score_coherence for s in items]
+    assert aggregator.dimension_breakdown()['coherence']['std_dev'] == pytest.approx(statistics.stdev(coherence))
+    web = [f for s, f in zip(items, finals) if s.channel == 'web']
+    assert summary['rollups']['channel']['web'] == {'count': len(web), 'average_rating': pytest.approx(statistics.mean(web))}
+    assert [e['final_score'] for e in summary['top_examples']] == sorted(finals, reverse=True)[:3]
+    assert [e['final_score'] for e in summary['bottom_examples']] == sorted(finals)[:3]
+    json.dumps(summary)
+
+
+def test_report_uses_run_aggregates_and_keeps_its_shape():
+    items = make_scores(50, seed=2)
+    pipeline = ScoringPipeline()
+
+    aggregator = RunAggregator()
+    for s in items:
+        aggregator.add(s)
+    report = pipeline.generate_scoring_report(items, {'brand_id': 'b'}, aggregator=aggregator)
+    rebuilt = pipeline.generate_scoring_report(items, {'brand_id': 'b'})
+
+    assert report['dimension_breakdown'] == rebuilt['dimension_breakdown']
+    assert set(report['dimension_breakdown']['provenance']) == {'average', 'min', 'max', 'std_dev'}
+    assert report['score_based_ar_pct'] == pytest.approx(statistics.mean(i['final_score'] for i in report['items']))
+    assert sum(report['content_type_breakdown_pct'].values()) == pytest.approx(100.0)
+    assert report['aggregates']['total_items'] == 50
+
+
+def test_stale_aggregator_is_rebuilt():
+    items = make_scores(20, seed=3)
+    partial = RunAggregator.from_scores(items[:5])
+
+    report = ScoringPipeline().generate_scoring_report(items, {'brand_id': 'b'}, aggregator=partial)
+
+    assert report['aggregates']['total_items'] == 20
+
+
+def test_batch_pipeline_aggregates_items_as_they_are_scored(monkeypatch):
+    from unittest.mock import MagicMock
+
+    import scoring.scorer as scorer_module
+    from data.models import NormalizedContent
+
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    pipeline = ScoringPipeline()
+    pipeline.scorer.use_attribute_detection = False
+    pipeline.scorer.attribute_detector = None
+    pipeline.scorer.triage_gate = None
+    monkeypatch.setattr(pipeline.scorer, 'score_content',
+                        lambda c, b: scorer_module.DimensionScores(0.8, 0.8, 0.8, 0.8, 0.8))
+    pipeline.athena_client = MagicMock()
+    # No second pass over the scores unless the LLM review adjusted some
+    monkeypatch.setattr(RunAggregator, 'from_scores', MagicMock(side_effect=AssertionError))
+    contents = [NormalizedContent(
+        content_id=f'c{i}', src='brave', platform_id=f'https://example.com/{i}', author='web',
+        title=f'Page {i}', body=f'Body of page {i} with enough distinct words to pass validation. ' * 5,
+        run_id='run-test', url=f'https://example.com/page-{i}') for i in range(3)]
+
+    run = pipeline.run_scoring_pipeline(contents, {'brand_id': 'acme', 'brand_name': 'acme'})
+
+    assert run.aggregates.count == 3
+    assert run.aggregates.summary()['total_items'] == 3
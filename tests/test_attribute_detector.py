@@ -419,3 +419,37 @@ class TestAuthorIdentityDetection:
         assert result is not None
         assert result.value >= 6.0
         assert "publisher" in result.evidence.lower() or "Test Company" in result.evidence
+
+
+class TestBatchDetection:
+    """Tests for detect_attributes_batch and the shared detector plan"""
+
+    def test_batch_matches_per_item_detection(self, detector):
+        contents = [
+            _make_content(body="A study found 45% of users agree [1]. Read our privacy policy.", title="Study",
+                          url="https://example.com/blog/study"),
+            _make_content(body="Buy now! Limited time offer on everything. Visit https://example.com/shop today.",
+                          title="Sale", url="https://example.com/p/1"),
+            _make_content(body="", title="Empty", url="https://example.com/"),
+        ]
+
+        batch = detector.detect_attributes_batch(contents)
+        per_item = [detector.detect_attributes(c) for c in contents]
+
+        assert [[(a.attribute_id, a.value) for a in attrs] for attrs in batch] == \
+               [[(a.attribute_id, a.value) for a in attrs] for attrs in per_item]
+
+    def test_batch_records_detector_timings(self, detector):
+        detector.detect_attributes_batch([_make_content(body="Hello world. " * 10, title="T",
+                                                        url="https://example.com/")] * 3)
+
+        report = detector.timing_report()
+        assert report
+        assert all(row['calls'] == 3 for row in report)
+        assert [row['seconds'] for row in report] == sorted((row['seconds'] for row in report), reverse=True)
+
+    def test_plan_is_reused_until_the_rubric_changes(self, detector):
+        plan = detector._plan()
+
+        assert detector._plan() is plan
+        assert {attr_id for attr_id, _, _ in plan} <= set(detector.attributes)
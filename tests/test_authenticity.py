@@ -0,0 +1,103 @@
+import json
+import random
+
+import pytest
+
+from data.models import ContentScores
+from scoring.authenticity import AuthenticityArrays
+from scoring.pipeline import ScoringPipeline
+from scoring.rubric import clear_rubric_cache, get_rubric
+
+
+def write_rubric(path):
+    path.write_text(json.dumps({
+        'version': 'test',
+        'dimension_weights': {'provenance': 1, 'resonance': 1, 'coherence': 2, 'transparency': 1, 'verification': 1},
+        'thresholds': {'authentic': 70, 'suspect': 40},
+        'attributes': [
+            {'id': 'c2pa', 'effect': 'bonus', 'value': 8, 'match_meta': ['c2pa', 'signed'], 'label': 'Signed'},
+            {'id': 'dup', 'effect': 'penalty', 'value': -12, 'match_meta': ['dup_similarity', 'near_dup'],
+             'condition': {'op': '>=', 'threshold': 0.8}},
+            {'id': 'off', 'enabled': False, 'value': 50, 'match_meta': ['c2pa']},
+        ],
+        'defaults': {'normalize_weights': True, 'max_llm_items': 0},
+    }))
+    return str(path)
+
+
+@pytest.fixture
+def rubric(tmp_path):
+    clear_rubric_cache()
+    yield get_rubric(write_rubric(tmp_path / 'rubric.json'))
+    clear_rubric_cache()
+
+
+def make_score(i, p, r, c, t, v, meta):
+    return ContentScores(content_id=f'id-{i}', brand='b', src='brave', event_ts='ts',
+                         score_provenance=p, score_resonance=r, score_coherence=c,
+                         score_transparency=t, score_verification=v,
+                         class_label='pending', run_id='run', meta=meta)
+
+
+def scalar_item(s, rubric):
+    """The per-item formula the columnar path replaces"""
+    w = rubric.dimension_weights
+    base = ((s.score_provenance or 0.0) * w['provenance'] + (s.score_resonance or 0.0) * w['resonance'] +
+            (s.score_coherence or 0.0) * w['coherence'] + (s.score_transparency or 0.0) * w['transparency'] +
+            (s.score_verification or 0.0) * w['verification']) * 100.0
+    meta = json.loads(s.meta) if isinstance(s.meta, str) and s.meta else (s.meta or {})
+    reasons = []
+    for rule in rubric.meta_rules:
+        reason = rule.evaluate(meta)
+        if reason is None:
+            continue
+        reasons.append((rule.id, reason))
+        base = base + rule.value if rule.effect == 'bonus' else base - abs(rule.value)
+    final = max(0.0, min(100.0, base))
+    return base, final, rubric.classify(final), reasons
+
+
+def test_columnar_matches_the_scalar_formula(rubric):
+    rng = random.Random(7)
+    values = [True, False, '', 'yes', 0.95, 0.5, '0.9', 'n/a', None, 1]
+    items = []
+    for i in range(300):
+        meta = {key: rng.choice(values) for key in rng.sample(['c2pa', 'signed', 'dup_similarity', 'near_dup'], 2)}
+        items.append(make_score(i, *(rng.choice([None, rng.random()]) for _ in range(5)),
+                                meta=json.dumps(meta) if i % 2 else meta))
+
+    arrays = AuthenticityArrays(items, rubric)
+    breakdowns = arrays.breakdowns()
+
+    for s, bd in zip(items, breakdowns):
+        base, final, label, reasons = scalar_item(s, rubric)
+        assert bd['base_score'] == base
+        assert bd['final_score'] == final
+        assert bd['label'] == label
+        assert [(rule['id'], rule['reason']) for rule in bd['applied_rules']] == reasons
+
+
+def test_breakdowns_hold_plain_python_values(rubric):
+    items = [make_score(0, 0.9, 0.9, 0.9, 0.9, 0.9, {'c2pa': True, 'dup_similarity': '0.85'})]
+
+    bd = AuthenticityArrays(items, rubric).breakdowns()[0]
+
+    assert type(bd['final_score']) is float and type(bd['label']) is str
+    assert [rule['reason'] for rule in bd['applied_rules']] == ['meta.c2pa present', 'dup_similarity 0.85 >= 0.8']
+    json.dumps(bd)
+
+
+def test_ratio_counts_and_persisted_labels(rubric, monkeypatch):
+    monkeypatch.setattr('scoring.rubric.get_rubric', lambda path=None: rubric)
+    items = [
+        make_score(0, 0.9, 0.9, 0.9, 0.9, 0.9, {}),
+        make_score(1, 0.5, 0.5, 0.5, 0.5, 0.5, {}),
+        make_score(2, 0.5, 0.5, 0.5, 0.5, 0.5, {'dup_similarity': 0.9}),
+    ]
+
+    ar, breakdowns = ScoringPipeline()._calculate_authenticity_ratio(items, 'brand', 'run', include_appendix=True)
+
+    assert (ar.authentic_items, ar.suspect_items, ar.inauthentic_items) == (1, 1, 1)
+    assert [s.class_label for s in items] == ['authentic', 'suspect', 'inauthentic']
+    assert [bd['label'] for bd in breakdowns] == ['authentic', 'suspect', 'inauthentic']
+    assert breakdowns[2]['applied_rules'][0]['id'] == 'dup'
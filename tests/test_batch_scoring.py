@@ -0,0 +1,130 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import scoring.scorer as scorer_module
+from scoring.scorer import ContentScorer, DimensionScores
+from data.models import NormalizedContent
+
+
+@pytest.fixture
+def scorer(monkeypatch):
+    # Avoid constructing real OpenAI clients
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    return ContentScorer(use_attribute_detection=False)
+
+
+def make_content(i):
+    return NormalizedContent(
+        content_id=f'c{i}', src='brave', platform_id=f'https://example.com/{i}',
+        author='web', title=f'Page {i}',
+        body=f'Body of page {i}. ' * 40, run_id='run-test',
+        url=f'https://example.com/page-{i}',
+    )
+
+
+def test_concurrent_batch_preserves_input_order(scorer, monkeypatch):
+    def fake_score_content(content, brand_context):
+        i = int(content.content_id[1:])
+        # Later items finish first so completion order differs from input order
+        time.sleep(0.01 * (5 - i))
+        v = i / 10.0
+        return DimensionScores(v, v, v, v, v)
+
+    monkeypatch.setattr(scorer, 'score_content', fake_score_content)
+    contents = [make_content(i) for i in range(5)]
+
+    scores = scorer.batch_score_content(contents, {'brand_name': 'test'}, max_workers=4)
+
+    assert [s.content_id for s in scores] == [c.content_id for c in contents]
+    assert [s.score_provenance for s in scores] == [0.0, 0.1, 0.2, 0.3, 0.4]
+
+
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_batch_isolates_item_failures(scorer, monkeypatch, max_workers):
+    def fake_score_content(content, brand_context):
+        if content.content_id == 'c2':
+            raise RuntimeError('boom')
+        return DimensionScores(0.7, 0.7, 0.7, 0.7, 0.7)
+
+    monkeypatch.setattr(scorer, 'score_content', fake_score_content)
+    contents = [make_content(i) for i in range(4)]
+
+    scores = scorer.batch_score_content(contents, {'brand_name': 'test'}, max_workers=max_workers)
+
+    assert [s.content_id for s in scores] == ['c0', 'c1', 'c3']
+
+
+def test_batch_uses_settings_concurrency_by_default(scorer, monkeypatch):
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_concurrency', 1)
+    monkeypatch.setattr(scorer, 'score_content', lambda c, b: DimensionScores(0.5, 0.5, 0.5, 0.5, 0.5))
+    contents = [make_content(i) for i in range(3)]
+
+    scores = scorer.batch_score_content(contents, {'brand_name': 'test'})
+
+    assert [s.content_id for s in scores] == ['c0', 'c1', 'c2']
+
+
+def test_dimension_scorers_run_concurrently(scorer, monkeypatch):
+    monkeypatch.setitem(scorer_module.SETTINGS, 'dimension_concurrency', 5)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'triage_enabled', False)
+    # Every scorer waits for the other four; this only completes if all five
+    # run at the same time.
+    barrier = threading.Barrier(5, timeout=5)
+
+    def make_fake(dim, value):
+        def fake(content, brand_context):
+            barrier.wait()
+            scorer._record_llm_issues(content, dim, [{'type': f'{dim}_issue'}])
+            scorer._record_score_debug(content, dim, {'base_score': value})
+            return value
+        return fake
+
+    values = {'provenance': 0.1, 'verification': 0.2, 'transparency': 0.3,
+              'coherence': 0.4, 'resonance': 0.5}
+    for dim, value in values.items():
+        monkeypatch.setattr(scorer, f'_score_{dim}', make_fake(dim, value))
+
+    content = make_content(0)
+    result = scorer.score_content(content, {'brand_name': 'test'})
+
+    assert result == DimensionScores(0.1, 0.2, 0.3, 0.4, 0.5)
+    assert set(content._llm_issues) == set(values)
+    assert set(content._score_debug) == set(values)
+
+
+def test_scores_carry_source_type_into_run_rollups(scorer, monkeypatch):
+    from scoring.aggregator import RunAggregator
+
+    monkeypatch.setattr(scorer, 'score_content', lambda content, brand: DimensionScores(0.7, 0.7, 0.7, 0.7, 0.7))
+    contents = [make_content(i) for i in range(3)]
+    contents[0].source_type, contents[0].source_tier = 'brand_owned', 'primary_website'
+    contents[1].source_type, contents[1].source_tier = 'third_party', 'news_media'
+
+    scores = scorer.batch_score_content(contents, {'brand_name': 'test'}, max_workers=1)
+
+    assert [(s.source_type, s.source_tier) for s in scores] == [
+        ('brand_owned', 'primary_website'), ('third_party', 'news_media'), ('unknown', 'unknown')]
+    rollup = RunAggregator.from_scores(scores).summary()['rollups']['source_type']
+    assert {key: group['count'] for key, group in rollup.items()} == {
+        'brand_owned': 1, 'third_party': 1, 'unknown': 1}
+
+
+@pytest.mark.parametrize('max_workers', [1, 3])
+def test_on_item_sees_each_scored_item_as_it_finishes(scorer, monkeypatch, max_workers):
+    def fake_score_content(content, brand_context):
+        if content.content_id == 'c2':
+            raise RuntimeError('boom')
+        return DimensionScores(0.7, 0.7, 0.7, 0.7, 0.7)
+
+    monkeypatch.setattr(scorer, 'score_content', fake_score_content)
+    seen = []
+
+    scores = scorer.batch_score_content([make_content(i) for i in range(4)], {'brand_name': 'test'},
+                                        max_workers=max_workers, on_item=seen.append)
+
+    assert sorted(s.content_id for s in seen) == ['c0', 'c1', 'c3']
+    assert {id(s) for s in seen} == {id(s) for s in scores}
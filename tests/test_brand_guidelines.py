@@ -0,0 +1,118 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+import scoring.brand_guidelines as guidelines_module
+import utils.document_processor as processor_module
+from scoring.brand_guidelines import GuidelineIndex, get_brand_guidelines, invalidate_brand_guidelines
+from utils.document_processor import chunk_text
+
+GUIDELINES = (
+    "Voice: We speak in a warm, confident and plain voice. Avoid jargon. "
+    "Tone: Friendly but never flippant; no slang in customer support replies. "
+    "Vocabulary: Say 'members' rather than 'customers'. Never call products 'cheap'; use 'affordable'. "
+    "Pricing: Always show prices with currency symbols and never promise discounts that are not live. "
+    "Legal: Product safety claims must cite the certification body. "
+) * 3
+
+
+@pytest.fixture
+def local_guidelines(tmp_path, monkeypatch):
+    monkeypatch.setattr(processor_module, 'LOCAL_CACHE_DIR', tmp_path)
+    processor = MagicMock()
+    processor.load_guidelines.side_effect = lambda brand_id: (
+        (tmp_path / brand_id / 'guidelines.txt').read_text()
+        if (tmp_path / brand_id / 'guidelines.txt').exists() else None
+    )
+    monkeypatch.setattr(guidelines_module, '_processor', processor)
+    monkeypatch.setitem(guidelines_module.SETTINGS, 'guidelines_chunk_size', 200)
+    monkeypatch.setitem(guidelines_module.SETTINGS, 'guidelines_chunk_overlap', 20)
+    invalidate_brand_guidelines()
+    yield tmp_path, processor
+    invalidate_brand_guidelines()
+
+
+def write_guidelines(root, brand_id, text):
+    (root / brand_id).mkdir(exist_ok=True)
+    path = root / brand_id / 'guidelines.txt'
+    path.write_text(text)
+    return path
+
+
+def test_chunk_text_respects_size_and_overlap():
+    chunks = chunk_text(GUIDELINES, max_chunk_size=200, overlap=20)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 200 for chunk in chunks)
+    assert chunk_text('short', max_chunk_size=200) == ['short']
+
+
+def test_bm25_ranks_the_matching_chunk_first():
+    index = GuidelineIndex([
+        'Voice is warm and confident.',
+        'Prices always show currency symbols; discounts must be live.',
+        'Safety claims cite the certification body.',
+    ])
+
+    hits = index.search('20% discount on all prices this week', k=2)
+
+    assert hits[0][1] == 1
+    assert index.search('unrelated zebra', k=2) == []
+
+
+def test_guidelines_are_loaded_once_and_reloaded_when_the_file_changes(local_guidelines):
+    root, processor = local_guidelines
+    path = write_guidelines(root, 'acme', GUIDELINES)
+
+    first = get_brand_guidelines('acme')
+    assert get_brand_guidelines('acme') is first
+    assert processor.load_guidelines.call_count == 1
+
+    path.write_text(GUIDELINES + ' Emoji: never in headlines.')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = get_brand_guidelines('acme')
+
+    assert second is not first
+    assert second.text.endswith('never in headlines.')
+
+
+def test_missing_guidelines_are_cached_for_the_ttl(local_guidelines, monkeypatch):
+    root, processor = local_guidelines
+
+    assert get_brand_guidelines('nobody') is None
+    assert get_brand_guidelines('nobody') is None
+    assert processor.load_guidelines.call_count == 1
+
+    monkeypatch.setitem(guidelines_module.SETTINGS, 'guidelines_cache_ttl', 0)
+    assert get_brand_guidelines('nobody') is None
+    assert processor.load_guidelines.call_count == 2
+
+
+def test_relevant_excerpts_are_a_small_part_of_the_guidelines(local_guidelines):
+    root, _ = local_guidelines
+    write_guidelines(root, 'acme', GUIDELINES)
+
+    guidelines = get_brand_guidelines('acme')
+    excerpts = guidelines.relevant_excerpts('Huge discount! Prices slashed, cheap deals for customers', k=2)
+
+    assert len(excerpts) <= 2
+    assert sum(len(e) for e in excerpts) < len(GUIDELINES) / 2
+    assert any('discount' in e or 'cheap' in e for e in excerpts)
+
+
+def test_excerpt_text_stays_within_the_character_cap(local_guidelines, monkeypatch):
+    root, _ = local_guidelines
+    write_guidelines(root, 'acme', GUIDELINES)
+    guidelines = get_brand_guidelines('acme')
+    query = 'Huge discount! Prices slashed, cheap deals for customers'
+
+    monkeypatch.setitem(guidelines_module.SETTINGS, 'guidelines_max_chars', 450)
+    assert len(guidelines.excerpt_text(query)) <= 450
+    assert len(guidelines.relevant_excerpts(query, k=3)) == 2
+
+    # A single chunk longer than the cap is cut to it
+    monkeypatch.setitem(guidelines_module.SETTINGS, 'guidelines_max_chars', 120)
+    assert len(guidelines.excerpt_text(query)) == 120
+    assert len(guidelines.excerpt_text('unrelated zebra')) == 120
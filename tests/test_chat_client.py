@@ -191,5 +191,68 @@ def test_provenance_in_pdf_generator():
         pytest.skip("PDF generator dependencies not available")
 
 
+def _async_openai_response(text):
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = text
+    response.usage = Mock(prompt_tokens=5, completion_tokens=5, total_tokens=10)
+    return response
+
+
+@patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key-12345'})
+def test_achat_many_uses_one_pooled_client_and_keeps_order():
+    """achat_many shares one async client per provider and preserves request order."""
+    import asyncio
+    from unittest.mock import AsyncMock
+    from scoring.llm_cache import LLMResponseCache
+
+    with patch('scoring.llm_client.OpenAI'), patch('scoring.llm_client.AsyncOpenAI') as mock_async_openai:
+        from scoring.llm_client import ChatClient
+
+        async def create(**kwargs):
+            text = kwargs['messages'][0]['content']
+            # Later requests finish first
+            await asyncio.sleep(0.01 * (5 - int(text)))
+            return _async_openai_response(f"reply {text}")
+
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(side_effect=create)
+        client = ChatClient(cache=LLMResponseCache(bypass=True))
+
+        requests = [{'messages': [{'role': 'user', 'content': str(i)}]} for i in range(5)]
+        responses = asyncio.run(client.achat_many(requests, concurrency=3))
+
+        assert [r['content'] for r in responses] == [f"reply {i}" for i in range(5)]
+        assert mock_async_openai.call_count == 1
+
+
+@patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key-12345'})
+def test_achat_timeout_cancels_request():
+    """A request that exceeds its timeout raises TimeoutError and is reported per item by achat_many."""
+    import asyncio
+    from unittest.mock import AsyncMock
+    from scoring.llm_cache import LLMResponseCache
+
+    with patch('scoring.llm_client.OpenAI'), patch('scoring.llm_client.AsyncOpenAI') as mock_async_openai:
+        from scoring.llm_client import ChatClient
+
+        async def create(**kwargs):
+            if kwargs['messages'][0]['content'] == 'slow':
+                await asyncio.sleep(5)
+            return _async_openai_response('ok')
+
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(side_effect=create)
+        client = ChatClient(cache=LLMResponseCache(bypass=True))
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(client.achat(messages=[{'role': 'user', 'content': 'slow'}], timeout=0.05))
+
+        results = asyncio.run(client.achat_many([
+            {'messages': [{'role': 'user', 'content': 'slow'}], 'timeout': 0.05},
+            {'messages': [{'role': 'user', 'content': 'fast'}], 'timeout': 1},
+        ]))
+        assert isinstance(results[0], asyncio.TimeoutError)
+        assert results[1]['content'] == 'ok'
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,69 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+import scoring.verification_manager as vm_module
+from scoring.claim_cache import ClaimCache, normalize_claim
+from scoring.verification_manager import VerificationManager
+
+
+def make_response(payload):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = json.dumps(payload)
+    return response
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    searches = []
+
+    def fake_search(query, size=10):
+        searches.append(query)
+        return [{'title': 'About', 'url': 'https://example.com', 'snippet': 'Founded in 1964'}]
+
+    monkeypatch.setattr(vm_module, 'search_serper', fake_search)
+    m = VerificationManager(claim_cache=ClaimCache(path=str(tmp_path / 'claims.sqlite3')))
+    m.llm_client.client = MagicMock()
+    m.llm_client.client.chat.completions.create.return_value = make_response(
+        {'status': 'SUPPORTED', 'confidence': 0.9, 'reasoning': 'Company history page'})
+    m.searches = searches
+    return m
+
+
+def test_normalize_claim_collapses_surface_variation():
+    assert normalize_claim('Founded in 1964.') == normalize_claim('  founded in   1964')
+    assert normalize_claim('No. 1 rated card') == normalize_claim('#1 rated card')
+    assert normalize_claim('Over 1,000,000 users') == normalize_claim('over 1000000 users')
+    assert normalize_claim('50 percent cashback') == normalize_claim('50% cashback')
+    assert normalize_claim('Founded in 1964') != normalize_claim('Founded in 1965')
+
+
+def test_repeated_claim_skips_search_and_llm(manager):
+    first = manager._verify_single_claim('Founded in 1964.')
+    second = manager._verify_single_claim('founded in 1964')
+
+    assert first['status'] == second['status'] == 'SUPPORTED'
+    assert second['claim'] == 'founded in 1964'
+    assert manager.searches == ['Founded in 1964.']
+    assert manager.llm_client.client.chat.completions.create.call_count == 1
+
+
+def test_search_results_cached_when_verification_fails(manager):
+    manager.llm_client.client.chat.completions.create.side_effect = RuntimeError('LLM down')
+
+    assert manager._verify_single_claim('Founded in 1964')['status'] == 'unverified'
+    manager.llm_client.client.chat.completions.create.side_effect = None
+    assert manager._verify_single_claim('Founded in 1964')['status'] == 'SUPPORTED'
+
+    # The failed verdict was not cached but its evidence was
+    assert manager.searches == ['Founded in 1964']
+    assert manager.llm_client.client.chat.completions.create.call_count == 2
+
+
+def test_cache_entries_expire(tmp_path):
+    cache = ClaimCache(path=str(tmp_path / 'claims.sqlite3'), ttl_seconds=1e-9)
+    cache.set_verdict('Founded in 1964', 'gpt-test', {'status': 'SUPPORTED'})
+
+    assert cache.get_verdict('Founded in 1964', 'gpt-test') is None
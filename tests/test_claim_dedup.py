@@ -0,0 +1,187 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+import scoring.verification_manager as vm_module
+from config.settings import SETTINGS
+from data.models import NormalizedContent
+from scoring.claim_cache import ClaimCache
+from scoring.claim_dedup import cluster_claims
+from scoring.verification_manager import VerificationManager
+
+
+def make_content(content_id, body='Body text'):
+    return NormalizedContent(
+        content_id=content_id, src='brave', platform_id=f'https://example.com/{content_id}',
+        author='web', title=content_id, body=body, run_id='run-test',
+        url=f'https://example.com/{content_id}',
+    )
+
+
+def make_response(payload):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = json.dumps(payload)
+    return response
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    monkeypatch.setitem(SETTINGS, 'claim_extraction_batch_size', 5)
+    monkeypatch.setattr(vm_module, 'search_serper', lambda query, size=10: [
+        {'title': 'About', 'url': 'https://example.com', 'snippet': query}])
+    m = VerificationManager(claim_cache=ClaimCache(path=str(tmp_path / 'claims.sqlite3'), bypass=True))
+    m.llm_client.client = MagicMock()
+    m.prompts = {'extract_batch': 0, 'extract': 0, 'verify': []}
+    m.batch_payload = {'documents': {
+        '1': ['Founded in 1964.', 'Accepted in 200 countries'],
+        '2': ['founded in 1964', 'Over 1,000,000 users'],
+        '3': [],
+    }}
+
+    def create(**kwargs):
+        system = kwargs['messages'][0]['content']
+        if 'per document' in system:
+            m.prompts['extract_batch'] += 1
+            return make_response(m.batch_payload)
+        if 'Extract specific claims' in system:
+            m.prompts['extract'] += 1
+            return make_response({'claims': ['Founded in 1964']})
+        m.prompts['verify'].append(kwargs['messages'][1]['content'])
+        return make_response({'status': 'SUPPORTED', 'confidence': 0.9, 'reasoning': 'ok'})
+
+    m.llm_client.client.chat.completions.create.side_effect = create
+    return m
+
+
+def test_cluster_claims_groups_near_duplicates_only():
+    claims = [
+        'Founded in 1964.',
+        'founded in 1964',
+        'Founded in 1965',
+        'Accepted in over 200 countries and territories',
+        'Accepted in over 200 countries & territories',
+    ]
+    assert cluster_claims(claims) == [[0, 1], [2], [3, 4]]
+    assert cluster_claims([]) == []
+
+
+@pytest.mark.parametrize('claim, other', [
+    ('Acme Widgets are FDA approved for children', 'Acme Widgets are not FDA approved for children'),
+    ("Acme Widgets are FDA approved for children", "Acme Widgets aren't FDA approved for children"),
+    ('Acme is the best selling phone in Europe', 'Acme is the best selling phone in Asia'),
+    ('The company was founded by John Smith', 'The company was founded by Jane Smith'),
+    ('Acme was founded in Boston', 'Globex was founded in Boston'),
+])
+def test_cluster_claims_keeps_negations_and_entity_swaps_apart(claim, other):
+    assert cluster_claims([claim, other]) == [[0], [1]]
+
+
+def test_cluster_members_are_compared_with_the_representative():
+    # b is close to both a and c, but a and c are not close to each other:
+    # chaining a-b-c would share a's verdict with c
+    claims = [
+        'Acme ships to over 200 countries worldwide every day',
+        'Acme ships to over 200 countries worldwide each day of the week',
+        'Acme ships parcels to over 200 countries each day of the week',
+    ]
+    assert cluster_claims(claims, threshold=0.5) == [[0, 1], [2]]
+
+
+def test_verify_run_verifies_shared_claim_once(manager):
+    contents = [make_content('a'), make_content('b'), make_content('c')]
+
+    results = manager.verify_run(contents)
+
+    assert manager.prompts['extract_batch'] == 1
+    assert manager.prompts['extract'] == 0
+    # Three distinct claims out of four extracted
+    assert len(manager.prompts['verify']) == 3
+    assert set(results) == {'a', 'b', 'c'}
+    assert results['c'] == {'score': 0.5, 'issues': []}
+    assert results['a']['score'] == results['b']['score'] > 0.5
+
+
+def test_verify_content_consumes_run_results(manager):
+    contents = [make_content('a'), make_content('b')]
+    results = manager.verify_run(contents)
+    calls = manager.llm_client.client.chat.completions.create.call_count
+
+    assert manager.verify_content(contents[0]) == results['a']
+    assert manager.llm_client.client.chat.completions.create.call_count == calls
+
+    manager.clear_run_results()
+    manager.verify_content(contents[1])
+    assert manager.llm_client.client.chat.completions.create.call_count > calls
+
+
+def test_unusable_batch_response_falls_back_per_item(manager):
+    manager.batch_payload = {'claims': ['not the batched shape']}
+
+    results = manager.verify_run([make_content('a'), make_content('b')])
+
+    assert manager.prompts['extract_batch'] == 1
+    assert manager.prompts['extract'] == 2
+    assert len(manager.prompts['verify']) == 1
+    assert results['a']['score'] == results['b']['score']
+
+
+def test_extraction_batches_run_concurrently(manager, monkeypatch):
+    import threading
+
+    monkeypatch.setitem(SETTINGS, 'claim_extraction_batch_size', 2)
+    monkeypatch.setitem(SETTINGS, 'claim_extraction_concurrency', 2)
+    manager.batch_payload = {'documents': {'1': ['Founded in 1964.'], '2': []}}
+    # Each batch waits for the other one: a serial loop would break the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    create = manager.llm_client.client.chat.completions.create.side_effect
+
+    def create_in_parallel(**kwargs):
+        if 'per document' in kwargs['messages'][0]['content']:
+            barrier.wait()
+        return create(**kwargs)
+
+    manager.llm_client.client.chat.completions.create.side_effect = create_in_parallel
+
+    results = manager.verify_run([make_content(c) for c in 'abcd'])
+
+    assert manager.prompts['extract_batch'] == 2
+    assert manager.prompts['extract'] == 0
+    assert set(results) == {'a', 'b', 'c', 'd'}
+
+
+def test_run_verification_skips_items_that_will_not_reach_the_llm(monkeypatch):
+    import scoring.scorer as scorer_module
+    from scoring.scheduler import ScoringBudget
+
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    scorer = scorer_module.ContentScorer(use_attribute_detection=False)
+    scorer.triage_gate = MagicMock(max_uncertainty=0.15)
+    body = ('Founded in 1964, the company serves 45% of the market in 200 countries, '
+            'according to a 2023 study by Gartner. ') * 4
+    contents = [make_content(c, body) for c in 'abcd']
+
+    # 'a' is answered by the triage model (but still takes an LLM slot);
+    # 'd' is past the LLM item cap
+    scorer._prepare_run_verification(contents, {'brand_name': 'test'}, order=[0, 1, 2, 3],
+                                     uncertainties=[0.05, 0.5, 0.5, 0.5],
+                                     budget=ScoringBudget(max_llm_items=3))
+
+    candidates = scorer.verification_manager.verify_run.call_args.args[0]
+    assert [c.content_id for c in candidates] == ['b', 'c']
+
+
+def test_verdicts_are_not_shared_with_a_negated_member(manager, monkeypatch):
+    manager.batch_payload = {'documents': {
+        '1': ['Acme Widgets are FDA approved for children'],
+        '2': ['Acme Widgets are not FDA approved for children'],
+    }}
+    # Even if clustering merged them, the negated claim gets its own verdict
+    monkeypatch.setattr(vm_module, 'cluster_claims', lambda claims, threshold: [[0, 1]])
+
+    manager.verify_run([make_content('a'), make_content('b')])
+
+    assert len(manager.prompts['verify']) == 2
+    assert any('not FDA approved' in prompt for prompt in manager.prompts['verify'])
@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import scoring.scorer as scorer_module
+from scoring.claim_detector import claim_likelihood, should_verify
+from scoring.scorer import ContentScorer
+from data.models import NormalizedContent
+
+
+def make_content(body):
+    return NormalizedContent(
+        content_id='c1', src='brave', platform_id='https://example.com/a',
+        author='web', title='Page', body=body, run_id='run-test',
+        url='https://example.com/a',
+    )
+
+
+@pytest.fixture
+def scorer(monkeypatch):
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    monkeypatch.setitem(scorer_module.SETTINGS, 'claim_predetect_enabled', True)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'claim_predetect_threshold', 0.3)
+    s = ContentScorer(use_attribute_detection=False)
+    s.verification_manager.verify_content.return_value = {'score': 0.8, 'issues': []}
+    monkeypatch.setattr(s, '_get_score_multiplier', lambda dimension, content_type: 1.0)
+    return s
+
+
+NAV_PAGE_WITH_FOOTER = '''Home | Shop | Men | Women | Kids | Sale | Help | Contact us
+New arrivals
+Shop the latest styles for every season.
+About us | Careers | Store locator | Gift cards
+Privacy policy | Terms of use | Cookie settings
+© 2024 Acme Inc. All rights reserved.'''
+
+PRODUCT_GRID_WITH_CTA = '''Running shoes
+Air Max 90 ($129.99)
+Pegasus 41 ($140.00)
+Dunk Low (€110)
+Sign up for emails and be the first to know about new drops.
+Copyright 2019-2024 Acme Inc.'''
+
+SHORT_REVIEW = 'Super comfy and they look great with jeans. I only wish it came in blue.'
+
+
+@pytest.mark.parametrize('body', [
+    '- Air Max 90 ($129.99)\n- Pegasus 41 ($140.00)\n- Dunk Low (€110)',
+    'Home | Shop | Men | Women | Kids | Sale | Help | Contact us',
+    'Love these shoes, super comfy and they look great with jeans.',
+    NAV_PAGE_WITH_FOOTER,
+    PRODUCT_GRID_WITH_CTA,
+    SHORT_REVIEW,
+    '',
+])
+def test_claim_free_content_is_skipped(body):
+    verify, debug = should_verify(make_content(body), threshold=0.3)
+    assert not verify
+    assert debug['claim_likelihood'] < 0.3
+
+
+@pytest.mark.parametrize('body, signal', [
+    ('According to a 2023 survey, most customers prefer contactless payments.', 'citations'),
+    ('Contactless usage grew 45% year over year.', 'percentages'),
+    ('The network serves 3,100,000 merchants.', 'statistics'),
+    ('Founded in 1966, we were the first payments company to launch tokenization on March 3rd.',
+     'superlatives'),
+    ('The program launched on March 3rd, 2021 and expanded on June 1st, 2022.', 'dates'),
+    (NAV_PAGE_WITH_FOOTER + '\nContactless usage grew 45% year over year.', 'percentages'),
+])
+def test_checkable_claims_are_verified(body, signal):
+    verify, debug = should_verify(make_content(body), threshold=0.3)
+    assert verify
+    assert debug['signals'][signal] >= 1
+
+
+@pytest.mark.parametrize('body', [
+    'We were the first payments company to launch tokenization.',
+    'The program launched on March 3rd with new partners.',
+    'Our story began in 1966.',
+])
+def test_single_weak_signal_is_not_enough(body):
+    verify, debug = should_verify(make_content(body), threshold=0.3)
+    assert not verify
+    assert 0.0 < debug['claim_likelihood'] < 0.3
+
+
+def test_copyright_years_are_ignored():
+    likelihood, signals = claim_likelihood('© 2024 Acme. Copyright 2019-2024 Acme Inc. (c) 2023')
+    assert signals['years'] == 0
+    assert likelihood == 0.0
+
+
+def test_prices_do_not_count_as_statistics():
+    likelihood, signals = claim_likelihood('Bundle price $1,299.00, was USD 1,499')
+    assert signals['statistics'] == 0
+    assert likelihood == 0.0
+
+
+def test_scorer_skips_verification_with_debug_reason(scorer):
+    content = make_content('Home | Shop | Sale | Contact us')
+
+    score = scorer._score_verification(content, {'keywords': []})
+
+    assert score == 0.5
+    assert not scorer.verification_manager.verify_content.called
+    skipped = content._score_debug['verification']['verification_skipped']
+    assert skipped['skipped'] == 'no_checkable_claims'
+    assert content._llm_issues['verification'] == []
+
+
+def test_scorer_verifies_content_with_claims(scorer):
+    content = make_content('A 2024 study found that 62% of shoppers read reviews first.')
+
+    score = scorer._score_verification(content, {'keywords': []})
+
+    assert score == 0.8
+    scorer.verification_manager.verify_content.assert_called_once_with(content)
+    assert 'verification_skipped' not in content._score_debug['verification']
@@ -0,0 +1,91 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from config.settings import SETTINGS
+from data.models import ContentScores, RatingBand
+from scoring.classifier import DIMENSIONS, ContentClassifier, ScoreMatrix
+
+
+def make_scores(n, seed=0):
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        # Exact band edges (0.8 / 0.6 / 0.4) alongside random values
+        values = [rng.choice([0.8, 0.6, 0.4, rng.random()]) for _ in range(5)]
+        items.append(ContentScores(
+            content_id=f'id-{i}', brand='b', src='brave', event_ts='',
+            score_provenance=values[0], score_resonance=values[1], score_coherence=values[2],
+            score_transparency=values[3], score_verification=values[4],
+            class_label=rng.choice(['authentic', 'suspect', 'inauthentic', 'pending']),
+        ))
+    return items
+
+
+@pytest.fixture
+def classifier():
+    return ContentClassifier(suppress_warning=True)
+
+
+def test_rating_band_histogram_matches_per_item_bands(classifier):
+    items = make_scores(500)
+
+    histogram = classifier.batch_get_rating_bands(items)
+
+    expected = Counter(s.rating_band for s in items)
+    assert histogram == {band: expected.get(band, 0) for band in RatingBand}
+
+
+def test_rating_bands_follow_settings(classifier, monkeypatch):
+    monkeypatch.setitem(SETTINGS, 'rating_bands', {'excellent': 95, 'good': 90, 'fair': 85, 'poor': 0})
+    items = make_scores(200)
+
+    histogram = classifier.batch_get_rating_bands(items)
+
+    assert histogram == {band: sum(1 for s in items if s.rating_band == band) for band in RatingBand}
+    assert histogram[RatingBand.POOR] > histogram[RatingBand.EXCELLENT]
+
+
+def test_correlations_match_pairwise_pearson(classifier):
+    items = make_scores(300, seed=3)
+
+    correlations = classifier._get_dimension_correlations(items)
+
+    for i, dim1 in enumerate(DIMENSIONS):
+        for dim2 in DIMENSIONS[i + 1:]:
+            expected = classifier._calculate_correlation(
+                [getattr(s, f'score_{dim1}') for s in items], [getattr(s, f'score_{dim2}') for s in items])
+            assert correlations[f'{dim1}_{dim2}'] == pytest.approx(expected, abs=1e-9)
+
+
+def test_constant_dimension_correlates_as_zero():
+    matrix = np.column_stack([np.linspace(0, 1, 10), np.full(10, 0.5), *np.random.default_rng(0).random((3, 10))])
+
+    corr = ScoreMatrix(matrix).correlation_matrix()
+
+    assert corr[0, 1] == 0.0 and corr[0, 0] == pytest.approx(1.0)
+    assert ScoreMatrix(matrix[:1]).correlations() == {}
+
+
+def test_confidence_vectors_match_per_item_confidence(classifier):
+    items = make_scores(200, seed=5)
+
+    vectors = classifier.batch_classification_confidence(items)
+
+    for i, s in enumerate(items):
+        for label, value in classifier.get_classification_confidence(s).items():
+            assert vectors[label][i] == pytest.approx(value, abs=1e-12)
+
+
+def test_dimension_performance_groups_by_label(classifier):
+    items = make_scores(100, seed=7)
+
+    analysis = classifier.analyze_dimension_performance(items)
+
+    authentic = [s for s in items if s.class_label == 'authentic']
+    assert analysis['classification_distribution']['authentic'] == len(authentic)
+    assert analysis['dimension_averages']['authentic']['coherence'] == pytest.approx(
+        sum(s.score_coherence for s in authentic) / len(authentic))
+    assert list(analysis['dimension_averages']['all']) == list(DIMENSIONS)
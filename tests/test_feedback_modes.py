@@ -0,0 +1,94 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from scoring.llm_cache import LLMResponseCache
+
+
+def make_response(text):
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = text
+    return response
+
+
+@pytest.fixture
+def content():
+    return SimpleNamespace(title='Title', body='Find the right card for you today.')
+
+
+def make_client(tmp_path, responses):
+    from scoring.scoring_llm_client import LLMScoringClient
+
+    patcher = patch('scoring.scoring_llm_client.OpenAI')
+    mock_openai = patcher.start()
+    mock_openai.return_value.chat.completions.create.side_effect = [make_response(r) for r in responses]
+    client = LLMScoringClient(cache=LLMResponseCache(path=str(tmp_path / 'c.sqlite3'), bypass=True))
+    return client, mock_openai.return_value.chat.completions.create, patcher
+
+
+def test_single_round_trip_makes_one_call(tmp_path, content):
+    issues = [{'type': 'vocabulary', 'evidence': "EXACT QUOTE: 'Find the right card'"}]
+    client, create, patcher = make_client(tmp_path, [json.dumps({'score': 0.7, 'issues': issues})])
+    try:
+        result = client.get_score_with_feedback('Score this', content, 'Coherence', single_round_trip=True)
+    finally:
+        patcher.stop()
+
+    assert result == {'score': 0.7, 'issues': issues}
+    assert create.call_count == 1
+
+
+def test_two_step_path_makes_two_calls(tmp_path, content):
+    client, create, patcher = make_client(tmp_path, ['0.7', json.dumps({'issues': []})])
+    try:
+        result = client.get_score_with_feedback('Score this', content, 'Coherence', single_round_trip=False)
+    finally:
+        patcher.stop()
+
+    assert result == {'score': 0.7, 'issues': []}
+    assert create.call_count == 2
+
+
+def test_single_round_trip_selected_per_dimension(tmp_path, content, monkeypatch):
+    import scoring.scoring_llm_client as client_module
+    monkeypatch.setitem(client_module.SETTINGS, 'single_round_trip_feedback', ['coherence'])
+
+    client, create, patcher = make_client(tmp_path, [json.dumps({'score': 0.95, 'issues': []})])
+    try:
+        client.get_score_with_feedback('Score this', content, 'Coherence')
+    finally:
+        patcher.stop()
+
+    assert create.call_count == 1
+
+
+def test_single_round_trip_falls_back_on_missing_score(tmp_path, content):
+    client, create, patcher = make_client(tmp_path, [json.dumps({'issues': []}), '0.6', json.dumps({'issues': []})])
+    try:
+        result = client.get_score_with_feedback('Score this', content, 'Coherence', single_round_trip=True)
+    finally:
+        patcher.stop()
+
+    assert result['score'] == 0.6
+    assert create.call_count == 3
+
+
+def test_summarize_agreement():
+    from scripts.ab_feedback_modes import summarize_agreement
+
+    rows = [
+        {'two_step_score': 0.85, 'single_score': 0.82, 'two_step_issues': 2, 'single_issues': 1},
+        {'two_step_score': 0.65, 'single_score': 0.45, 'two_step_issues': 1, 'single_issues': 1},
+    ]
+
+    summary = summarize_agreement(rows, tolerance=0.1)
+
+    assert summary['n'] == 2
+    assert summary['max_abs_diff'] == pytest.approx(0.2)
+    assert summary['within_tolerance_rate'] == 0.5
+    # 0.85/0.82 are both "excellent"; 0.65 is "good" but 0.45 is "fair"
+    assert summary['band_agreement_rate'] == 0.5
+    assert summary['two_step_mean_issues'] == 1.5
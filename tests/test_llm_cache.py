@@ -0,0 +1,103 @@
+import time
+from unittest.mock import Mock, patch
+
+from scoring.llm_cache import LLMResponseCache, make_cache_key
+
+
+def test_cache_key_depends_on_request_fields():
+    messages = [{'role': 'user', 'content': 'Score this'}]
+    base = make_cache_key('openai', 'gpt-3.5-turbo', messages, 0.1, None, 'v1')
+
+    assert base == make_cache_key('openai', 'gpt-3.5-turbo', [dict(m) for m in messages], 0.1, None, 'v1')
+    assert base != make_cache_key('openai', 'gpt-4o', messages, 0.1, None, 'v1')
+    assert base != make_cache_key('openai', 'gpt-3.5-turbo', messages, 0.3, None, 'v1')
+    assert base != make_cache_key('openai', 'gpt-3.5-turbo', messages, 0.1, {'type': 'json_object'}, 'v1')
+    assert base != make_cache_key('openai', 'gpt-3.5-turbo', messages, 0.1, None, 'v2')
+
+
+def test_cache_hit_miss_counters(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / 'cache.sqlite3'), ttl_seconds=0, max_entries=0, bypass=False)
+
+    assert cache.get('k') is None
+    cache.set('k', {'content': 'hello'})
+    assert cache.get('k') == {'content': 'hello'}
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['writes'] == 1
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    LLMResponseCache(path=path, bypass=False).set('k', '0.8')
+
+    assert LLMResponseCache(path=path, bypass=False).get('k') == '0.8'
+
+
+def test_cache_ttl_expiry(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / 'cache.sqlite3'), ttl_seconds=60, max_entries=0, bypass=False)
+    cache.set('k', 'v')
+
+    with patch('scoring.llm_cache.time.time', return_value=time.time() + 120):
+        assert cache.get('k') is None
+
+
+def test_cache_lru_eviction(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / 'cache.sqlite3'), ttl_seconds=0, max_entries=2, bypass=False)
+    cache.set('a', 1)
+    time.sleep(0.01)
+    cache.set('b', 2)
+    time.sleep(0.01)
+    cache.get('a')  # 'a' is now more recently used than 'b'
+    time.sleep(0.01)
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+
+def test_cache_bypass(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / 'cache.sqlite3'), bypass=True)
+    cache.set('k', 'v')
+
+    assert cache.get('k') is None
+    assert not (tmp_path / 'cache.sqlite3').exists()
+
+
+def test_scoring_client_reuses_cached_score(tmp_path):
+    from scoring.scoring_llm_client import LLMScoringClient
+
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = '0.8'
+
+    cache = LLMResponseCache(path=str(tmp_path / 'cache.sqlite3'), bypass=False)
+    with patch('scoring.scoring_llm_client.OpenAI') as mock_openai:
+        mock_openai.return_value.chat.completions.create.return_value = response
+        client = LLMScoringClient(cache=cache)
+
+        assert client.get_score('Score this') == 0.8
+        assert client.get_score('Score this') == 0.8
+
+        assert mock_openai.return_value.chat.completions.create.call_count == 1
+
+
+def test_scoring_client_does_not_cache_unparseable_response(tmp_path):
+    from scoring.scoring_llm_client import LLMScoringClient
+
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = 'not a number'
+
+    cache = LLMResponseCache(path=str(tmp_path / 'cache.sqlite3'), bypass=False)
+    with patch('scoring.scoring_llm_client.OpenAI') as mock_openai:
+        mock_openai.return_value.chat.completions.create.return_value = response
+        client = LLMScoringClient(cache=cache)
+
+        assert client.get_score('Score this') == 0.5
+        assert client.get_score('Score this') == 0.5
+
+        assert mock_openai.return_value.chat.completions.create.call_count == 2
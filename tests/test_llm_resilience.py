@@ -0,0 +1,152 @@
+import os
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+import scoring.llm_client as llm_client_module
+from scoring import llm_resilience
+from scoring.llm_cache import LLMResponseCache
+from scoring.llm_resilience import LatencyHistogram, is_server_error
+
+
+class ServerError(Exception):
+    status_code = 503
+
+
+def openai_response(text):
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = text
+    response.usage = Mock(prompt_tokens=5, completion_tokens=5, total_tokens=10)
+    return response
+
+
+def anthropic_response(text):
+    response = Mock()
+    response.content = [Mock(text=text)]
+    response.usage = Mock(input_tokens=5, output_tokens=5)
+    return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    llm_resilience.reset_resilience_state()
+    monkeypatch.setitem(llm_client_module.SETTINGS, 'llm_equivalent_models',
+                        {'gpt-4o-mini': ['claude-3-haiku-20240307']})
+    yield
+    llm_resilience.reset_resilience_state()
+
+
+def make_client():
+    env = {'OPENAI_API_KEY': 'test-openai', 'ANTHROPIC_API_KEY': 'test-anthropic'}
+    with patch.dict(os.environ, env):
+        return llm_client_module.ChatClient(cache=LLMResponseCache(bypass=True))
+
+
+def test_latency_histogram_quantiles_over_window():
+    histogram = LatencyHistogram(window=10)
+    for latency in range(1, 21):
+        histogram.record(float(latency))
+
+    assert histogram.count() == 10
+    assert histogram.quantile(0.0) == 11.0
+    assert histogram.quantile(0.9) == 20.0
+
+
+def test_server_error_classification():
+    assert is_server_error(ServerError())
+    assert not is_server_error(ValueError('bad request'))
+
+
+def test_hedge_delay_uses_observed_p90(monkeypatch):
+    monkeypatch.setitem(llm_resilience.SETTINGS, 'llm_hedge_min_samples', 5)
+    monkeypatch.setitem(llm_resilience.SETTINGS, 'llm_hedge_min_delay_seconds', 0.0)
+    monkeypatch.setitem(llm_resilience.SETTINGS, 'llm_hedge_default_delay_seconds', 7.0)
+
+    assert llm_resilience.hedge_delay('openai') == 7.0
+    for latency in [1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 4.0]:
+        llm_resilience.get_latency_histogram('openai').record(latency)
+    assert llm_resilience.hedge_delay('openai') == 4.0
+
+
+def test_failover_to_equivalent_model_on_5xx():
+    with patch.object(llm_client_module, 'OpenAI') as mock_openai, \
+            patch.object(llm_client_module, 'Anthropic') as mock_anthropic:
+        mock_openai.return_value.chat.completions.create.side_effect = ServerError('503')
+        mock_anthropic.return_value.messages.create.return_value = anthropic_response('from claude')
+        client = make_client()
+
+        response = client.chat(messages=[{'role': 'user', 'content': 'hi'}], model='gpt-4o-mini')
+
+    assert response['provider'] == 'anthropic'
+    assert llm_resilience.resilience_stats()['failovers'] == 1
+
+
+def test_no_failover_on_client_error():
+    with patch.object(llm_client_module, 'OpenAI') as mock_openai, \
+            patch.object(llm_client_module, 'Anthropic') as mock_anthropic:
+        mock_openai.return_value.chat.completions.create.side_effect = ValueError('bad request')
+        client = make_client()
+
+        with pytest.raises(ValueError):
+            client.chat(messages=[{'role': 'user', 'content': 'hi'}], model='gpt-4o-mini')
+
+    assert not mock_anthropic.return_value.messages.create.called
+
+
+def test_hedged_request_takes_first_valid_response(monkeypatch):
+    monkeypatch.setitem(llm_client_module.SETTINGS, 'llm_hedging_enabled', True)
+    monkeypatch.setitem(llm_resilience.SETTINGS, 'llm_hedge_min_delay_seconds', 0.05)
+    monkeypatch.setitem(llm_resilience.SETTINGS, 'llm_hedge_default_delay_seconds', 0.05)
+
+    def slow_openai(**kwargs):
+        time.sleep(1.0)
+        return openai_response('slow')
+
+    with patch.object(llm_client_module, 'OpenAI') as mock_openai, \
+            patch.object(llm_client_module, 'Anthropic') as mock_anthropic:
+        mock_openai.return_value.chat.completions.create.side_effect = slow_openai
+        mock_anthropic.return_value.messages.create.return_value = anthropic_response('fast')
+        client = make_client()
+
+        started = time.monotonic()
+        response = client.chat(messages=[{'role': 'user', 'content': 'hi'}], model='gpt-4o-mini')
+
+    assert response['content'] == 'fast'
+    assert time.monotonic() - started < 0.9
+    stats = llm_resilience.resilience_stats()
+    assert stats['hedges_fired'] == 1
+    assert stats['hedges_won'] == 1
+
+
+def test_latency_histogram_excludes_rate_limiter_wait(monkeypatch):
+    real_call = llm_client_module.call_with_rate_limit
+
+    def throttled(provider, model, call, estimated_tokens=0):
+        time.sleep(0.3)  # queued behind the limiter
+        return real_call(provider, model, call, estimated_tokens=estimated_tokens)
+
+    monkeypatch.setattr(llm_client_module, 'call_with_rate_limit', throttled)
+    with patch.object(llm_client_module, 'OpenAI') as mock_openai:
+        mock_openai.return_value.chat.completions.create.return_value = openai_response('ok')
+        client = make_client()
+        client.chat(messages=[{'role': 'user', 'content': 'hi'}], model='gpt-4o-mini')
+
+    histogram = llm_resilience.get_latency_histogram('openai')
+    assert histogram.count() == 1
+    assert histogram.quantile(1.0) < 0.1
+
+
+def test_hedged_requests_share_one_executor(monkeypatch):
+    monkeypatch.setitem(llm_client_module.SETTINGS, 'llm_hedging_enabled', True)
+    with patch.object(llm_client_module, 'OpenAI') as mock_openai:
+        mock_openai.return_value.chat.completions.create.return_value = openai_response('ok')
+        client = make_client()
+        with patch.object(llm_client_module, 'ThreadPoolExecutor',
+                          wraps=llm_client_module.ThreadPoolExecutor) as executor_class:
+            monkeypatch.setattr(llm_client_module, '_hedge_executor', None)
+            for n in range(3):
+                client.chat(messages=[{'role': 'user', 'content': f'hi {n}'}], model='gpt-4o-mini')
+
+    assert executor_class.call_count == 1
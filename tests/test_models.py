@@ -2,9 +2,12 @@
 Unit tests for data models
 """
 
+import pickle
 import unittest
 from datetime import datetime
-from data.models import NormalizedContent, ContentScores, AuthenticityRatio, BrandConfig, PipelineRun
+from data.models import (NormalizedContent, ContentScores, DetectedAttribute, ScoresBatch,
+                         AuthenticityRatio, BrandConfig, PipelineRun)
+from scoring.classifier import ScoreMatrix
 
 class TestNormalizedContent(unittest.TestCase):
     """Test NormalizedContent model"""
@@ -154,5 +157,64 @@ class TestPipelineRun(unittest.TestCase):
         self.assertEqual(run.items_processed, 0)
         self.assertEqual(len(run.errors), 0)
 
+class TestSlottedModels(unittest.TestCase):
+    """Test the slotted model layout"""
+
+    def test_undeclared_attributes_are_rejected(self):
+        """Test that only declared fields can be set"""
+        content = NormalizedContent("c1", "brave", "p1", "a", "t", "b")
+        attr = DetectedAttribute("attr", "provenance", "Label", 5.0, "evidence")
+
+        for obj in (content, attr):
+            self.assertFalse(hasattr(obj, '__dict__'))
+            with self.assertRaises(AttributeError):
+                obj.extra = 1
+
+    def test_side_channels_are_declared_per_instance(self):
+        """Test that scorer side channels exist and are not shared"""
+        first = NormalizedContent("c1", "brave", "p1", "a", "t", "b")
+        second = NormalizedContent("c2", "brave", "p2", "a", "t", "b")
+
+        first._llm_issues['coherence'] = [{'type': 'tone_shift'}]
+        first._score_debug['coherence'] = {'base_score': 0.5}
+
+        self.assertEqual(second._llm_issues, {})
+        self.assertEqual(second._score_debug, {})
+        self.assertEqual(first, pickle.loads(pickle.dumps(first)))
+
+
+class TestScoresBatch(unittest.TestCase):
+    """Test the array-backed ScoresBatch container"""
+
+    def make_scores(self, n):
+        return [ContentScores(
+            content_id=f"id-{i}", brand="b", src="reddit", event_ts="", score_provenance=i / n,
+            score_resonance=0.1, score_coherence=0.2, score_transparency=0.3, score_verification=1 - i / n,
+            class_label="authentic" if i % 2 else "suspect", is_authentic=bool(i % 2),
+            meta={'title': f"Item {i}"}, channel="web")
+            for i in range(n)]
+
+    def test_items_round_trip(self):
+        """Test that stored items are materialized unchanged"""
+        items = self.make_scores(20)
+        batch = ScoresBatch(items)
+
+        self.assertEqual(len(batch), 20)
+        self.assertEqual(list(batch), items)
+        self.assertEqual(batch[-1], items[-1])
+        self.assertEqual(list(batch.dimension('provenance')), [s.score_provenance for s in items])
+        with self.assertRaises(IndexError):
+            batch[20]
+
+    def test_classifier_matrix_reads_the_arrays(self):
+        """Test that ScoreMatrix builds the same matrix from a ScoresBatch"""
+        items = self.make_scores(30)
+
+        from_batch = ScoreMatrix.from_scores(ScoresBatch(items))
+        from_items = ScoreMatrix.from_scores(items)
+
+        self.assertEqual(from_batch.matrix.tolist(), from_items.matrix.tolist())
+        self.assertEqual(list(from_batch.labels), list(from_items.labels))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,133 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+import scoring.rate_limiter as rate_limiter
+from scoring.rate_limiter import AdaptiveRateLimiter, call_with_rate_limit, get_retry_after, is_rate_limit_error
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after=None):
+        super().__init__('429')
+        self.status_code = 429
+        headers = {'retry-after': str(retry_after)} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=429, headers=headers)
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters():
+    rate_limiter.reset_rate_limiters()
+    yield
+    rate_limiter.reset_rate_limiters()
+
+
+def test_rate_limit_error_detection():
+    assert is_rate_limit_error(RateLimitError())
+    assert get_retry_after(RateLimitError(retry_after=7)) == 7.0
+    assert not is_rate_limit_error(ValueError('bad'))
+
+
+def test_additive_increase_and_multiplicative_decrease():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter('openai/test', max_concurrency=8, initial_concurrency=4, clock=clock)
+
+    for _ in range(8):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+    assert limiter.concurrency_limit > 5
+
+    limiter.acquire()
+    limiter.release(latency=0.1, rate_limited=True, retry_after=2)
+    assert int(limiter.concurrency_limit) == 2
+    assert limiter.stats()['rate_limited'] == 1
+
+
+def test_high_latency_shrinks_window():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter('openai/test', max_concurrency=10, initial_concurrency=10,
+                                  latency_target=5.0, clock=clock)
+
+    limiter.acquire()
+    limiter.release(latency=12.0)
+
+    assert limiter.concurrency_limit == pytest.approx(8.0)
+
+
+def test_concurrency_window_blocks_extra_requests():
+    limiter = AdaptiveRateLimiter('openai/test', max_concurrency=1, initial_concurrency=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def second():
+        limiter.acquire()
+        acquired.set()
+
+    t = threading.Thread(target=second)
+    t.start()
+    assert not acquired.wait(0.1)
+
+    limiter.release(latency=0.1)
+    assert acquired.wait(2)
+    t.join()
+
+
+def test_request_budget_enforced(monkeypatch):
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter('openai/test', requests_per_minute=2, max_concurrency=10, clock=clock)
+    limiter.acquire()
+    limiter.acquire()
+
+    # Bucket is empty: the next request has to wait ~30s for one token
+    assert limiter._wait_time(clock(), 0) == pytest.approx(30.0)
+    clock.now += 30
+    limiter._refill(clock())
+    assert limiter._wait_time(clock(), 0) == 0
+
+
+def test_call_with_rate_limit_retries_after_429(monkeypatch):
+    monkeypatch.setitem(rate_limiter.SETTINGS, 'llm_requests_per_minute', 0)
+    monkeypatch.setitem(rate_limiter.SETTINGS, 'llm_tokens_per_minute', 0)
+    calls = []
+
+    def call():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RateLimitError(retry_after=0)
+        return {'content': 'ok', 'usage': {'total_tokens': 10}}
+
+    assert call_with_rate_limit('openai', 'gpt-test', call, max_retries=2) == {'content': 'ok', 'usage': {'total_tokens': 10}}
+    assert len(calls) == 2
+
+    stats = rate_limiter.get_rate_limiter('openai', 'gpt-test').stats()
+    assert stats['rate_limited'] == 1
+    assert stats['in_flight'] == 0
+
+
+def test_call_with_rate_limit_gives_up_after_retries(monkeypatch):
+    monkeypatch.setitem(rate_limiter.SETTINGS, 'llm_requests_per_minute', 0)
+    monkeypatch.setitem(rate_limiter.SETTINGS, 'llm_tokens_per_minute', 0)
+
+    def call():
+        raise RateLimitError(retry_after=0)
+
+    with pytest.raises(RateLimitError):
+        call_with_rate_limit('openai', 'gpt-test', call, max_retries=1)
+
+
+def test_limiters_are_shared_per_provider_model(monkeypatch):
+    monkeypatch.setitem(rate_limiter.SETTINGS, 'llm_rate_limit_overrides',
+                        {'anthropic': {'requests_per_minute': 50}})
+
+    a = rate_limiter.get_rate_limiter('anthropic', 'claude-3-haiku')
+    assert a is rate_limiter.get_rate_limiter('anthropic', 'claude-3-haiku')
+    assert a is not rate_limiter.get_rate_limiter('openai', 'gpt-4o')
+    assert a.requests_per_minute == 50
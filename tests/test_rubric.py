@@ -0,0 +1,97 @@
+import json
+import os
+
+import pytest
+
+from scoring.rubric import clear_rubric_cache, get_rubric, load_rubric
+
+
+def write_rubric(path, **overrides):
+    data = {
+        'version': 'test',
+        'dimension_weights': {'provenance': 1, 'resonance': 1, 'coherence': 2, 'transparency': 0, 'verification': 0},
+        'thresholds': {'authentic': 70, 'suspect': 30},
+        'score_multipliers': {
+            'coherence': {'landing_page': 1.25, '_default': 1.1, '_rationale': 'text'},
+        },
+        'attributes': [
+            {'id': 'a1', 'dimension': 'provenance', 'enabled': True, 'value': 5, 'match_meta': ['has_author']},
+            {'id': 'a2', 'dimension': 'coherence', 'enabled': True, 'value': 0, 'match_meta': ['x']},
+            {'id': 'a3', 'dimension': 'coherence', 'enabled': False, 'value': 3, 'match_meta': ['y']},
+            {'id': 'a4', 'dimension': 'verification', 'effect': 'penalty', 'value': 4, 'match_meta': ['risk'],
+             'condition': {'op': '>=', 'threshold': 0.8}},
+        ],
+        'defaults': {'normalize_weights': True, 'max_llm_items': 3},
+    }
+    data.update(overrides)
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_rubric_cache()
+    yield
+    clear_rubric_cache()
+
+
+def test_compiled_rubric_tables(tmp_path):
+    rubric = get_rubric(write_rubric(tmp_path / 'rubric.json'))
+
+    assert rubric.dimension_weights['coherence'] == pytest.approx(0.5)
+    assert rubric.multiplier('coherence', 'landing_page') == 1.25
+    assert rubric.multiplier('coherence', 'blog') == 1.1
+    assert rubric.multiplier('verification', 'blog') == 1.0
+    assert rubric.classify(70) == 'authentic'
+    assert rubric.classify(30) == 'suspect'
+    assert rubric.classify(29.9) == 'inauthentic'
+    assert set(rubric.enabled_attributes) == {'a1', 'a2'}
+    assert rubric.enabled_by_dimension['coherence'] == frozenset({'a2'})
+    # Zero-value and disabled rules never change a score; a4 has no `enabled` key
+    assert [rule.id for rule in rubric.meta_rules] == ['a1', 'a4']
+
+
+def test_meta_rules_evaluate_presence_and_conditions(tmp_path):
+    rubric = get_rubric(write_rubric(tmp_path / 'rubric.json'))
+    presence, condition = rubric.meta_rules
+
+    assert presence.evaluate({'has_author': 'Jane'}) == 'meta.has_author present'
+    assert presence.evaluate({'has_author': ''}) is None
+    assert condition.evaluate({'risk': '0.9'}) == 'risk 0.9 >= 0.8'
+    assert condition.evaluate({'risk': 0.5}) is None
+    assert condition.evaluate({'risk': 'n/a'}) is None
+
+
+def test_rubric_is_cached_until_the_file_changes(tmp_path):
+    path = write_rubric(tmp_path / 'rubric.json')
+    first = get_rubric(path)
+    assert get_rubric(path) is first
+
+    write_rubric(tmp_path / 'rubric.json', thresholds={'authentic': 80, 'suspect': 50})
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = get_rubric(path)
+
+    assert second is not first
+    assert second.thresholds['authentic'] == 80
+    assert second.fingerprint != first.fingerprint
+
+
+def test_touched_but_unchanged_file_keeps_compiled_rubric(tmp_path):
+    path = write_rubric(tmp_path / 'rubric.json')
+    first = get_rubric(path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert get_rubric(path) is first
+
+
+def test_missing_file_uses_defaults_and_load_rubric_returns_a_copy(tmp_path):
+    rubric = get_rubric(str(tmp_path / 'missing.json'))
+    assert rubric.fingerprint.startswith('default-')
+    assert rubric.classify(80) == 'authentic'
+
+    path = write_rubric(tmp_path / 'rubric.json')
+    loaded = load_rubric(path)
+    loaded['thresholds']['authentic'] = 1
+    assert get_rubric(path).thresholds['authentic'] == 70
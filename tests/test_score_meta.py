@@ -0,0 +1,73 @@
+import json
+
+import pytest
+
+from data import json_codec
+from data.models import ContentScores, ScoreMeta
+from scoring.authenticity import AuthenticityArrays
+from scoring.pipeline import ScoringPipeline
+
+
+def make_score(i, meta):
+    return ContentScores(content_id=f'id-{i}', brand='b', src='brave', event_ts='',
+                         score_provenance=0.5, score_resonance=0.5, score_coherence=0.5,
+                         score_transparency=0.5, score_verification=0.5, run_id='run', meta=meta)
+
+
+def test_coerce_accepts_every_meta_form():
+    meta = ScoreMeta({'title': 'A'})
+
+    assert ScoreMeta.coerce(meta) is meta
+    assert ScoreMeta.coerce({'title': 'A'}) == meta
+    assert ScoreMeta.coerce('{"title": "A"}') == meta
+    assert ScoreMeta.coerce('not json') == {} and ScoreMeta.coerce(None) == {} and ScoreMeta.coerce('[1]') == {}
+
+
+@pytest.mark.parametrize('orjson', [True, False])
+def test_serialized_only_at_the_boundary(monkeypatch, orjson):
+    if orjson and not json_codec.ORJSON_AVAILABLE:
+        pytest.skip('orjson not installed')
+    monkeypatch.setattr(json_codec, 'ORJSON_AVAILABLE', orjson)
+    meta = ScoreMeta({'title': 'Café', 'detected_attributes': [{'id': 'x', 'value': 7.5}], 'when': object()})
+    scores = make_score(0, meta)
+
+    parsed = json.loads(scores.meta_json)
+
+    assert parsed['title'] == 'Café' and parsed['detected_attributes'] == [{'id': 'x', 'value': 7.5}]
+    assert isinstance(parsed['when'], str)
+    assert make_score(1, '{"a": 1}').meta_json == '{"a": 1}'
+    assert make_score(2, '').meta_json == ''
+
+
+def test_triage_status_falls_back_to_fetched_meta():
+    assert ScoreMeta({'orig_meta': {'triage_status': 'skipped'}}).triage_status == 'skipped'
+    assert ScoreMeta({'triage_status': 'scored', 'orig_meta': None}).triage_status == 'scored'
+    assert ScoreMeta().triage_status is None
+
+
+def test_demoted_items_are_detected_in_every_meta_form():
+    skipped = {'orig_meta': {'triage_status': 'skipped'}}
+
+    assert ScoringPipeline._is_demoted(make_score(0, ScoreMeta(skipped)))
+    assert ScoringPipeline._is_demoted(make_score(1, json.dumps(skipped)))
+    assert not ScoringPipeline._is_demoted(make_score(2, ScoreMeta({'title': 'kept'})))
+
+
+def test_authenticity_pass_leaves_item_meta_untouched():
+    meta = ScoreMeta({'name': 'From name', 'channel': ''})
+    scores = make_score(0, meta)
+
+    arrays = AuthenticityArrays([scores])
+
+    assert arrays.metas[0]['title'] == 'From name' and arrays.metas[0]['channel'] == 'unknown'
+    assert scores.meta is meta and meta == {'name': 'From name', 'channel': ''}
+
+
+def test_report_items_share_the_in_memory_meta():
+    meta = ScoreMeta({'title': 'A', 'channel': 'web', '_llm_adjusted_score_total': 42.0})
+    scores = make_score(0, meta)
+
+    report = ScoringPipeline().generate_scoring_report([scores], {'brand_id': 'b'})
+
+    assert report['items'][0]['meta'] is meta
+    assert report['items'][0]['final_score'] == 42.0
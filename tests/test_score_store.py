@@ -0,0 +1,98 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import scoring.scorer as scorer_module
+from data.models import DetectedAttribute, NormalizedContent
+from scoring.score_store import ScoreStore, content_fingerprint
+from scoring.scorer import ContentScorer, DimensionScores
+
+
+def make_content(body='Our cards are accepted in 200 countries. ' * 10):
+    return NormalizedContent(
+        content_id='c1', src='brave', platform_id='https://example.com/about',
+        author='web', title='About us', body=body, run_id='run-test',
+        url='https://example.com/about',
+    )
+
+
+@pytest.fixture
+def scorer(monkeypatch, tmp_path):
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    s = ContentScorer(use_attribute_detection=False)
+    s.llm_client.model = 'gpt-test'
+    s.llm_client.error_count = 0
+    s.score_store = ScoreStore(path=str(tmp_path / 'scores.sqlite3'))
+    calls = []
+
+    def fake_score_content(content, brand_context):
+        calls.append(content.content_id)
+        s._record_llm_issues(content, 'coherence', [{'type': 'tone_shift'}])
+        return DimensionScores(0.8, 0.7, 0.6, 0.5, 0.4)
+
+    monkeypatch.setattr(s, 'score_content', fake_score_content)
+    s.calls = calls
+    return s
+
+
+def test_fingerprint_ignores_whitespace_and_case():
+    a = make_content('Founded in 1964.\n\n  We serve   customers.')
+    b = make_content('founded in 1964. we serve customers.')
+    c = make_content('Founded in 1965. We serve customers.')
+
+    assert content_fingerprint(a) == content_fingerprint(b)
+    assert content_fingerprint(a) != content_fingerprint(c)
+
+
+def test_unchanged_item_reuses_stored_scores(scorer):
+    brand = {'brand_name': 'acme', 'keywords': ['acme']}
+
+    first = scorer._score_item(make_content(), brand)
+    second = scorer._score_item(make_content(), brand)
+
+    assert scorer.calls == ['c1']
+    assert second.score_provenance == first.score_provenance == 0.8
+    assert second.score_resonance == 0.4
+    assert scorer.reuse_stats == {'reused': 1, 'scored': 1}
+    assert second.meta['score_reused'] is True
+
+
+def test_reuse_restores_issues_and_attributes(scorer, monkeypatch):
+    attr = DetectedAttribute('author_brand_identity_verified', 'provenance', 'Author verified', 8.0, 'byline')
+    monkeypatch.setattr(scorer, '_score_fresh',
+                        lambda c, b, triage_run=None: (scorer.score_content(c, b), [attr]))
+    brand = {'brand_name': 'acme'}
+    scorer._score_item(make_content(), brand)
+
+    content = make_content()
+    scores = scorer._score_item(content, brand)
+
+    assert content._llm_issues == {'coherence': [{'type': 'tone_shift'}]}
+    assert scores.meta['attribute_count'] == 1
+    assert [a['id'] for a in scores.meta.detected_attributes] == ['author_brand_identity_verified']
+
+
+def test_changed_body_or_rubric_version_is_rescored(scorer):
+    brand = {'brand_name': 'acme'}
+    scorer._score_item(make_content(), brand)
+    scorer._score_item(make_content('Completely rewritten page body. ' * 10), brand)
+    scorer.rubric_version = 'v3'
+    scorer._score_item(make_content(), brand)
+
+    assert len(scorer.calls) == 3
+    assert scorer.reuse_stats['reused'] == 0
+
+
+def test_failed_scoring_is_not_stored(scorer, monkeypatch):
+    original = scorer.score_content
+
+    def failing_score_content(content, brand_context):
+        scorer.llm_client.error_count += 1
+        return original(content, brand_context)
+
+    monkeypatch.setattr(scorer, 'score_content', failing_score_content)
+    scorer._score_item(make_content(), {'brand_name': 'acme'})
+    scorer._score_item(make_content(), {'brand_name': 'acme'})
+
+    assert len(scorer.calls) == 2
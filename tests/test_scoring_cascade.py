@@ -0,0 +1,176 @@
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+import scoring.scoring_llm_client as client_module
+from scoring.llm_cache import LLMResponseCache
+from scoring.scoring_llm_client import LLMScoringClient, band_boundaries, detect_provider
+
+
+def make_response(text):
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = text
+    return response
+
+
+@pytest.fixture
+def cascade(monkeypatch):
+    monkeypatch.setitem(client_module.SETTINGS, 'scoring_cascade_enabled', True)
+    monkeypatch.setitem(client_module.SETTINGS, 'scoring_cascade_models', ['gpt-cheap', 'gpt-strong'])
+    monkeypatch.setitem(client_module.SETTINGS, 'scoring_cascade_margin', 0.05)
+
+
+@pytest.fixture
+def client(tmp_path):
+    patcher = patch('scoring.scoring_llm_client.OpenAI')
+    mock_openai = patcher.start()
+    c = LLMScoringClient(cache=LLMResponseCache(path=str(tmp_path / 'c.sqlite3'), bypass=True))
+    c.replies = {}
+
+    def create(**kwargs):
+        return make_response(c.replies[kwargs['model']])
+
+    c.create = mock_openai.return_value.chat.completions.create
+    c.create.side_effect = create
+    yield c
+    patcher.stop()
+
+
+def models_called(client):
+    return [call.kwargs['model'] for call in client.create.call_args_list]
+
+
+def test_band_boundaries_include_bands_and_rubric_thresholds():
+    boundaries = band_boundaries()
+    assert {0.4, 0.6, 0.8}.issubset(boundaries)
+    assert 0.0 not in boundaries
+
+
+def test_detect_provider_uses_chat_client_patterns():
+    assert detect_provider('gpt-4o-mini') == 'openai'
+    assert detect_provider('claude-3-haiku-20240307') == 'anthropic'
+    assert detect_provider('gemini-1.5-flash') == 'google'
+
+
+def test_confident_cheap_score_is_final(cascade, client):
+    client.replies = {'gpt-cheap': '0.7', 'gpt-strong': '0.9'}
+
+    assert client.get_score('Score this') == 0.7
+    assert models_called(client) == ['gpt-cheap']
+    assert client.cascade_summary()['escalation_rate'] == 0.0
+
+
+def test_valid_score_near_a_band_is_answered_by_the_cheap_model(cascade, client):
+    # One dimension near 0.6 says nothing about the item's band; that check
+    # is made on the composite by ContentScorer
+    client.replies = {'gpt-cheap': '0.62', 'gpt-strong': '0.55'}
+
+    assert client.get_score('Score this') == 0.62
+    assert models_called(client) == ['gpt-cheap']
+
+
+def test_escalate_answers_moves_cheap_answers_to_the_last_model(cascade, client):
+    client.replies = {'gpt-cheap': '0.62', 'gpt-strong': '0.55'}
+
+    with client.tracking_cascade() as answers:
+        client.get_score('Score this')
+        client.get_score('Score that')
+    client.escalate_answers(answers)
+
+    assert answers == ['gpt-cheap', 'gpt-cheap']
+    summary = client.cascade_summary()
+    assert summary['calls'] == 2
+    assert summary['answered_by'] == {'gpt-strong': 2}
+    assert summary['escalations'] == {'near_boundary': 2}
+    assert summary['escalation_rate'] == 1.0
+
+
+def test_invalid_json_escalates(cascade, client):
+    client.replies = {'gpt-cheap': 'not json', 'gpt-strong': json.dumps({'score': 0.3, 'issues': []})}
+
+    result = client.get_score_and_feedback('Score this', 'Coherence')
+
+    assert result == {'score': 0.3, 'issues': []}
+    assert client.cascade_summary()['escalations'] == {'invalid_output': 1}
+
+
+def test_multi_dimension_escalates_on_invalid_output_only(cascade, client):
+    dims = ['provenance', 'coherence']
+    client.replies = {
+        'gpt-cheap': json.dumps({'provenance': {'score': 0.3}, 'coherence': {'score': 0.79}}),
+        'gpt-strong': json.dumps({'provenance': {'score': 0.3}, 'coherence': {'score': 0.85}}),
+    }
+
+    result = client.get_multi_dimension_scores('Score these', dims)
+
+    assert result['coherence']['score'] == 0.79
+    assert models_called(client) == ['gpt-cheap']
+
+    client.replies['gpt-cheap'] = json.dumps({'provenance': {'score': 0.3}})
+    assert client.get_multi_dimension_scores('Score these again', dims)['coherence']['score'] == 0.85
+
+
+def test_cascade_disabled_uses_configured_model(monkeypatch, client):
+    monkeypatch.setitem(client_module.SETTINGS, 'scoring_cascade_enabled', False)
+    client.replies = {client.model: '0.61'}
+
+    assert client.get_score('Score this') == 0.61
+    assert models_called(client) == [client.model]
+    assert client.cascade_summary()['calls'] == 0
+
+
+LLM_DIMENSIONS = ['provenance', 'transparency', 'coherence', 'resonance']
+
+
+@pytest.fixture
+def scorer(cascade, client, monkeypatch):
+    """ContentScorer whose LLM dimensions ask the cascade client for '<dimension>'"""
+    import scoring.scorer as scorer_module
+
+    monkeypatch.setattr(scorer_module, 'VerificationManager', Mock())
+    s = scorer_module.ContentScorer(use_attribute_detection=False)
+    s.llm_client = client
+    for dim in LLM_DIMENSIONS:
+        monkeypatch.setattr(s, f'_score_{dim}', lambda content, brand, dim=dim: client.get_score(dim))
+    monkeypatch.setattr(s, '_score_verification', lambda content, brand: s.verification)
+
+    def create(**kwargs):
+        return make_response(client.replies[kwargs['model']][kwargs['messages'][1]['content']])
+
+    client.create.side_effect = create
+    return s
+
+
+def test_dimension_near_a_band_keeps_cheap_scores_when_composite_is_far(scorer, client):
+    # Coherence sits on the 0.6 band, but the weighted composite (~0.87) is
+    # well inside a band: cheap scores cannot move the item across one
+    scorer.verification = 0.95
+    client.replies = {
+        'gpt-cheap': {'provenance': '0.95', 'transparency': '0.95', 'coherence': '0.61', 'resonance': '0.95'},
+        'gpt-strong': {dim: '0.5' for dim in LLM_DIMENSIONS},
+    }
+
+    results = scorer._run_dimension_scorers(Mock(content_id='c1'), {})
+
+    assert results['coherence'] == 0.61
+    assert set(models_called(client)) == {'gpt-cheap'}
+    assert client.cascade_summary()['escalation_rate'] == 0.0
+
+
+def test_composite_near_a_band_rescores_with_last_model(scorer, client):
+    scorer.verification = 0.62
+    client.replies = {
+        'gpt-cheap': {'provenance': '0.7', 'transparency': '0.55', 'coherence': '0.62', 'resonance': '0.6'},
+        'gpt-strong': {dim: '0.9' for dim in LLM_DIMENSIONS},
+    }
+
+    results = scorer._run_dimension_scorers(Mock(content_id='c1'), {})
+
+    assert {dim: results[dim] for dim in LLM_DIMENSIONS} == {dim: 0.9 for dim in LLM_DIMENSIONS}
+    assert results['verification'] == 0.62
+    assert models_called(client).count('gpt-strong') == len(LLM_DIMENSIONS)
+    summary = client.cascade_summary()
+    assert summary['answered_by'] == {'gpt-strong': len(LLM_DIMENSIONS)}
+    assert summary['escalations'] == {'near_boundary': len(LLM_DIMENSIONS)}
@@ -0,0 +1,146 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import scoring.scorer as scorer_module
+import scoring.scheduler as scheduler_module
+from data.models import NormalizedContent
+from scoring.scorer import ContentScorer
+from scoring.scheduler import (
+    ScoringBudget, ScoringScheduler, prioritize, tokens_cost,
+    TREATMENT_LLM, TREATMENT_CHEAP_MODEL, TREATMENT_DETECTOR_ONLY, TREATMENT_SKIPPED
+)
+
+BODY = 'Our team reviews products and publishes buying guides for customers. ' * 5
+
+
+def make_content(i, channel='web', source_type='third_party'):
+    return NormalizedContent(
+        content_id=f'c{i}', src='brave', platform_id=f'https://example.com/{i}',
+        author='web', title=f'Page {i}', body=BODY, run_id='run-test', url=f'https://example.com/{i}', channel=channel, source_type=source_type,
+    )
+
+
+class FakeUsage:
+    def __init__(self):
+        self.tokens = 0
+
+    def __call__(self):
+        return {('openai', 'gpt-4o'): self.tokens}
+
+
+def test_prioritize_puts_brand_owned_first_and_spreads_channels():
+    contents = [
+        make_content(0, 'web'), make_content(1, 'web'), make_content(2, 'web'),
+        make_content(3, 'youtube'), make_content(4, 'web', source_type='brand_owned'),
+    ]
+
+    order = prioritize(contents)
+
+    assert order[0] == 4
+    # The first youtube page beats the third and fourth web pages
+    assert order.index(3) < order.index(1)
+    assert sorted(order) == list(range(5))
+
+
+def test_prioritize_prefers_uncertain_items_within_a_channel():
+    contents = [make_content(i) for i in range(3)]
+
+    assert prioritize(contents, [0.1, 0.9, 0.5]) == [1, 2, 0]
+
+
+def test_tokens_cost_uses_model_prices(monkeypatch):
+    monkeypatch.setitem(scheduler_module.SETTINGS, 'llm_cost_per_1k_tokens', {'gpt-4o': 0.005, 'default': 0.001})
+
+    assert tokens_cost({('openai', 'gpt-4o'): 2000, ('openai', 'other'): 1000}) == pytest.approx(0.011)
+
+
+def test_scheduler_degrades_as_budget_is_spent():
+    usage = FakeUsage()
+    budget = ScoringBudget(max_tokens=1000, cheap_model='gpt-4o-mini', cheap_reserve=0.2)
+    scheduler = ScoringScheduler(budget, usage=usage, clock=lambda: 0.0)
+
+    def run(content_id, tokens):
+        treatment = scheduler.acquire(content_id)
+        usage.tokens += tokens
+        scheduler.release(treatment)
+        return treatment
+
+    assert run('a', 850) == TREATMENT_LLM
+    assert run('b', 200) == TREATMENT_CHEAP_MODEL
+    assert run('c', 0) == TREATMENT_DETECTOR_ONLY
+
+    summary = scheduler.summary()
+    assert summary['treatments'] == {'a': 'llm', 'b': 'cheap_model', 'c': 'detector_only'}
+    assert summary['counts'] == {'llm': 1, 'cheap_model': 1, 'detector_only': 1}
+    assert summary['tokens'] == 1050
+
+
+def test_scheduler_limits_llm_items_and_time():
+    clock = [0.0]
+    budget = ScoringBudget(max_seconds=10, max_llm_items=1, exhausted_treatment=TREATMENT_SKIPPED)
+    scheduler = ScoringScheduler(budget, usage=FakeUsage(), clock=lambda: clock[0])
+
+    assert scheduler.acquire('a') == TREATMENT_LLM
+    # No cheap model configured: the item cap goes straight to the exhausted treatment
+    assert scheduler.acquire('b') == TREATMENT_SKIPPED
+
+
+def test_budget_rejects_unknown_exhausted_treatment():
+    with pytest.raises(ValueError):
+        ScoringBudget(exhausted_treatment='llm')
+
+
+def test_batch_records_treatment_per_item(monkeypatch):
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_enabled', True)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_max_llm_items', 1)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_cheap_model', None)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_exhausted_treatment', 'detector_only')
+    monkeypatch.setitem(scorer_module.SETTINGS, 'run_level_verification', False)
+    scorer = ContentScorer(use_attribute_detection=False)
+    scorer.triage_gate = None
+    scorer.score_store = MagicMock()
+    scorer.score_store.get.return_value = None
+    monkeypatch.setattr(scorer, 'score_content',
+                        MagicMock(return_value=scorer_module.DimensionScores(0.9, 0.9, 0.9, 0.9, 0.9)))
+    contents = [make_content(0), make_content(1, source_type='brand_owned')]
+
+    results = scorer.batch_score_content(contents, {'brand_name': 'test'}, max_workers=1)
+
+    # The brand-owned item gets the single LLM slot; output keeps input order
+    assert [r.content_id for r in results] == ['c0', 'c1']
+    assert results[1].meta['scoring_treatment'] == TREATMENT_LLM
+    assert results[0].meta['scoring_treatment'] == TREATMENT_DETECTOR_ONLY
+    assert results[0].score_coherence == 0.5
+    assert scorer.score_content.call_count == 1
+    assert scorer.last_schedule['treatments'] == {'c1': 'llm', 'c0': 'detector_only'}
+    # Only the full-LLM result is persisted
+    assert scorer.score_store.set.call_count == 1
+
+
+def test_run_verification_does_not_spend_the_scoring_budget(monkeypatch):
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_enabled', True)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_max_tokens', 500)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_max_cost', 1000.0)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_max_llm_items', 10)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_cheap_model', None)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'run_level_verification', True)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'claim_predetect_enabled', False)
+    usage = FakeUsage()
+    monkeypatch.setattr(scorer_module, 'ScoringScheduler', lambda budget: ScoringScheduler(budget, usage=usage))
+    scorer = ContentScorer(use_attribute_detection=False)
+    scorer.triage_gate = None
+    # Verifying every candidate up front uses twice the scoring budget
+    scorer.verification_manager.verify_run.side_effect = lambda contents: setattr(usage, 'tokens', 1000)
+    monkeypatch.setattr(scorer, 'score_content',
+                        MagicMock(return_value=scorer_module.DimensionScores(0.9, 0.9, 0.9, 0.9, 0.9)))
+
+    results = scorer.batch_score_content([make_content(0), make_content(1)], {'brand_name': 'test'},
+                                         max_workers=1)
+
+    assert scorer.verification_manager.verify_run.called
+    assert [r.meta['scoring_treatment'] for r in results] == [TREATMENT_LLM, TREATMENT_LLM]
@@ -0,0 +1,100 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+import scoring.scorer as scorer_module
+from scoring.scorer import ContentScorer
+from scoring.scoring_llm_client import parse_multi_dimension_response
+from data.models import NormalizedContent
+
+DIMENSIONS = ['provenance', 'transparency', 'coherence', 'resonance']
+
+
+@pytest.fixture
+def scorer(monkeypatch):
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_mode', 'single_call')
+    monkeypatch.setitem(scorer_module.SETTINGS, 'triage_enabled', False)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'claim_predetect_enabled', False)
+    s = ContentScorer(use_attribute_detection=False)
+    s.verification_manager.verify_content.return_value = {'score': 0.6, 'issues': []}
+    s.llm_client._get_valid_issue_types.return_value = '  - improvement_opportunity'
+    monkeypatch.setattr(s, '_load_brand_guidelines', lambda brand_id: None)
+    monkeypatch.setattr(s, '_get_score_multiplier', lambda dimension, content_type: 1.0)
+    return s
+
+
+def make_content():
+    return NormalizedContent(
+        content_id='c1', src='brave', platform_id='https://example.com/a',
+        author='web', title='Page', body='Some page body text. ' * 20,
+        run_id='run-test', url='https://example.com/blog/a',
+    )
+
+
+def test_parse_multi_dimension_response_validates_and_clamps():
+    text = json.dumps({
+        'Provenance': {'score': 1.4, 'issues': [{'type': 'unclear_authorship'}, 'junk']},
+        'transparency': {'score': '0.6', 'issues': 'none'},
+        'coherence': {'score': 0.7, 'issues': []},
+        'resonance': {'score': 0.2},
+    })
+
+    result = parse_multi_dimension_response(text, DIMENSIONS)
+
+    assert result['provenance'] == {'score': 1.0, 'issues': [{'type': 'unclear_authorship'}]}
+    assert result['transparency'] == {'score': 0.6, 'issues': []}
+    assert result['resonance']['issues'] == []
+
+
+def test_parse_multi_dimension_response_rejects_missing_dimension():
+    text = json.dumps({'provenance': {'score': 0.5, 'issues': []}})
+
+    with pytest.raises(ValueError):
+        parse_multi_dimension_response(text, DIMENSIONS)
+
+    with pytest.raises(ValueError):
+        parse_multi_dimension_response('not json', DIMENSIONS)
+
+
+def test_single_call_mode_maps_response_into_scores_and_issues(scorer):
+    scorer.llm_client.get_multi_dimension_scores.return_value = {
+        'provenance': {'score': 0.8, 'issues': []},
+        'transparency': {'score': 0.6, 'issues': [{'type': 'missing_privacy_policy', 'confidence': 0.9}]},
+        'coherence': {'score': 0.7, 'issues': [
+            {'type': 'tone_shift', 'confidence': 0.9},
+            {'type': 'vocabulary', 'confidence': 0.3},
+        ]},
+        'resonance': {'score': 0.5, 'issues': []},
+    }
+    content = make_content()
+
+    scores = scorer.score_content(content, {'brand_name': 'test', 'keywords': ['test']})
+
+    assert scorer.llm_client.get_multi_dimension_scores.call_count == 1
+    assert not scorer.llm_client.get_score.called
+    assert not scorer.llm_client.get_score_with_feedback.called
+    assert scores.provenance == 0.8
+    assert scores.verification == 0.6
+    assert scores.transparency == 0.6
+    assert scores.coherence == 0.7
+    # 70% LLM, 30% engagement (neutral 0.5 with no engagement metrics)
+    assert scores.resonance == pytest.approx(0.5)
+    assert content._llm_issues['transparency'] == [{'type': 'missing_privacy_policy', 'confidence': 0.9}]
+    # Low-confidence coherence issues are filtered as in per-dimension mode
+    assert [i['type'] for i in content._llm_issues['coherence']] == ['tone_shift']
+
+
+def test_single_call_mode_falls_back_on_invalid_response(scorer):
+    scorer.llm_client.get_multi_dimension_scores.return_value = None
+    scorer.llm_client.get_score.return_value = 0.4
+    scorer.llm_client.get_score_with_reasoning.return_value = {'score': 0.3, 'issues': []}
+    scorer.llm_client.get_score_with_feedback.return_value = {'score': 0.9, 'issues': []}
+
+    scores = scorer.score_content(make_content(), {'brand_name': 'test'})
+
+    assert scores.provenance == 0.4
+    assert scores.transparency == 0.3
+    assert scores.coherence == 0.9
@@ -0,0 +1,251 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+import scoring.scorer as scorer_module
+from data.models import ContentScores, NormalizedContent
+from scoring.streaming import Stage, run_stages
+
+
+def make_content(i):
+    return NormalizedContent(
+        content_id=f'c{i}', src='brave', platform_id=f'https://example.com/{i}',
+        author='web', title=f'Page {i}',
+        body=f'Body of page {i} with enough distinct words to pass validation. ' * 5,
+        run_id='run-test', url=f'https://example.com/page-{i}',
+    )
+
+
+def test_run_stages_processes_every_item():
+    stages = [
+        Stage('double', lambda x: x * 2, workers=3),
+        Stage('drop_odd', lambda x: x if x % 4 == 0 else None),
+    ]
+    stats = {}
+
+    results = sorted(run_stages(range(10), stages, queue_size=2, stats=stats))
+
+    assert results == [0, 4, 8, 12, 16]
+    assert stats['double']['processed'] == 10
+    assert stats['drop_odd']['dropped'] == 5
+
+
+def test_run_stages_yields_before_source_is_exhausted():
+    release = threading.Event()
+
+    def source():
+        yield 1
+        # The rest of the source only arrives after the first item came out
+        assert release.wait(5)
+        yield 2
+
+    stream = run_stages(source(), [Stage('identity', lambda x: x)], queue_size=1)
+    assert next(stream) == 1
+    release.set()
+    assert list(stream) == [2]
+
+
+def test_run_stages_bounds_items_in_flight():
+    produced = []
+
+    def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    slow = threading.Event()
+    stream = run_stages(source(), [Stage('slow', lambda x: (slow.wait(5), x)[1])], queue_size=2)
+    first = threading.Thread(target=lambda: next(stream))
+    first.start()
+    time.sleep(0.3)
+
+    # Queues of size 2 in front of and behind the blocked worker: the source
+    # cannot run ahead by more than a handful of items
+    assert len(produced) <= 6
+    slow.set()
+    first.join()
+    stream.close()
+
+
+def test_run_stages_flattens_lists_and_closes_once():
+    closed = []
+    stages = [
+        Stage('expand', lambda x: [x, x + 100], workers=2),
+        Stage('collect', lambda x: x, workers=3, on_close=lambda: closed.append(1)),
+    ]
+
+    assert sorted(run_stages([1, 2], stages)) == [1, 2, 101, 102]
+    assert closed == [1]
+
+
+def test_run_stages_forwards_items_returned_on_close():
+    held = []
+
+    def hold(x):
+        held.append(x)
+        if len(held) < 2:
+            return None
+        return release()
+
+    def release():
+        items = list(held)
+        held.clear()
+        return items
+
+    stages = [Stage('window', hold, on_close=release), Stage('identity', lambda x: x)]
+
+    assert sorted(run_stages(range(5), stages)) == [0, 1, 2, 3, 4]
+
+
+def test_run_stages_isolates_item_failures():
+    def fail_on_three(x):
+        if x == 3:
+            raise RuntimeError('boom')
+        return x
+
+    stats = {}
+    assert sorted(run_stages(range(5), [Stage('check', fail_on_three)], stats=stats)) == [0, 1, 2, 4]
+    assert stats['check']['failed'] == 1
+
+
+def test_run_stages_reraises_source_error():
+    def source():
+        yield 1
+        raise ValueError('source broke')
+
+    with pytest.raises(ValueError):
+        list(run_stages(source(), [Stage('identity', lambda x: x)]))
+
+
+def test_normalize_item_drops_duplicates():
+    from ingestion.normalizer import ContentNormalizer
+
+    normalizer = ContentNormalizer()
+    first, second = make_content(1), make_content(2)
+    second.title, second.body = first.title, first.body
+
+    first = normalizer.normalize_item(first)
+    second = normalizer.normalize_item(second)
+
+    assert first is not None and first.content_id == 'c1'
+    assert second is None
+    assert normalizer.normalize_item(NormalizedContent(
+        content_id='c4', src='brave', platform_id='', author='web', title='', body='')) is None
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    monkeypatch.setitem(scorer_module.SETTINGS, 'triage_enabled', False)
+
+    from scoring.pipeline import ScoringPipeline
+
+    p = ScoringPipeline()
+    p.scorer.use_attribute_detection = False
+    p.scorer.attribute_detector = None
+    monkeypatch.setattr(p.scorer, 'score_content',
+                        lambda c, b: scorer_module.DimensionScores(0.8, 0.8, 0.8, 0.8, 0.8))
+    p.athena_client = MagicMock()
+    return p
+
+
+def test_stream_scoring_pipeline_uploads_in_parts(pipeline):
+    contents = [make_content(i) for i in range(5)]
+
+    scores = list(pipeline.stream_scoring_pipeline(
+        contents, {'brand_id': 'acme', 'brand_name': 'acme'},
+        max_workers=2, upload_batch_size=2))
+
+    assert sorted(s.content_id for s in scores) == [f'c{i}' for i in range(5)]
+    assert all(isinstance(s, ContentScores) and s.class_label for s in scores)
+
+    uploads = pipeline.athena_client.upload_content_scores.call_args_list
+    assert [len(call.args[0]) for call in uploads] == [2, 2, 1]
+    assert [call.kwargs['part'] for call in uploads] == [0, 1, 2]
+
+
+def test_run_streaming_pipeline_with_fetch_stage(pipeline):
+    seen = []
+
+    def fetch(i):
+        # Task 2 fails to fetch and is dropped
+        return None if i == 2 else make_content(i)
+
+    run = pipeline.run_streaming_pipeline(range(4), {'brand_id': 'acme', 'brand_name': 'acme'},
+                                          fetch=fetch, on_score=lambda s: seen.append(s.content_id))
+
+    assert run.status == 'completed'
+    assert sorted(s.content_id for s in run.classified_scores) == ['c0', 'c1', 'c3']
+    assert sorted(seen) == ['c0', 'c1', 'c3']
+    assert run.stage_stats['fetch']['dropped'] == 1
+    assert len(run.appendix) == 3
+    # Report aggregates were built as items finished scoring
+    assert run.aggregates.count == 3
+
+
+def test_uploaded_items_keep_only_a_description_preview(pipeline, monkeypatch):
+    monkeypatch.setitem(scorer_module.SETTINGS, 'stream_retained_description_chars', 40)
+    contents = [make_content(i) for i in range(3)]
+
+    run = pipeline.run_streaming_pipeline(contents, {'brand_id': 'acme', 'brand_name': 'acme'},
+                                          upload_batch_size=2)
+
+    uploaded = [s for call in pipeline.athena_client.upload_content_scores.call_args_list
+                for s in call.args[0]]
+    assert len(uploaded) == 3
+    bodies = {c.content_id: c.body for c in contents}
+    for scores in run.classified_scores:
+        assert scores.meta['description'] == bodies[scores.content_id][:40]
+
+
+def test_each_streaming_run_gets_its_own_triage_counters(pipeline):
+    gate = MagicMock()
+    gate.decide.return_value = None
+    gate.new_run.side_effect = lambda: object()
+    pipeline.scorer.triage_gate = gate
+    brand = {'brand_id': 'acme', 'brand_name': 'acme'}
+
+    pipeline.run_streaming_pipeline([make_content(i) for i in range(2)], brand)
+    pipeline.run_streaming_pipeline([make_content(i) for i in range(2, 4)], brand)
+
+    runs = [call.args[2] for call in gate.decide.call_args_list]
+    assert gate.new_run.call_count == 2
+    assert runs[0] is runs[1]
+    assert runs[2] is runs[3]
+    assert runs[0] is not runs[2]
+
+
+def test_streaming_run_verifies_claims_per_window(pipeline, monkeypatch):
+    monkeypatch.setitem(scorer_module.SETTINGS, 'stream_verification_window', 3)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'claim_predetect_enabled', False)
+    manager = pipeline.scorer.verification_manager
+
+    run = pipeline.run_streaming_pipeline([make_content(i) for i in range(7)],
+                                          {'brand_id': 'acme', 'brand_name': 'acme'})
+
+    windows = [[c.content_id for c in call.args[0]] for call in manager.verify_run.call_args_list]
+    # Two full windows; the last item alone has nothing to share claims with
+    assert [len(w) for w in windows] == [3, 3]
+    assert sorted(cid for w in windows for cid in w) == [f'c{i}' for i in range(6)]
+    assert len(run.classified_scores) == 7
+    manager.clear_run_results.assert_called()
+
+
+def test_streaming_run_enforces_the_scoring_budget(pipeline, monkeypatch):
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_enabled', True)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_max_llm_items', 2)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_cheap_model', None)
+    monkeypatch.setitem(scorer_module.SETTINGS, 'scoring_budget_exhausted_treatment', 'detector_only')
+    pipeline.scorer.score_store = MagicMock()
+    pipeline.scorer.score_store.get.return_value = None
+
+    run = pipeline.run_streaming_pipeline([make_content(i) for i in range(5)],
+                                          {'brand_id': 'acme', 'brand_name': 'acme'}, max_workers=1)
+
+    treatments = {s.content_id: s.meta['scoring_treatment'] for s in run.classified_scores}
+    assert sorted(treatments.values()) == ['detector_only'] * 3 + ['llm'] * 2
+    assert run.scoring_treatments['treatments'] == treatments
+    assert run.scoring_treatments['counts'] == {'llm': 2, 'detector_only': 3}
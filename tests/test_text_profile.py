@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+from data.models import NormalizedContent
+from scoring.claim_detector import should_verify
+from scoring.content_filter import content_skip_reason, should_skip_content
+from scoring.linguistic_analyzer import LinguisticAnalyzer
+from scoring.text_profile import profile_of, split_sentences
+
+BODY = (
+    "The report was written by our editors. Results were reviewed by an independent lab in 2023. "
+    "A 2023 study found that 64% of shoppers read reviews first [1]. It is basically very good. "
+    "Visit https://example.com/about for details."
+)
+
+
+def make_content(body=BODY, title='About us'):
+    return NormalizedContent(content_id='c1', src='brave', platform_id='p1', author='a',
+                             title=title, body=body, run_id='r1')
+
+
+def test_profile_is_memoized_and_rebuilt_when_the_body_changes():
+    content = make_content()
+    profile = profile_of(content)
+
+    assert profile_of(content) is profile
+    assert profile.urls == ['https://example.com/about']
+    assert profile.title_lower == 'about us'
+
+    content.body = BODY + " Extra sentence added later."
+    rebuilt = profile_of(content)
+    assert rebuilt is not profile
+    assert rebuilt.sentences[-1] == 'Extra sentence added later.'
+
+
+def test_profile_is_not_part_of_equality_or_repr():
+    a, b = make_content(), make_content()
+    profile_of(a)
+
+    assert a == b
+    assert '_text_profile' not in repr(a)
+
+
+def test_split_sentences_drops_short_fragments():
+    assert split_sentences('Hi. This is a real sentence! Ok?') == ['This is a real sentence!']
+
+
+def test_linguistic_analysis_with_profile_matches_plain_text():
+    analyzer = LinguisticAnalyzer()
+    content = make_content()
+
+    with_profile = analyzer.analyze(content.body, profile_of(content))
+    plain = analyzer.analyze(content.body)
+
+    assert with_profile == plain
+    assert with_profile['passive_voice']
+    assert with_profile['weak_words'] == ['basically']
+
+
+def test_skip_reason_is_computed_once_per_item():
+    content = make_content(title='Login')
+
+    with patch('scoring.content_filter.should_skip_content', wraps=should_skip_content) as skip:
+        assert content_skip_reason(content) == 'login_wall'
+        assert content_skip_reason(content) == 'login_wall'
+    assert skip.call_count == 1
+
+    content.title = 'About us'
+    assert content_skip_reason(content) is None
+
+
+def test_claim_likelihood_is_memoized_on_the_profile():
+    content = make_content()
+
+    first = should_verify(content, 0.3)
+    with patch('scoring.claim_detector.claim_likelihood') as likelihood:
+        second = should_verify(content, 0.3)
+    likelihood.assert_not_called()
+    assert first == second
@@ -0,0 +1,145 @@
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip('sklearn')
+
+import scoring.scorer as scorer_module
+from data.models import NormalizedContent, DetectedAttribute
+from scoring.scorer import ContentScorer
+from scoring.triage_model import (
+    DIMENSIONS, TriageGate, TriageModel, TriagePrediction, calibration_report
+)
+
+HIGH = 'Written by our editorial team. Sources cited below. Privacy policy and disclosures apply.'
+LOW = 'Buy now! Huge sale, limited offer, click here, best deals today only.'
+
+
+def make_content(i, body):
+    return NormalizedContent(
+        content_id=f'c{i}', src='brave', platform_id=f'https://example.com/{i}',
+        author='web', title=f'Page {i}', body=body, run_id='run-test',
+        url=f'https://example.com/{i}',
+    )
+
+
+def make_dataset(n=60):
+    rng = random.Random(0)
+    contents, targets, attrs_list = [], [], []
+    for i in range(n):
+        high = i % 2 == 0
+        contents.append(make_content(i, (HIGH if high else LOW) + f' item {i}'))
+        base = 0.8 if high else 0.3
+        targets.append({d: base + rng.uniform(-0.02, 0.02) for d in DIMENSIONS})
+        attrs_list.append([DetectedAttribute('author_verified', 'provenance', 'Author', 9.0 if high else 2.0, 'x')])
+    return contents, targets, attrs_list
+
+
+@pytest.fixture(scope='module')
+def model():
+    contents, targets, attrs_list = make_dataset()
+    return TriageModel.train(contents, targets, attrs_list, n_estimators=30)
+
+
+def test_model_learns_separable_scores(model):
+    high = model.predict(make_content(100, HIGH),
+                         [DetectedAttribute('author_verified', 'provenance', 'Author', 9.0, 'x')])
+    low = model.predict(make_content(101, LOW),
+                        [DetectedAttribute('author_verified', 'provenance', 'Author', 2.0, 'x')])
+
+    for d in DIMENSIONS:
+        assert high.scores[d] == pytest.approx(0.8, abs=0.1)
+        assert low.scores[d] == pytest.approx(0.3, abs=0.1)
+        assert high.lower[d] <= high.scores[d] <= high.upper[d]
+
+
+def test_save_load_roundtrip(model, tmp_path):
+    model.save(str(tmp_path / 'triage'))
+    loaded = TriageModel.load(str(tmp_path / 'triage'))
+
+    content = make_content(5, HIGH)
+    assert loaded.predict(content, []).scores == model.predict(content, []).scores
+    assert loaded.manifest['n_train'] == 60
+
+
+def test_load_rejects_other_format_version(model, tmp_path):
+    path = tmp_path / 'triage'
+    model.manifest['format_version'] = 999
+    try:
+        model.save(str(path))
+    finally:
+        model.manifest['format_version'] = 1
+    with pytest.raises(ValueError):
+        TriageModel.load(str(path))
+
+
+def test_calibration_report(model):
+    contents, targets, attrs_list = make_dataset(20)
+
+    report = calibration_report(model, contents, targets, attrs_list, thresholds=(0.05, 1.0))
+
+    assert report['n'] == 20
+    assert set(report['dimensions']) == set(DIMENSIONS)
+    assert report['dimensions']['coherence']['mae'] < 0.1
+    assert report['thresholds'][-1]['skip_rate'] == 1.0
+
+
+def test_gate_respects_uncertainty_and_budget():
+    prediction = TriagePrediction(scores={d: 0.7 for d in DIMENSIONS},
+                                  lower={d: 0.65 for d in DIMENSIONS},
+                                  upper={d: 0.75 for d in DIMENSIONS})
+    model = MagicMock()
+    model.predict.return_value = prediction
+
+    gate = TriageGate(model, max_uncertainty=0.2, skip_budget=0.5)
+    run = gate.new_run()
+    decisions = [gate.decide(make_content(i, 'x'), run=run) is not None for i in range(10)]
+    assert sum(decisions) == 5
+    assert run.stats == {'seen': 10, 'skipped': 5}
+
+    strict = TriageGate(model, max_uncertainty=0.05, skip_budget=1.0)
+    assert strict.decide(make_content(0, 'x'), run=strict.new_run()) is None
+
+
+def test_gate_counts_skip_budget_per_run():
+    prediction = TriagePrediction(scores={d: 0.7 for d in DIMENSIONS},
+                                  lower={d: 0.65 for d in DIMENSIONS},
+                                  upper={d: 0.75 for d in DIMENSIONS})
+    model = MagicMock()
+    model.predict.return_value = prediction
+    gate = TriageGate(model, max_uncertainty=0.2, skip_budget=0.5)
+
+    first, second = gate.new_run(), gate.new_run()
+    for i in range(4):
+        gate.decide(make_content(i, 'x'), run=first)
+    # A second run starts with its own budget instead of inheriting (or
+    # resetting) the first run's counts
+    assert gate.decide(make_content(10, 'x'), run=second) is None
+    assert gate.decide(make_content(11, 'x'), run=second) is not None
+    assert first.stats == {'seen': 4, 'skipped': 2}
+    assert second.stats == {'seen': 2, 'skipped': 1}
+
+
+def test_scorer_uses_confident_prediction(monkeypatch):
+    monkeypatch.setattr(scorer_module, 'LLMScoringClient', MagicMock())
+    monkeypatch.setattr(scorer_module, 'VerificationManager', MagicMock())
+    scorer = ContentScorer(use_attribute_detection=False)
+    gate = MagicMock()
+    gate.decide.return_value = TriagePrediction(scores={d: 0.7 for d in DIMENSIONS},
+                                                lower={d: 0.65 for d in DIMENSIONS},
+                                                upper={d: 0.75 for d in DIMENSIONS})
+    scorer.triage_gate = gate
+    monkeypatch.setattr(scorer, 'score_content', MagicMock())
+    content = make_content(1, HIGH)
+
+    dimension_scores, attrs = scorer._score_fresh(content, {'brand_name': 'test'})
+
+    assert not scorer.score_content.called
+    assert dimension_scores.coherence == 0.7
+    assert content.meta['triage_status'] == 'model_scored'
+
+    gate.decide.return_value = None
+    scorer.score_content.return_value = scorer_module.DimensionScores(0.5, 0.5, 0.5, 0.5, 0.5)
+    scorer._score_fresh(content, {'brand_name': 'test'})
+    assert scorer.score_content.called
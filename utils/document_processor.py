@@ -20,6 +20,40 @@ S3_BUCKET = "ar-ingestion-normalized"
 S3_PREFIX = "brand_guidelines"
 
 
+def chunk_text(text: str, max_chunk_size: int = 2000, overlap: int = 200) -> List[str]:
+    """
+    Split text into chunks of at most max_chunk_size characters, breaking at
+    sentence boundaries where possible, with `overlap` characters repeated
+    between consecutive chunks.
+    """
+    if len(text) <= max_chunk_size:
+        return [text]
+    
+    chunks = []
+    start = 0
+    
+    while start < len(text):
+        end = start + max_chunk_size
+        
+        # Try to break at sentence boundary
+        if end < len(text):
+            # Look for sentence endings near the chunk boundary
+            sentence_ends = ['.', '!', '?', '\n']
+            for i in range(end, max(start, end - 200), -1):
+                if text[i] in sentence_ends:
+                    end = i + 1
+                    break
+        
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        
+        # Move start position with overlap
+        start = end - overlap if end < len(text) else end
+    
+    return chunks
+
+
 class BrandGuidelinesProcessor:
     """Process and manage brand guidelines documents with S3 storage"""
     
@@ -176,31 +210,7 @@ class BrandGuidelinesProcessor:
         Returns:
             List of text chunks
         """
-        if len(text) <= max_chunk_size:
-            return [text]
-        
-        chunks = []
-        start = 0
-        
-        while start < len(text):
-            end = start + max_chunk_size
-            
-            # Try to break at sentence boundary
-            if end < len(text):
-                # Look for sentence endings near the chunk boundary
-                sentence_ends = ['.', '!', '?', '\n']
-                for i in range(end, max(start, end - 200), -1):
-                    if text[i] in sentence_ends:
-                        end = i + 1
-                        break
-            
-            chunk = text[start:end].strip()
-            if chunk:
-                chunks.append(chunk)
-            
-            # Move start position with overlap
-            start = end - overlap if end < len(text) else end
-        
+        chunks = chunk_text(text, max_chunk_size, overlap)
         logger.info(f"Split text into {len(chunks)} chunks")
         return chunks
     
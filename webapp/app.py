@@ -30,6 +30,7 @@ from urllib.parse import urlparse
 
 from config.settings import APIConfig, SETTINGS
 from scoring.llm_client import ChatClient
+from scoring.rate_limiter import call_with_rate_limit, estimate_tokens
 from ingestion.fetch_config import get_realistic_headers, get_random_delay
 
 # Import utility modules
@@ -186,11 +187,16 @@ priceless.com
 """
 
     try:
-        response = openai.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0,
-            max_tokens=500
+        messages = [{"role": "user", "content": prompt}]
+        response = call_with_rate_limit(
+            'openai', model,
+            lambda: openai.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=0,
+                max_tokens=500
+            ),
+            estimated_tokens=estimate_tokens(messages, 500)
         )
 
         text = response.choices[0].message.content.strip()
@@ -1607,18 +1613,25 @@ def show_results_page():
 
     report = run_data.get('scoring_report', {})
     items = report.get('items', [])
+    aggregates = report.get('aggregates')
 
-    # Calculate average comprehensive rating
-    if items:
-        avg_rating = sum(item.get('final_score', 0) for item in items) / len(items)
+    if aggregates and aggregates.get('total_items') == len(items):
+        # Computed while the run scored (scoring.aggregator.RunAggregator)
+        avg_rating = aggregates['average_rating']
+        bands = aggregates['rating_bands']
+        excellent, good, fair, poor = bands['excellent'], bands['good'], bands['fair'], bands['poor']
     else:
-        avg_rating = 0
+        # Calculate average comprehensive rating
+        if items:
+            avg_rating = sum(item.get('final_score', 0) for item in items) / len(items)
+        else:
+            avg_rating = 0
 
-    # Calculate rating distribution
-    excellent = sum(1 for item in items if item.get('final_score', 0) >= 80)
-    good = sum(1 for item in items if 60 <= item.get('final_score', 0) < 80)
-    fair = sum(1 for item in items if 40 <= item.get('final_score', 0) < 60)
-    poor = sum(1 for item in items if item.get('final_score', 0) < 40)
+        # Calculate rating distribution
+        excellent = sum(1 for item in items if item.get('final_score', 0) >= 80)
+        good = sum(1 for item in items if 60 <= item.get('final_score', 0) < 80)
+        fair = sum(1 for item in items if 40 <= item.get('final_score', 0) < 60)
+        poor = sum(1 for item in items if item.get('final_score', 0) < 40)
 
     # Header
     st.markdown('<div class="main-header">⭐ Trust Stack Results</div>', unsafe_allow_html=True)
@@ -8,6 +8,7 @@ import os
 import json
 import time
 import logging
+import threading
 import streamlit as st
 from datetime import datetime
 from typing import List, Dict, Any
@@ -72,7 +73,6 @@ def run_analysis(brand_id: str, keywords: List[str], sources: List[str], max_ite
         progress_bar.progress(10)
 
         from ingestion.brave_search import collect_brave_pages, fetch_page
-        from ingestion.normalizer import ContentNormalizer
         from scoring.pipeline import ScoringPipeline
         from reporting.pdf_generator import PDFReportGenerator
         from reporting.markdown_generator import MarkdownReportGenerator
@@ -88,31 +88,18 @@ def run_analysis(brand_id: str, keywords: List[str], sources: List[str], max_ite
         except:
             YouTubeScraper = None
 
-        # Step 2: Data Ingestion
-        progress_animator.show(f"Ingesting content from {', '.join(sources)}...", "📥")
+        # Step 2: Ingestion, normalization and scoring run as one stream: each
+        # page is normalized and scored while later pages are still fetching
+        progress_animator.show(f"Ingesting and scoring content from {', '.join(sources)}...", "📥")
         progress_bar.progress(20)
 
-        all_content = []
-
-        # Web search ingestion (using selected provider)
+        # One fetch task per web page plus one per API source
+        tasks = []
         if 'web' in sources:
-            # If URLs were pre-selected, use only those
             if selected_urls:
-                # Filter URLs from the current search provider
+                # If URLs were pre-selected, use only those from the current search provider
                 selected_web_urls = [u for u in selected_urls if u['source'] in ['brave', 'serper', 'web']]
-                collected = []
-
-                for url_data in selected_web_urls:
-                    try:
-                        page_data = fetch_page(url_data['url'])
-                        if page_data and page_data.get('body'):
-                            # Add brand-owned flag to metadata
-                            page_data['is_brand_owned'] = url_data.get('is_brand_owned', False)
-                            collected.append(page_data)
-                    except Exception as e:
-                        st.warning(f"⚠️ Could not fetch {url_data['url']}: {str(e)}")
-
-                st.info(f"✓ Fetched {len(collected)} of {len(selected_web_urls)} selected web pages")
+                tasks.extend(('selected', i, u) for i, u in enumerate(selected_web_urls))
             else:
                 # Original behavior: search and fetch automatically
                 query = ' '.join(keywords)
@@ -120,108 +107,108 @@ def run_analysis(brand_id: str, keywords: List[str], sources: List[str], max_ite
                 # Use the unified search interface with the selected provider
                 from ingestion.search_unified import search
                 search_results = search(query, size=web_pages, provider=search_provider)
-
-                collected = []
-                for result in search_results:
-                    url = result.get('url', '')
-                    if url:
-                        try:
-                            page_data = fetch_page(url)
-                            if page_data and page_data.get('body'):
-                                # Add metadata from search result
-                                page_data['search_title'] = result.get('title', '')
-                                page_data['search_snippet'] = result.get('snippet', '')
-                                classification = detect_brand_owned_url(url, brand_id, brand_domains, brand_subdomains, brand_social_handles)
-                                page_data['is_brand_owned'] = classification['is_brand_owned']
-                                page_data['source_type'] = classification['source_type']
-                                page_data['source_tier'] = classification['source_tier']
-                                collected.append(page_data)
-                        except Exception as e:
-                            st.warning(f"⚠️ Could not fetch {url}: {str(e)}")
-
-                st.info(f"✓ Collected {len(collected)} web pages using {search_provider}")
-
-            # Convert to NormalizedContent
-            for i, c in enumerate(collected):
-                url = c.get('url')
-                content_id = f"{search_provider}_{i}_{abs(hash(url or ''))}"
-                is_brand_owned = c.get('is_brand_owned', False)
-
-                meta = {
-                    'source_url': url or '',
-                    'content_type': 'web',
-                    'title': c.get('title', ''),
-                    'description': c.get('body', '')[:200],
-                    'is_brand_owned': is_brand_owned,  # Add brand-owned flag to metadata
-                    'search_provider': search_provider  # Track which provider was used
-                }
-                if c.get('terms'):
-                    meta['terms'] = c.get('terms')
-                if c.get('privacy'):
-                    meta['privacy'] = c.get('privacy')
-
-                nc = NormalizedContent(
-                    content_id=content_id,
-                    src=search_provider,
-                    platform_id=url or '',
-                    author='web',
-                    title=c.get('title', '') or '',
-                    body=c.get('body', '') or '',
-                    run_id=run_id,
-                    event_ts=datetime.now().isoformat(),
-                    meta=meta,
-                    url=url or '',
-                    modality='text',
-                    channel='web',
-                    platform_type='web',
-                    source_type=c.get('source_type', 'unknown'),
-                    source_tier=c.get('source_tier', 'unknown')
-                )
-                all_content.append(nc)
-
-        # Reddit ingestion
+                search_results = [r for r in search_results if r.get('url', '')]
+                tasks.extend(('search', i, r) for i, r in enumerate(search_results))
+        web_tasks = len(tasks)
         if 'reddit' in sources and RedditCrawler:
-            try:
-                reddit = RedditCrawler()
-                posts = reddit.search_posts(keywords=keywords, limit=max_items // len(sources))
-                reddit_content = reddit.convert_to_normalized_content(posts, brand_id, run_id)
-                all_content.extend(reddit_content)
-                st.info(f"✓ Collected {len(reddit_content)} Reddit posts")
-            except Exception as e:
-                st.warning(f"⚠️ Reddit ingestion failed: {e}")
-
-        # YouTube ingestion
+            tasks.append(('reddit', None, None))
         if 'youtube' in sources and YouTubeScraper:
+            tasks.append(('youtube', None, None))
+
+        counts = {'web': 0, 'reddit': 0, 'youtube': 0}
+        counts_lock = threading.Lock()
+
+        def fetch(task):
+            kind, i, data = task
+            if kind == 'reddit':
+                try:
+                    reddit = RedditCrawler()
+                    posts = reddit.search_posts(keywords=keywords, limit=max_items // len(sources))
+                    items = reddit.convert_to_normalized_content(posts, brand_id, run_id)
+                except Exception as e:
+                    logger.warning(f"Reddit ingestion failed: {e}")
+                    return None
+                with counts_lock:
+                    counts['reddit'] += len(items)
+                return list(items)
+
+            if kind == 'youtube':
+                try:
+                    yt = YouTubeScraper()
+                    query = ' '.join(keywords)
+                    videos = yt.search_videos(query=query, max_results=max_items // len(sources))
+                    items = yt.convert_videos_to_normalized(videos, brand_id, run_id, include_comments=include_comments)
+                except Exception as e:
+                    logger.warning(f"YouTube ingestion failed: {e}")
+                    return None
+                with counts_lock:
+                    counts['youtube'] += len(items)
+                return list(items)
+
+            url = data['url']
             try:
-                yt = YouTubeScraper()
-                query = ' '.join(keywords)
-                videos = yt.search_videos(query=query, max_results=max_items // len(sources))
-                youtube_content = yt.convert_videos_to_normalized(videos, brand_id, run_id, include_comments=include_comments)
-                all_content.extend(youtube_content)
-                st.info(f"✓ Collected {len(youtube_content)} YouTube videos")
+                c = fetch_page(url)
             except Exception as e:
-                st.warning(f"⚠️ YouTube ingestion failed: {e}")
-
-        if not all_content:
-            st.error("❌ No content collected from any source")
-            return
-
-        # Step 3: Normalization
-        progress_animator.show("Normalizing content...", "🔄")
-        progress_bar.progress(40)
-
-        normalizer = ContentNormalizer()
-        normalized_content = normalizer.normalize_content(all_content)
+                logger.warning(f"Could not fetch {url}: {e}")
+                return None
+            if not c or not c.get('body'):
+                return None
+
+            if kind == 'selected':
+                # Add brand-owned flag to metadata
+                c['is_brand_owned'] = data.get('is_brand_owned', False)
+            else:
+                # Add metadata from search result
+                c['search_title'] = data.get('title', '')
+                c['search_snippet'] = data.get('snippet', '')
+                classification = detect_brand_owned_url(url, brand_id, brand_domains, brand_subdomains, brand_social_handles)
+                c['is_brand_owned'] = classification['is_brand_owned']
+                c['source_type'] = classification['source_type']
+                c['source_tier'] = classification['source_tier']
+            with counts_lock:
+                counts['web'] += 1
 
-        # Step 4: Scoring
-        progress_animator.show("Scoring content on 5D Trust dimensions...", "📊")
-        progress_bar.progress(60)
+            # Convert to NormalizedContent
+            url = c.get('url')
+            content_id = f"{search_provider}_{i}_{abs(hash(url or ''))}"
+            is_brand_owned = c.get('is_brand_owned', False)
+
+            meta = {
+                'source_url': url or '',
+                'content_type': 'web',
+                'title': c.get('title', ''),
+                'description': c.get('body', '')[:200],
+                'is_brand_owned': is_brand_owned,  # Add brand-owned flag to metadata
+                'search_provider': search_provider  # Track which provider was used
+            }
+            if c.get('terms'):
+                meta['terms'] = c.get('terms')
+            if c.get('privacy'):
+                meta['privacy'] = c.get('privacy')
+
+            return NormalizedContent(
+                content_id=content_id,
+                src=search_provider,
+                platform_id=url or '',
+                author='web',
+                title=c.get('title', '') or '',
+                body=c.get('body', '') or '',
+                run_id=run_id,
+                event_ts=datetime.now().isoformat(),
+                meta=meta,
+                url=url or '',
+                modality='text',
+                channel='web',
+                platform_type='web',
+                source_type=c.get('source_type', 'unknown'),
+                source_tier=c.get('source_tier', 'unknown')
+            )
 
         scoring_pipeline = ScoringPipeline()
-        
+
         # Get use_guidelines preference from session state
         use_guidelines = st.session_state.get('use_guidelines', True)
-        
+
         brand_config = {
             'brand_id': brand_id,
             'brand_name': brand_id,
@@ -230,14 +217,42 @@ def run_analysis(brand_id: str, keywords: List[str], sources: List[str], max_ite
             'use_guidelines': use_guidelines  # Pass guidelines preference to scorer
         }
 
-        pipeline_run = scoring_pipeline.run_scoring_pipeline(normalized_content, brand_config)
+        # Rough item estimate for the progress bar (API sources return up to
+        # max_items // len(sources) each)
+        expected = max(1, web_tasks + (len(tasks) - web_tasks) * (max_items // len(sources)))
+        scored = [0]
+
+        def on_score(scores):
+            scored[0] += 1
+            progress_animator.show(f"Scored {scored[0]} content items on 5D Trust dimensions...", "📊")
+            progress_bar.progress(20 + min(60, int(60 * scored[0] / expected)))
+
+        pipeline_run = scoring_pipeline.run_streaming_pipeline(tasks, brand_config, fetch=fetch, on_score=on_score)
+
+        if 'web' in sources:
+            if selected_urls:
+                st.info(f"✓ Fetched {counts['web']} of {web_tasks} selected web pages")
+            else:
+                st.info(f"✓ Collected {counts['web']} web pages using {search_provider}")
+        if 'reddit' in sources and RedditCrawler:
+            st.info(f"✓ Collected {counts['reddit']} Reddit posts")
+        if 'youtube' in sources and YouTubeScraper:
+            st.info(f"✓ Collected {counts['youtube']} YouTube videos")
+
+        if not any(counts.values()):
+            st.error("❌ No content collected from any source")
+            return
+
+        normalize_stats = pipeline_run.stage_stats.get('normalize', {})
+        total_items = normalize_stats.get('processed', 0) - normalize_stats.get('dropped', 0)
 
         # Step 5: Generate Reports
         progress_animator.show("Generating reports...", "📄")
         progress_bar.progress(80)
 
         scores_list = pipeline_run.classified_scores or []
-        scoring_report = scoring_pipeline.generate_scoring_report(scores_list, brand_config)
+        scoring_report = scoring_pipeline.generate_scoring_report(scores_list, brand_config,
+                                                                  aggregator=pipeline_run.aggregates)
 
         # Add LLM model configuration to the report for use in executive summary
         scoring_report['llm_model'] = summary_model
@@ -264,7 +279,7 @@ def run_analysis(brand_id: str, keywords: List[str], sources: List[str], max_ite
             'pdf_path': pdf_path,
             'md_path': md_path,
             'scoring_report': scoring_report,
-            'total_items': len(normalized_content)
+            'total_items': total_items
         }
 
         data_path = os.path.join(run_dir, '_run_data.json')
@@ -280,7 +295,7 @@ def run_analysis(brand_id: str, keywords: List[str], sources: List[str], max_ite
         if 'progress_container' in st.session_state:
             st.session_state['progress_container'] = None
 
-        st.success(f"✅ Analysis completed successfully! Analyzed {len(normalized_content)} content items.")
+        st.success(f"✅ Analysis completed successfully! Analyzed {total_items} content items.")
 
         # Store in session state
         st.session_state['last_run'] = run_data
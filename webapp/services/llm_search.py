@@ -13,6 +13,7 @@ except ImportError:
     st = None
 
 from scoring.llm_client import ChatClient
+from scoring.rate_limiter import call_with_rate_limit, estimate_tokens
 from config.settings import SETTINGS
 from webapp.utils.url_utils import is_usa_host, classify_brand_url, is_promotional_url
 
@@ -61,11 +62,16 @@ priceless.com
 """
 
     try:
-        response = openai.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0,
-            max_tokens=500
+        messages = [{"role": "user", "content": prompt}]
+        response = call_with_rate_limit(
+            'openai', model,
+            lambda: openai.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=0,
+                max_tokens=500
+            ),
+            estimated_tokens=estimate_tokens(messages, 500)
         )
 
         text = response.choices[0].message.content.strip()